@@ -0,0 +1,158 @@
+"""asyncio facade over StellarMemory for async servers."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from stellar_memory.config import ConcurrencyConfig
+from stellar_memory.models import MemoryItem, ReorbitResult
+
+
+class AsyncStellarMemory:
+    """Awaitable ``store``/``recall``/``forget``/``reorbit`` for a StellarMemory.
+
+    Blocking calls run on a dedicated thread pool so SQLite, embedding and
+    LLM work never stalls the event loop. Each call belongs to a *stage*
+    (``store``, ``recall``, ``llm``, ``maintenance``) with its own
+    concurrency limit: excess calls wait on the loop without holding a
+    worker thread, so slow LLM narration or a reorbit cannot starve recalls.
+    """
+
+    STAGES = ("store", "recall", "llm", "maintenance")
+
+    def __init__(self, memory, config: ConcurrencyConfig | None = None):
+        self.memory = memory
+        self._config = config or ConcurrencyConfig()
+        self._limits = {stage: max(1, getattr(self._config, stage))
+                        for stage in self.STAGES}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self._config.max_workers),
+            thread_name_prefix="stellar-async",
+        )
+        # asyncio.Semaphore binds to the loop it is first used on
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats = {stage: {"calls": 0, "running": 0, "waiting": 0,
+                               "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+                       for stage in self.STAGES}
+
+    def _semaphore(self, stage: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        per_loop = self._semaphores.get(loop)
+        if per_loop is None:
+            per_loop = {s: asyncio.Semaphore(n) for s, n in self._limits.items()}
+            self._semaphores[loop] = per_loop
+        return per_loop[stage]
+
+    async def run(self, stage: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the executor under ``stage``'s limit."""
+        if stage not in self._limits:
+            raise ValueError(f"Unknown stage: {stage}")
+        stats = self._stats[stage]
+        with self._lock:
+            stats["waiting"] += 1
+        sem = self._semaphore(stage)
+        try:
+            await sem.acquire()
+        finally:
+            with self._lock:
+                stats["waiting"] -= 1
+        start = time.perf_counter()
+        with self._lock:
+            stats["running"] += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(fn, *args, **kwargs)
+            )
+        except Exception:
+            with self._lock:
+                stats["errors"] += 1
+            raise
+        finally:
+            sem.release()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                stats["running"] -= 1
+                stats["calls"] += 1
+                stats["total_ms"] += elapsed_ms
+                stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    # --- Core API ---
+
+    def _store_stage(self, auto_evaluate: bool, skip_summarize: bool) -> str:
+        """Stores that may call an LLM share the (smaller) llm limit."""
+        cfg = self.memory.config
+        if cfg.ingest.enabled or not cfg.llm.enabled:
+            return "store"  # no LLM, or enrichment runs on the ingest workers
+        if auto_evaluate or (not skip_summarize and self.memory._summarizer is not None):
+            return "llm"
+        return "store"
+
+    async def store(self, content: str, importance: float = 0.5,
+                    metadata: dict | None = None, auto_evaluate: bool = False,
+                    skip_summarize: bool = False, **kwargs) -> MemoryItem:
+        stage = self._store_stage(auto_evaluate, skip_summarize)
+        return await self.run(stage, self.memory.store, content,
+                              importance=importance, metadata=metadata,
+                              auto_evaluate=auto_evaluate,
+                              skip_summarize=skip_summarize, **kwargs)
+
+    async def recall(self, query: str, limit: int = 5, **kwargs) -> list[MemoryItem]:
+        return await self.run("recall", self.memory.recall, query, limit=limit, **kwargs)
+
+    async def store_batch(self, entries: list[dict], **kwargs) -> list:
+        stage = "store"
+        for entry in entries:
+            stage = self._store_stage(entry.get("auto_evaluate", False),
+                                      entry.get("skip_summarize", False))
+            if stage == "llm":
+                break
+        return await self.run(stage, self.memory.store_batch, entries, **kwargs)
+
+    async def recall_batch(self, queries: list[str], limit: int = 5, **kwargs) -> list:
+        return await self.run("recall", self.memory.recall_batch, queries,
+                              limit=limit, **kwargs)
+
+    async def get(self, memory_id: str) -> MemoryItem | None:
+        return await self.run("recall", self.memory.get, memory_id)
+
+    async def forget(self, memory_id: str, user_id: str | None = None) -> bool:
+        return await self.run("store", self.memory.forget, memory_id, user_id=user_id)
+
+    async def reorbit(self) -> ReorbitResult:
+        return await self.run("maintenance", self.memory.reorbit)
+
+    async def timeline(self, *args, **kwargs):
+        return await self.run("recall", self.memory.timeline, *args, **kwargs)
+
+    async def narrate(self, *args, **kwargs) -> str:
+        return await self.run("llm", self.memory.narrate, *args, **kwargs)
+
+    async def stats(self):
+        return await self.run("recall", self.memory.stats)
+
+    async def health(self):
+        return await self.run("recall", self.memory._health)
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        return await self.run("maintenance", self.memory.flush, timeout)
+
+    # --- Lifecycle ---
+
+    def concurrency_stats(self) -> dict:
+        with self._lock:
+            return {
+                stage: {**s, "limit": self._limits[stage],
+                        "avg_ms": s["total_ms"] / s["calls"] if s["calls"] else 0.0}
+                for stage, s in self._stats.items()
+            }
+
+    def close(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
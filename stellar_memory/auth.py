@@ -5,7 +5,10 @@ from __future__ import annotations
 import hashlib
 import logging
 import secrets
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +38,143 @@ def key_prefix(key: str) -> str:
 
 
 class AuthManager:
-    """Manages users and API keys via asyncpg connection pool."""
-
-    def __init__(self, pool):
+    """Manages users and API keys via asyncpg connection pool.
+
+    Key lookups are cached for ``key_cache_ttl`` seconds (unknown keys for
+    at most ``negative_ttl``). Revoking a key or changing a tier drops the
+    affected entries at once, here and - through ``NOTIFY`` on
+    :attr:`NOTIFY_CHANNEL` - in every worker running :meth:`start_listener`.
+    ``last_used_at`` is buffered and written by :meth:`flush_last_used`.
+    Memory counts are read from the database once per ``count_resync``
+    seconds and adjusted in process in between.
+    """
+
+    NOTIFY_CHANNEL = "stellar_auth"
+
+    def __init__(self, pool, key_cache_ttl: float = 60.0,
+                 negative_ttl: float = 5.0, key_cache_size: int = 10_000,
+                 count_resync: float = 300.0):
         self._pool = pool
+        self._key_ttl = key_cache_ttl
+        self._negative_ttl = min(negative_ttl, key_cache_ttl)
+        self._key_cache_size = key_cache_size
+        self._keys: OrderedDict[str, tuple[UserInfo | None, float]] = OrderedDict()
+        # Invalidation fence: a lookup that read the row before a revoke or
+        # tier change must not cache it afterwards (see _fence)
+        self._generation = 0
+        self._tombstones: OrderedDict[str, int] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self._counts: dict[str, tuple[int, float]] = {}
+        self._count_resync = count_resync
+        self._listener_conn = None
+        self.key_hits = 0
+        self.key_misses = 0
+
+    # --- Key cache ---
+
+    def _cache_key(self, key_hash: str, user: UserInfo | None) -> None:
+        ttl = self._key_ttl if user is not None else self._negative_ttl
+        self._keys[key_hash] = (user, time.monotonic() + ttl)
+        self._keys.move_to_end(key_hash)
+        while len(self._keys) > self._key_cache_size:
+            self._keys.popitem(last=False)
+
+    def _fence(self, name: str) -> None:
+        self._generation += 1
+        self._tombstones[name] = self._generation
+        self._tombstones.move_to_end(name)
+        while len(self._tombstones) > self._key_cache_size:
+            self._tombstones.popitem(last=False)
+
+    def _fenced_since(self, started: int, key_hash: str, user: UserInfo | None) -> bool:
+        if self._tombstones.get(f"key:{key_hash}", -1) > started:
+            return True
+        return user is not None and self._tombstones.get(f"user:{user.id}", -1) > started
+
+    def invalidate_key(self, key_hash: str) -> None:
+        self._keys.pop(key_hash, None)
+        self._fence(f"key:{key_hash}")
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop cached keys of ``user_id`` (e.g. after a tier change)."""
+        stale = [h for h, (user, _) in self._keys.items()
+                 if user is not None and user.id == user_id]
+        for key_hash in stale:
+            del self._keys[key_hash]
+        self._fence(f"user:{user_id}")
+
+    async def _notify(self, conn, kind: str, value: str) -> None:
+        """Tell other workers to drop a cached entry."""
+        try:
+            await conn.execute("SELECT pg_notify($1, $2)",
+                               self.NOTIFY_CHANNEL, f"{kind}:{value}")
+        except Exception as e:
+            logger.warning("Auth cache notify failed: %s", e)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        kind, _, value = payload.partition(":")
+        if kind == "key":
+            self.invalidate_key(value)
+        elif kind == "user":
+            self.invalidate_user(value)
+
+    async def start_listener(self) -> None:
+        """Hold one pooled connection that LISTENs for invalidations."""
+        if self._listener_conn is not None:
+            return
+        conn = await self._pool.acquire()
+        try:
+            await conn.add_listener(self.NOTIFY_CHANNEL, self._on_notify)
+        except Exception:
+            await self._pool.release(conn)
+            raise
+        self._listener_conn = conn
+
+    async def flush_last_used(self) -> int:
+        """Write buffered ``last_used_at`` stamps in one statement."""
+        if not self._last_used:
+            return 0
+        pending, self._last_used = self._last_used, {}
+        hashes = list(pending)
+        stamps = [datetime.fromtimestamp(pending[h], timezone.utc) for h in hashes]
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    """UPDATE api_keys AS ak SET last_used_at = v.ts
+                       FROM unnest($1::text[], $2::timestamptz[]) AS v(key_hash, ts)
+                       WHERE ak.key_hash = v.key_hash""",
+                    hashes,
+                    stamps,
+                )
+        except Exception:
+            for key_hash, ts in pending.items():  # retry on the next flush
+                self._last_used[key_hash] = max(ts, self._last_used.get(key_hash, 0.0))
+            raise
+        return len(hashes)
+
+    async def close(self) -> None:
+        """Flush pending ``last_used_at`` stamps and stop listening."""
+        try:
+            await self.flush_last_used()
+        except Exception as e:
+            logger.warning("Final last_used_at flush failed: %s", e)
+        conn, self._listener_conn = self._listener_conn, None
+        if conn is not None:
+            try:
+                await conn.remove_listener(self.NOTIFY_CHANNEL, self._on_notify)
+            finally:
+                await self._pool.release(conn)
+
+    def cache_stats(self) -> dict:
+        lookups = self.key_hits + self.key_misses
+        return {
+            "keys": len(self._keys),
+            "hits": self.key_hits,
+            "misses": self.key_misses,
+            "hit_rate": self.key_hits / lookups if lookups else 0.0,
+            "pending_last_used": len(self._last_used),
+            "tenant_counts": len(self._counts),
+        }
 
     async def init_schema(self):
         """Create tables if they don't exist."""
@@ -91,27 +227,32 @@ class AuthManager:
             }, raw_key
 
     async def get_user_by_api_key(self, key_hash: str) -> UserInfo | None:
-        """Look up user by hashed API key."""
-        async with self._pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """SELECT u.id, u.email, u.tier
-                   FROM users u
-                   JOIN api_keys ak ON ak.user_id = u.id
-                   WHERE ak.key_hash = $1 AND ak.is_active = TRUE""",
-                key_hash,
-            )
-            if row:
-                # Update last_used_at
-                await conn.execute(
-                    "UPDATE api_keys SET last_used_at = NOW() WHERE key_hash = $1",
+        """Look up user by hashed API key (cached; see class docstring)."""
+        cached = self._keys.get(key_hash)
+        if cached is not None and cached[1] > time.monotonic():
+            self.key_hits += 1
+            user = cached[0]
+        else:
+            self.key_misses += 1
+            started = self._generation
+            async with self._pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    """SELECT u.id, u.email, u.tier
+                       FROM users u
+                       JOIN api_keys ak ON ak.user_id = u.id
+                       WHERE ak.key_hash = $1 AND ak.is_active = TRUE""",
                     key_hash,
                 )
-                return UserInfo(
-                    id=str(row["id"]),
-                    email=row["email"],
-                    tier=row["tier"],
-                )
-        return None
+            user = UserInfo(
+                id=str(row["id"]),
+                email=row["email"],
+                tier=row["tier"],
+            ) if row else None
+            if not self._fenced_since(started, key_hash, user):
+                self._cache_key(key_hash, user)
+        if user is not None:
+            self._last_used[key_hash] = time.time()  # written by flush_last_used
+        return user
 
     async def list_api_keys(self, user_id: str) -> list[dict]:
         """List all API keys for a user (prefix only, no raw keys)."""
@@ -177,15 +318,21 @@ class AuthManager:
             }, raw_key
 
     async def revoke_api_key(self, user_id: str, key_id: str) -> bool:
-        """Deactivate an API key."""
+        """Deactivate an API key and drop it from every worker's cache."""
         async with self._pool.acquire() as conn:
-            result = await conn.execute(
+            key_hash = await conn.fetchval(
                 """UPDATE api_keys SET is_active = FALSE
-                   WHERE id = $1 AND user_id = $2 AND is_active = TRUE""",
+                   WHERE id = $1 AND user_id = $2 AND is_active = TRUE
+                   RETURNING key_hash""",
                 key_id,
                 user_id,
             )
-            return result == "UPDATE 1"
+            if key_hash is None:
+                return False
+            self.invalidate_key(key_hash)
+            self._last_used.pop(key_hash, None)
+            await self._notify(conn, "key", key_hash)
+            return True
 
     async def get_user_by_email(self, email: str) -> UserInfo | None:
         """Look up user by email."""
@@ -227,6 +374,8 @@ class AuthManager:
                 provider_subscription_id,
             )
             if row:
+                self.invalidate_user(str(row["id"]))
+                await self._notify(conn, "user", str(row["id"]))
                 return UserInfo(
                     id=str(row["id"]),
                     email=row["email"],
@@ -247,7 +396,25 @@ class AuthManager:
         return UserInfo(id=info["user_id"], email=email, tier="free")
 
     async def get_memory_count(self, user_id: str) -> int:
-        """Get memory count for a user (from memories table)."""
+        """Memory count for a user, recounted at most every ``count_resync`` s.
+
+        In between, callers keep it current with :meth:`adjust_memory_count`.
+        """
+        cached = self._counts.get(user_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self._count_resync:
+            return cached[0]
+        count = await self._count_memories(user_id)
+        self._counts[user_id] = (count, now)
+        return count
+
+    def adjust_memory_count(self, user_id: str, delta: int) -> None:
+        """Apply a store (+n) or forget (-n) to a cached memory count."""
+        cached = self._counts.get(user_id)
+        if cached is not None:
+            self._counts[user_id] = (max(0, cached[0] + delta), cached[1])
+
+    async def _count_memories(self, user_id: str) -> int:
         async with self._pool.acquire() as conn:
             count = await conn.fetchval(
                 """SELECT COUNT(*) FROM information_schema.tables
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import itertools
+import math
+import os
 import random
+import sys
+import threading
 import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
+from stellar_memory.config import StellarConfig
 from stellar_memory.models import BenchmarkReport
 
 
@@ -64,6 +72,9 @@ class StandardDataset:
         "small": (100, 20),
         "standard": (1000, 100),
         "large": (10000, 500),
+        # Scale tiers: pair with SyntheticEmbedder (see scale_benchmark)
+        "xlarge": (100_000, 1000),
+        "xxlarge": (1_000_000, 1000),
     }
 
     def __init__(self, name: str = "standard", seed: int = 42):
@@ -78,9 +89,16 @@ class StandardDataset:
     def name(self) -> str:
         return self._name
 
+    @property
+    def memory_count(self) -> int:
+        return self._memory_count
+
     def generate_memories(self) -> list[dict]:
         """Generate reproducible memory items."""
-        memories = []
+        return list(self.iter_memories())
+
+    def iter_memories(self):
+        """Yield the memory items one at a time (for the scale tiers)."""
         for i in range(self._memory_count):
             cat = _CATEGORIES[i % len(_CATEGORIES)]
             template = self._rng.choice(_TEMPLATES[cat])
@@ -89,14 +107,13 @@ class StandardDataset:
             tags = [cat]
             if cat == "code":
                 tags.append("code")
-            memories.append({
+            yield {
                 "content": content,
                 "importance": round(importance, 2),
                 "tags": tags,
                 "category": cat,
                 "id_hint": f"bench_{i}",
-            })
-        return memories
+            }
 
     def generate_queries(self) -> list[dict]:
         """Generate queries with expected category matches."""
@@ -144,6 +161,80 @@ class StandardDataset:
         return result
 
 
+def percentiles(samples_ms: list[float]) -> dict:
+    """Nearest-rank p50/p95/p99 (plus count, mean and max) of millisecond samples."""
+    if not samples_ms:
+        return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0,
+                "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(samples_ms)
+    n = len(ordered)
+
+    def rank(q: float) -> float:
+        return round(ordered[max(0, math.ceil(q * n) - 1)], 3)
+    return {
+        "count": n,
+        "avg_ms": round(sum(ordered) / n, 3),
+        "p50_ms": rank(0.50),
+        "p95_ms": rank(0.95),
+        "p99_ms": rank(0.99),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def _rss_mb() -> float:
+    """Resident set size of this process in MB (0.0 where unavailable).
+
+    Reads ``/proc/self/statm`` on Linux; elsewhere falls back to the peak
+    RSS reported by ``resource``.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class SyntheticEmbedder:
+    """Deterministic hashed bag-of-words embedder for benchmarks.
+
+    Every token maps to a fixed random vector (seeded by the token); a
+    text embeds to the normalized sum of its tokens. No model is needed,
+    and texts that share words still land near each other.
+    """
+
+    def __init__(self, dim: int = 384, seed: int = 42):
+        self.dim = dim
+        self._seed = seed
+        self._tokens: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def _token(self, token: str) -> list[float]:
+        vec = self._tokens.get(token)
+        if vec is None:
+            rng = random.Random(f"{self._seed}:{token}")
+            vec = [rng.gauss(0, 1) for _ in range(self.dim)]
+            with self._lock:
+                vec = self._tokens.setdefault(token, vec)
+        return vec
+
+    def embed(self, text: str) -> list[float]:
+        from stellar_memory.utils import normalize
+        tokens = "".join(c.lower() if c.isalnum() else " " for c in text).split()
+        if not tokens:
+            return [0.0] * self.dim
+        return normalize([sum(col) for col in zip(*(self._token(t) for t in tokens))])
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed(t) for t in texts]
+
+
 class MemoryBenchmark:
     """Comprehensive memory system benchmark."""
 
@@ -155,6 +246,7 @@ class MemoryBenchmark:
         ds = StandardDataset(dataset, seed)
         memories = ds.generate_memories()
         query_list = ds.generate_queries()[:queries]
+        rss_before = _rss_mb()
 
         # Measure store latency
         store_times = []
@@ -201,7 +293,6 @@ class MemoryBenchmark:
 
         # Stats
         stats = self._stellar.stats()
-        import os
         db_size = 0.0
         if hasattr(self._stellar, 'config') and self._stellar.config.db_path != ":memory:":
             try:
@@ -209,8 +300,8 @@ class MemoryBenchmark:
             except OSError:
                 pass
 
-        import sys
-        mem_usage = sys.getsizeof(self._stellar) / (1024 * 1024)
+        # Process RSS growth over the run (sys.getsizeof saw only the facade)
+        mem_usage = max(0.0, _rss_mb() - rss_before)
 
         total_q = len(query_list) or 1
         return BenchmarkReport(
@@ -226,4 +317,253 @@ class MemoryBenchmark:
             zone_distribution=dict(stats.zone_counts),
             dataset_name=dataset,
             queries_run=total_q,
+            store_latency=percentiles(store_times),
+            recall_latency=percentiles(recall_times),
         )
+
+
+def _legacy_cosine(a: list[float], b: list[float]) -> float:
+    """Per-pair cosine as computed before the batched kernel (baseline)."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return max(0.0, min(1.0, dot / (norm_a * norm_b)))
+
+
+def similarity_benchmark(n: int = 1000, dim: int = 384, repeats: int = 5,
+                         seed: int = 42) -> dict:
+    """Micro-benchmark: per-pair cosine vs batched ``similarities`` kernels.
+
+    Returns best-of-``repeats`` timings in milliseconds for scoring one
+    query against ``n`` unit vectors, plus speed-ups over the baseline.
+    """
+    from stellar_memory.utils import normalize, similarities, vector_norm
+
+    rng = random.Random(seed)
+    vectors = [normalize([rng.gauss(0, 1) for _ in range(dim)]) for _ in range(n)]
+    query = normalize([rng.gauss(0, 1) for _ in range(dim)])
+    norms = [vector_norm(v) for v in vectors]
+
+    def best(fn) -> float:
+        times = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            fn()
+            times.append((time.perf_counter() - t0) * 1000)
+        return min(times)
+
+    result = {
+        "n": n, "dim": dim,
+        "per_pair_ms": best(lambda: [_legacy_cosine(query, v) for v in vectors]),
+        "batched_ms": best(lambda: similarities(query, vectors)),
+        "cached_norms_ms": best(lambda: similarities(query, vectors, norms)),
+        "normalized_ms": best(lambda: similarities(query, vectors, normalized=True)),
+        "numpy_ms": None,
+    }
+    try:
+        import numpy as np
+        matrix = np.asarray(vectors)
+        result["numpy_ms"] = best(lambda: similarities(query, matrix, normalized=True))
+    except ImportError:
+        pass
+    base = result["per_pair_ms"]
+    result["speedup"] = {
+        key[:-3]: round(base / result[key], 1)
+        for key in ("batched_ms", "cached_norms_ms", "normalized_ms", "numpy_ms")
+        if result[key]
+    }
+    return result
+
+
+def scale_config(dim: int = 128) -> StellarConfig:
+    """In-memory StellarConfig for :func:`scale_benchmark`.
+
+    No files and no background scheduler. Consolidation and graph
+    auto-linking are off because each searches the whole store on every
+    store, which makes loading quadratic at these sizes. Zones use the
+    columnar layout and the vector index int8 codes, so a million
+    embeddings fit in memory.
+    """
+    config = StellarConfig(db_path=":memory:", auto_start_scheduler=False)
+    config.embedder.dimension = dim
+    config.embedder.enabled = False  # replaced by SyntheticEmbedder
+    config.event_logger.enabled = False
+    config.consolidation.enabled = False
+    config.graph.auto_link = False
+    config.summarization.enabled = False
+    config.storage.in_memory_layout = "columnar"
+    config.vector_index.quantization = "int8"
+    return config
+
+
+def _timed(fn, *args) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - t0) * 1000
+
+
+def _throughput(ops: list, threads: int) -> dict:
+    """Run zero-argument callables on ``threads`` workers; ops/s and latencies."""
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = list(pool.map(_timed, ops))
+    wall = time.perf_counter() - t0
+    return {
+        "threads": threads,
+        "ops": len(ops),
+        "wall_s": round(wall, 3),
+        "ops_per_s": round(len(ops) / wall, 1) if wall else 0.0,
+        "latency": percentiles(latencies),
+    }
+
+
+def scale_benchmark(dataset: str = "large", queries: int | None = None,
+                    threads: int = 4, dim: int = 128, seed: int = 42,
+                    samples: int = 200, batch_size: int = 1000,
+                    reorbits: int = 3, trace_memory: bool = True,
+                    config: StellarConfig | None = None) -> dict:
+    """Load a dataset tier into a fresh in-memory StellarMemory and measure it.
+
+    Embeddings come from :class:`SyntheticEmbedder`, so tiers up to
+    ``xxlarge`` (1M memories) run without a model. The returned dict is
+    JSON-ready:
+
+    - ``load``: bulk ``store_batch`` throughput while filling the store
+    - ``latency``: per-call store and recall percentiles at full size
+    - ``throughput``: recall-only and mixed (1 store per 10 ops) runs on
+      ``threads`` workers
+    - ``stages``: embed, vector index, zone storage, reorbit and decay
+    - ``memory``: tracemalloc bytes held after loading (and per memory)
+      plus process RSS
+
+    With ``trace_memory`` the load runs under tracemalloc, which slows it
+    down; tracing stops before any latency is measured.
+    """
+    from stellar_memory.stellar import StellarMemory
+
+    ds = StandardDataset(dataset, seed)
+    query_list = ds.generate_queries()
+    if queries is not None:
+        query_list = query_list[:queries]
+    query_texts = [q["query"] for q in query_list] or ["memory"]
+    embedder = SyntheticEmbedder(dim, seed)
+    config = config or scale_config(dim)
+
+    rss_start = _rss_mb()
+    if trace_memory:
+        tracemalloc.start()
+    memory = StellarMemory(config)
+    memory._embedder = embedder  # as StellarBuilder.with_embedder
+    try:
+        # Load
+        loaded = 0
+        t0 = time.perf_counter()
+        chunk: list[dict] = []
+        for mem in ds.iter_memories():
+            chunk.append({"content": mem["content"], "importance": mem["importance"],
+                          "metadata": {"category": mem["category"]}})
+            if len(chunk) >= batch_size:
+                memory.store_batch(chunk)
+                loaded += len(chunk)
+                chunk = []
+        if chunk:
+            memory.store_batch(chunk)
+            loaded += len(chunk)
+        load_s = time.perf_counter() - t0
+        traced = peak = 0
+        if trace_memory:
+            traced, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        rss_loaded = _rss_mb()
+
+        # Per-call latency at full size
+        # Fresh contents for stores made after loading
+        extra = itertools.cycle([m["content"] for m in
+                                 StandardDataset("standard", seed + 1).iter_memories()])
+        store_ms = [_timed(memory.store, next(extra)) for _ in range(samples)]
+        recall_ms = []
+        hits = 0
+        for q in query_list:
+            t0 = time.perf_counter()
+            results = memory.recall(q["query"], limit=5)
+            recall_ms.append((time.perf_counter() - t0) * 1000)
+            hits += any(r.metadata.get("category") == q["expected_category"]
+                        for r in results)
+
+        # Multi-threaded throughput
+        n_ops = max(len(query_texts), threads * 50)
+        recall_ops = [lambda q=query_texts[i % len(query_texts)]: memory.recall(q, limit=5)
+                      for i in range(n_ops)]
+        mixed_ops = [
+            (lambda c=next(extra): memory.store(c)) if i % 10 == 0
+            else recall_ops[i]
+            for i in range(n_ops)
+        ]
+        throughput = {"recall": _throughput(recall_ops, threads),
+                      "mixed": _throughput(mixed_ops, threads)}
+
+        # Stages
+        texts = [next(extra) for _ in range(samples)]
+        probes = query_texts[:samples]
+        vectors = [embedder.embed(t) for t in probes]
+        t0 = time.perf_counter()
+        embedder.embed_batch(texts)
+        batch_ms = (time.perf_counter() - t0) * 1000
+        stages = {
+            "embed": {**percentiles([_timed(embedder.embed, t) for t in texts]),
+                      "batch_per_item_ms": round(batch_ms / len(texts), 4) if texts else 0.0},
+            "index": {"size": memory._vector_index.size(),
+                      **percentiles([_timed(memory._vector_index.search, v, 10)
+                                     for v in vectors])},
+            "storage": {},
+        }
+        for zone in config.zones:
+            storage = memory._orbit_mgr.get_storage(zone.zone_id)
+            count = storage.count()
+            if not count:
+                continue
+            stages["storage"][str(zone.zone_id)] = {
+                "items": count,
+                **percentiles([_timed(lambda q=q, v=v: storage.search(q, 10, query_embedding=v))
+                               for q, v in zip(probes, vectors)]),
+            }
+        stages["reorbit"] = percentiles([_timed(memory.reorbit) for _ in range(reorbits)])
+        stages["decay"] = percentiles([_timed(memory._apply_decay) for _ in range(reorbits)])
+
+        total = memory.stats().total_memories
+        return {
+            "dataset": ds.name,
+            "memories": total,
+            "queries": len(query_list),
+            "dim": dim,
+            "threads": threads,
+            "seed": seed,
+            "python": sys.version.split()[0],
+            "load": {
+                "memories": loaded,
+                "seconds": round(load_s, 3),
+                "per_s": round(loaded / load_s, 1) if load_s else 0.0,
+                "traced": trace_memory,
+            },
+            "latency": {
+                "store": percentiles(store_ms),
+                "recall": percentiles(recall_ms),
+                "recall_at_5": round(hits / len(query_list), 3) if query_list else 0.0,
+            },
+            "throughput": throughput,
+            "stages": stages,
+            "memory": {
+                "traced_mb": round(traced / (1024 * 1024), 2),
+                "traced_peak_mb": round(peak / (1024 * 1024), 2),
+                "bytes_per_memory": round(traced / loaded) if loaded else 0,
+                "rss_start_mb": round(rss_start, 1),
+                "rss_loaded_mb": round(rss_loaded, 1),
+                "rss_end_mb": round(_rss_mb(), 1),
+            },
+        }
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        memory.stop()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 
 from stellar_memory.config import StellarConfig
@@ -16,6 +17,8 @@ def main(argv: list[str] | None = None) -> None:
         description="Stellar Memory - AI memory management CLI",
     )
     parser.add_argument("--db", default="stellar_memory.db", help="Database path")
+    parser.add_argument("--config", default=None,
+                        help="JSON config file (overrides --db)")
     parser.add_argument("--namespace", "-n", default=None, help="Memory namespace")
 
     subparsers = parser.add_subparsers(dest="command")
@@ -56,6 +59,10 @@ def main(argv: list[str] | None = None) -> None:
     # health
     subparsers.add_parser("health", help="System health check")
 
+    # metrics
+    p_metrics = subparsers.add_parser("metrics", help="Show a running server's metrics")
+    p_metrics.add_argument("--url", default="http://localhost:9000/metrics")
+
     # logs
     p_logs = subparsers.add_parser("logs", help="Show event logs")
     p_logs.add_argument("--limit", "-l", type=int, default=20)
@@ -94,9 +101,18 @@ def main(argv: list[str] | None = None) -> None:
     # benchmark (P9)
     p_bench = subparsers.add_parser("benchmark", help="Run memory system benchmark")
     p_bench.add_argument("--queries", "-q", type=int, default=100)
-    p_bench.add_argument("--dataset", choices=["small", "standard", "large"],
-                         default="standard")
+    p_bench.add_argument("--dataset", default="standard",
+                         choices=["small", "standard", "large", "xlarge", "xxlarge"])
     p_bench.add_argument("--seed", type=int, default=42)
+    p_bench.add_argument("--scale", action="store_true",
+                         help="Scale run on a fresh in-memory store with synthetic "
+                              "embeddings (percentiles, throughput, memory)")
+    p_bench.add_argument("--threads", type=int, default=4,
+                         help="Worker threads for the --scale throughput runs")
+    p_bench.add_argument("--dim", type=int, default=128,
+                         help="Synthetic embedding dimension for --scale")
+    p_bench.add_argument("--output", "-o", default=None,
+                         help="Write the JSON report here (default: stdout)")
 
     # serve
     p_serve = subparsers.add_parser("serve", help="Start MCP server")
@@ -108,6 +124,8 @@ def main(argv: list[str] | None = None) -> None:
     p_serve_api.add_argument("--host", default="0.0.0.0")
     p_serve_api.add_argument("--port", type=int, default=9000)
     p_serve_api.add_argument("--reload", action="store_true", help="Enable auto-reload")
+    p_serve_api.add_argument("--workers", type=int, default=1,
+                             help="Worker processes (>1 shares state via the database)")
 
     # init-mcp (P8)
     p_init_mcp = subparsers.add_parser("init-mcp", help="Generate MCP configuration for AI IDEs")
@@ -163,7 +181,18 @@ def main(argv: list[str] | None = None) -> None:
         parser.print_help()
         return
 
-    config = StellarConfig(db_path=args.db)
+    if args.command == "metrics":
+        _print_metrics(args.url)
+        return
+
+    if args.command == "benchmark" and args.scale:
+        _run_scale_benchmark(args)
+        return
+
+    if args.config:
+        config = StellarConfig.from_json(args.config)
+    else:
+        config = StellarConfig(db_path=args.db)
     memory = StellarMemory(config, namespace=args.namespace)
 
     if args.command == "store":
@@ -228,6 +257,9 @@ def main(argv: list[str] | None = None) -> None:
         print(f"Graph edges: {h.graph_edges}")
         for zone_id, usage in sorted(h.zone_usage.items()):
             print(f"  Zone {zone_id}: {usage}")
+        for op, summary in h.latency.items():
+            print(f"  {op}: p50 {summary['p50_ms']}ms, p99 {summary['p99_ms']}ms "
+                  f"({summary['count']} calls)")
         if h.warnings:
             print("Warnings:")
             for w in h.warnings:
@@ -341,6 +373,8 @@ def main(argv: list[str] | None = None) -> None:
         print(f"Reorbit latency:    {report.avg_reorbit_latency_ms:.2f}ms")
         print(f"Total memories: {report.total_memories}")
         print(f"DB size: {report.db_size_mb:.2f}MB")
+        if args.output:
+            _write_json(report.to_dict(), args.output)
 
     elif args.command == "serve":
         try:
@@ -352,8 +386,25 @@ def main(argv: list[str] | None = None) -> None:
         run_server(config, namespace=args.namespace, transport=args.transport)
 
     elif args.command == "serve-api":
-        from stellar_memory.server import create_api_app
         import uvicorn
+        if args.workers > 1:
+            # Workers import the app themselves; hand them the full config
+            import tempfile
+            fd, config_path = tempfile.mkstemp(prefix="stellar-config-", suffix=".json")
+            os.close(fd)
+            config.to_json(config_path)
+            os.environ["STELLAR_CONFIG"] = config_path
+            os.environ["STELLAR_DB_PATH"] = config.db_path
+            os.environ["STELLAR_NAMESPACE"] = args.namespace or ""
+            os.environ["STELLAR_WORKERS"] = str(args.workers)
+            try:
+                uvicorn.run("stellar_memory.server:create_worker_app", factory=True,
+                            host=args.host, port=args.port, workers=args.workers,
+                            log_level="info")
+            finally:
+                os.remove(config_path)
+            return
+        from stellar_memory.server import create_api_app
         app, _ = create_api_app(config, namespace=args.namespace)
         uvicorn.run(app, host=args.host, port=args.port,
                     reload=args.reload, log_level="info")
@@ -496,6 +547,61 @@ def _run_onboard(args, config) -> None:
     memory.stop()
 
 
+def _write_json(data: dict, output: str | None) -> None:
+    text = json.dumps(data, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Report written to {output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+def _run_scale_benchmark(args) -> None:
+    """benchmark --scale: JSON report from scale_benchmark()."""
+    from stellar_memory.benchmark import scale_benchmark
+    report = scale_benchmark(dataset=args.dataset, queries=args.queries,
+                             threads=args.threads, dim=args.dim, seed=args.seed)
+    _write_json(report, args.output)
+
+
+def _print_metrics(url: str) -> None:
+    """Fetch a server's /metrics and print stage latencies and counters."""
+    import re
+    import urllib.request
+
+    request = urllib.request.Request(url)
+    if os.environ.get("STELLAR_API_KEY"):
+        request.add_header("X-API-Key", os.environ["STELLAR_API_KEY"])
+    try:
+        with urllib.request.urlopen(request, timeout=10) as resp:
+            text = resp.read().decode("utf-8")
+    except Exception as e:
+        print(f"Could not fetch {url}: {e}")
+        return
+    stages: dict[str, dict[str, str]] = {}
+    counters = []
+    for line in text.splitlines():
+        m = re.match(r'\w+_stage_seconds(_count)?\{op="(\w+)",stage="(\w+)"'
+                     r'(?:,quantile="([\d.]+)")?\} (\S+)', line)
+        if m:
+            is_count, op, stage, q, value = m.groups()
+            key = "count" if is_count else f"p{int(float(q) * 100)}" if q else None
+            if key:
+                stages.setdefault(f"{op}.{stage}", {})[key] = value
+        elif line and not line.startswith("#") and "_stage_seconds" not in line:
+            counters.append(line)
+    if not stages and not counters:
+        print("No metrics recorded (is metrics.enabled set on the server?)")
+        return
+    print(f"{'stage':<24} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'count':>8}")
+    for name, v in sorted(stages.items()):
+        p50, p90, p99 = (float(v.get(k, 0)) * 1000 for k in ("p50", "p90", "p99"))
+        print(f"{name:<24} {p50:>9.3f} {p90:>9.3f} {p99:>9.3f} {v.get('count', '0'):>8}")
+    for line in counters:
+        print(line)
+
+
 def _run_viz(args, config) -> None:
     """Generate and open memory visualization."""
     from stellar_memory.viz import MemoryVisualizer
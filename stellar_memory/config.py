@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
+import types
+import typing
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -47,6 +50,22 @@ class EmbedderConfig:
     batch_size: int = 32
     enabled: bool = True
     provider: str = "sentence-transformers"  # "sentence-transformers" | "openai" | "ollama"
+    # Dimension reduction applied to every embedding before storage/indexing
+    projection: str = "none"  # "none" | "truncate" | "pca"
+    projection_dim: int | None = None
+    pca_sample_size: int = 1000
+    rerank_full_dim: bool = False
+    rerank_top_k: int = 20
+    rerank_codec: str = "int8"  # codec of the full-dim vectors kept for rerank
+    # Query-embedding cache used by recall (0 disables)
+    query_cache_mb: float = 4.0
+
+    @property
+    def index_dimension(self) -> int:
+        """Dimension of stored/indexed vectors after projection."""
+        if self.projection != "none" and self.projection_dim:
+            return min(self.projection_dim, self.dimension)
+        return self.dimension
 
 
 @dataclass
@@ -129,6 +148,20 @@ class EventLoggerConfig:
     enabled: bool = True
     log_path: str = "stellar_events.jsonl"
     max_size_mb: float = 10.0
+    compress: bool = False  # gzip rotated segments
+    flush_interval: float = 1.0  # seconds an entry may sit in the write buffer
+
+
+@dataclass
+class EventBusConfig:
+    async_dispatch: bool = False  # True: handlers run on a worker thread
+    queue_size: int = 10_000  # full queue: emit runs the handlers itself
+    batch_size: int = 256  # events handled per worker wake-up
+
+
+@dataclass
+class MetricsConfig:
+    enabled: bool = False  # stage spans and storage counters (see metrics.py)
 
 
 @dataclass
@@ -138,12 +171,31 @@ class RecallConfig:
     graph_boost_depth: int = 1
 
 
+@dataclass
+class RecallCacheConfig:
+    enabled: bool = False
+    max_entries: int = 256
+    ttl_seconds: float = 30.0
+    max_pending_bumps: int = 1000  # flush deferred recall-stat bumps past this
+
+
+@dataclass
+class IngestConfig:
+    enabled: bool = False  # True: store() returns after a provisional write
+    workers: int = 2
+    queue_size: int = 1000
+    submit_timeout: float | None = None  # None: block until queue has room
+
+
 @dataclass
 class VectorIndexConfig:
     enabled: bool = True
     backend: str = "brute_force"  # "brute_force" | "ball_tree" | "faiss"
     rebuild_on_start: bool = True
     ball_tree_leaf_size: int = 40
+    quantization: str = "none"  # "none" | "int8" | "float16"
+    rescore: bool = True
+    rescore_factor: int = 4
 
 
 @dataclass
@@ -158,6 +210,20 @@ class SummarizationConfig:
 
 # P6 Config classes
 
+@dataclass
+class PgVectorIndexConfig:
+    method: str = "hnsw"  # "hnsw" | "ivfflat" | "none"
+    min_rows: int = 10_000  # build the ANN index once the table reaches this
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    ef_search: int = 40  # per query, raised to at least the result limit
+    ivf_lists: int | None = None  # None: rows / 1000 (sqrt(rows) past 1M)
+    ivf_probes: int = 10
+    iterative_scan: str = "relaxed_order"  # pgvector >= 0.8: "off" | "strict_order"
+    tenant_min_rows: int = 50_000  # per-user partial index threshold (0 disables)
+    maintenance: str = "background"  # "background" | "manual" (call ensure_indexes)
+
+
 @dataclass
 class StorageConfig:
     backend: str = "sqlite"  # "sqlite" | "postgresql" | "memory"
@@ -165,7 +231,18 @@ class StorageConfig:
     pool_size: int = 10
     redis_url: str | None = None
     redis_ttl: int = 300
-    redis_cached_zones: tuple = (0, 1)
+    redis_cached_zones: tuple | None = None  # None: every zone whose storage does I/O
+    l1_cache_items: int = 10_000  # in-process tier in front of Redis (0 disables)
+    cache_invalidation_channel: str = "sm:invalidate"
+    embedding_codec: str = "float32"  # "float32" | "float16" | "int8"
+    in_memory_layout: str = "dict"  # "dict" | "columnar" (zones 0-1)
+    shared_hot_zones: bool = False  # zones 0-1 in SQLite (WAL) so worker processes share them
+    change_poll_interval: float = 0.25  # seconds between cross-process change-feed polls
+    hot_zone_log: bool = False  # zones 0-1 survive restarts (op log + snapshots
+    # in <db>_hot/); restart is fastest with in_memory_layout="columnar"
+    hot_zone_sync: bool = True  # store/forget wait for the group-commit fsync
+    hot_zone_snapshot_ops: int = 50_000  # logged operations between snapshots
+    pg_index: PgVectorIndexConfig = field(default_factory=PgVectorIndexConfig)
 
 
 @dataclass
@@ -227,9 +304,25 @@ class ServerConfig:
     port: int = 9000
     api_key_env: str = "STELLAR_API_KEY"
     rate_limit: int = 60
+    workers: int = 1  # >1: shared hot zones, rate limits and change feed across processes
+    max_batch_size: int = 100  # items/queries per batch call; tiers may set their own
+    # "memory" (per process), "redis" (storage.redis_url) or "sqlite";
+    # workers > 1 switches "memory" to "sqlite" so limits stay global
+    rate_limit_backend: str = "memory"
+    rate_limit_max_keys: int = 100_000  # in-process limiter: tracked clients
     cors_origins: list[str] = field(default_factory=lambda: ["*"])
 
 
+@dataclass
+class ConcurrencyConfig:
+    # AsyncStellarMemory limits (REST / MCP servers)
+    max_workers: int = 8  # executor threads
+    store: int = 4
+    recall: int = 8
+    llm: int = 2  # stores/narration that may call an LLM
+    maintenance: int = 1  # reorbit, optimize, benchmark
+
+
 # P9 Config classes
 
 @dataclass
@@ -304,7 +397,11 @@ class StellarConfig:
     graph: GraphConfig = field(default_factory=GraphConfig)
     decay: DecayConfig = field(default_factory=DecayConfig)
     event_logger: EventLoggerConfig = field(default_factory=EventLoggerConfig)
+    event_bus: EventBusConfig = field(default_factory=EventBusConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
     recall_boost: RecallConfig = field(default_factory=RecallConfig)
+    recall_cache: RecallCacheConfig = field(default_factory=RecallCacheConfig)
+    ingest: IngestConfig = field(default_factory=IngestConfig)
     vector_index: VectorIndexConfig = field(default_factory=VectorIndexConfig)
     summarization: SummarizationConfig = field(default_factory=SummarizationConfig)
     graph_analytics: GraphAnalyticsConfig = field(default_factory=GraphAnalyticsConfig)
@@ -317,6 +414,7 @@ class StellarConfig:
     # P7 fields
     emotion: EmotionConfig = field(default_factory=EmotionConfig)
     server: ServerConfig = field(default_factory=ServerConfig)
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
     # P9 fields
     metacognition: MetacognitionConfig = field(default_factory=MetacognitionConfig)
     self_learning: SelfLearningConfig = field(default_factory=SelfLearningConfig)
@@ -328,23 +426,51 @@ class StellarConfig:
 
     @classmethod
     def from_json(cls, path: str | Path) -> StellarConfig:
-        """Load configuration from a JSON file."""
+        """Load configuration from a JSON file (any subset of :meth:`to_dict`)."""
         with open(path) as f:
-            data = json.load(f)
-        mf_data = data.get("memory_function", {})
-        mf = MemoryFunctionConfig(**mf_data)
-        zones = []
-        for z in data.get("zones", []):
-            imp_max = z.get("importance_max", float("inf"))
-            zones.append(ZoneConfig(
-                zone_id=z["zone_id"], name=z["name"],
-                max_slots=z.get("max_slots"),
-                importance_min=z["importance_min"],
-                importance_max=imp_max,
-            ))
-        return cls(
-            memory_function=mf,
-            zones=zones or list(DEFAULT_ZONES),
-            reorbit_interval=data.get("reorbit_interval", 300),
-            db_path=data.get("db_path", "stellar_memory.db"),
-        )
+            config = cls.from_dict(json.load(f))
+        if not config.zones:
+            config.zones = list(DEFAULT_ZONES)
+        return config
+
+    def to_json(self, path: str | Path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    def to_dict(self) -> dict:
+        """Every setting as plain data; :meth:`from_dict` restores it."""
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> StellarConfig:
+        """Build a config from nested dicts; missing keys keep their defaults."""
+        return _from_dict(cls, data)
+
+
+def _from_dict(cls, data: dict):
+    hints = typing.get_type_hints(cls)
+    kwargs = {}
+    for f in dataclasses.fields(cls):
+        if not f.init or f.name not in data:
+            continue
+        kwargs[f.name] = _coerce(hints[f.name], data[f.name])
+    return cls(**kwargs)
+
+
+def _coerce(hint, value):
+    """Turn JSON data back into the dataclasses/tuples ``hint`` names."""
+    if value is None:
+        return None
+    origin = typing.get_origin(hint)
+    if origin in (typing.Union, types.UnionType):
+        for arg in typing.get_args(hint):
+            if arg is not type(None):
+                return _coerce(arg, value)
+    if dataclasses.is_dataclass(hint) and isinstance(value, dict):
+        return _from_dict(hint, value)
+    if origin is list and isinstance(value, list):
+        (arg,) = typing.get_args(hint) or (None,)
+        return [_coerce(arg, v) for v in value] if arg is not None else value
+    if (hint is tuple or origin is tuple) and isinstance(value, list):
+        return tuple(value)
+    return value
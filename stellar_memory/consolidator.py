@@ -6,7 +6,7 @@ import time
 from typing import TYPE_CHECKING
 
 from stellar_memory.models import MemoryItem, ConsolidationResult
-from stellar_memory.utils import cosine_similarity
+from stellar_memory.utils import similarities
 
 if TYPE_CHECKING:
     from stellar_memory.config import ConsolidationConfig
@@ -22,12 +22,12 @@ class MemoryConsolidator:
         """Find the most similar existing item above threshold."""
         if new_item.embedding is None:
             return None
+        pool = [c for c in candidates
+                if c.embedding is not None and c.id != new_item.id]
         best_match = None
         best_score = 0.0
-        for candidate in candidates:
-            if candidate.embedding is None or candidate.id == new_item.id:
-                continue
-            score = cosine_similarity(new_item.embedding, candidate.embedding)
+        scores = similarities(new_item.embedding, [c.embedding for c in pool])
+        for candidate, score in zip(pool, scores):
             if score >= self._config.similarity_threshold and score > best_score:
                 best_score = score
                 best_match = candidate
@@ -59,14 +59,21 @@ class MemoryConsolidator:
         for i, item_a in enumerate(items):
             if item_a.id in merged_ids:
                 continue
-            for item_b in items[i + 1:]:
-                if item_b.id in merged_ids:
-                    continue
-                if (item_a.embedding is not None and item_b.embedding is not None
-                        and cosine_similarity(item_a.embedding, item_b.embedding)
-                        >= self._config.similarity_threshold):
+            rest = [b for b in items[i + 1:]
+                    if b.id not in merged_ids and b.embedding is not None]
+            if item_a.embedding is None or not rest:
+                result.skipped_count += 1
+                continue
+            scores = similarities(item_a.embedding, [b.embedding for b in rest])
+            for j, item_b in enumerate(rest):
+                if scores[j] >= self._config.similarity_threshold:
+                    before = item_a.embedding
                     self.merge(item_a, item_b)
                     merged_ids.add(item_b.id)
                     result.merged_count += 1
+                    if item_a.embedding is not before:
+                        # Merge re-embedded item_a: re-score the remainder
+                        scores[j + 1:] = similarities(
+                            item_a.embedding, [b.embedding for b in rest[j + 1:]])
             result.skipped_count += 1
         return result
@@ -31,6 +31,12 @@ def create_app(stellar_memory=None):
 
     app = FastAPI(title="Stellar Memory Dashboard", version="0.7.0")
 
+    broker = None
+    if stellar_memory is not None and hasattr(stellar_memory, "_event_bus"):
+        from stellar_memory.event_broker import EventBroker
+        broker = EventBroker()
+        broker.attach(stellar_memory._event_bus)
+
     @app.get("/", response_class=HTMLResponse)
     async def index():
         return _index_html()
@@ -51,25 +57,31 @@ def create_app(stellar_memory=None):
         }
 
     @app.get("/api/memories")
-    async def memories(zone: int | None = None, limit: int = 50):
+    async def memories(zone: int | None = None, limit: int = 50,
+                       cursor: str | None = None):
         if _stellar_ref is None:
-            return []
-        items = []
-        for z in _stellar_ref._zones.values():
-            if zone is not None and z.config.zone_id != zone:
-                continue
-            for item in z.get_all():
-                items.append({
-                    "id": item.id,
-                    "content": item.content[:200],
-                    "zone": item.zone,
-                    "score": round(item.total_score, 4),
-                    "recall_count": item.recall_count,
-                    "importance": item.arbitrary_importance,
-                })
-                if len(items) >= limit:
-                    break
-        return items
+            return {"items": [], "next_cursor": None}
+        from stellar_memory.storage import ListCursor
+        try:
+            after = ListCursor.decode(cursor) if cursor else None
+            rows, next_cursor = _stellar_ref._orbit_mgr.list_items(
+                zone=zone, after=after, limit=max(1, min(limit, 200)),
+                fields=["content", "zone", "total_score", "recall_count",
+                        "arbitrary_importance"],
+            )
+        except ValueError as exc:
+            return JSONResponse({"error": str(exc)}, status_code=400)
+        return {
+            "items": [{
+                "id": row["id"],
+                "content": row["content"][:200],
+                "zone": row["zone"],
+                "score": round(row["total_score"], 4),
+                "recall_count": row["recall_count"],
+                "importance": row["arbitrary_importance"],
+            } for row in rows],
+            "next_cursor": next_cursor.encode() if next_cursor else None,
+        }
 
     @app.get("/api/health")
     async def health():
@@ -105,33 +117,17 @@ def create_app(stellar_memory=None):
         import json as _json
 
         async def event_stream():
-            q: asyncio.Queue = asyncio.Queue()
-            # Register listener on event bus
-            if _stellar_ref and hasattr(_stellar_ref, '_event_bus'):
-                bus = _stellar_ref._event_bus
-
-                def _push(event_name, *args):
-                    data = {"event": event_name, "ts": time.time()}
-                    if args:
-                        try:
-                            data["detail"] = str(args[0])[:200]
-                        except Exception:
-                            pass
-                    try:
-                        q.put_nowait(data)
-                    except asyncio.QueueFull:
-                        pass
-
-                for evt in ("on_store", "on_recall", "on_forget",
-                            "on_reorbit", "on_decay"):
-                    bus.on(evt, lambda *a, en=evt: _push(en, *a))
-
-            while True:
-                try:
-                    data = await asyncio.wait_for(q.get(), timeout=15.0)
-                    yield f"data: {_json.dumps(data)}\n\n"
-                except asyncio.TimeoutError:
+            if broker is None:
+                while True:
+                    await asyncio.sleep(15.0)
                     yield f"data: {_json.dumps({'event': 'heartbeat', 'ts': time.time()})}\n\n"
+            # Bursts of the same event redraw the page once
+            client = broker.subscribe(coalesce=True)
+            async for batch in broker.stream(client, heartbeat=15.0):
+                if not batch:
+                    yield f"data: {_json.dumps({'event': 'heartbeat', 'ts': time.time()})}\n\n"
+                for data in batch:
+                    yield f"data: {_json.dumps(data)}\n\n"
 
         return StreamingResponse(
             event_stream(),
@@ -232,7 +228,7 @@ async function load(){
   const ms=await(await fetch('/api/memories?limit=30')).json();
   const md=document.getElementById('memories');
   md.innerHTML='';
-  for(const m of ms){
+  for(const m of ms.items||[]){
     md.innerHTML+='<div class="mem"><b>'+m.content+'</b><br><span class="score">zone='+
       m.zone+' score='+m.score+' recalls='+m.recall_count+'</span></div>';
   }
@@ -247,7 +243,7 @@ try{
     const el=document.getElementById('events');
     const div=document.createElement('div');
     div.className='evt';
-    div.textContent=new Date(d.ts*1000).toLocaleTimeString()+' '+d.event+(d.detail?' - '+d.detail:'');
+    div.textContent=new Date(d.ts*1000).toLocaleTimeString()+' '+d.event+(d.count>1?' x'+d.count:'')+(d.id?' - '+d.id:'');
     el.prepend(div);
     while(el.children.length>50)el.removeChild(el.lastChild);
     load();
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
+import threading
+from array import array
+from collections import OrderedDict
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from stellar_memory.config import EmbedderConfig
@@ -56,6 +59,115 @@ class NullEmbedder:
         return [None] * len(texts)
 
 
+class QueryEmbeddingCache:
+    """Memory-bounded LRU cache for query embeddings.
+
+    Separate from content embeddings: keys are case- and
+    whitespace-normalized query text, so near-identical agent queries
+    share one vector (the first one embedded). Vectors are held as
+    ``array('d')`` and the total footprint is capped at ``max_bytes``.
+    Works in front of any provider, which matters most for HTTP ones.
+    """
+
+    _ENTRY_OVERHEAD = 200  # dict slot, key object, array header (approx.)
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, array] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def normalize_key(text: str) -> str:
+        return " ".join(text.split()).casefold()
+
+    def _cost(self, key: str, vector: array) -> int:
+        return len(key) + vector.itemsize * len(vector) + self._ENTRY_OVERHEAD
+
+    def get_or_embed(self, text: str,
+                     embed: Callable[[str], list[float] | None]) -> list[float] | None:
+        key = self.normalize_key(text)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached.tolist()
+            self.misses += 1
+        vector = embed(text)
+        if vector is not None:
+            self._put(key, array("d", vector))
+        return vector
+
+    def get_or_embed_many(
+        self, texts: list[str],
+        embed_batch: Callable[[list[str]], list[list[float] | None]],
+    ) -> list[list[float] | None]:
+        """Like :meth:`get_or_embed` for many texts; misses share one batch."""
+        results: list[list[float] | None] = [None] * len(texts)
+        missing: dict[str, list[int]] = {}
+        with self._lock:
+            for i, text in enumerate(texts):
+                key = self.normalize_key(text)
+                cached = self._entries.get(key)
+                if cached is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    results[i] = cached.tolist()
+                elif key in missing:
+                    self.hits += 1
+                    missing[key].append(i)
+                else:
+                    self.misses += 1
+                    missing[key] = [i]
+        if missing:
+            keys = list(missing)
+            vectors = embed_batch([texts[missing[k][0]] for k in keys])
+            for key, vector in zip(keys, vectors):
+                if vector is None:
+                    continue
+                self._put(key, array("d", vector))
+                for i in missing[key]:
+                    results[i] = list(vector)
+        return results
+
+    def _put(self, key: str, vector: array) -> None:
+        cost = self._cost(key, vector)
+        if cost > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= self._cost(key, old)
+            self._entries[key] = vector
+            self._bytes += cost
+            while self._bytes > self._max_bytes:
+                k, v = self._entries.popitem(last=False)
+                self._bytes -= self._cost(k, v)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
 def create_embedder(config: EmbedderConfig | None = None) -> Embedder | NullEmbedder:
     """Create an embedder with graceful degradation."""
     from stellar_memory.config import EmbedderConfig as _EC
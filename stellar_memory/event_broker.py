@@ -0,0 +1,185 @@
+"""Fan-out of memory events to streaming clients (SSE).
+
+:class:`EventBroker` registers one handler per event on the
+:class:`~stellar_memory.event_bus.EventBus`, however many clients are
+connected. The handler only appends a small record to a shared buffer
+and, at most once per batch, wakes the asyncio loop; distribution to the
+per-client queues happens there. Emitting an event on the store or
+recall path is therefore O(1) in the number of viewers, and free when
+nobody is watching.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+from stellar_memory.event_bus import EventBus
+
+# Events streamed to clients
+STREAM_EVENTS = ("on_store", "on_recall", "on_forget", "on_reorbit",
+                 "on_decay", "on_remote_change")
+
+
+def _describe(event: str, args: tuple) -> dict:
+    """JSON-ready summary of an event: ids and owner only, never content.
+
+    ``user_id`` is set when the event belongs to one user; records without
+    it are only delivered to unscoped clients (see :meth:`BrokerClient.wants`).
+    """
+    record: dict = {"event": event, "ts": time.time()}
+    try:
+        if event == "on_store":
+            item = args[0]
+            record.update(id=item.id, zone=item.zone, user_id=item.user_id)
+        elif event == "on_recall":
+            owners = {item.user_id for item in args[0]}
+            record["results"] = len(args[0])
+            if len(owners) == 1:
+                record["user_id"] = owners.pop()
+        elif event == "on_forget":
+            record["id"] = args[0]
+        elif event == "on_remote_change":
+            kind, item_id, user_id = args
+            record.update(kind=kind, id=item_id, user_id=user_id)
+    except Exception:
+        pass
+    return record
+
+
+class BrokerClient:
+    """One connected viewer: a bounded queue that drops its oldest entries.
+
+    ``events`` limits the event names delivered; with ``user_id`` set,
+    only events owned by that user are delivered. With ``coalesce``,
+    consecutive events of the same name merge into one carrying a
+    ``count``.
+    """
+
+    def __init__(self, events: set[str] | None = None,
+                 user_id: str | None = None, coalesce: bool = False,
+                 max_queue: int = 256):
+        self.events = events
+        self.user_id = user_id
+        self.coalesce = coalesce
+        self._queue: deque[dict] = deque(maxlen=max_queue)
+        self._ready = asyncio.Event()
+        self.delivered = 0
+        self.dropped = 0
+
+    def wants(self, record: dict) -> bool:
+        if self.events is not None and record["event"] not in self.events:
+            return False
+        return self.user_id is None or record.get("user_id") == self.user_id
+
+    def offer(self, record: dict) -> None:
+        """Queue ``record`` (loop thread only)."""
+        queue = self._queue
+        if self.coalesce and queue and queue[-1]["event"] == record["event"]:
+            last = queue[-1]
+            queue[-1] = {**record, "count": last.get("count", 1) + record.get("count", 1)}
+        else:
+            if len(queue) == queue.maxlen:
+                self.dropped += 1
+            queue.append(record)
+        self._ready.set()
+
+    async def get(self, timeout: float | None = None) -> list[dict]:
+        """Everything queued, waiting up to ``timeout``; [] on timeout."""
+        if not self._queue:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        self._ready.clear()
+        batch = list(self._queue)
+        self._queue.clear()
+        self.delivered += len(batch)
+        return batch
+
+
+class EventBroker:
+    """Single bus subscriber that fans events out to :class:`BrokerClient` s."""
+
+    def __init__(self, max_pending: int = 10_000, max_queue: int = 256):
+        self._max_queue = max_queue
+        self._clients: set[BrokerClient] = set()
+        self._pending: deque[dict] = deque(maxlen=max_pending)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake_scheduled = False
+        self._lock = threading.Lock()
+        self._bus: EventBus | None = None
+        self._handlers: list[tuple[str, object]] = []
+        self.published = 0
+
+    def attach(self, bus: EventBus) -> None:
+        if self._bus is not None:
+            return
+        self._bus = bus
+        for event in STREAM_EVENTS:
+            handler = (lambda *args, _event=event: self._publish(_event, args))
+            bus.on(event, handler)
+            self._handlers.append((event, handler))
+
+    def detach(self) -> None:
+        if self._bus is not None:
+            for event, handler in self._handlers:
+                self._bus.off(event, handler)
+        self._bus = None
+        self._handlers.clear()
+
+    def _publish(self, event: str, args: tuple) -> None:
+        # Runs on whichever thread emitted; must stay O(1)
+        if not self._clients:
+            return
+        self._pending.append(_describe(event, args))
+        self.published += 1
+        if not self._wake_scheduled and self._loop is not None:
+            self._wake_scheduled = True
+            try:
+                self._loop.call_soon_threadsafe(self._dispatch)
+            except RuntimeError:  # loop closed
+                self._wake_scheduled = False
+
+    def _dispatch(self) -> None:
+        self._wake_scheduled = False  # before draining: later appends re-wake
+        pending = self._pending
+        clients = list(self._clients)
+        while pending:
+            record = pending.popleft()
+            for client in clients:
+                if client.wants(record):
+                    client.offer(record)
+
+    def subscribe(self, events: set[str] | None = None, user_id: str | None = None,
+                  coalesce: bool = False) -> BrokerClient:
+        """Register a client; call from the event loop that will read it."""
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            client = BrokerClient(events, user_id, coalesce, self._max_queue)
+            self._clients = self._clients | {client}  # copy-on-write for _publish
+        return client
+
+    def unsubscribe(self, client: BrokerClient) -> None:
+        with self._lock:
+            self._clients = self._clients - {client}
+
+    async def stream(self, client: BrokerClient, heartbeat: float = 15.0):
+        """Yield batches for ``client`` ([] as a heartbeat); detaches on exit."""
+        try:
+            while True:
+                yield await client.get(timeout=heartbeat)
+        finally:
+            self.unsubscribe(client)
+
+    def stats(self) -> dict:
+        clients = list(self._clients)
+        return {
+            "clients": len(clients),
+            "published": self.published,
+            "pending": len(self._pending),
+            "delivered": sum(c.delivered for c in clients),
+            "dropped": sum(c.dropped for c in clients),
+        }
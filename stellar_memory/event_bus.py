@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
+import time
 from collections import defaultdict
 from typing import Callable, Any
 
@@ -10,9 +13,58 @@ logger = logging.getLogger(__name__)
 
 EventHandler = Callable[..., None]
 
+_STOP = object()
+
+
+class _Handler:
+    """A registered handler with its latency and error counters."""
+
+    __slots__ = ("fn", "event", "sync", "calls", "errors", "total_time", "max_time")
+
+    def __init__(self, fn: EventHandler, event: str, sync: bool):
+        self.fn = fn
+        self.event = event
+        self.sync = sync
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def run(self, args: tuple, kwargs: dict) -> None:
+        start = time.perf_counter()
+        try:
+            self.fn(*args, **kwargs)
+        except Exception:
+            self.errors += 1
+            logger.exception(f"Error in event handler for {self.event}")
+        elapsed = time.perf_counter() - start
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+
+    def stats(self) -> dict:
+        fn = self.fn
+        name = f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', repr(fn))}"
+        return {
+            "event": self.event, "handler": name, "sync": self.sync,
+            "calls": self.calls, "errors": self.errors,
+            "avg_ms": round(self.total_time / self.calls * 1000, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_time * 1000, 3),
+        }
+
 
 class EventBus:
-    """Publish-subscribe event system for memory lifecycle events."""
+    """Publish-subscribe event system for memory lifecycle events.
+
+    By default handlers run inline in :meth:`emit`. With ``async_dispatch``
+    they run on a worker thread instead, fed by a bounded queue that the
+    worker drains up to ``batch_size`` events at a time, so a slow handler
+    cannot add latency to store or recall. Handlers registered with
+    ``sync=True`` (cache invalidation and the like) still run inline. When
+    the queue is full, ``emit`` runs the handlers itself rather than drop
+    the event.
+    """
 
     EVENTS = (
         "on_store",
@@ -25,33 +77,140 @@ class EventBus:
         "on_auto_forget",
         "on_summarize",
         "on_adaptive_decay",
+        "on_ingest_stage",
+        "on_ingest_complete",
+        "on_ingest_error",
+        "on_remote_change",  # (kind, item_id, user_id) from another process
+        "on_remove",  # (item) row gone for good: forget, auto-forget, eviction
     )
 
-    def __init__(self):
-        self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
+    def __init__(self, async_dispatch: bool = False, queue_size: int = 10_000,
+                 batch_size: int = 256):
+        self._handlers: dict[str, list[_Handler]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._async = async_dispatch
+        self._batch_size = max(1, batch_size)
+        self._queue: queue.Queue | None = (
+            queue.Queue(maxsize=queue_size) if async_dispatch else None)
+        self._worker: threading.Thread | None = None
+        self.overflows = 0
 
-    def on(self, event: str, handler: EventHandler) -> None:
-        """Register a handler for an event."""
+    def on(self, event: str, handler: EventHandler, sync: bool = False) -> None:
+        """Register a handler for an event.
+
+        ``sync=True`` keeps the handler inline even in async dispatch mode,
+        for handlers whose effect must be visible when ``emit`` returns.
+        """
         if event not in self.EVENTS:
             raise ValueError(f"Unknown event: {event}. Valid: {self.EVENTS}")
-        self._handlers[event].append(handler)
+        with self._lock:
+            # Copy-on-write: emit iterates without taking the lock
+            self._handlers[event] = [*self._handlers[event], _Handler(handler, event, sync)]
 
     def off(self, event: str, handler: EventHandler) -> None:
         """Remove a handler for an event."""
-        if handler in self._handlers[event]:
-            self._handlers[event].remove(handler)
+        with self._lock:
+            handlers = self._handlers[event]
+            for i, h in enumerate(handlers):
+                if h.fn == handler:
+                    self._handlers[event] = handlers[:i] + handlers[i + 1:]
+                    return
 
     def emit(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Emit an event, calling all registered handlers."""
-        for handler in self._handlers.get(event, []):
-            try:
-                handler(*args, **kwargs)
-            except Exception:
-                logger.exception(f"Error in event handler for {event}")
+        handlers = self._handlers.get(event)
+        if not handlers:
+            return
+        if not self._async:
+            for h in handlers:
+                h.run(args, kwargs)
+            return
+        deferred = False
+        for h in handlers:
+            if h.sync:
+                h.run(args, kwargs)
+            else:
+                deferred = True
+        if deferred:
+            self._enqueue((event, args, kwargs))
+
+    def _enqueue(self, entry: tuple) -> None:
+        if self._worker is None:
+            self._start()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.overflows += 1
+            self._dispatch(entry)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="stellar-events", daemon=True)
+                self._worker.start()
+
+    def _dispatch(self, entry: tuple) -> None:
+        event, args, kwargs = entry
+        for h in self._handlers.get(event, ()):
+            if not h.sync:
+                h.run(args, kwargs)
+
+    def _run(self) -> None:
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            for entry in batch:
+                if entry is _STOP:
+                    return
+                if isinstance(entry, threading.Event):  # flush() marker
+                    entry.set()
+                else:
+                    self._dispatch(entry)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until events emitted so far have been handled."""
+        if self._worker is None:
+            return True
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Handle queued events and stop the worker thread."""
+        worker = self._worker
+        if worker is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Event queue still full at close; pending events dropped")
+            return
+        worker.join(timeout)
+        self._worker = None
+
+    def stats(self) -> dict:
+        """Dispatch mode, queue depth and per-handler counters."""
+        return {
+            "async": self._async,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "overflows": self.overflows,
+            "handlers": [h.stats() for handlers in list(self._handlers.values())
+                         for h in handlers],
+        }
 
     def clear(self, event: str | None = None) -> None:
         """Clear handlers for a specific event or all events."""
-        if event:
-            self._handlers[event].clear()
-        else:
-            self._handlers.clear()
+        with self._lock:
+            if event:
+                self._handlers[event] = []
+            else:
+                self._handlers.clear()
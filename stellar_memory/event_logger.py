@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 from pathlib import Path
 
 from stellar_memory.event_bus import EventBus
+from stellar_memory.jsonl_writer import JsonlWriter
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +16,11 @@ class EventLogger:
     """Logs memory events to a JSONL file."""
 
     def __init__(self, log_path: str = "stellar_events.jsonl",
-                 max_size_mb: float = 10.0):
+                 max_size_mb: float = 10.0, compress: bool = False,
+                 flush_interval: float = 1.0):
         self._log_path = Path(log_path)
-        self._max_size = int(max_size_mb * 1024 * 1024)
-        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = JsonlWriter(log_path, max_size_mb, compress=compress,
+                                   flush_interval=flush_interval)
 
     def attach(self, bus: EventBus) -> None:
         """Register handlers for all events on the bus."""
@@ -36,33 +37,17 @@ class EventLogger:
                item_id=item.id, from_zone=fz, to_zone=tz))
 
     def _log(self, event_type: str, **kwargs) -> None:
-        """Write a single event line to the log file."""
-        self._rotate_if_needed()
-        entry = {
+        """Buffer a single event line for the log file."""
+        self._writer.write({
             "timestamp": time.time(),
             "event": event_type,
             **kwargs,
-        }
-        with open(self._log_path, "a") as f:
-            f.write(json.dumps(entry) + "\n")
-
-    def _rotate_if_needed(self) -> None:
-        """Rotate log file if it exceeds max size."""
-        if not self._log_path.exists():
-            return
-        if self._log_path.stat().st_size >= self._max_size:
-            rotated = self._log_path.with_suffix(".jsonl.1")
-            if rotated.exists():
-                rotated.unlink()
-            self._log_path.rename(rotated)
+        })
 
     def read_logs(self, limit: int = 100) -> list[dict]:
         """Read recent log entries."""
-        if not self._log_path.exists():
-            return []
-        lines = self._log_path.read_text().strip().split("\n")
-        entries = []
-        for line in lines[-limit:]:
-            if line:
-                entries.append(json.loads(line))
-        return entries
+        return self._writer.tail(limit)
+
+    def close(self) -> None:
+        """Write buffered entries and close the file."""
+        self._writer.close()
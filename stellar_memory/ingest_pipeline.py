@@ -0,0 +1,146 @@
+"""Background ingestion pipeline: bounded queue + worker pool."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Any
+
+logger = logging.getLogger(__name__)
+
+_MAX_RESULTS = 10_000
+
+
+class IngestPipeline:
+    """Runs submitted ingest jobs on a fixed pool of worker threads.
+
+    ``submit`` blocks when the queue is full (backpressure) and raises
+    ``RuntimeError`` if ``submit_timeout`` elapses first. Each job's return
+    value is kept (bounded) so callers can ``wait_for`` a specific id;
+    ``flush`` waits for everything submitted so far.
+    """
+
+    def __init__(self, workers: int = 2, queue_size: int = 1000,
+                 submit_timeout: float | None = None,
+                 on_error: Callable[[str, Exception], None] | None = None):
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._submit_timeout = submit_timeout
+        self._on_error = on_error
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pending: dict[str, threading.Event] = {}
+        self._results: OrderedDict[str, Any] = OrderedDict()
+        self._stopped = False
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"stellar-ingest-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def in_worker(self) -> bool:
+        """True when called from one of this pipeline's worker threads."""
+        return getattr(self._local, "active", False)
+
+    def submit(self, job_id: str, job: Callable[[], Any]) -> None:
+        done = threading.Event()
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Ingest pipeline is stopped")
+            self._pending[job_id] = done
+            self.submitted += 1
+        try:
+            self._queue.put((job_id, job), timeout=self._submit_timeout)
+        except queue.Full:
+            with self._lock:
+                self._pending.pop(job_id, None)
+                self.submitted -= 1
+            raise RuntimeError(
+                f"Ingest queue full ({self._queue.maxsize} pending jobs)"
+            )
+
+    def _worker(self) -> None:
+        self._local.active = True
+        while True:
+            task = self._queue.get()
+            if task is None:
+                self._queue.task_done()
+                return
+            job_id, job = task
+            result = None
+            try:
+                result = job()
+                with self._lock:
+                    self.completed += 1
+            except Exception as exc:
+                with self._lock:
+                    self.failed += 1
+                logger.exception("Ingest job %s failed", job_id)
+                if self._on_error is not None:
+                    try:
+                        self._on_error(job_id, exc)
+                    except Exception:
+                        logger.exception("Error in ingest error handler")
+            finally:
+                with self._lock:
+                    self._results[job_id] = result
+                    while len(self._results) > _MAX_RESULTS:
+                        self._results.popitem(last=False)
+                    done = self._pending.pop(job_id, None)
+                if done is not None:
+                    done.set()
+                self._queue.task_done()
+
+    def wait_for(self, job_id: str, timeout: float | None = None) -> Any:
+        """Block until ``job_id`` finishes; return its result (None if unknown)."""
+        with self._lock:
+            done = self._pending.get(job_id)
+        if done is not None and not done.wait(timeout):
+            raise TimeoutError(f"Ingest of {job_id} still pending")
+        with self._lock:
+            return self._results.get(job_id)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for all jobs submitted so far. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            waiting = list(self._pending.values())
+        for done in waiting:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not done.wait(remaining):
+                return False
+        return True
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "queued": self._queue.qsize(),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "workers": len(self._threads),
+            }
+
+    def stop(self, wait: bool = True, timeout: float | None = None) -> None:
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        if wait:
+            self.flush(timeout)
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join(timeout)
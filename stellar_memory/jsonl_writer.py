@@ -0,0 +1,188 @@
+"""Buffered JSONL log files shared by the event logger and security audit.
+
+:class:`JsonlWriter` keeps the file open and appends entries in batches:
+a batch is written once ``flush_bytes`` have accumulated, when it would
+take the file past ``max_size_mb`` (so rotation happens on time), or
+``flush_interval`` seconds after the first unwritten entry. Full files
+are rotated to ``<name>.1`` … ``<name>.<backups>``, optionally gzipped.
+
+:func:`tail_jsonl` reads the last entries by seeking backwards from the
+end of the file, so its cost depends on the entries asked for, not on
+the size of the log.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+import weakref
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_TAIL_BLOCK = 8192
+
+_open_writers: weakref.WeakSet[JsonlWriter] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for writer in list(_open_writers):
+        writer.close()
+
+
+def tail_jsonl(path: str | Path, limit: int) -> list[dict]:
+    """The last ``limit`` entries of a JSONL file, oldest first.
+
+    Lines that are not valid JSON (e.g. a torn final write) are skipped.
+    """
+    path = Path(path)
+    if limit <= 0 or not path.exists():
+        return []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        # One extra line: the first one found may be partial
+        while pos > 0 and data.count(b"\n") <= limit:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.split(b"\n")
+    if pos > 0:
+        lines = lines[1:]
+    entries = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue
+    return entries[-limit:]
+
+
+class JsonlWriter:
+    """Append-only JSONL file with buffered writes and size-based rotation."""
+
+    def __init__(self, path: str | Path, max_size_mb: float | None = None,
+                 backups: int = 1, compress: bool = False,
+                 flush_bytes: int = 64 * 1024, flush_interval: float = 1.0):
+        self._path = Path(path)
+        self._max_size = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        self._backups = max(1, backups)
+        self._compress = compress
+        self._flush_bytes = flush_bytes
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._timer: threading.Timer | None = None
+        self.flushes = 0
+        self.rotations = 0
+        _open_writers.add(self)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def write(self, entry: dict) -> None:
+        line = (json.dumps(entry) + "\n").encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            if (self._pending_bytes >= self._flush_bytes
+                    or (self._max_size is not None
+                        and self._size + self._pending_bytes > self._max_size)):
+                self._flush_locked()
+            elif self._timer is None and self._flush_interval > 0:
+                self._timer = threading.Timer(self._flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def tail(self, limit: int) -> list[dict]:
+        """The last ``limit`` entries, including ones not written yet."""
+        self.flush()
+        return tail_jsonl(self._path, limit)
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._path, "ab")
+        self._size = self._file.tell()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        if self._file is None:
+            self._open()
+        lines, self._pending, self._pending_bytes = self._pending, [], 0
+        chunk: list[bytes] = []
+        chunk_bytes = 0
+        for line in lines:
+            if (self._max_size is not None and self._size + chunk_bytes >= self._max_size
+                    and self._size + chunk_bytes > 0):
+                self._write(chunk, chunk_bytes)
+                chunk, chunk_bytes = [], 0
+                self._rotate()
+            chunk.append(line)
+            chunk_bytes += len(line)
+        self._write(chunk, chunk_bytes)
+        self.flushes += 1
+
+    def _write(self, chunk: list[bytes], size: int) -> None:
+        if not chunk:
+            return
+        self._file.write(b"".join(chunk))
+        self._file.flush()
+        self._size += size
+
+    def _segment(self, n: int) -> Path:
+        suffix = f".{n}.gz" if self._compress else f".{n}"
+        return self._path.with_name(self._path.name + suffix)
+
+    def _rotate(self) -> None:
+        self._file.close()
+        oldest = self._segment(self._backups)
+        if oldest.exists():
+            oldest.unlink()
+        for n in range(self._backups - 1, 0, -1):
+            if self._segment(n).exists():
+                self._segment(n).rename(self._segment(n + 1))
+        if self._compress:
+            with open(self._path, "rb") as src, gzip.open(self._segment(1), "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            self._path.unlink()
+        else:
+            self._path.rename(self._segment(1))
+        self.rotations += 1
+        self._open()
+
+    def stats(self) -> dict:
+        return {"path": str(self._path), "size": self._size,
+                "pending": len(self._pending), "flushes": self.flushes,
+                "rotations": self.rotations}
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 
+from stellar_memory.async_memory import AsyncStellarMemory
 from stellar_memory.config import StellarConfig
 from stellar_memory.stellar import StellarMemory
 
@@ -18,10 +19,11 @@ def create_mcp_server(config: StellarConfig | None = None,
 
     mcp = FastMCP("stellar-memory")
     memory = StellarMemory(config or StellarConfig(), namespace=namespace)
+    amemory = AsyncStellarMemory(memory, memory.config.concurrency)
 
     @mcp.tool()
-    def memory_store(content: str, importance: float = 0.5,
-                     metadata_json: str = "{}") -> str:
+    async def memory_store(content: str, importance: float = 0.5,
+                           metadata_json: str = "{}") -> str:
         """Store a new memory. Returns the memory ID.
 
         Args:
@@ -30,8 +32,8 @@ def create_mcp_server(config: StellarConfig | None = None,
             metadata_json: Optional JSON string of metadata
         """
         metadata = json.loads(metadata_json) if metadata_json else {}
-        item = memory.store(content, importance=importance,
-                           metadata=metadata, auto_evaluate=True)
+        item = await amemory.store(content, importance=importance,
+                                   metadata=metadata, auto_evaluate=True)
         return json.dumps({
             "id": item.id,
             "zone": item.zone,
@@ -39,7 +41,7 @@ def create_mcp_server(config: StellarConfig | None = None,
         })
 
     @mcp.tool()
-    def memory_recall(query: str, limit: int = 5) -> str:
+    async def memory_recall(query: str, limit: int = 5) -> str:
         """Search memories by query. Returns matching memories.
 
         Args:
@@ -47,7 +49,7 @@ def create_mcp_server(config: StellarConfig | None = None,
             limit: Maximum number of results (1-20)
         """
         limit = max(1, min(20, limit))
-        results = memory.recall(query, limit=limit)
+        results = await amemory.recall(query, limit=limit)
         return json.dumps([{
             "id": item.id,
             "content": item.content,
@@ -57,13 +59,13 @@ def create_mcp_server(config: StellarConfig | None = None,
         } for item in results])
 
     @mcp.tool()
-    def memory_get(memory_id: str) -> str:
+    async def memory_get(memory_id: str) -> str:
         """Get a specific memory by ID.
 
         Args:
             memory_id: The UUID of the memory to retrieve
         """
-        item = memory.get(memory_id)
+        item = await amemory.get(memory_id)
         if item is None:
             return json.dumps({"error": "Memory not found"})
         return json.dumps({
@@ -77,13 +79,13 @@ def create_mcp_server(config: StellarConfig | None = None,
         })
 
     @mcp.tool()
-    def memory_forget(memory_id: str) -> str:
+    async def memory_forget(memory_id: str) -> str:
         """Delete a specific memory by ID.
 
         Args:
             memory_id: The UUID of the memory to delete
         """
-        removed = memory.forget(memory_id)
+        removed = await amemory.forget(memory_id)
         return json.dumps({"removed": removed})
 
     @mcp.tool()
@@ -231,7 +233,7 @@ def create_mcp_server(config: StellarConfig | None = None,
     # --- P9 Tools ---
 
     @mcp.tool()
-    def memory_introspect(topic: str, depth: int = 1) -> str:
+    async def memory_introspect(topic: str, depth: int = 1) -> str:
         """Analyze knowledge state for a given topic.
 
         Args:
@@ -239,7 +241,7 @@ def create_mcp_server(config: StellarConfig | None = None,
             depth: Graph traversal depth for gap detection (1-3)
         """
         depth = max(1, min(3, depth))
-        result = memory.introspect(topic, depth=depth)
+        result = await amemory.run("recall", memory.introspect, topic, depth=depth)
         return json.dumps({
             "topic": result.topic,
             "confidence": result.confidence,
@@ -251,8 +253,8 @@ def create_mcp_server(config: StellarConfig | None = None,
         })
 
     @mcp.tool()
-    def memory_recall_confident(query: str, limit: int = 5,
-                                threshold: float = 0.0) -> str:
+    async def memory_recall_confident(query: str, limit: int = 5,
+                                      threshold: float = 0.0) -> str:
         """Search memories with confidence scoring.
 
         Args:
@@ -261,7 +263,8 @@ def create_mcp_server(config: StellarConfig | None = None,
             threshold: Minimum confidence score (0.0-1.0)
         """
         limit = max(1, min(20, limit))
-        result = memory.recall_with_confidence(query, top_k=limit)
+        result = await amemory.run("recall", memory.recall_with_confidence,
+                                   query, top_k=limit)
         if threshold > 0 and result.confidence < threshold:
             return json.dumps({
                 "confidence": result.confidence,
@@ -282,14 +285,15 @@ def create_mcp_server(config: StellarConfig | None = None,
         })
 
     @mcp.tool()
-    def memory_optimize(min_logs: int = 0) -> str:
+    async def memory_optimize(min_logs: int = 0) -> str:
         """Optimize memory function weights from recall patterns.
 
         Args:
             min_logs: Minimum number of recall logs required (0 = use default)
         """
         try:
-            report = memory.optimize(min_logs=min_logs if min_logs > 0 else None)
+            report = await amemory.run("maintenance", memory.optimize,
+                                       min_logs=min_logs if min_logs > 0 else None)
             return json.dumps({
                 "before_weights": report.before_weights,
                 "after_weights": report.after_weights,
@@ -302,7 +306,7 @@ def create_mcp_server(config: StellarConfig | None = None,
             return json.dumps({"error": str(e)})
 
     @mcp.tool()
-    def memory_reason(query: str, max_sources: int = 5) -> str:
+    async def memory_reason(query: str, max_sources: int = 5) -> str:
         """Derive insights by reasoning over related memories.
 
         Args:
@@ -310,7 +314,8 @@ def create_mcp_server(config: StellarConfig | None = None,
             max_sources: Maximum number of source memories to use
         """
         max_sources = max(1, min(20, max_sources))
-        result = memory.reason(query, max_sources=max_sources)
+        result = await amemory.run("llm", memory.reason, query,
+                                   max_sources=max_sources)
         return json.dumps({
             "query": result.query,
             "insights": result.insights,
@@ -321,8 +326,8 @@ def create_mcp_server(config: StellarConfig | None = None,
         })
 
     @mcp.tool()
-    def memory_benchmark(queries: int = 100, dataset: str = "standard",
-                         seed: int = 42) -> str:
+    async def memory_benchmark(queries: int = 100, dataset: str = "standard",
+                               seed: int = 42) -> str:
         """Run comprehensive memory system benchmark.
 
         Args:
@@ -332,7 +337,8 @@ def create_mcp_server(config: StellarConfig | None = None,
         """
         if dataset not in ("small", "standard", "large"):
             dataset = "standard"
-        report = memory.benchmark(queries=queries, dataset=dataset, seed=seed)
+        report = await amemory.run("maintenance", memory.benchmark,
+                                   queries=queries, dataset=dataset, seed=seed)
         return json.dumps(report.to_dict())
 
     # --- Smart Onboarding Tools (v2.1.0) ---
@@ -0,0 +1,232 @@
+"""Stage timings and counters for store, recall and reorbit.
+
+Code marks stages with ``with metrics.span("recall.search"):``; each span
+name ``<op>.<stage>`` gets a latency :class:`Histogram`. Counters such as
+``storage_queries`` are bumped with :meth:`Metrics.inc`.
+
+Instrumentation goes through the process-wide registry returned by
+:func:`get_metrics`. It is a :class:`NullMetrics` until :func:`enable` is
+called (``metrics.enabled`` in the config does this), so instrumented code
+costs one no-op call per span when metrics are off.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+_SUB_BITS = 4  # 16 linear sub-buckets per power of two: <= 6.25% error
+_SUB = 1 << _SUB_BITS
+_BUCKETS = (40 - _SUB_BITS) * _SUB + 2 * _SUB  # values up to 2**40 us (~12 days)
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _bucket(us: int) -> int:
+    shift = us.bit_length() - _SUB_BITS - 1
+    if shift <= 0:
+        return us
+    return min((shift << _SUB_BITS) + (us >> shift), _BUCKETS - 1)
+
+
+def _bucket_floor(index: int) -> int:
+    shift = (index >> _SUB_BITS) - 1
+    if shift <= 0:
+        return index
+    return (index - (shift << _SUB_BITS)) << shift
+
+
+class Histogram:
+    """Latency histogram with log-linear buckets, in the style of HdrHistogram.
+
+    Values are kept in microseconds. Every power of two is split into 16
+    linear buckets, so quantiles are within 6.25% of the true value while
+    the histogram stays a fixed array of counts.
+    """
+
+    __slots__ = ("_counts", "_lock", "count", "total", "max")
+
+    def __init__(self):
+        self._counts = [0] * _BUCKETS
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = _bucket(max(0, int(seconds * 1_000_000)))
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q``-quantile in seconds (0.0 when empty)."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, round(q * self.count))
+            seen = 0
+            for index, n in enumerate(self._counts):
+                seen += n
+                if seen >= rank:
+                    low = _bucket_floor(index)
+                    high = _bucket_floor(index + 1)
+                    return min((low + high) / 2 / 1_000_000, self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            **{f"p{int(q * 100)}_ms": round(self.quantile(q) * 1000, 3) for q in QUANTILES},
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class _Span:
+    __slots__ = ("_hist", "_start")
+
+    def __init__(self, hist: Histogram):
+        self._hist = hist
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._hist.record(time.perf_counter() - self._start)
+
+
+class Metrics:
+    """Registry of span histograms and counters."""
+
+    enabled = True
+
+    def __init__(self):
+        self._histograms: dict[str, Histogram] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> Histogram:
+        hist = self._histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(name, Histogram())
+        return hist
+
+    def span(self, name: str) -> _Span:
+        """Context manager timing the ``<op>.<stage>`` named ``name``."""
+        return _Span(self.histogram(name))
+
+    def observe(self, name: str, seconds: float) -> None:
+        self.histogram(name).record(seconds)
+
+    def inc(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def snapshot(self) -> dict:
+        """{"spans": {name: summary}, "counters": {name: value}}."""
+        return {
+            "spans": {name: h.summary() for name, h in sorted(self._histograms.items())},
+            "counters": dict(sorted(self._counters.items())),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def render_prometheus(self, prefix: str = "stellar") -> str:
+        """Prometheus text exposition (format 0.0.4).
+
+        Spans become one summary, ``<prefix>_stage_seconds``, labelled by
+        ``op`` and ``stage``; counters become ``<prefix>_<name>_total``.
+        """
+        lines = []
+        if self._histograms:
+            metric = f"{prefix}_stage_seconds"
+            lines += [f"# HELP {metric} Time spent in each stage of an operation.",
+                      f"# TYPE {metric} summary"]
+            for name, hist in sorted(self._histograms.items()):
+                op, _, stage = name.partition(".")
+                labels = f'op="{op}",stage="{stage or "total"}"'
+                for q in QUANTILES:
+                    lines.append(f'{metric}{{{labels},quantile="{q}"}} {hist.quantile(q):.6f}')
+                lines.append(f"{metric}_sum{{{labels}}} {hist.total:.6f}")
+                lines.append(f"{metric}_count{{{labels}}} {hist.count}")
+        for name, value in sorted(self._counters.items()):
+            metric = f"{prefix}_{name}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullMetrics:
+    """Metrics off: every call is a no-op."""
+
+    enabled = False
+
+    def span(self, name: str) -> _NullSpan:
+        return _NULL_SPAN
+
+    def observe(self, name: str, seconds: float) -> None:
+        pass
+
+    def inc(self, name: str, n: int = 1) -> None:
+        pass
+
+    def snapshot(self) -> dict:
+        return {"spans": {}, "counters": {}}
+
+    def reset(self) -> None:
+        pass
+
+    def render_prometheus(self, prefix: str = "stellar") -> str:
+        return ""
+
+
+NULL_METRICS = NullMetrics()
+_registry: Metrics | NullMetrics = NULL_METRICS
+
+
+def get_metrics() -> Metrics | NullMetrics:
+    """The process-wide registry (a :class:`NullMetrics` unless enabled)."""
+    return _registry
+
+
+def enable() -> Metrics:
+    """Switch the process-wide registry on; idempotent."""
+    global _registry
+    if not isinstance(_registry, Metrics):
+        _registry = Metrics()
+    return _registry
+
+
+def disable() -> None:
+    global _registry
+    _registry = NULL_METRICS
+
+
+def count_query(rows: int = 0) -> None:
+    """Count one storage query and the rows it turned into items."""
+    metrics = _registry
+    if metrics.enabled:
+        metrics.inc("storage_queries")
+        if rows:
+            metrics.inc("storage_rows_deserialized", rows)
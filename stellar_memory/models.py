@@ -134,6 +134,9 @@ class MemoryStats:
     zone_counts: dict[int, int] = field(default_factory=dict)
     zone_capacities: dict[int, int | None] = field(default_factory=dict)
     total_memories: int = 0
+    recall_cache: dict | None = None  # hit/miss/latency stats when enabled
+    query_cache: dict | None = None  # query-embedding cache counters
+    item_cache: dict | None = None  # per-tier (l1/l2) item cache hit ratios
 
 
 @dataclass
@@ -198,6 +201,7 @@ class HealthStatus:
     graph_edges: int = 0
     zone_usage: dict[int, str] = field(default_factory=dict)
     warnings: list[str] = field(default_factory=list)
+    latency: dict[str, dict] = field(default_factory=dict)  # op -> summary, with metrics on
 
 
 @dataclass
@@ -332,6 +336,8 @@ class BenchmarkReport:
     zone_distribution: dict[int, int] = field(default_factory=dict)
     dataset_name: str = ""
     queries_run: int = 0
+    store_latency: dict = field(default_factory=dict)  # percentiles() of per-call ms
+    recall_latency: dict = field(default_factory=dict)
 
     def to_dict(self) -> dict:
         return {
@@ -347,6 +353,8 @@ class BenchmarkReport:
             "zone_distribution": self.zone_distribution,
             "dataset_name": self.dataset_name,
             "queries_run": self.queries_run,
+            "store_latency": self.store_latency,
+            "recall_latency": self.recall_latency,
         }
 
     def to_html(self) -> str:
@@ -4,24 +4,68 @@ from __future__ import annotations
 
 import logging
 import time
+from contextlib import ExitStack, contextmanager
+from typing import Callable
 
 from stellar_memory.config import ZoneConfig, DEFAULT_ZONES
 from stellar_memory.memory_function import MemoryFunction
 from stellar_memory.models import MemoryItem, ReorbitResult
-from stellar_memory.storage import ZoneStorage, StorageFactory
+from stellar_memory.storage import ListCursor, StorageFactory, ZoneStorage, list_key
 
 logger = logging.getLogger(__name__)
 
 
 class OrbitManager:
     def __init__(self, zones: list[ZoneConfig] | None = None,
-                 storage_factory: StorageFactory | None = None):
+                 storage_factory: StorageFactory | None = None,
+                 on_evict: Callable[[MemoryItem], None] | None = None):
         zones = zones or DEFAULT_ZONES
         factory = storage_factory or StorageFactory()
         self._zones = {z.zone_id: z for z in zones}
         self._storages: dict[int, ZoneStorage] = {}
         for z in zones:
             self._storages[z.zone_id] = factory.create(z)
+        self._item_cache = None
+        self._cache_io_zones = False
+        # Called with each item evicted from the outermost zone
+        self._on_evict = on_evict
+
+    def io_zones(self) -> tuple:
+        """Zones whose storage does I/O (the ones worth an item cache)."""
+        return tuple(zone_id for zone_id, storage in sorted(self._storages.items())
+                     if not storage.in_process)
+
+    def attach_cache(self, cache) -> None:
+        """Put an item cache (e.g. RedisCache) in front of the cached zones.
+
+        Those zones become write-through; id lookups consult the cache
+        after in-process zones and before any storage that does I/O.
+        """
+        from stellar_memory.storage.cached import CachedZoneStorage
+        for zone_id in cache.cached_zones:
+            storage = self._storages.get(zone_id)
+            if storage is not None and not isinstance(storage, CachedZoneStorage):
+                self._storages[zone_id] = CachedZoneStorage(storage, cache)
+        self._item_cache = cache
+        # In-process zones answer first, so only cached I/O zones can hit
+        self._cache_io_zones = any(z in cache.cached_zones for z in self.io_zones())
+
+    def close(self) -> None:
+        """Release storages that hold files or threads (e.g. hot-zone logs)."""
+        for storage in self._storages.values():
+            close = getattr(storage, "close", None)
+            if close is not None:
+                close()
+
+    @contextmanager
+    def deferred_commit(self):
+        """Batch durable writes made by this thread (see DurableZoneStorage)."""
+        with ExitStack() as stack:
+            for storage in self._storages.values():
+                deferred = getattr(storage, "deferred_commit", None)
+                if deferred is not None:
+                    stack.enter_context(deferred())
+            yield
 
     def get_storage(self, zone_id: int) -> ZoneStorage:
         return self._storages[zone_id]
@@ -92,16 +136,86 @@ class OrbitManager:
             items = [i for i in items if i.user_id is None or i.user_id == user_id]
         return items
 
+    def list_items(self, zone: int | None = None, user_id: str | None = None,
+                   order_by: str = "total_score",
+                   after: ListCursor | None = None, limit: int = 50,
+                   fields: list[str] | None = None,
+                   ) -> tuple[list[dict], ListCursor | None]:
+        """One keyset page across zones plus the cursor for the next page.
+
+        Each zone returns at most ``limit + 1`` rows after the cursor from
+        its own ordered index; the pages are merged, so cost does not grow
+        with zone size. The next cursor is None on the last page.
+        """
+        if after is not None and after.order_by != order_by:
+            raise ValueError("Cursor was issued for a different order_by")
+        zones = [zone] if zone is not None else sorted(self._storages)
+        merged: list[dict] = []
+        for zone_id in zones:
+            storage = self._storages.get(zone_id)
+            if storage is not None:
+                merged.extend(storage.list_items(user_id, order_by, after,
+                                                 limit + 1, fields))
+        merged.sort(key=list_key(order_by))
+        page = merged[:limit]
+        next_cursor = (ListCursor.of(order_by, page[-1])
+                       if len(merged) > limit and page else None)
+        return page, next_cursor
+
+    def count_items(self, zone: int | None = None, user_id: str | None = None) -> int:
+        zones = [zone] if zone is not None else list(self._storages)
+        return sum(self._storages[z].count_items(user_id)
+                   for z in zones if z in self._storages)
+
     def get_zone_count(self, zone_id: int) -> int:
         storage = self._storages.get(zone_id)
         return storage.count() if storage else 0
 
     def find_item(self, item_id: str) -> MemoryItem | None:
+        return self.find_items([item_id]).get(item_id)
+
+    def find_items(self, item_ids: list[str]) -> dict[str, MemoryItem]:
+        """Look up several ids; missing ids are absent from the result."""
+        found: dict[str, MemoryItem] = {}
+        if not self._cache_io_zones:
+            for item_id in item_ids:
+                for storage in self._storages.values():
+                    item = storage.get(item_id)
+                    if item is not None:
+                        found[item_id] = item
+                        break
+            return found
+        remote = [s for s in self._storages.values() if not s.in_process]
+        pending = list(dict.fromkeys(item_ids))
         for storage in self._storages.values():
+            if storage.in_process:
+                pending = self._collect(storage, pending, found)
+        if pending:
+            cached = self._item_cache.get_many(pending)
+            found.update(cached)
+            pending = [i for i in pending if i not in cached]
+        loaded: list[MemoryItem] = []
+        for storage in remote:
+            if not pending:
+                break
+            before = len(found)
+            pending = self._collect(storage, pending, found)
+            loaded.extend(list(found.values())[before:])
+        if loaded:
+            self._item_cache.set_many(loaded)  # read-through fill
+        return found
+
+    @staticmethod
+    def _collect(storage: ZoneStorage, pending: list[str],
+                 found: dict[str, MemoryItem]) -> list[str]:
+        missing = []
+        for item_id in pending:
             item = storage.get(item_id)
-            if item is not None:
-                return item
-        return None
+            if item is None:
+                missing.append(item_id)
+            else:
+                found[item_id] = item
+        return missing
 
     def _evict_lowest(self, zone_id: int) -> list[MemoryItem]:
         storage = self._storages[zone_id]
@@ -116,6 +230,8 @@ class OrbitManager:
         else:
             evicted.append(lowest)
             logger.info(f"Permanently evicted memory {lowest.id}")
+            if self._on_evict is not None:
+                self._on_evict(lowest)
         return evicted
 
     def _enforce_capacity(self, zone_id: int) -> int:
@@ -0,0 +1,313 @@
+"""Embedding dimension reduction (Matryoshka truncation / PCA)."""
+
+from __future__ import annotations
+
+import logging
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from stellar_memory.utils import serialize_embedding, deserialize_embedding
+
+if TYPE_CHECKING:
+    from stellar_memory.config import EmbedderConfig
+
+logger = logging.getLogger(__name__)
+
+
+def _renormalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return vector
+    return [x / norm for x in vector]
+
+
+class EmbeddingProjector(ABC):
+    """Maps full-dimension model embeddings to a reduced space."""
+
+    method: str = "none"
+
+    def __init__(self, input_dim: int, output_dim: int):
+        self.input_dim = input_dim
+        self.output_dim = output_dim
+
+    @property
+    def fitted(self) -> bool:
+        return True
+
+    @abstractmethod
+    def project(self, vector: list[float]) -> list[float]: ...
+
+    def project_batch(self, vectors: list[list[float]]) -> list[list[float]]:
+        return [self.project(v) for v in vectors]
+
+
+class IdentityProjector(EmbeddingProjector):
+    """No-op projector (full dimension)."""
+
+    def __init__(self, dim: int = 384):
+        super().__init__(dim, dim)
+
+    def project(self, vector: list[float]) -> list[float]:
+        return vector
+
+
+class TruncationProjector(EmbeddingProjector):
+    """Matryoshka-style truncation: keep the leading dims and re-normalize.
+
+    Only meaningful for models trained with Matryoshka representation
+    learning (e.g. nomic-embed, text-embedding-3-*).
+    """
+
+    method = "truncate"
+
+    def project(self, vector: list[float]) -> list[float]:
+        if len(vector) <= self.output_dim:
+            return vector
+        return _renormalize(list(vector[:self.output_dim]))
+
+
+class PCAProjector(EmbeddingProjector):
+    """PCA projection fitted on a sample of the corpus.
+
+    Until :meth:`fit` is called the projector passes vectors through
+    unchanged, so items stored before fitting keep their full dimension
+    and can be projected later. Fitting requires numpy.
+    """
+
+    method = "pca"
+
+    def __init__(self, input_dim: int, output_dim: int):
+        super().__init__(input_dim, output_dim)
+        self._mean: list[float] | None = None
+        self._components: list[list[float]] | None = None
+        self.fitted_at: float | None = None
+
+    @property
+    def fitted(self) -> bool:
+        return self._components is not None
+
+    def fit(self, sample: list[list[float]]) -> None:
+        """Fit principal components on full-dimension sample vectors."""
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "numpy is required for PCA projection. "
+                "Install with: pip install stellar-memory[embedding]"
+            )
+        vectors = [v for v in sample if len(v) == self.input_dim]
+        if len(vectors) < 2:
+            raise ValueError(
+                f"Need at least 2 full-dimension vectors to fit PCA, got {len(vectors)}"
+            )
+        x = np.asarray(vectors, dtype=np.float64)
+        mean = x.mean(axis=0)
+        # Rows of vt are principal axes ordered by explained variance
+        _, _, vt = np.linalg.svd(x - mean, full_matrices=False)
+        k = min(self.output_dim, vt.shape[0])
+        self.output_dim = k
+        self._mean = mean.tolist()
+        self._components = vt[:k].tolist()
+        self.fitted_at = time.time()
+
+    def set_state(self, mean: list[float], components: list[list[float]],
+                  fitted_at: float | None = None) -> None:
+        self._mean = mean
+        self._components = components
+        self.output_dim = len(components)
+        self.fitted_at = fitted_at
+
+    def project(self, vector: list[float]) -> list[float]:
+        if self._components is None or len(vector) != self.input_dim:
+            return vector
+        try:
+            import numpy as np
+            out = np.asarray(self._components) @ (np.asarray(vector) - np.asarray(self._mean))
+            return _renormalize(out.tolist())
+        except ImportError:
+            centered = [v - m for v, m in zip(vector, self._mean)]
+            return _renormalize([
+                sum(c * x for c, x in zip(row, centered))
+                for row in self._components
+            ])
+
+    # --- Persistence (stored alongside the memory DB) ---
+
+    def save(self, db_path: str) -> None:
+        if self._components is None or db_path == ":memory:":
+            return
+        conn = sqlite3.connect(db_path)
+        try:
+            _ensure_projection_table(conn)
+            flat = [x for row in self._components for x in row]
+            conn.execute(
+                "INSERT OR REPLACE INTO embedding_projection "
+                "(method, input_dim, output_dim, mean, components, fitted_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.method, self.input_dim, self.output_dim,
+                 serialize_embedding(self._mean), serialize_embedding(flat),
+                 self.fitted_at or time.time()),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def load(self, db_path: str) -> bool:
+        """Load a previously fitted projection. Returns True if found."""
+        if db_path == ":memory:":
+            return False
+        conn = sqlite3.connect(db_path)
+        try:
+            _ensure_projection_table(conn)
+            row = conn.execute(
+                "SELECT input_dim, output_dim, mean, components, fitted_at "
+                "FROM embedding_projection WHERE method = ?", (self.method,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None or row[0] != self.input_dim:
+            return False
+        input_dim, output_dim, mean_blob, comp_blob, fitted_at = row
+        flat = deserialize_embedding(comp_blob)
+        components = [flat[i * input_dim:(i + 1) * input_dim]
+                      for i in range(output_dim)]
+        self.set_state(deserialize_embedding(mean_blob), components, fitted_at)
+        return True
+
+
+def _ensure_projection_table(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS embedding_projection (
+            method TEXT PRIMARY KEY,
+            input_dim INTEGER NOT NULL,
+            output_dim INTEGER NOT NULL,
+            mean BLOB NOT NULL,
+            components BLOB NOT NULL,
+            fitted_at REAL NOT NULL
+        )
+    """)
+
+
+class FullVectorStore:
+    """Full-dimension vectors kept beside the reduced ones for re-ranking.
+
+    Written at store time so recall can re-score a shortlist without
+    re-embedding it. Vectors use a compact embedding codec (``int8`` by
+    default) and live in the ``embedding_full`` table of the memory DB,
+    or in a dict for ``:memory:`` databases.
+    """
+
+    def __init__(self, db_path: str, codec: str = "int8"):
+        self._codec = codec
+        self._lock = threading.Lock()
+        self._blobs: dict[str, bytes] | None = None
+        self._conn: sqlite3.Connection | None = None
+        if db_path == ":memory:":
+            self._blobs = {}
+        else:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_full "
+                "(id TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    def put_many(self, vectors: dict[str, list[float]]) -> None:
+        rows = [(item_id, serialize_embedding(vec, self._codec))
+                for item_id, vec in vectors.items()]
+        if not rows:
+            return
+        with self._lock:
+            if self._blobs is not None:
+                self._blobs.update(rows)
+                return
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_full (id, vector) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
+
+    def get_many(self, item_ids: list[str]) -> dict[str, list[float]]:
+        """Vectors for the ids that have one."""
+        with self._lock:
+            if self._blobs is not None:
+                rows = [(i, self._blobs[i]) for i in item_ids if i in self._blobs]
+            else:
+                marks = ",".join("?" * len(item_ids))
+                rows = self._conn.execute(
+                    f"SELECT id, vector FROM embedding_full WHERE id IN ({marks})",
+                    list(item_ids),
+                ).fetchall() if item_ids else []
+        return {item_id: deserialize_embedding(blob) for item_id, blob in rows}
+
+    def remove_many(self, item_ids: list[str]) -> None:
+        with self._lock:
+            if self._blobs is not None:
+                for item_id in item_ids:
+                    self._blobs.pop(item_id, None)
+                return
+            self._conn.executemany(
+                "DELETE FROM embedding_full WHERE id = ?", [(i,) for i in item_ids]
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ProjectedEmbedder:
+    """Embedder wrapper that returns projected (reduced) vectors.
+
+    The wrapped embedder stays reachable through ``embed_full`` for
+    optional full-dimension re-ranking.
+    """
+
+    def __init__(self, base, projector: EmbeddingProjector):
+        self._base = base
+        self.projector = projector
+
+    @property
+    def base(self):
+        return self._base
+
+    def embed(self, text: str) -> list[float] | None:
+        vector = self._base.embed(text)
+        if vector is None:
+            return None
+        return self.projector.project(vector)
+
+    def embed_batch(self, texts: list[str]) -> list[list[float] | None]:
+        return [None if v is None else self.projector.project(v)
+                for v in self._base.embed_batch(texts)]
+
+    def embed_full(self, text: str) -> list[float] | None:
+        return self._base.embed(text)
+
+    def embed_full_batch(self, texts: list[str]) -> list[list[float] | None]:
+        return self._base.embed_batch(texts)
+
+
+def create_projector(config: EmbedderConfig,
+                     db_path: str | None = None) -> EmbeddingProjector:
+    """Create the projector configured in ``EmbedderConfig``."""
+    if config.projection == "none" or not config.projection_dim:
+        return IdentityProjector(config.dimension)
+    out_dim = min(config.projection_dim, config.dimension)
+    if config.projection == "truncate":
+        return TruncationProjector(config.dimension, out_dim)
+    if config.projection == "pca":
+        projector = PCAProjector(config.dimension, out_dim)
+        if db_path:
+            try:
+                projector.load(db_path)
+            except sqlite3.Error:
+                logger.warning("Could not load PCA projection from %s", db_path)
+        return projector
+    raise ValueError(f"Unknown projection: {config.projection}. "
+                     f"Valid: none, truncate, pca")
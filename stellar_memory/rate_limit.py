@@ -0,0 +1,176 @@
+"""Request rate limiting for the REST server.
+
+Limiters implement GCRA (the generic cell rate algorithm, a token bucket
+stored as one number): each key keeps only its *theoretical arrival
+time*, so a request costs O(1) no matter how high the limit is. A key
+whose arrival time has passed is indistinguishable from a new key, which
+makes idle keys free to drop.
+
+Every limiter exposes ``hit(key, limit, now=None) -> (allowed, remaining,
+reset_at)`` like :class:`~stellar_memory.shared_state.SharedRateLimiter`.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+_EPSILON = 1e-9  # float slack so exactly ``limit`` requests fit a window
+
+
+def _gcra(tat: float, now: float, limit: int,
+          window: float) -> tuple[bool, float, int, int]:
+    """One GCRA step: ``(allowed, new_tat, remaining, reset_at)``.
+
+    ``limit`` requests are allowed per ``window`` seconds, all of them as
+    a burst when the key is idle.
+    """
+    interval = window / max(1, limit)
+    tat = max(tat, now)
+    new_tat = tat + interval
+    if new_tat - now > window + _EPSILON:
+        return False, tat, 0, math.ceil(tat - window + interval)
+    remaining = int((window - (new_tat - now) + _EPSILON) // interval)
+    return True, new_tat, remaining, math.ceil(new_tat)
+
+
+class RateLimiter:
+    """In-process GCRA limiter with bounded memory.
+
+    Keys are kept in least-recently-used order. Each call drops a few of
+    the oldest keys whose bucket has refilled, so idle clients cost
+    nothing after ``window`` seconds. Past ``max_keys``, the oldest key is
+    dropped even if its bucket is not full yet.
+    """
+
+    in_process = True
+
+    def __init__(self, window: float = 60, max_keys: int = 100_000):
+        self._window = window
+        self._max_keys = max_keys
+        self._tats: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def hit(self, key: str, limit: int,
+            now: float | None = None) -> tuple[bool, int, int]:
+        now = time.time() if now is None else now
+        with self._lock:
+            ok, tat, remaining, reset_at = _gcra(
+                self._tats.get(key, now), now, limit, self._window)
+            self._tats[key] = tat
+            self._tats.move_to_end(key)
+            self._evict(now)
+            if ok:
+                self.allowed += 1
+            else:
+                self.rejected += 1
+        return ok, remaining, reset_at
+
+    def _evict(self, now: float, batch: int = 4) -> None:
+        # Caller holds the lock. LRU order means the front is the stalest
+        tats = self._tats
+        for _ in range(batch):
+            if not tats:
+                return
+            key, tat = next(iter(tats.items()))
+            if tat > now and len(tats) <= self._max_keys:
+                return
+            del tats[key]
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"backend": "memory", "keys": len(self._tats),
+                    "max_keys": self._max_keys, "allowed": self.allowed,
+                    "rejected": self.rejected, "evictions": self.evictions}
+
+
+# KEYS[1]: bucket key; ARGV: now, limit, window. Floats travel as strings
+# because Redis truncates Lua numbers to integers in replies.
+_GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local interval = window / math.max(1, limit)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + interval
+if new_tat - now > window + 1e-9 then
+    return {0, tostring(tat)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX',
+           math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat)}
+"""
+
+
+class RedisRateLimiter:
+    """GCRA limiter whose state lives in Redis, shared by every worker.
+
+    The check runs as one Lua script, so it is atomic and takes a single
+    round trip. Each key expires when its bucket has refilled, so Redis
+    holds only active clients. If Redis is unreachable, requests are
+    limited by a per-process :class:`RateLimiter` instead.
+    """
+
+    in_process = False
+
+    def __init__(self, redis_url: str, window: float = 60,
+                 prefix: str = "sm:rl:", client=None):
+        self._url = redis_url
+        self._window = window
+        self._prefix = prefix
+        self._client = client
+        self._script = None
+        self._fallback = RateLimiter(window)
+        self.errors = 0
+
+    def connect(self) -> None:
+        if self._client is None:
+            try:
+                import redis as redis_lib
+            except ImportError:
+                raise ImportError(
+                    "redis is required for the Redis rate limiter. "
+                    "Install with: pip install stellar-memory[redis]"
+                )
+            self._client = redis_lib.from_url(self._url)
+        try:
+            self._client.ping()
+            self._script = self._client.register_script(_GCRA_SCRIPT)
+        except Exception as e:
+            logger.warning("Redis rate limiter unavailable, limiting per process: %s", e)
+            self._script = None
+
+    def hit(self, key: str, limit: int,
+            now: float | None = None) -> tuple[bool, int, int]:
+        now = time.time() if now is None else now
+        if self._script is None:
+            return self._fallback.hit(key, limit, now)
+        try:
+            ok, tat = self._script(keys=[self._prefix + key],
+                                   args=[repr(now), limit, self._window])
+        except Exception:
+            self.errors += 1
+            return self._fallback.hit(key, limit, now)
+        tat = float(tat)
+        interval = self._window / max(1, limit)
+        if not ok:
+            return False, 0, math.ceil(tat - self._window + interval)
+        remaining = int((self._window - (tat - now) + _EPSILON) // interval)
+        return True, remaining, math.ceil(tat)
+
+    def stats(self) -> dict:
+        return {"backend": "redis", "connected": self._script is not None,
+                "errors": self.errors}
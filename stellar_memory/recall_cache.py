@@ -0,0 +1,174 @@
+"""Recall result cache with event-bus-driven invalidation."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from stellar_memory.event_bus import EventBus
+from stellar_memory.models import MemoryItem
+
+
+@dataclass
+class _Entry:
+    results: list[MemoryItem]
+    user_id: str | None
+    expires_at: float
+    ids: frozenset = field(default_factory=frozenset)
+
+
+class RecallCache:
+    """LRU + TTL cache of recall results.
+
+    Keys are ``(normalized query, limit, user_id, emotion, session_id)``.
+    Entries are dropped selectively from bus events: a store only
+    invalidates entries whose tenant could see the new item, a forget only
+    entries that returned it; reorbit/decay reshuffle zones and clear all.
+    Changes relayed from other processes are handled the same way.
+    Recall-stat bumps for hits are queued and applied later by the owner
+    via :meth:`drain_bumps`.
+
+    Every invalidation bumps :attr:`generation`. A recall reads it before
+    searching and passes it to :meth:`put`, which refuses results computed
+    before a store or forget that could have changed them.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0):
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._pending: dict[str, int] = {}
+        self._last_hit_at = 0.0
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.stale_puts = 0
+        self._hit_ms = 0.0
+        self._miss_ms = 0.0
+
+    @staticmethod
+    def make_key(query: str, limit: int, user_id: str | None = None,
+                 emotion: str | None = None,
+                 session_id: str | None = None) -> tuple:
+        return (" ".join(query.lower().split()), limit, user_id, emotion, session_id)
+
+    def get(self, key: tuple) -> list[MemoryItem] | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            for item in entry.results:
+                self._pending[item.id] = self._pending.get(item.id, 0) + 1
+            self._last_hit_at = now
+            return list(entry.results)
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter; read it before computing results to :meth:`put`."""
+        return self._generation
+
+    def put(self, key: tuple, results: list[MemoryItem],
+            generation: int | None = None) -> bool:
+        """Cache ``results``; refused (False) if invalidated since ``generation``."""
+        entry = _Entry(results=list(results), user_id=key[2],
+                       expires_at=time.time() + self._ttl,
+                       ids=frozenset(i.id for i in results))
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self.stale_puts += 1
+                return False
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def record_latency(self, hit: bool, elapsed_ms: float) -> None:
+        with self._lock:
+            if hit:
+                self._hit_ms += elapsed_ms
+            else:
+                self._miss_ms += elapsed_ms
+
+    def drain_bumps(self) -> tuple[dict[str, int], float]:
+        """Return and clear queued ``{item_id: hit_count}`` plus last hit time."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            return pending, self._last_hit_at
+
+    @property
+    def pending_bumps(self) -> int:
+        return len(self._pending)
+
+    # --- Invalidation ---
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._generation += 1
+            if self._entries:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+
+    def invalidate_item(self, item_id: str) -> None:
+        self._drop(lambda e: item_id in e.ids)
+
+    def invalidate_for_user(self, user_id: str | None) -> None:
+        """Drop entries whose scope can see memories owned by ``user_id``."""
+        if user_id is None:
+            self.invalidate_all()
+            return
+        self._drop(lambda e: e.user_id is None or e.user_id == user_id)
+
+    def _drop(self, predicate) -> None:
+        with self._lock:
+            # Recalls in flight cannot be matched yet; fence them all
+            self._generation += 1
+            stale = [k for k, e in self._entries.items() if predicate(e)]
+            for k in stale:
+                del self._entries[k]
+            self.invalidations += len(stale)
+
+    def attach(self, bus: EventBus) -> None:
+        """Register invalidation handlers on the bus (inline, never deferred)."""
+        bus.on("on_store", lambda item: self.invalidate_for_user(item.user_id), sync=True)
+        bus.on("on_forget", self.invalidate_item, sync=True)
+        bus.on("on_auto_forget", self.invalidate_item, sync=True)
+        bus.on("on_consolidate", lambda existing, new: self.invalidate_item(existing.id),
+               sync=True)
+        bus.on("on_reorbit", lambda result: self.invalidate_all(), sync=True)
+        bus.on("on_decay", lambda result: self.invalidate_all(), sync=True)
+        bus.on("on_remote_change", self._on_remote_change, sync=True)
+
+    def _on_remote_change(self, kind: str, item_id: str | None,
+                          user_id: str | None) -> None:
+        if kind == "store":
+            self.invalidate_for_user(user_id)
+        elif kind in ("update", "forget") and item_id:
+            self.invalidate_item(item_id)
+        else:
+            self.invalidate_all()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "stale_puts": self.stale_puts,
+                "pending_bumps": len(self._pending),
+                "avg_hit_ms": self._hit_ms / self.hits if self.hits else 0.0,
+                "avg_miss_ms": self._miss_ms / self.misses if self.misses else 0.0,
+            }
@@ -14,10 +14,11 @@ logger = logging.getLogger(__name__)
 
 class ReorbitScheduler:
     def __init__(self, orbit_mgr: OrbitManager, memory_fn: MemoryFunction,
-                 interval: int = 300):
+                 interval: int = 300, lease=None):
         self._orbit_mgr = orbit_mgr
         self._memory_fn = memory_fn
         self._interval = interval
+        self._lease = lease  # SharedLease: only its holder reorbits
         self._running = False
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
@@ -55,6 +56,8 @@ class ReorbitScheduler:
             self._stop_event.wait(timeout=self._interval)
             if self._stop_event.is_set():
                 break
+            if self._lease is not None and not self._lease.acquire():
+                continue
             try:
                 result = self._orbit_mgr.reorbit_all(self._memory_fn, time.time())
                 logger.info(f"Reorbit: moved={result.moved}, evicted={result.evicted}, "
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 from pathlib import Path
 
+from stellar_memory.jsonl_writer import JsonlWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,9 +15,11 @@ class SecurityAudit:
     """Append-only audit log for security-relevant events."""
 
     def __init__(self, log_path: str = "stellar_audit.jsonl",
-                 enabled: bool = True):
+                 enabled: bool = True, max_size_mb: float | None = None,
+                 compress: bool = False):
         self._log_path = Path(log_path)
         self._enabled = enabled
+        self._writer = JsonlWriter(log_path, max_size_mb, compress=compress)
 
     def attach(self, event_bus) -> None:
         """Attach to an EventBus to log security-relevant events."""
@@ -40,8 +43,7 @@ class SecurityAudit:
             "details": details,
         }
         try:
-            with open(self._log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
+            self._writer.write(entry)
         except Exception as e:
             logger.warning("Audit log write failed: %s", e)
 
@@ -63,15 +65,11 @@ class SecurityAudit:
 
     def get_entries(self, limit: int = 100) -> list[dict]:
         """Read last N audit entries."""
-        if not self._log_path.exists():
-            return []
-        entries: list[dict] = []
         try:
-            with open(self._log_path, encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        entries.append(json.loads(line))
+            return self._writer.tail(limit)
         except Exception:
-            pass
-        return entries[-limit:]
+            return []
+
+    def close(self) -> None:
+        """Write buffered entries and close the log."""
+        self._writer.close()
@@ -1,12 +1,12 @@
 """Standalone REST API server for Stellar Memory."""
 
-from __future__ import annotations
-
+import asyncio
 import hashlib
 import json
 import logging
 import os
 import time
+from typing import Literal
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +23,8 @@ def create_api_app(config=None, namespace: str | None = None):
             "fastapi is required. Install with: pip install stellar-memory[server]"
         )
 
+    from stellar_memory.async_memory import AsyncStellarMemory
+    from stellar_memory.event_broker import EventBroker
     from stellar_memory.config import StellarConfig
     from stellar_memory.stellar import StellarMemory
 
@@ -32,10 +34,21 @@ def create_api_app(config=None, namespace: str | None = None):
         __version__ = "0.9.0-dev"
 
     cfg = config or StellarConfig()
+    # Several worker processes: hot zones, rate limits and change
+    # notification go through the shared SQLite file instead of process memory
+    shared = cfg.server.workers > 1
+    if shared:
+        if cfg.db_path == ":memory:":
+            raise ValueError("server.workers > 1 requires a file-backed db_path")
+        cfg.storage.shared_hot_zones = True
     memory = StellarMemory(cfg, namespace=namespace)
+    amemory = AsyncStellarMemory(memory, cfg.concurrency)
+    broker = EventBroker()
+    broker.attach(memory._event_bus)
 
     # ── Billing system initialization ──
-    _billing_enabled = cfg.billing.enabled
+    # Billing settings are optional; StellarConfig itself carries none
+    _billing_enabled = bool(getattr(getattr(cfg, "billing", None), "enabled", False))
     _db_pool = None
     _auth_mgr = None
     _lemon_provider = None
@@ -56,7 +69,8 @@ Configure via `STELLAR_API_KEY` environment variable.
 If no key is set, authentication is disabled.
 
 ## Rate Limiting
-Default: 60 requests per minute per IP.
+Default: 60 requests per minute per API account (per IP when unauthenticated),
+with bursts up to the full limit. Rejected requests get `429` and `Retry-After`.
 Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Reset`.
 
 ## Zones
@@ -87,31 +101,39 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         allow_headers=["*"],
     )
 
-    # Rate limiting (simple in-memory, tier-aware)
-    _rate_store: dict[str, list[float]] = {}
+    # Rate limiting (tier-aware; in-memory, Redis, or shared across worker processes)
     _default_rate_limit = cfg.server.rate_limit
     RATE_WINDOW = 60
+    _limiter = _create_rate_limiter(memory.config, shared, RATE_WINDOW)
 
     async def check_rate_limit(request: Request):
-        client_ip = request.client.host if request.client else "unknown"
-        # Use tier-based rate limit if user is authenticated
+        # Authenticated callers are limited per account, others per IP
+        user_id = getattr(request.state, "user_id", None)
+        if user_id is not None:
+            key = f"user:{user_id}"
+        else:
+            key = f"ip:{request.client.host if request.client else 'unknown'}"
         rate_limit = _default_rate_limit
         if hasattr(request.state, "user_tier") and _billing_enabled:
             from stellar_memory.billing.tiers import get_tier_limits
             rate_limit = get_tier_limits(request.state.user_tier)["rate_limit"]
 
         now = time.time()
-        times = _rate_store.get(client_ip, [])
-        times = [t for t in times if now - t < RATE_WINDOW]
-        if len(times) >= rate_limit:
-            raise HTTPException(429, "Rate limit exceeded")
-        times.append(now)
-        _rate_store[client_ip] = times
-        # Set rate limit headers
-        remaining = rate_limit - len(times)
+        if _limiter.in_process:
+            allowed, remaining, reset_at = _limiter.hit(key, rate_limit, now)
+        else:
+            allowed, remaining, reset_at = await asyncio.to_thread(
+                _limiter.hit, key, rate_limit, now)
+        if not allowed:
+            raise HTTPException(429, "Rate limit exceeded", headers={
+                "Retry-After": str(max(1, reset_at - int(now))),
+                "X-RateLimit-Limit": str(rate_limit),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(reset_at),
+            })
         request.state.rate_limit = rate_limit
-        request.state.rate_remaining = max(0, remaining)
-        request.state.rate_reset = int(now + RATE_WINDOW)
+        request.state.rate_remaining = remaining
+        request.state.rate_reset = reset_at
 
     # API key auth (supports both env-var mode and DB-backed mode)
     API_KEY = os.environ.get(cfg.server.api_key_env)
@@ -203,6 +225,9 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         """Paginated memory list response."""
         total: int = Field(description="Total matching memories")
         items: list[MemoryListItem] = Field(description="Memory items")
+        next_cursor: str | None = Field(
+            None, description="Pass as `cursor` to fetch the next page; null on the last page",
+        )
 
     class TimelineItem(BaseModel):
         """A timeline entry."""
@@ -241,6 +266,86 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         """Standard error response."""
         detail: str = Field(description="Error description")
 
+    class BatchStoreRequest(BaseModel):
+        """Request body for storing many memories in one call."""
+        items: list[StoreRequest] = Field(
+            ..., min_length=1,
+            description="Memories to store; the maximum count depends on the tier",
+        )
+
+    class BatchStoreResult(BaseModel):
+        """Outcome for one item of a batch store."""
+        index: int = Field(description="Position of the item in the request")
+        id: str | None = Field(None, description="Memory ID if stored")
+        zone: int | None = Field(None, description="Assigned zone if stored")
+        score: float | None = Field(None, description="Calculated importance score")
+        error: str | None = Field(None, description="Why the item was not stored")
+
+    class BatchStoreResponse(BaseModel):
+        """Per-item results of a batch store."""
+        stored: int = Field(description="Number of items stored")
+        failed: int = Field(description="Number of items rejected")
+        results: list[BatchStoreResult] = Field(description="Results in request order")
+
+    class BatchRecallRequest(BaseModel):
+        """Request body for running several recall queries in one call."""
+        queries: list[str] = Field(
+            ..., min_length=1,
+            description="Queries to run; the maximum count depends on the tier",
+        )
+        limit: int = Field(5, ge=1, le=50, description="Max results per query")
+        emotion: str | None = Field(None, description="Optional emotion filter")
+
+    class BatchRecallResult(BaseModel):
+        """Outcome for one query of a batch recall."""
+        query: str = Field(description="The query as sent")
+        items: list[RecallItem] = Field(default_factory=list, description="Recalled memories")
+        error: str | None = Field(None, description="Why the query failed")
+
+    def _recall_item(item) -> RecallItem:
+        return RecallItem(
+            id=item.id, content=item.content,
+            zone=item.zone,
+            importance=round(item.arbitrary_importance, 4),
+            recall_count=item.recall_count,
+            emotion=item.emotion.to_dict() if item.emotion else None,
+        )
+
+    def _batch_limit(request: Request, size: int) -> None:
+        """Reject batches larger than the caller's tier allows."""
+        limit = cfg.server.max_batch_size
+        if _billing_enabled and hasattr(request.state, "user_tier"):
+            from stellar_memory.billing.tiers import get_tier_limits
+            tier_limit = get_tier_limits(request.state.user_tier).get("max_batch_size")
+            if tier_limit is not None and tier_limit > 0:
+                limit = tier_limit
+        if size > limit:
+            raise HTTPException(413, f"Batch too large ({size} > {limit})")
+
+    async def _memory_quota(request: Request) -> int | None:
+        """Memories the caller may still store, or None when unlimited."""
+        if not (_billing_enabled and _auth_mgr and hasattr(request.state, "user_id")):
+            return None
+        from stellar_memory.billing.tiers import get_tier_limits
+        limits = get_tier_limits(getattr(request.state, "user_tier", "free"))
+        if limits["max_memories"] < 0:
+            return None
+        count = await _auth_mgr.get_memory_count(request.state.user_id)
+        return max(0, limits["max_memories"] - count)
+
+    # Keep cached per-user memory counts in step with rows as they are
+    # created and deleted, whichever path (API, ingest worker, decay,
+    # eviction) did it. A merge re-emits on_store for an existing row, so
+    # on_consolidate takes that back off.
+    def _count_rows(item, delta: int) -> None:
+        if _auth_mgr and item.user_id:
+            _auth_mgr.adjust_memory_count(item.user_id, delta)
+
+    memory.events.on("on_store", lambda item: _count_rows(item, 1), sync=True)
+    memory.events.on("on_consolidate",
+                     lambda existing, item: _count_rows(existing, -1), sync=True)
+    memory.events.on("on_remove", lambda item: _count_rows(item, -1), sync=True)
+
     # Routes
     @app.post(
         "/api/v1/store",
@@ -253,7 +358,7 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
     )
     async def store(req: StoreRequest, request: Request):
         user_id = getattr(request.state, "user_id", None)
-        item = memory.store(
+        item = await amemory.store(
             req.content, importance=req.importance,
             metadata=req.metadata, auto_evaluate=req.auto_evaluate,
             user_id=user_id,
@@ -275,15 +380,64 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
     async def recall(q: str, limit: int = 5, emotion: str | None = None,
                      request: Request = None):
         user_id = getattr(request.state, "user_id", None) if request else None
-        results = memory.recall(q, limit=min(limit, 50), emotion=emotion,
-                                user_id=user_id)
-        return [RecallItem(
-            id=item.id, content=item.content,
-            zone=item.zone,
-            importance=round(item.arbitrary_importance, 4),
-            recall_count=item.recall_count,
-            emotion=item.emotion.to_dict() if item.emotion else None,
-        ) for item in results]
+        results = await amemory.recall(q, limit=min(limit, 50), emotion=emotion,
+                                       user_id=user_id)
+        return [_recall_item(item) for item in results]
+
+    @app.post(
+        "/api/v1/store/batch",
+        response_model=BatchStoreResponse,
+        summary="Store many memories",
+        description="Store a batch of memories with one embedding pass. "
+                    "Each item gets its own result; one bad item does not fail the batch.",
+        responses={401: {"model": ErrorResponse}, 413: {"model": ErrorResponse},
+                   429: {"model": ErrorResponse}},
+        tags=["Memories"],
+        dependencies=[Depends(check_api_key), Depends(check_rate_limit)],
+    )
+    async def store_batch(req: BatchStoreRequest, request: Request):
+        _batch_limit(request, len(req.items))
+        user_id = getattr(request.state, "user_id", None)
+        quota = await _memory_quota(request)
+        accepted = req.items if quota is None else req.items[:quota]
+        outcomes = await amemory.store_batch(
+            [item.model_dump() for item in accepted], user_id=user_id)
+        outcomes += ["Memory limit reached"] * (len(req.items) - len(accepted))
+        results = []
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, (Exception, str)):
+                results.append(BatchStoreResult(index=index, error=str(outcome)))
+            else:
+                results.append(BatchStoreResult(
+                    index=index, id=outcome.id, zone=outcome.zone,
+                    score=round(outcome.total_score, 4)))
+        failed = sum(1 for r in results if r.error is not None)
+        return BatchStoreResponse(stored=len(results) - failed, failed=failed,
+                                  results=results)
+
+    @app.post(
+        "/api/v1/recall/batch",
+        response_model=list[BatchRecallResult],
+        summary="Recall for many queries",
+        description="Run several recall queries with one shared embedding pass. "
+                    "Results are returned in query order.",
+        responses={401: {"model": ErrorResponse}, 413: {"model": ErrorResponse},
+                   429: {"model": ErrorResponse}},
+        tags=["Memories"],
+        dependencies=[Depends(check_api_key), Depends(check_rate_limit)],
+    )
+    async def recall_batch(req: BatchRecallRequest, request: Request):
+        _batch_limit(request, len(req.queries))
+        user_id = getattr(request.state, "user_id", None)
+        outcomes = await amemory.recall_batch(req.queries, limit=req.limit,
+                                              emotion=req.emotion, user_id=user_id)
+        return [
+            BatchRecallResult(query=query, error=str(outcome))
+            if isinstance(outcome, Exception)
+            else BatchRecallResult(query=query,
+                                   items=[_recall_item(item) for item in outcome])
+            for query, outcome in zip(req.queries, outcomes)
+        ]
 
     @app.delete(
         "/api/v1/forget/{memory_id}",
@@ -295,37 +449,59 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
     )
     async def forget(memory_id: str, request: Request):
         user_id = getattr(request.state, "user_id", None)
-        removed = memory.forget(memory_id, user_id=user_id)
+        removed = await amemory.forget(memory_id, user_id=user_id)
         if not removed:
             raise HTTPException(404, "Memory not found")
         return {"removed": True}
 
+    _LIST_FIELDS = ["id", "content", "zone", "total_score", "recall_count",
+                    "arbitrary_importance", "created_at"]
+
+    def _list_page(zone, user_id, order_by, cursor, limit, offset):
+        from stellar_memory.storage import ListCursor
+        after = ListCursor.decode(cursor) if cursor else None
+        if after is None and offset:
+            # Legacy offset paging: still bounded by offset + limit rows
+            rows, _ = memory._orbit_mgr.list_items(
+                zone, user_id, order_by, None, offset, ["id"])
+            if len(rows) < offset:
+                return [], None, memory._orbit_mgr.count_items(zone, user_id)
+            after = ListCursor.of(order_by, rows[-1])
+        rows, next_cursor = memory._orbit_mgr.list_items(
+            zone, user_id, order_by, after, limit, _LIST_FIELDS)
+        return rows, next_cursor, memory._orbit_mgr.count_items(zone, user_id)
+
     @app.get(
         "/api/v1/memories",
         response_model=MemoryListResponse,
         summary="List memories",
-        description="List all memories with optional zone filter and pagination.",
+        description="List memories with an optional zone filter. Pages are "
+                    "keyset-paginated: pass `next_cursor` back as `cursor`.",
         tags=["Memories"],
         dependencies=[Depends(check_api_key), Depends(check_rate_limit)],
     )
     async def memories(zone: int | None = None, limit: int = 50,
-                       offset: int = 0, request: Request = None):
+                       offset: int = 0, cursor: str | None = None,
+                       order_by: str = "total_score", request: Request = None):
         user_id = getattr(request.state, "user_id", None) if request else None
-        all_items = memory._orbit_mgr.get_all_items(user_id=user_id)
-        if zone is not None:
-            all_items = [i for i in all_items if i.zone == zone]
-        all_items.sort(key=lambda x: x.total_score, reverse=True)
-        page = all_items[offset:offset + limit]
+        try:
+            rows, next_cursor, total = await amemory.run(
+                "recall", _list_page, zone, user_id, order_by, cursor,
+                max(1, min(limit, 200)), max(0, offset),
+            )
+        except ValueError as exc:
+            raise HTTPException(400, str(exc))
         return MemoryListResponse(
-            total=len(all_items),
+            total=total,
             items=[MemoryListItem(
-                id=item.id, content=item.content[:200],
-                zone=item.zone,
-                score=round(item.total_score, 4),
-                recall_count=item.recall_count,
-                importance=round(item.arbitrary_importance, 4),
-                created_at=item.created_at,
-            ) for item in page],
+                id=row["id"], content=row["content"][:200],
+                zone=row["zone"],
+                score=round(row["total_score"], 4),
+                recall_count=row["recall_count"],
+                importance=round(row["arbitrary_importance"], 4),
+                created_at=row["created_at"],
+            ) for row in rows],
+            next_cursor=next_cursor.encode() if next_cursor else None,
         )
 
     @app.get(
@@ -339,7 +515,7 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
     async def timeline(start: str | None = None, end: str | None = None,
                        limit: int = 100, request: Request = None):
         user_id = getattr(request.state, "user_id", None) if request else None
-        entries = memory.timeline(start, end, limit, user_id=user_id)
+        entries = await amemory.timeline(start, end, limit, user_id=user_id)
         return [TimelineItem(
             timestamp=e.timestamp,
             memory_id=e.memory_id,
@@ -359,7 +535,7 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
     )
     async def narrate(req: NarrateRequest, request: Request = None):
         user_id = getattr(request.state, "user_id", None) if request else None
-        text = memory.narrate(req.topic, req.limit, user_id=user_id)
+        text = await amemory.narrate(req.topic, req.limit, user_id=user_id)
         return NarrateResponse(narrative=text)
 
     @app.get(
@@ -374,17 +550,19 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         user_id = getattr(request.state, "user_id", None) if request else None
         if user_id:
             # Tenant-scoped stats: count only this user's memories
-            all_items = memory._orbit_mgr.get_all_items(user_id=user_id)
+            all_items = await amemory.run(
+                "recall", memory._orbit_mgr.get_all_items, user_id=user_id
+            )
             zone_counts: dict[int, int] = {}
             for item in all_items:
                 zone_counts[item.zone] = zone_counts.get(item.zone, 0) + 1
-            s = memory.stats()
+            s = await amemory.stats()
             return StatsResponse(
                 total_memories=len(all_items),
                 zones={str(k): v for k, v in zone_counts.items()},
                 capacities={str(k): v for k, v in s.zone_capacities.items()},
             )
-        s = memory.stats()
+        s = await amemory.stats()
         return StatsResponse(
             total_memories=s.total_memories,
             zones={str(k): v for k, v in s.zone_counts.items()},
@@ -399,46 +577,55 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         tags=["System"],
     )
     async def health():
-        h = memory.health()
+        h = await amemory.health()
         return HealthResponse(
             healthy=h.healthy,
             total_memories=h.total_memories,
             warnings=h.warnings,
         )
 
+    @app.get(
+        "/metrics",
+        summary="Prometheus metrics",
+        description="Stage latencies and storage counters in Prometheus text "
+                    "format. Empty unless `metrics.enabled` is set.",
+        tags=["System"],
+        dependencies=[Depends(check_api_key)],
+    )
+    async def prometheus_metrics():
+        from stellar_memory.metrics import get_metrics
+        return Response(get_metrics().render_prometheus(),
+                        media_type="text/plain; version=0.0.4")
+
     @app.get(
         "/api/v1/events",
         summary="Event stream (SSE)",
-        description="Server-Sent Events stream for real-time memory updates.",
+        description="Server-Sent Events stream for real-time memory updates. "
+                    "`events` is a comma-separated list of event names to receive; "
+                    "with `coalesce`, bursts of the same event arrive as one "
+                    "message with a `count`.",
         tags=["System"],
         dependencies=[Depends(check_api_key)],
     )
-    async def events():
+    async def events(request: Request, events: str | None = None,
+                     coalesce: bool = False):
         """SSE endpoint for real-time updates."""
-        import asyncio
         from starlette.responses import StreamingResponse
 
-        async def event_stream():
-            q: asyncio.Queue = asyncio.Queue()
-            bus = memory._event_bus
-
-            def _push(event_name, *args):
-                data = {"event": event_name, "ts": time.time()}
-                try:
-                    q.put_nowait(data)
-                except asyncio.QueueFull:
-                    pass
-
-            for evt in ("on_store", "on_recall", "on_forget",
-                        "on_reorbit", "on_decay"):
-                bus.on(evt, lambda *a, en=evt: _push(en, *a))
+        wanted = None
+        if events:
+            names = (e.strip() for e in events.split(","))
+            wanted = {n if n.startswith("on_") else f"on_{n}" for n in names if n}
+        user_id = getattr(request.state, "user_id", None)
 
-            while True:
-                try:
-                    data = await asyncio.wait_for(q.get(), timeout=15.0)
-                    yield f"data: {json.dumps(data)}\n\n"
-                except asyncio.TimeoutError:
+        async def event_stream():
+            client = broker.subscribe(events=wanted, user_id=user_id,
+                                      coalesce=coalesce)
+            async for batch in broker.stream(client, heartbeat=15.0):
+                if not batch:
                     yield f"data: {json.dumps({'event': 'heartbeat'})}\n\n"
+                for data in batch:
+                    yield f"data: {json.dumps(data)}\n\n"
 
         return StreamingResponse(
             event_stream(), media_type="text/event-stream",
@@ -496,7 +683,9 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
     class BenchmarkRequest(BaseModel):
         """Benchmark request body."""
         queries: int = Field(100, ge=1, le=1000, description="Number of queries to run")
-        dataset: str = Field("standard", description="Dataset: small, standard, large")
+        # The 100k/1M scale tiers would load into the live store; CLI only
+        dataset: Literal["small", "standard", "large"] = Field(
+            "standard", description="Dataset: small, standard, large")
         seed: int = Field(42, description="Random seed for reproducibility")
 
     class BenchmarkResponse(BaseModel):
@@ -520,7 +709,7 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         dependencies=[Depends(check_api_key), Depends(check_rate_limit)],
     )
     async def introspect(topic: str, depth: int = 1):
-        result = memory.introspect(topic, depth=depth)
+        result = await amemory.run("recall", memory.introspect, topic, depth=depth)
         return IntrospectResponse(
             topic=result.topic,
             confidence=result.confidence,
@@ -540,7 +729,8 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         dependencies=[Depends(check_api_key), Depends(check_rate_limit)],
     )
     async def recall_confident(query: str, top_k: int = 5):
-        result = memory.recall_with_confidence(query, top_k=top_k)
+        result = await amemory.run("recall", memory.recall_with_confidence,
+                                   query, top_k=top_k)
         return ConfidentRecallItem(
             memories=[RecallItem(
                 id=item.id, content=item.content, zone=item.zone,
@@ -562,7 +752,7 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
     )
     async def optimize():
         try:
-            report = memory.optimize()
+            report = await amemory.run("maintenance", memory.optimize)
         except ValueError as e:
             raise HTTPException(400, str(e))
         return OptimizeResponse(
@@ -583,7 +773,7 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
     )
     async def rollback_weights():
         try:
-            weights = memory.rollback_weights()
+            weights = await amemory.run("maintenance", memory.rollback_weights)
         except RuntimeError as e:
             raise HTTPException(400, str(e))
         return {"weights": weights}
@@ -597,7 +787,8 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         dependencies=[Depends(check_api_key), Depends(check_rate_limit)],
     )
     async def reason(req: ReasonRequest):
-        result = memory.reason(req.query, max_sources=req.max_sources)
+        result = await amemory.run("llm", memory.reason, req.query,
+                                   max_sources=req.max_sources)
         return ReasonResponse(
             query=result.query,
             insights=result.insights,
@@ -616,7 +807,8 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         dependencies=[Depends(check_api_key), Depends(check_rate_limit)],
     )
     async def contradictions(scope: str | None = None):
-        results = memory.detect_contradictions(scope=scope)
+        results = await amemory.run("maintenance", memory.detect_contradictions,
+                                    scope=scope)
         return [ContradictionItem(
             memory_a_id=c.memory_a_id,
             memory_b_id=c.memory_b_id,
@@ -633,7 +825,8 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
         dependencies=[Depends(check_api_key), Depends(check_rate_limit)],
     )
     async def run_benchmark(req: BenchmarkRequest):
-        report = memory.benchmark(
+        report = await amemory.run(
+            "maintenance", memory.benchmark,
             queries=req.queries, dataset=req.dataset, seed=req.seed,
         )
         return BenchmarkResponse(
@@ -965,6 +1158,17 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
 
     # ── Startup / Shutdown ──
 
+    _background: list = []
+    LAST_USED_FLUSH = 30  # seconds between batched api_keys.last_used_at writes
+
+    async def _flush_last_used():
+        while True:
+            await asyncio.sleep(LAST_USED_FLUSH)
+            try:
+                await _auth_mgr.flush_last_used()
+            except Exception as e:
+                logger.warning(f"last_used_at flush failed: {e}")
+
     @app.on_event("startup")
     async def startup():
         nonlocal _db_pool, _auth_mgr
@@ -982,6 +1186,8 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
                     from stellar_memory.auth import AuthManager
                     _auth_mgr = AuthManager(_db_pool)
                     await _auth_mgr.init_schema()
+                    await _auth_mgr.start_listener()
+                    _background.append(asyncio.create_task(_flush_last_used()))
                     logger.info("Billing DB initialized")
                 except Exception as e:
                     logger.error(f"Failed to initialize billing DB: {e}")
@@ -1025,8 +1231,54 @@ Response headers: `X-RateLimit-Limit`, `X-RateLimit-Remaining`, `X-RateLimit-Res
 
     @app.on_event("shutdown")
     async def shutdown():
+        for task in _background:
+            task.cancel()
+        if _auth_mgr:
+            await _auth_mgr.close()
         memory.stop()
+        amemory.close()
         if _db_pool:
             await _db_pool.close()
 
     return app, memory
+
+
+def _create_rate_limiter(cfg, shared: bool, window: int):
+    """Pick the limiter backend from ``cfg.server.rate_limit_backend``."""
+    backend = cfg.server.rate_limit_backend
+    if backend == "redis":
+        if not cfg.storage.redis_url:
+            raise ValueError("rate_limit_backend='redis' requires storage.redis_url")
+        from stellar_memory.rate_limit import RedisRateLimiter
+        limiter = RedisRateLimiter(cfg.storage.redis_url, window)
+        limiter.connect()
+        return limiter
+    if backend == "sqlite" or (backend == "memory" and shared):
+        if cfg.db_path == ":memory:":
+            raise ValueError("rate_limit_backend='sqlite' requires a file-backed db_path")
+        from stellar_memory.shared_state import SharedRateLimiter
+        return SharedRateLimiter(cfg.db_path, window)
+    if backend != "memory":
+        raise ValueError(f"Unknown rate_limit_backend: {backend}")
+    from stellar_memory.rate_limit import RateLimiter
+    return RateLimiter(window, max_keys=cfg.server.rate_limit_max_keys)
+
+
+def create_worker_app():
+    """App factory for multi-process servers (``uvicorn --workers N --factory``).
+
+    Each worker builds its own app from environment variables set by
+    ``stellar-memory serve-api --workers N``: ``STELLAR_CONFIG`` (a JSON
+    file holding the full config), or just ``STELLAR_DB_PATH``, plus
+    ``STELLAR_NAMESPACE`` and ``STELLAR_WORKERS``.
+    """
+    from stellar_memory.config import StellarConfig
+
+    config_path = os.environ.get("STELLAR_CONFIG")
+    if config_path:
+        cfg = StellarConfig.from_json(config_path)
+    else:
+        cfg = StellarConfig(db_path=os.environ.get("STELLAR_DB_PATH", "stellar_memory.db"))
+    cfg.server.workers = int(os.environ.get("STELLAR_WORKERS", "2"))
+    app, _ = create_api_app(cfg, namespace=os.environ.get("STELLAR_NAMESPACE") or None)
+    return app
@@ -0,0 +1,261 @@
+"""Cross-process shared state for multi-worker servers.
+
+Every worker opens the same SQLite file (WAL mode). :class:`ChangeFeed`
+relays store/forget/reorbit events between processes, :class:`SharedRateLimiter`
+counts requests for all workers and :class:`SharedLease` lets a single
+worker own periodic maintenance such as reorbit.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+
+from stellar_memory.event_bus import EventBus
+
+logger = logging.getLogger(__name__)
+
+
+class _SqliteState:
+    """Thread-local autocommit connections to a shared WAL database."""
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._local = threading.local()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        if getattr(self._local, "conn", None) is None:
+            conn = sqlite3.connect(self._db_path, timeout=5.0,
+                                   isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return self._local.conn
+
+    def _transaction(self, fn):
+        """Run ``fn(conn)`` inside ``BEGIN IMMEDIATE`` (one writer at a time)."""
+        conn = self._get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(conn)
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+
+class ChangeFeed(_SqliteState):
+    """Append-only change log that mirrors bus events to other processes.
+
+    Local ``on_store`` / ``on_forget`` / ``on_reorbit`` (and related) events
+    are appended to the ``change_feed`` table tagged with this process's
+    origin. A poller thread reads rows from other origins and re-emits them
+    locally as ``on_remote_change(kind, item_id, user_id)`` so caches and
+    indexes can catch up. Rows older than ``retention_seconds`` are pruned.
+    """
+
+    def __init__(self, db_path: str, poll_interval: float = 0.25,
+                 retention_seconds: float = 300.0):
+        super().__init__(db_path)
+        self.origin = uuid.uuid4().hex
+        self._poll_interval = poll_interval
+        self._retention = retention_seconds
+        self._bus: EventBus | None = None
+        self._last_prune = 0.0
+        self._poll_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self.published = 0
+        self.received = 0
+        conn = self._get_conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS change_feed (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                origin TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                item_id TEXT,
+                user_id TEXT,
+                ts REAL NOT NULL
+            )
+        """)
+        row = conn.execute("SELECT MAX(seq) FROM change_feed").fetchone()
+        self._cursor = row[0] or 0  # history before startup is already in storage
+
+    def attach(self, bus: EventBus) -> None:
+        """Publish local lifecycle events and re-emit remote ones on ``bus``."""
+        self._bus = bus
+        # Inline: the change is in the feed before the call that made it returns
+        bus.on("on_store", lambda item: self.publish("store", item.id, item.user_id),
+               sync=True)
+        bus.on("on_forget", lambda mid: self.publish("forget", mid), sync=True)
+        bus.on("on_auto_forget", lambda mid: self.publish("forget", mid), sync=True)
+        bus.on("on_consolidate", lambda existing, new: self.publish(
+            "update", existing.id, existing.user_id), sync=True)
+        bus.on("on_reorbit", lambda result: self.publish("reorbit"), sync=True)
+        bus.on("on_decay", lambda result: self.publish("reorbit"), sync=True)
+
+    def publish(self, kind: str, item_id: str | None = None,
+                user_id: str | None = None) -> None:
+        try:
+            self._get_conn().execute(
+                "INSERT INTO change_feed (origin, kind, item_id, user_id, ts) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.origin, kind, item_id, user_id, time.time()),
+            )
+            self.published += 1
+        except sqlite3.Error:
+            logger.exception("Failed to publish %s change", kind)
+
+    def poll(self) -> int:
+        """Deliver changes made by other processes; returns how many."""
+        with self._poll_lock:
+            rows = self._get_conn().execute(
+                "SELECT seq, origin, kind, item_id, user_id FROM change_feed "
+                "WHERE seq > ? ORDER BY seq",
+                (self._cursor,),
+            ).fetchall()
+            delivered = 0
+            for seq, origin, kind, item_id, user_id in rows:
+                self._cursor = seq
+                if origin == self.origin:
+                    continue
+                delivered += 1
+                if self._bus is not None:
+                    self._bus.emit("on_remote_change", kind, item_id, user_id)
+            self.received += delivered
+            self._prune()
+            return delivered
+
+    def _prune(self) -> None:
+        now = time.time()
+        if now - self._last_prune < self._retention / 10:
+            return
+        self._last_prune = now
+        try:
+            self._get_conn().execute(
+                "DELETE FROM change_feed WHERE ts < ?", (now - self._retention,))
+        except sqlite3.OperationalError:
+            pass  # another worker holds the write lock; prune next time
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True,
+                                        name="stellar-change-feed")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Error polling change feed")
+
+    def stats(self) -> dict:
+        return {"origin": self.origin, "cursor": self._cursor,
+                "published": self.published, "received": self.received}
+
+
+class SharedRateLimiter(_SqliteState):
+    """Fixed-window request counter shared by every worker process."""
+
+    in_process = False
+
+    def __init__(self, db_path: str, window: int = 60):
+        super().__init__(db_path)
+        self._window = window
+        self._hits = 0
+        self._get_conn().execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                key TEXT PRIMARY KEY,
+                window_start INTEGER NOT NULL,
+                count INTEGER NOT NULL
+            )
+        """)
+
+    def hit(self, key: str, limit: int,
+            now: float | None = None) -> tuple[bool, int, int]:
+        """Count one request for ``key``.
+
+        Returns ``(allowed, remaining, reset_at)``; rejected requests are
+        not counted.
+        """
+        now = time.time() if now is None else now
+        window_start = int(now // self._window) * self._window
+
+        def _hit(conn: sqlite3.Connection) -> int:
+            row = conn.execute(
+                "SELECT window_start, count FROM rate_limits WHERE key = ?",
+                (key,),
+            ).fetchone()
+            count = row[1] if row and row[0] == window_start else 0
+            if count < limit:
+                count += 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_limits (key, window_start, count) "
+                    "VALUES (?, ?, ?)",
+                    (key, window_start, count),
+                )
+                return count
+            return -1
+
+        count = self._transaction(_hit)
+        self._hits += 1
+        if self._hits % 1000 == 0:
+            self._get_conn().execute(
+                "DELETE FROM rate_limits WHERE window_start < ?", (window_start,))
+        reset_at = window_start + self._window
+        if count < 0:
+            return False, 0, reset_at
+        return True, max(0, limit - count), reset_at
+
+
+class SharedLease(_SqliteState):
+    """Time-limited named lease; at most one holder across processes."""
+
+    def __init__(self, db_path: str, name: str, ttl: float):
+        super().__init__(db_path)
+        self._name = name
+        self._ttl = ttl
+        self.holder = uuid.uuid4().hex
+        self._get_conn().execute("""
+            CREATE TABLE IF NOT EXISTS leases (
+                name TEXT PRIMARY KEY,
+                holder TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+
+    def acquire(self, now: float | None = None) -> bool:
+        """Take or renew the lease; False while another holder's is live."""
+        now = time.time() if now is None else now
+
+        def _acquire(conn: sqlite3.Connection) -> bool:
+            row = conn.execute(
+                "SELECT holder, expires_at FROM leases WHERE name = ?",
+                (self._name,),
+            ).fetchone()
+            if row and row[0] != self.holder and row[1] > now:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO leases (name, holder, expires_at) "
+                "VALUES (?, ?, ?)",
+                (self._name, self.holder, now + self._ttl),
+            )
+            return True
+
+        try:
+            return self._transaction(_acquire)
+        except sqlite3.OperationalError:
+            return False
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import logging
+import threading
 import time
+from dataclasses import replace
 
 from stellar_memory._plugin_manager import PluginManager
 from stellar_memory.config import StellarConfig
@@ -13,6 +16,7 @@ from stellar_memory.event_bus import EventBus
 from stellar_memory.importance_evaluator import create_evaluator
 from stellar_memory.memory_function import MemoryFunction
 from stellar_memory.memory_graph import MemoryGraph
+from stellar_memory import metrics as _metrics
 from stellar_memory.models import (
     MemoryItem, MemoryStats, MemorySnapshot, ReorbitResult, FeedbackRecord,
     SessionInfo, DecayResult, HealthStatus, IngestResult,
@@ -26,11 +30,15 @@ from stellar_memory.plugin import MemoryPlugin
 from stellar_memory.scheduler import ReorbitScheduler
 from stellar_memory.serializer import MemorySerializer
 from stellar_memory.session import SessionManager
-from stellar_memory.storage import StorageFactory
-from stellar_memory.utils import cosine_similarity
+from stellar_memory.storage import SearchFilter, StorageFactory
+from stellar_memory.utils import similarities
 from stellar_memory.vector_index import create_vector_index
 from stellar_memory.weight_tuner import create_tuner
 
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
 
 class StellarMemory:
     def __init__(self, config: StellarConfig | None = None,
@@ -45,6 +53,25 @@ class StellarMemory:
 
         self._memory_fn = MemoryFunction(self.config.memory_function, self.config.zones)
         self._embedder = create_embedder(self.config.embedder)
+        self._full_vectors = None
+        if self.config.embedder.projection != "none":
+            from stellar_memory.projection import (
+                FullVectorStore, ProjectedEmbedder, create_projector,
+            )
+            self._embedder = ProjectedEmbedder(
+                self._embedder,
+                create_projector(self.config.embedder, self.config.db_path),
+            )
+            if self.config.embedder.rerank_full_dim:
+                self._full_vectors = FullVectorStore(
+                    self.config.db_path, self.config.embedder.rerank_codec)
+        self._commit_lock = threading.RLock()
+        self._query_cache = None
+        if self.config.embedder.query_cache_mb > 0:
+            from stellar_memory.embedder import QueryEmbeddingCache
+            self._query_cache = QueryEmbeddingCache(
+                int(self.config.embedder.query_cache_mb * 1024 * 1024)
+            )
         self._evaluator = create_evaluator(self.config.llm)
         self._tuner = create_tuner(self.config.tuner, self.config.memory_function)
         self._consolidator = MemoryConsolidator(self.config.consolidation, self._embedder)
@@ -53,12 +80,29 @@ class StellarMemory:
             self.config.decay,
             emotion_config=self.config.emotion if self.config.emotion.enabled else None,
         )
-        factory = StorageFactory(self.config.db_path)
-        self._orbit_mgr = OrbitManager(self.config.zones, factory)
+        factory = StorageFactory(self.config.db_path, self.config.storage)
+        self._orbit_mgr = OrbitManager(
+            self.config.zones, factory,
+            on_evict=lambda item: self._event_bus.emit("on_remove", item))
+        # Multi-process mode: hot zones live in the shared SQLite file
+        self._shared = (self.config.storage.shared_hot_zones
+                        and self.config.db_path != ":memory:")
+        lease = None
+        if self._shared:
+            from stellar_memory.shared_state import SharedLease
+            lease = SharedLease(self.config.db_path, "reorbit",
+                                ttl=self.config.reorbit_interval * 1.5)
         self._scheduler = ReorbitScheduler(
-            self._orbit_mgr, self._memory_fn, self.config.reorbit_interval
+            self._orbit_mgr, self._memory_fn, self.config.reorbit_interval,
+            lease=lease,
+        )
+        self._metrics = (_metrics.enable() if self.config.metrics.enabled
+                         else _metrics.NULL_METRICS)
+        self._event_bus = EventBus(
+            self.config.event_bus.async_dispatch,
+            self.config.event_bus.queue_size,
+            self.config.event_bus.batch_size,
         )
-        self._event_bus = EventBus()
         self._plugin_mgr = PluginManager()
 
         # Graph: persistent or in-memory
@@ -78,12 +122,14 @@ class StellarMemory:
             self._event_logger = EventLogger(
                 self.config.event_logger.log_path,
                 self.config.event_logger.max_size_mb,
+                self.config.event_logger.compress,
+                self.config.event_logger.flush_interval,
             )
             self._event_logger.attach(self._event_bus)
 
         # P5: Vector Index
         self._vector_index = create_vector_index(
-            self.config.vector_index, self.config.embedder.dimension
+            self.config.vector_index, self.config.embedder.index_dimension
         )
 
         # P5: Summarizer
@@ -105,6 +151,16 @@ class StellarMemory:
 
         self._last_recall_ids: list[str] = []
 
+        # Recall result cache (opt-in)
+        self._recall_cache = None
+        if self.config.recall_cache.enabled:
+            from stellar_memory.recall_cache import RecallCache
+            self._recall_cache = RecallCache(
+                self.config.recall_cache.max_entries,
+                self.config.recall_cache.ttl_seconds,
+            )
+            self._recall_cache.attach(self._event_bus)
+
         # P7: Emotion Analyzer
         self._emotion_analyzer = None
         if self.config.emotion.enabled:
@@ -184,20 +240,63 @@ class StellarMemory:
             if self.config.sync.remote_url:
                 self._sync.connect_remote(self.config.sync.remote_url)
 
-        # P6: Redis cache
+        # Pipelined ingest (opt-in)
+        self._ingest_pipeline = None
+        if self.config.ingest.enabled:
+            from stellar_memory.ingest_pipeline import IngestPipeline
+            self._ingest_pipeline = IngestPipeline(
+                workers=self.config.ingest.workers,
+                queue_size=self.config.ingest.queue_size,
+                submit_timeout=self.config.ingest.submit_timeout,
+                on_error=lambda item_id, exc: self._event_bus.emit(
+                    "on_ingest_error", item_id, exc),
+            )
+
+        # P6: Redis cache (optionally behind an in-process L1 tier)
         self._redis_cache = None
+        self._item_cache = None
         if self.config.storage.redis_url:
             try:
                 from stellar_memory.storage.redis_cache import RedisCache
+                cached_zones = self.config.storage.redis_cached_zones
+                if cached_zones is None:
+                    cached_zones = self._orbit_mgr.io_zones()
                 self._redis_cache = RedisCache(
                     self.config.storage.redis_url,
                     self.config.storage.redis_ttl,
-                    self.config.storage.redis_cached_zones,
+                    cached_zones,
                 )
                 self._redis_cache.connect()
+                if self._redis_cache.is_connected():
+                    self._item_cache = self._redis_cache
+                    if self.config.storage.l1_cache_items > 0:
+                        from stellar_memory.storage.tiered_cache import TieredItemCache
+                        self._item_cache = TieredItemCache(
+                            self._redis_cache,
+                            self.config.storage.l1_cache_items,
+                            self.config.storage.cache_invalidation_channel,
+                        )
+                        self._item_cache.start()
+                    self._orbit_mgr.attach_cache(self._item_cache)
             except Exception:
                 pass
 
+        # Multi-process mode: relay changes so per-process indexes/caches follow
+        self._change_feed = None
+        if self._shared:
+            from stellar_memory.shared_state import ChangeFeed
+            self._vector_index.rebuild({
+                item.id: item.embedding
+                for item in self._orbit_mgr.get_all_items()
+                if item.embedding is not None
+            })
+            self._change_feed = ChangeFeed(
+                self.config.db_path, self.config.storage.change_poll_interval
+            )
+            self._change_feed.attach(self._event_bus)
+            self._event_bus.on("on_remote_change", self._on_remote_change, sync=True)
+            self._change_feed.start()
+
     @property
     def events(self) -> EventBus:
         return self._event_bus
@@ -225,6 +324,95 @@ class StellarMemory:
             if self._audit:
                 self._audit.log_access(role, "", "store")
 
+        item = self._prepare_item(content, importance, metadata, encrypted,
+                                  emotion, content_type, user_id)
+
+        # Pipelined ingest: persist provisionally, enrich in the worker pool
+        if self._ingest_pipeline is not None and not self._ingest_pipeline.in_worker():
+            return self._submit_ingest(item, content, importance, metadata,
+                                       auto_evaluate, skip_summarize)
+        return self._enrich(item, content, importance, metadata,
+                            auto_evaluate, skip_summarize)
+
+    _BATCH_STORE_FIELDS = frozenset({
+        "content", "importance", "metadata", "auto_evaluate", "skip_summarize",
+        "encrypted", "emotion", "content_type", "user_id",
+    })
+
+    def store_batch(self, entries: list[dict], role: str | None = None,
+                    user_id: str | None = None) -> list[MemoryItem | Exception]:
+        """Store many memories through one bulk path.
+
+        Each entry holds :meth:`store` keyword arguments (``content`` is
+        required; ``user_id`` defaults to the argument). Contents are
+        embedded in one ``embed_batch`` call and hot-zone log commits are
+        awaited once for the whole batch. Returns one result per entry, in
+        order: the stored item, or the exception that entry raised.
+        """
+        if self._access_control and role:
+            self._access_control.require_permission(role, "write")
+            if self._audit:
+                self._audit.log_access(role, "", "store_batch")
+
+        results: list[MemoryItem | Exception | None] = [None] * len(entries)
+        prepared: list[tuple[int, MemoryItem, dict]] = []
+        for i, entry in enumerate(entries):
+            try:
+                unknown = set(entry) - self._BATCH_STORE_FIELDS
+                if unknown:
+                    raise TypeError(f"Unknown store fields: {sorted(unknown)}")
+                if not entry.get("content"):
+                    raise ValueError("content is required")
+                kwargs = {"importance": 0.5, "metadata": None,
+                          "auto_evaluate": False, "skip_summarize": False,
+                          "encrypted": False, "emotion": None,
+                          "content_type": None, "user_id": user_id, **entry}
+                item = self._prepare_item(
+                    kwargs["content"], kwargs["importance"], kwargs["metadata"],
+                    kwargs["encrypted"], kwargs["emotion"],
+                    kwargs["content_type"], kwargs["user_id"],
+                )
+                prepared.append((i, item, kwargs))
+            except Exception as exc:
+                results[i] = exc
+
+        if self._ingest_pipeline is not None and not self._ingest_pipeline.in_worker():
+            for i, item, kw in prepared:
+                try:
+                    results[i] = self._submit_ingest(
+                        item, kw["content"], kw["importance"], kw["metadata"],
+                        kw["auto_evaluate"], kw["skip_summarize"])
+                except Exception as exc:
+                    results[i] = exc
+            return results
+
+        try:
+            texts = [kw["content"] for _, _, kw in prepared]
+            if self._full_vectors is None:
+                embeddings = self._embedder.embed_batch(texts)
+            else:
+                embeddings = self._embed_keeping_full(
+                    [item for _, item, _ in prepared], texts)
+        except Exception:
+            logger.exception("Batch embedding failed, embedding items one by one")
+            embeddings = None
+        with self._orbit_mgr.deferred_commit():
+            for n, (i, item, kw) in enumerate(prepared):
+                try:
+                    if embeddings is not None:
+                        item.embedding = embeddings[n]
+                    results[i] = self._enrich(
+                        item, kw["content"], kw["importance"], kw["metadata"],
+                        kw["auto_evaluate"], kw["skip_summarize"],
+                        embedded=embeddings is not None)
+                except Exception as exc:
+                    results[i] = exc
+        return results
+
+    def _prepare_item(self, content: str, importance: float,
+                      metadata: dict | None, encrypted: bool,
+                      emotion: EmotionVector | None, content_type: str | None,
+                      user_id: str | None) -> MemoryItem:
         item = MemoryItem.create(content, importance, metadata, user_id=user_id)
         # P9: Content type detection/assignment
         if content_type is not None:
@@ -233,10 +421,6 @@ class StellarMemory:
             from stellar_memory.multimodal import detect_content_type
             item.content_type = detect_content_type(content)
         self._session_mgr.tag_memory(item)
-        if auto_evaluate:
-            result = self._evaluator.evaluate(content)
-            item.arbitrary_importance = result.importance
-            item.metadata["evaluation"] = result.method
 
         # P6: Auto-encrypt by tag or explicit flag
         should_encrypt = encrypted
@@ -257,35 +441,82 @@ class StellarMemory:
             if self._audit:
                 self._audit.log_encrypt(item.id)
 
-        # P7: Emotion analysis
         if emotion is not None:
             item.emotion = emotion
-        elif self._emotion_analyzer is not None:
-            item.emotion = self._emotion_analyzer.analyze(content)
+        return item
 
-        item.embedding = self._embedder.embed(content)
+    def _enrich(self, item: MemoryItem, content: str, importance: float,
+                metadata: dict | None, auto_evaluate: bool,
+                skip_summarize: bool, provisional: bool = False,
+                embedded: bool = False) -> MemoryItem:
+        """Enrichment stages of store(): evaluate, emotion, embed,
+        consolidate, summarize, place. ``provisional`` items were already
+        persisted by the ingest pipeline and are replaced on commit;
+        ``embedded`` items carry an embedding from a batch call."""
+        with self._metrics.span("store"):
+            return self._enrich_stages(item, content, importance, metadata,
+                                       auto_evaluate, skip_summarize,
+                                       provisional, embedded)
+
+    def _enrich_stages(self, item: MemoryItem, content: str, importance: float,
+                       metadata: dict | None, auto_evaluate: bool,
+                       skip_summarize: bool, provisional: bool,
+                       embedded: bool) -> MemoryItem:
+        stage = self._ingest_stage if provisional else (lambda item_id, name: None)
+        span = self._metrics.span
+        if auto_evaluate:
+            with span("store.evaluate"):
+                result = self._evaluator.evaluate(content)
+            item.arbitrary_importance = result.importance
+            item.metadata["evaluation"] = result.method
+            stage(item.id, "evaluate")
+
+        # P7: Emotion analysis
+        if item.emotion is None and self._emotion_analyzer is not None:
+            with span("store.emotion"):
+                item.emotion = self._emotion_analyzer.analyze(content)
+            stage(item.id, "emotion")
+
+        if not embedded:
+            with span("store.embed"):
+                if self._full_vectors is None:
+                    item.embedding = self._embedder.embed(content)
+                else:
+                    item.embedding = self._embed_keeping_full([item], [content])[0]
+        stage(item.id, "embed")
 
         # Consolidation: try to merge with similar existing memory
         if (self.config.consolidation.enabled
                 and self.config.consolidation.on_store
                 and item.embedding is not None):
-            existing = self._find_similar_in_zones(item)
-            if existing is not None:
-                merged = self._consolidator.merge(existing, item)
-                # Plugin hook: on_consolidate
-                merged = self._plugin_mgr.dispatch_consolidate(merged, [existing, item])
-                storage = self._orbit_mgr.get_storage(existing.zone)
-                storage.update(merged)
-                self._event_bus.emit("on_consolidate", existing, item)
-                self._event_bus.emit("on_store", merged)
-                return merged
+            with self._commit_lock:
+                with span("store.consolidate"):
+                    existing = self._find_similar_in_zones(item)
+                if existing is not None:
+                    if provisional:
+                        self._drop_provisional(item)
+                    if self._full_vectors is not None:
+                        # The merged content no longer matches either vector
+                        self._full_vectors.remove_many([existing.id, item.id])
+                    merged = self._consolidator.merge(existing, item)
+                    # Plugin hook: on_consolidate
+                    merged = self._plugin_mgr.dispatch_consolidate(merged, [existing, item])
+                    storage = self._orbit_mgr.get_storage(existing.zone)
+                    storage.update(merged)
+                    self._event_bus.emit("on_consolidate", existing, item)
+                    self._event_bus.emit("on_store", merged)
+                    stage(item.id, "consolidate")
+                    return merged
+            stage(item.id, "consolidate")
 
         # P5: Summarization pipeline
         if (not skip_summarize
                 and self._summarizer is not None
                 and self._summarizer.should_summarize(content)):
-            summary_text = self._summarizer.summarize(content)
+            with span("store.summarize"):
+                summary_text = self._summarizer.summarize(content)
             if summary_text:
+                stage(item.id, "summarize")
                 summary_importance = min(
                     1.0, importance + self.config.summarization.importance_boost
                 )
@@ -300,9 +531,10 @@ class StellarMemory:
                     skip_summarize=True,
                 )
                 # Store original at given importance
-                original_item = self._store_internal(
-                    content, importance, metadata, auto_evaluate, item
+                original_item = self._commit_store(
+                    content, importance, metadata, auto_evaluate, item, provisional
                 )
+                stage(item.id, "place")
                 # Link summary → original
                 if self.config.graph.enabled:
                     self._graph.add_edge(
@@ -311,27 +543,116 @@ class StellarMemory:
                 self._event_bus.emit("on_summarize", summary_item, original_item)
                 return summary_item
 
-        return self._store_internal(content, importance, metadata, auto_evaluate, item)
+        placed = self._commit_store(content, importance, metadata, auto_evaluate,
+                                    item, provisional)
+        stage(item.id, "place")
+        return placed
+
+    # --- Pipelined ingest ---
+
+    def _persist_provisional(self, item: MemoryItem) -> None:
+        """Place the raw item at once so it is durable and keyword-searchable."""
+        with self._commit_lock:
+            breakdown = self._memory_fn.calculate(item, time.time())
+            item.total_score = breakdown.total
+            self._orbit_mgr.place(item, breakdown.target_zone, breakdown.total)
+        self._ingest_stage(item.id, "persist")
+
+    def _drop_provisional(self, item: MemoryItem) -> None:
+        # Reorbit or eviction may have moved it since it was persisted
+        current = self._orbit_mgr.find_item(item.id)
+        if current is not None:
+            self._orbit_mgr.get_storage(current.zone).remove(item.id)
+
+    def _submit_ingest(self, item: MemoryItem, content: str, importance: float,
+                       metadata: dict | None, auto_evaluate: bool,
+                       skip_summarize: bool) -> MemoryItem:
+        self._persist_provisional(item)
+        try:
+            self._ingest_pipeline.submit(item.id, lambda: self._ingest_job(
+                item, content, importance, metadata, auto_evaluate, skip_summarize,
+            ))
+        except Exception:
+            # Queue full (or pipeline stopped): leave no orphaned raw item
+            with self._commit_lock:
+                self._drop_provisional(item)
+            raise
+        return item
+
+    def _ingest_stage(self, item_id: str, stage: str) -> None:
+        self._event_bus.emit("on_ingest_stage", item_id, stage)
+
+    def _ingest_job(self, item: MemoryItem, content: str, importance: float,
+                    metadata: dict | None, auto_evaluate: bool,
+                    skip_summarize: bool) -> MemoryItem:
+        try:
+            result = self._enrich(item, content, importance, metadata, auto_evaluate,
+                                  skip_summarize, provisional=True)
+        except Exception:
+            # Evaluate/embed/summarize failed: don't leave the raw item behind
+            with self._commit_lock:
+                self._drop_provisional(item)
+                self._vector_index.remove(item.id)
+                self._graph.remove_item(item.id)
+                if self._full_vectors is not None:
+                    self._full_vectors.remove_many([item.id])
+            raise
+        self._event_bus.emit("on_ingest_complete", item.id, result)
+        return result
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every pipelined store has been fully enriched.
+
+        Returns False if ``timeout`` elapsed first. No-op without the
+        ingest pipeline.
+        """
+        if self._ingest_pipeline is None:
+            return True
+        return self._ingest_pipeline.flush(timeout)
+
+    def wait_for(self, memory_id: str, timeout: float | None = None) -> MemoryItem | None:
+        """Wait for one pipelined store and return the final item.
+
+        The result may be a different item than the provisional one when
+        the memory was consolidated or summarized.
+        """
+        if self._ingest_pipeline is None or self._ingest_pipeline.in_worker():
+            return self.get(memory_id)
+        result = self._ingest_pipeline.wait_for(memory_id, timeout)
+        return result if result is not None else self.get(memory_id)
+
+    def _commit_store(self, content: str, importance: float,
+                      metadata: dict | None, auto_evaluate: bool,
+                      item: MemoryItem, provisional: bool) -> MemoryItem:
+        with self._commit_lock:
+            if provisional:
+                self._drop_provisional(item)
+            return self._store_internal(content, importance, metadata, auto_evaluate, item)
 
     def _store_internal(self, content: str, importance: float,
                         metadata: dict | None, auto_evaluate: bool,
                         item: MemoryItem) -> MemoryItem:
         """Internal store: place item, auto-link, register in vector index."""
-        now = time.time()
-        breakdown = self._memory_fn.calculate(item, now)
-        item.total_score = breakdown.total
-        self._orbit_mgr.place(item, breakdown.target_zone, breakdown.total)
+        span = self._metrics.span
+        with span("store.place"):
+            now = time.time()
+            breakdown = self._memory_fn.calculate(item, now)
+            item.total_score = breakdown.total
+            self._orbit_mgr.place(item, breakdown.target_zone, breakdown.total)
 
         # Register in vector index
         if item.embedding is not None:
-            self._vector_index.add(item.id, item.embedding)
+            with span("store.index"):
+                self._vector_index.add(item.id, item.embedding)
 
         # Graph: auto-link to similar memories
         if self.config.graph.enabled and self.config.graph.auto_link:
-            self._auto_link(item)
+            with span("store.auto_link"):
+                self._auto_link(item)
 
         # Plugin hook: on_store
-        item = self._plugin_mgr.dispatch_store(item)
+        with span("store.plugins"):
+            item = self._plugin_mgr.dispatch_store(item)
 
         self._event_bus.emit("on_store", item)
         return item
@@ -348,82 +669,160 @@ class StellarMemory:
 
         # Plugin hook: pre_recall
         query = self._plugin_mgr.dispatch_pre_recall(query)
+        return self._recall(query, limit, emotion, user_id)
 
-        query_embedding = self._embedder.embed(query)
-        results: list[MemoryItem] = []
-        session_id = self._session_mgr.current_session_id
+    def recall_batch(self, queries: list[str], limit: int = 5,
+                     role: str | None = None,
+                     emotion: str | None = None,
+                     user_id: str | None = None) -> list[list[MemoryItem] | Exception]:
+        """Run several recalls that share one query-embedding batch.
+
+        Repeated queries are searched once. Returns one result per query,
+        in order: its recalled items, or the exception it raised.
+        """
+        if self._access_control and role:
+            self._access_control.require_permission(role, "read")
+            if self._audit:
+                self._audit.log_access(role, "", "recall_batch")
 
-        if session_id and self.config.session.scope_current_first:
-            # Phase 1: current session items first
-            for zone_id in sorted(self._orbit_mgr._zones.keys()):
-                storage = self._orbit_mgr.get_storage(zone_id)
-                matches = storage.search(query, limit, query_embedding=query_embedding)
-                for m in matches:
-                    if m.metadata.get("session_id") == session_id:
-                        results.append(m)
-            # Phase 2: fill remaining from all items
-            if len(results) < limit:
-                existing_ids = {r.id for r in results}
+        rewritten = [self._plugin_mgr.dispatch_pre_recall(q) for q in queries]
+        unique = list(dict.fromkeys(rewritten))
+        try:
+            embeddings = dict(zip(unique, self._embed_queries(unique)))
+        except Exception:
+            logger.exception("Batch query embedding failed, embedding queries one by one")
+            embeddings = {}
+        answers: dict[str, list[MemoryItem] | Exception] = {}
+        for query in unique:
+            try:
+                answers[query] = self._recall(query, limit, emotion, user_id,
+                                              embeddings.get(query, _UNSET))
+            except Exception as exc:
+                answers[query] = exc
+        return [answers[q] for q in rewritten]
+
+    def _recall(self, query: str, limit: int, emotion: str | None,
+                user_id: str | None, query_embedding=_UNSET) -> list[MemoryItem]:
+        """recall() after RBAC and the pre_recall hook."""
+        with self._metrics.span("recall"):
+            return self._recall_stages(query, limit, emotion, user_id, query_embedding)
+
+    def _recall_stages(self, query: str, limit: int, emotion: str | None,
+                       user_id: str | None, query_embedding) -> list[MemoryItem]:
+        span = self._metrics.span
+        session_id = self._session_mgr.current_session_id
+        cache_key = None
+        if self._recall_cache is not None:
+            started = time.perf_counter()
+            scope = session_id if self.config.session.scope_current_first else None
+            cache_key = self._recall_cache.make_key(query, limit, user_id, emotion, scope)
+            generation = self._recall_cache.generation
+            cached = self._recall_cache.get(cache_key)
+            self._metrics.inc("recall_cache_hits" if cached is not None
+                              else "recall_cache_misses")
+            if cached is not None:
+                if self._recall_cache.pending_bumps >= self.config.recall_cache.max_pending_bumps:
+                    self._flush_recall_bumps()
+                self._recall_cache.record_latency(
+                    True, (time.perf_counter() - started) * 1000)
+                return self._finish_recall(query, cached)
+            self._flush_recall_bumps()
+
+        if query_embedding is _UNSET:
+            with span("recall.embed"):
+                query_embedding = self._embed_query(query)
+        results: list[MemoryItem] = []
+        fetch_limit = limit
+        if self.config.embedder.rerank_full_dim:
+            fetch_limit = max(limit, self.config.embedder.rerank_top_k)
+        # Attribute filters are pushed down so they apply before top-k
+        filters = SearchFilter(user_id=user_id, emotion=emotion)
+
+        with span("recall.search"):
+            if session_id and self.config.session.scope_current_first:
+                # Phase 1: current session items first
+                session_filters = replace(filters, session_id=session_id)
                 for zone_id in sorted(self._orbit_mgr._zones.keys()):
-                    if len(results) >= limit:
+                    storage = self._orbit_mgr.get_storage(zone_id)
+                    results.extend(storage.search(query, fetch_limit,
+                                                  query_embedding=query_embedding,
+                                                  filters=session_filters))
+                # Phase 2: fill remaining from all items
+                if len(results) < fetch_limit:
+                    existing_ids = {r.id for r in results}
+                    for zone_id in sorted(self._orbit_mgr._zones.keys()):
+                        if len(results) >= fetch_limit:
+                            break
+                        storage = self._orbit_mgr.get_storage(zone_id)
+                        matches = storage.search(query, fetch_limit,
+                                                 query_embedding=query_embedding,
+                                                 filters=filters)
+                        for m in matches:
+                            if m.id not in existing_ids:
+                                results.append(m)
+                                existing_ids.add(m.id)
+                                if len(results) >= fetch_limit:
+                                    break
+            else:
+                for zone_id in sorted(self._orbit_mgr._zones.keys()):
+                    if len(results) >= fetch_limit:
                         break
                     storage = self._orbit_mgr.get_storage(zone_id)
-                    matches = storage.search(query, limit, query_embedding=query_embedding)
-                    for m in matches:
-                        if m.id not in existing_ids:
-                            results.append(m)
-                            existing_ids.add(m.id)
-                            if len(results) >= limit:
-                                break
-        else:
-            for zone_id in sorted(self._orbit_mgr._zones.keys()):
-                if len(results) >= limit:
-                    break
-                storage = self._orbit_mgr.get_storage(zone_id)
-                matches = storage.search(query, limit - len(results),
-                                         query_embedding=query_embedding)
-                results.extend(matches)
+                    matches = storage.search(query, fetch_limit - len(results),
+                                             query_embedding=query_embedding,
+                                             filters=filters)
+                    results.extend(matches)
+
+        # Optional full-dimension re-rank of the reduced-space shortlist
+        if (self.config.embedder.rerank_full_dim
+                and hasattr(self._embedder, "embed_full")
+                and results):
+            with span("recall.rerank"):
+                results = self._rerank_full_dim(query, results, limit)
 
-        now = time.time()
-        for item in results:
-            item.recall_count += 1
-            item.last_recalled_at = now
-            storage = self._orbit_mgr.get_storage(item.zone)
-            storage.update(item)
+        with span("recall.bump_stats"):
+            now = time.time()
+            for item in results:
+                item.recall_count += 1
+                item.last_recalled_at = now
+                storage = self._orbit_mgr.get_storage(item.zone)
+                storage.update(item)
 
         results = results[:limit]
 
-        # Multi-tenant: filter by user_id if provided
-        if user_id:
-            results = [r for r in results if r.user_id is None or r.user_id == user_id]
-
         # Graph boost: enhance results with graph-connected memories
         if (self.config.recall_boost.graph_boost_enabled
                 and self.config.graph.enabled
                 and results):
-            results = self._apply_graph_boost(results, query_embedding, limit)
+            with span("recall.graph_boost"):
+                results = self._apply_graph_boost(results, query_embedding, limit)
+            # Graph neighbours bypass storage search, so re-apply the filter
+            if not filters.is_empty:
+                results = [r for r in results if filters.matches(r)]
 
         # P6: Auto-decrypt encrypted memories
         if self._encryption and self._encryption.enabled:
-            for item in results:
-                if item.encrypted:
-                    try:
-                        item.content = self._encryption.decrypt(item.content)
-                        if self._audit:
-                            self._audit.log_decrypt(item.id)
-                    except Exception:
-                        pass  # leave encrypted if decrypt fails
-
-        # P7: Emotion filter
-        if emotion is not None:
-            results = [
-                r for r in results
-                if r.emotion is not None and r.emotion.dominant == emotion
-            ]
+            with span("recall.decrypt"):
+                for item in results:
+                    if item.encrypted:
+                        try:
+                            item.content = self._encryption.decrypt(item.content)
+                            if self._audit:
+                                self._audit.log_decrypt(item.id)
+                        except Exception:
+                            pass  # leave encrypted if decrypt fails
 
         # Plugin hook: on_recall
-        results = self._plugin_mgr.dispatch_recall(query, results)
+        with span("recall.plugins"):
+            results = self._plugin_mgr.dispatch_recall(query, results)
 
+        if cache_key is not None:
+            self._recall_cache.put(cache_key, results, generation)
+            self._recall_cache.record_latency(
+                False, (time.perf_counter() - started) * 1000)
+        return self._finish_recall(query, results)
+
+    def _finish_recall(self, query: str, results: list[MemoryItem]) -> list[MemoryItem]:
         self._last_recall_ids = [item.id for item in results]
 
         # P9: Log recall for self-learning
@@ -438,6 +837,33 @@ class StellarMemory:
         self._event_bus.emit("on_recall", results, query)
         return results
 
+    def _embed_query(self, query: str) -> list[float] | None:
+        """Embed a recall query through the query-embedding cache."""
+        if self._query_cache is None:
+            return self._embedder.embed(query)
+        return self._query_cache.get_or_embed(query, self._embedder.embed)
+
+    def _embed_queries(self, queries: list[str]) -> list[list[float] | None]:
+        """Embed several recall queries with one batch call for cache misses."""
+        if self._query_cache is None:
+            return self._embedder.embed_batch(queries)
+        return self._query_cache.get_or_embed_many(queries, self._embedder.embed_batch)
+
+    def _flush_recall_bumps(self) -> int:
+        """Apply recall-stat bumps deferred by recall cache hits."""
+        if self._recall_cache is None:
+            return 0
+        pending, recalled_at = self._recall_cache.drain_bumps()
+        items = self._orbit_mgr.find_items(list(pending))
+        for item_id, hits in pending.items():
+            item = items.get(item_id)
+            if item is None:
+                continue
+            item.recall_count += hits
+            item.last_recalled_at = max(item.last_recalled_at, recalled_at)
+            self._orbit_mgr.get_storage(item.zone).update(item)
+        return len(pending)
+
     def get(self, memory_id: str) -> MemoryItem | None:
         return self._orbit_mgr.find_item(memory_id)
 
@@ -446,31 +872,57 @@ class StellarMemory:
         if not self._plugin_mgr.dispatch_forget(memory_id):
             return False
 
-        item = self._orbit_mgr.find_item(memory_id)
-        if item is None:
-            return False
-        if user_id and item.user_id and item.user_id != user_id:
-            return False
-        storage = self._orbit_mgr.get_storage(item.zone)
-        removed = storage.remove(memory_id)
+        with self._commit_lock:
+            item = self._orbit_mgr.find_item(memory_id)
+            if item is None:
+                return False
+            if user_id and item.user_id and item.user_id != user_id:
+                return False
+            storage = self._orbit_mgr.get_storage(item.zone)
+            removed = storage.remove(memory_id)
+            if removed:
+                self._graph.remove_item(memory_id)
+                self._vector_index.remove(memory_id)
+                if self._full_vectors is not None:
+                    self._full_vectors.remove_many([memory_id])
         if removed:
-            self._graph.remove_item(memory_id)
-            self._vector_index.remove(memory_id)
             self._event_bus.emit("on_forget", memory_id)
+            self._event_bus.emit("on_remove", item)
         return removed
 
+    def _on_remote_change(self, kind: str, item_id: str | None,
+                          user_id: str | None) -> None:
+        """Mirror another process's write into the local vector index."""
+        if item_id is None:
+            return
+        if kind == "forget":
+            with self._commit_lock:
+                self._vector_index.remove(item_id)
+            return
+        item = self._orbit_mgr.find_item(item_id)
+        if item is not None and item.embedding is not None:
+            with self._commit_lock:
+                self._vector_index.add(item.id, item.embedding)
+
     def reorbit(self) -> ReorbitResult:
-        result = self._orbit_mgr.reorbit_all(self._memory_fn, time.time())
+        span = self._metrics.span
+        with span("reorbit"):
+            with self._commit_lock:
+                self._flush_recall_bumps()
+                with span("reorbit.orbit"):
+                    result = self._orbit_mgr.reorbit_all(self._memory_fn, time.time())
 
-        # Plugin hook: on_reorbit
-        moves = [(str(i), 0, 0) for i in range(result.moved)]
-        self._plugin_mgr.dispatch_reorbit(moves)
+            # Plugin hook: on_reorbit
+            with span("reorbit.plugins"):
+                moves = [(str(i), 0, 0) for i in range(result.moved)]
+                self._plugin_mgr.dispatch_reorbit(moves)
 
-        self._event_bus.emit("on_reorbit", result)
+            self._event_bus.emit("on_reorbit", result)
 
-        # Apply decay after reorbit
-        if self.config.decay.enabled:
-            self._apply_decay()
+            # Apply decay after reorbit
+            if self.config.decay.enabled:
+                with span("reorbit.decay"):
+                    self._apply_decay()
 
         return result
 
@@ -487,8 +939,19 @@ class StellarMemory:
             zone_counts=zone_counts,
             zone_capacities=zone_capacities,
             total_memories=total,
+            recall_cache=self._recall_cache.stats() if self._recall_cache else None,
+            query_cache=self._query_cache.stats() if self._query_cache else None,
+            item_cache=self._item_cache_stats(),
         )
 
+    def _item_cache_stats(self) -> dict | None:
+        """Per-tier hit ratios of the item cache ({"l1": ..., "l2": ...})."""
+        if self._item_cache is None:
+            return None
+        if self._item_cache is self._redis_cache:
+            return {"l2": self._redis_cache.stats()}
+        return self._item_cache.stats()
+
     def _health(self) -> HealthStatus:
         """Run health diagnostics on the memory system."""
         status = HealthStatus()
@@ -516,6 +979,9 @@ class StellarMemory:
 
         status.scheduler_running = self._scheduler.running
         status.graph_edges = self._graph.count_edges()
+        spans = self._metrics.snapshot()["spans"]
+        status.latency = {op: spans[op] for op in ("store", "recall", "reorbit")
+                          if op in spans}
 
         if not status.db_accessible:
             status.healthy = False
@@ -585,6 +1051,74 @@ class StellarMemory:
                 return match
         return None
 
+    # --- Embedding projection ---
+
+    def _embed_keeping_full(self, items: list[MemoryItem],
+                            texts: list[str]) -> list[list[float] | None]:
+        """Embed texts for storage and keep their full-dim vectors for rerank."""
+        full = self._embedder.embed_full_batch(texts)
+        self._full_vectors.put_many(
+            {item.id: vec for item, vec in zip(items, full) if vec is not None})
+        project = self._embedder.projector.project
+        return [None if vec is None else project(vec) for vec in full]
+
+    def _rerank_full_dim(self, query: str, candidates: list[MemoryItem],
+                         limit: int) -> list[MemoryItem]:
+        """Re-score a reduced-space shortlist with the full-dimension vectors
+        kept at store time; candidates without one keep their reduced score."""
+        query_full = self._embedder.embed_full(query)
+        if query_full is None or self._full_vectors is None:
+            return candidates[:limit]
+        full = self._full_vectors.get_many([c.id for c in candidates])
+        pairs = [(item_id, vec) for item_id, vec in full.items()
+                 if len(vec) == len(query_full)]
+        scores = dict(zip((item_id for item_id, _ in pairs),
+                          similarities(query_full, [vec for _, vec in pairs])))
+        rest = [c for c in candidates if c.id not in scores and c.embedding is not None]
+        query_reduced = self._embedder.projector.project(query_full)
+        scores.update(zip((c.id for c in rest),
+                          similarities(query_reduced, [c.embedding for c in rest])))
+        ranked = sorted(candidates, key=lambda c: scores.get(c.id, 0.0), reverse=True)
+        return ranked[:limit]
+
+    def fit_projection(self, sample_size: int | None = None) -> int:
+        """Fit the PCA projection on a corpus sample and persist it.
+
+        Full-dimension vectors come from memories stored before fitting
+        and, with ``rerank_full_dim``, from the vectors kept for rerank,
+        so a refit re-projects from the originals. Returns the number of
+        memories re-projected.
+        """
+        import random
+        from stellar_memory.projection import PCAProjector
+
+        projector = getattr(self._embedder, "projector", None)
+        if not isinstance(projector, PCAProjector):
+            raise RuntimeError("PCA projection is not enabled")
+        size = sample_size or self.config.embedder.pca_sample_size
+        items = [i for i in self._orbit_mgr.get_all_items() if i.embedding is not None]
+        kept = (self._full_vectors.get_many([i.id for i in items])
+                if self._full_vectors is not None else {})
+        originals: dict[str, list[float]] = {}
+        for item in items:
+            vec = kept.get(item.id, item.embedding)
+            if len(vec) == projector.input_dim:
+                originals[item.id] = vec
+        sample = list(originals.values())
+        if len(sample) > size:
+            sample = random.Random(42).sample(sample, size)
+        projector.fit(sample)
+        projector.save(self.config.db_path)
+
+        for item in items:
+            if item.id in originals:
+                item.embedding = projector.project(originals[item.id])
+                self._orbit_mgr.get_storage(item.zone).update(item)
+        self._vector_index.rebuild({i.id: i.embedding for i in items})
+        if self._query_cache:
+            self._query_cache.clear()  # cached queries were projected pre-fit
+        return len(originals)
+
     # --- F3: Export/Import ---
 
     def export_json(self, include_embeddings: bool = True) -> str:
@@ -621,19 +1155,17 @@ class StellarMemory:
 
         # Use vector index for O(log n) search
         if self._vector_index.size() > 1:
-            candidates = self._vector_index.search(item.embedding, top_k=20)
+            candidates = self._vector_index.search(
+                item.embedding, top_k=20, filter_fn=lambda oid: oid != item.id)
             for other_id, sim in candidates:
-                if other_id == item.id:
-                    continue
                 if sim >= threshold:
                     self._graph.add_edge(item.id, other_id, "related_to", weight=sim)
         else:
             # Fallback: brute force for very small datasets
-            all_items = self._orbit_mgr.get_all_items()
-            for other in all_items:
-                if other.id == item.id or other.embedding is None:
-                    continue
-                sim = cosine_similarity(item.embedding, other.embedding)
+            others = [o for o in self._orbit_mgr.get_all_items()
+                      if o.id != item.id and o.embedding is not None]
+            sims = similarities(item.embedding, [o.embedding for o in others])
+            for other, sim in zip(others, sims):
                 if sim >= threshold:
                     self._graph.add_edge(item.id, other.id, "related_to", weight=sim)
 
@@ -724,11 +1256,9 @@ class StellarMemory:
             related = self._graph.get_related_ids(item.id, depth=depth)
             neighbor_ids.update(related - result_ids)
 
-        for nid in neighbor_ids:
-            neighbor = self._orbit_mgr.find_item(nid)
-            if neighbor is not None:
-                neighbor.total_score += boost_score
-                boosted.append(neighbor)
+        for neighbor in self._orbit_mgr.find_items(list(neighbor_ids)).values():
+            neighbor.total_score += boost_score
+            boosted.append(neighbor)
 
         boosted.sort(key=lambda x: x.total_score, reverse=True)
         return boosted[:limit]
@@ -777,6 +1307,8 @@ class StellarMemory:
         item.encrypted = True
         storage = self._orbit_mgr.get_storage(item.zone)
         storage.update(item)
+        if self._recall_cache:
+            self._recall_cache.invalidate_item(memory_id)
         if self._audit:
             self._audit.log_encrypt(memory_id)
         return True
@@ -1020,13 +1552,27 @@ class StellarMemory:
         self._scheduler.start()
 
     def stop(self) -> None:
+        if self._ingest_pipeline is not None:
+            self._ingest_pipeline.stop()
+            self._ingest_pipeline = None
+        self._flush_recall_bumps()
         self._plugin_mgr.shutdown()
         self._scheduler.stop()
+        if self._change_feed is not None:
+            self._change_feed.stop()
+        self._event_bus.close()
+        if self._event_logger is not None:
+            self._event_logger.close()
+        if self._audit is not None:
+            self._audit.close()
+        self._orbit_mgr.close()
+        if self._full_vectors is not None:
+            self._full_vectors.close()
         self._tuner.close()
         if self._sync:
             self._sync.stop()
         if self._redis_cache:
-            self._redis_cache.disconnect()
+            self._redis_cache.disconnect()  # also ends the L1 invalidation listener
 
     # --- v3.0 Backward Compatibility ---
     # Methods moved to private API. Old names still work via __getattr__.
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import base64
+import heapq
+import json
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,7 +14,121 @@ if TYPE_CHECKING:
     from stellar_memory.config import ZoneConfig, StorageConfig
 
 
+@dataclass
+class SearchFilter:
+    """Attribute filter pushed down into ``ZoneStorage.search``.
+
+    ``None`` fields are ignored. Items without an owner (``user_id is
+    None``) are shared and match every ``user_id``.
+    """
+    user_id: str | None = None
+    emotion: str | None = None
+    session_id: str | None = None
+    content_type: str | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return (self.user_id is None and self.emotion is None
+                and self.session_id is None and self.content_type is None)
+
+    def matches(self, item: MemoryItem) -> bool:
+        if self.user_id is not None and item.user_id not in (None, self.user_id):
+            return False
+        if self.emotion is not None and (
+                item.emotion is None or item.emotion.dominant != self.emotion):
+            return False
+        if (self.session_id is not None
+                and item.metadata.get("session_id") != self.session_id):
+            return False
+        if self.content_type is not None and item.content_type != self.content_type:
+            return False
+        return True
+
+
+# Keyset listing: rows are ordered by one of these (descending), then id
+LIST_ORDERS = ("total_score", "created_at")
+# Columns list_items can return; embeddings are never part of a listing
+LIST_FIELDS = ("id", "content", "zone", "total_score", "recall_count",
+               "arbitrary_importance", "created_at", "last_recalled_at",
+               "user_id", "content_type", "metadata")
+
+
+@dataclass(frozen=True)
+class ListCursor:
+    """Keyset position: the sort value and id of the last row returned."""
+    order_by: str
+    value: float
+    item_id: str
+
+    def encode(self) -> str:
+        raw = json.dumps([self.order_by, self.value, self.item_id],
+                         separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> ListCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            order_by, value, item_id = json.loads(base64.urlsafe_b64decode(padded))
+            cursor = cls(str(order_by), float(value), str(item_id))
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor") from None
+        if cursor.order_by not in LIST_ORDERS:
+            raise ValueError("Invalid cursor")
+        return cursor
+
+    @classmethod
+    def of(cls, order_by: str, row: dict) -> ListCursor:
+        return cls(order_by, row[order_by], row["id"])
+
+    def precedes(self, value: float, item_id: str) -> bool:
+        """True if a row with ``(value, item_id)`` comes after this cursor."""
+        return value < self.value or (value == self.value and item_id > self.item_id)
+
+
+def list_fields(order_by: str, fields: list[str] | tuple | None) -> list[str]:
+    """Validated column list for list_items; always includes id and the sort key."""
+    if order_by not in LIST_ORDERS:
+        raise ValueError(f"order_by must be one of {LIST_ORDERS}")
+    fields = list(dict.fromkeys(("id", order_by, *(fields or LIST_FIELDS))))
+    unknown = [f for f in fields if f not in LIST_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown list fields: {unknown}")
+    return fields
+
+
+def list_key(order_by: str):
+    """Sort key giving list_items order (value descending, then id)."""
+    return lambda row: (-row[order_by], row["id"])
+
+
+class OwnerCounts:
+    """Rows per ``user_id``, so in-process zones count without a scan."""
+
+    def __init__(self) -> None:
+        self._counts: dict[str | None, int] = {}
+
+    def add(self, user_id: str | None, n: int = 1) -> None:
+        total = self._counts.get(user_id, 0) + n
+        if total:
+            self._counts[user_id] = total
+        else:
+            self._counts.pop(user_id, None)
+
+    def move(self, old: str | None, new: str | None) -> None:
+        if old != new:
+            self.add(old, -1)
+            self.add(new)
+
+    def visible_to(self, user_id: str) -> int:
+        """Rows owned by ``user_id`` plus the shared (unowned) ones."""
+        return self._counts.get(None, 0) + self._counts.get(user_id, 0)
+
+
 class ZoneStorage(ABC):
+    # True when reads are plain in-process lookups (no I/O)
+    in_process: bool = False
+
     @abstractmethod
     def store(self, item: MemoryItem) -> None: ...
 
@@ -25,7 +143,8 @@ class ZoneStorage(ABC):
 
     @abstractmethod
     def search(self, query: str, limit: int = 5,
-               query_embedding: list[float] | None = None) -> list[MemoryItem]: ...
+               query_embedding: list[float] | None = None,
+               filters: SearchFilter | None = None) -> list[MemoryItem]: ...
 
     @abstractmethod
     def get_all(self) -> list[MemoryItem]: ...
@@ -36,6 +155,32 @@ class ZoneStorage(ABC):
     @abstractmethod
     def get_lowest_score_item(self) -> MemoryItem | None: ...
 
+    def list_items(self, user_id: str | None = None,
+                   order_by: str = "total_score",
+                   after: ListCursor | None = None, limit: int = 50,
+                   fields: list[str] | None = None) -> list[dict]:
+        """One page of rows ordered by ``order_by`` descending, then id.
+
+        Only rows after the ``after`` cursor are returned, projected onto
+        ``fields``. Backends with an index on the sort key override this
+        generic scan.
+        """
+        fields = list_fields(order_by, fields)
+        rows = (item for item in self.get_all()
+                if user_id is None or item.user_id in (None, user_id))
+        if after is not None:
+            rows = (item for item in rows
+                    if after.precedes(getattr(item, order_by), item.id))
+        page = heapq.nsmallest(limit, rows,
+                               key=lambda i: (-getattr(i, order_by), i.id))
+        return [{f: getattr(item, f) for f in fields} for item in page]
+
+    def count_items(self, user_id: str | None = None) -> int:
+        """Rows visible to ``user_id`` (all rows when None)."""
+        if user_id is None:
+            return self.count()
+        return sum(1 for item in self.get_all() if item.user_id in (None, user_id))
+
 
 class StorageBackend(ABC):
     """P6: Unified storage backend interface."""
@@ -83,17 +228,55 @@ class StorageBackend(ABC):
     def health_check(self) -> bool:
         return self.is_connected()
 
+    # Batch operations; backends override these with set-based versions
+
+    def store_many(self, items: list[MemoryItem]) -> int:
+        for item in items:
+            self.store(item)
+        return len(items)
+
+    def get_many(self, item_ids: list[str],
+                 user_id: str | None = None) -> list[MemoryItem]:
+        kwargs = {"user_id": user_id} if user_id else {}
+        found = (self.get(item_id, **kwargs) for item_id in item_ids)
+        return [item for item in found if item is not None]
+
+    def remove_many(self, item_ids: list[str],
+                    user_id: str | None = None) -> int:
+        kwargs = {"user_id": user_id} if user_id else {}
+        return sum(1 for item_id in item_ids if self.remove(item_id, **kwargs))
+
 
 class StorageFactory:
-    def __init__(self, db_path: str = "stellar_memory.db"):
+    def __init__(self, db_path: str = "stellar_memory.db",
+                 config: StorageConfig | None = None):
         self._db_path = db_path
+        self._config = config
 
     def create(self, zone_config: ZoneConfig) -> ZoneStorage:
         from stellar_memory.storage.in_memory import InMemoryStorage
-        if zone_config.zone_id <= 1 or self._db_path == ":memory:":
-            return InMemoryStorage()
+        shared = self._config is not None and self._config.shared_hot_zones
+        if self._db_path == ":memory:" or (zone_config.zone_id <= 1 and not shared):
+            if self._config and self._config.in_memory_layout == "columnar":
+                from stellar_memory.storage.columnar import ColumnarStorage
+                storage = ColumnarStorage()
+            else:
+                storage = InMemoryStorage()
+            if (self._db_path != ":memory:"
+                    and self._config is not None and self._config.hot_zone_log):
+                import os
+                from stellar_memory.storage.durable import DurableZoneStorage
+                return DurableZoneStorage(
+                    storage, os.path.splitext(self._db_path)[0] + "_hot",
+                    zone_config.zone_id,
+                    sync=self._config.hot_zone_sync,
+                    snapshot_ops=self._config.hot_zone_snapshot_ops,
+                )
+            return storage
         try:
             from stellar_memory.storage.sqlite_storage import SqliteStorage
-            return SqliteStorage(self._db_path, zone_config.zone_id)
+            codec = self._config.embedding_codec if self._config else "float32"
+            return SqliteStorage(self._db_path, zone_config.zone_id,
+                                 embedding_codec=codec)
         except Exception:
             return InMemoryStorage()
@@ -0,0 +1,67 @@
+"""Write-through cache wrapper for a zone storage."""
+
+from __future__ import annotations
+
+from stellar_memory.storage import ListCursor, SearchFilter, ZoneStorage
+from stellar_memory.models import MemoryItem
+
+
+class CachedZoneStorage(ZoneStorage):
+    """Delegates to ``inner`` and keeps an item cache in step with it.
+
+    Writes go through to the cache, removals invalidate it. Reads are
+    served by the inner storage; OrbitManager consults the cache first
+    for id lookups (see ``OrbitManager.find_item``).
+    """
+
+    def __init__(self, inner: ZoneStorage, cache) -> None:
+        self.inner = inner
+        self._cache = cache
+        self.in_process = inner.in_process
+
+    def store(self, item: MemoryItem) -> None:
+        self.inner.store(item)
+        self._cache.set(item)
+
+    def get(self, item_id: str) -> MemoryItem | None:
+        return self.inner.get(item_id)
+
+    def remove(self, item_id: str) -> bool:
+        removed = self.inner.remove(item_id)
+        if removed:
+            self._cache.invalidate(item_id)
+        return removed
+
+    def update(self, item: MemoryItem) -> None:
+        self.inner.update(item)
+        self._cache.set(item)
+
+    def search(self, query: str, limit: int = 5,
+               query_embedding: list[float] | None = None,
+               filters: SearchFilter | None = None) -> list[MemoryItem]:
+        return self.inner.search(query, limit, query_embedding=query_embedding,
+                                 filters=filters)
+
+    def get_all(self) -> list[MemoryItem]:
+        return self.inner.get_all()
+
+    def count(self) -> int:
+        return self.inner.count()
+
+    def get_lowest_score_item(self) -> MemoryItem | None:
+        return self.inner.get_lowest_score_item()
+
+    def list_items(self, user_id: str | None = None,
+                   order_by: str = "total_score",
+                   after: ListCursor | None = None, limit: int = 50,
+                   fields: list[str] | None = None) -> list[dict]:
+        return self.inner.list_items(user_id, order_by, after, limit, fields)
+
+    def count_items(self, user_id: str | None = None) -> int:
+        return self.inner.count_items(user_id)
+
+    def __getattr__(self, name):
+        # Backend-specific extras (e.g. SqliteStorage.close) pass through
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
@@ -0,0 +1,105 @@
+"""Compact binary encoding of a MemoryItem.
+
+Record layout: magic, ``<meta length, embedding dim>``, JSON meta,
+float32 little-endian vector. Shared by the Redis cache and the hot-zone
+operation log.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+
+from stellar_memory.models import EmotionVector, MemoryItem
+
+MAGIC = b"SM\x01"
+_HEADER = struct.Struct("<II")
+
+
+def item_to_meta(item: MemoryItem) -> dict:
+    """Every field except the embedding, as JSON-compatible values."""
+    return {
+        "id": item.id,
+        "content": item.content,
+        "created_at": item.created_at,
+        "last_recalled_at": item.last_recalled_at,
+        "recall_count": item.recall_count,
+        "arbitrary_importance": item.arbitrary_importance,
+        "zone": item.zone,
+        "metadata": item.metadata,
+        "total_score": item.total_score,
+        "encrypted": item.encrypted,
+        "source_type": item.source_type,
+        "source_url": item.source_url,
+        "ingested_at": item.ingested_at,
+        "vector_clock": item.vector_clock,
+        "emotion": item.emotion.to_list() if item.emotion else None,
+        "content_type": item.content_type,
+        "user_id": item.user_id,
+    }
+
+
+def item_from_meta(d: dict, embedding: list[float] | None = None) -> MemoryItem:
+    emotion = d.get("emotion")
+    return MemoryItem(
+        id=d["id"],
+        content=d["content"],
+        created_at=d["created_at"],
+        last_recalled_at=d["last_recalled_at"],
+        recall_count=d.get("recall_count", 0),
+        arbitrary_importance=d.get("arbitrary_importance", 0.5),
+        zone=d.get("zone", -1),
+        metadata=d.get("metadata", {}),
+        embedding=embedding,
+        total_score=d.get("total_score", 0.0),
+        encrypted=d.get("encrypted", False),
+        source_type=d.get("source_type", "user"),
+        source_url=d.get("source_url"),
+        ingested_at=d.get("ingested_at"),
+        vector_clock=d.get("vector_clock"),
+        emotion=EmotionVector.from_list(emotion) if emotion else None,
+        content_type=d.get("content_type", "text"),
+        user_id=d.get("user_id"),
+    )
+
+
+def pack_vectors(vectors) -> bytes:
+    """Concatenate float vectors as float32 little-endian."""
+    packed = array("f")
+    for vector in vectors:
+        packed.extend(vector)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_vectors(data) -> array:
+    """Inverse of :func:`pack_vectors` (one flat float32 array)."""
+    vector = array("f")
+    vector.frombytes(data)
+    if sys.byteorder != "little":
+        vector.byteswap()
+    return vector
+
+
+def encode_item(item: MemoryItem) -> bytes:
+    meta_bytes = json.dumps(item_to_meta(item), separators=(",", ":")).encode()
+    vector = pack_vectors([item.embedding or ()])
+    return MAGIC + _HEADER.pack(len(meta_bytes), len(vector) // 4) + meta_bytes + vector
+
+
+def decode_item(data: bytes) -> MemoryItem:
+    embedding = None
+    if data[:len(MAGIC)] == MAGIC:
+        offset = len(MAGIC)
+        meta_len, dim = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        d = json.loads(data[offset:offset + meta_len])
+        if dim:
+            start = offset + meta_len
+            embedding = unpack_vectors(data[start:start + 4 * dim]).tolist()
+    else:
+        d = json.loads(data)  # JSON entries written by older versions
+    return item_from_meta(d, embedding)
@@ -0,0 +1,397 @@
+"""Columnar (struct-of-arrays) in-memory storage for hot zones.
+
+Numeric fields live in typed ``array`` columns, embeddings in one flat
+float32 matrix, and content/metadata in side lists. ``MemoryItem``
+objects are only materialized when returned, so callers must call
+``update()`` after mutating an item (the same contract as SqliteStorage).
+
+Every public method holds one lock: appends can reallocate the typed
+arrays, so a search must never read a buffer while a store grows it.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+from array import array
+
+from stellar_memory.storage import (
+    ListCursor, OwnerCounts, SearchFilter, ZoneStorage, list_fields,
+)
+from stellar_memory.models import MemoryItem
+from stellar_memory.utils import synchronized
+
+# Rarely-set MemoryItem fields, kept per row only when non-default
+_EXTRA_DEFAULTS = {
+    "source_type": "user",
+    "source_url": None,
+    "ingested_at": None,
+    "vector_clock": None,
+    "emotion": None,
+    "content_type": "text",
+    "user_id": None,
+}
+
+# Typed array columns, in snapshot order
+NUMERIC_COLUMNS = ("created_at", "last_recalled_at", "importance", "total_score",
+                   "recall_count", "zone", "encrypted")
+VECTOR_COLUMNS = ("norms", "has_vec", "vectors")
+
+
+class ColumnarStorage(ZoneStorage):
+    in_process = True
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._content: list[str] = []
+        self._metadata: list[dict] = []
+        self._extras: list[dict | None] = []
+        self._created_at = array("d")
+        self._last_recalled_at = array("d")
+        self._importance = array("d")
+        self._total_score = array("d")
+        self._recall_count = array("q")
+        self._zone = array("b")
+        self._encrypted = array("b")
+        # Embedding matrix: row-major float32, zero rows where absent
+        self._dim: int | None = None
+        self._vectors = array("f")
+        self._norms = array("f")
+        self._has_vec = array("b")
+        # Embeddings whose dimension differs from the matrix (e.g. pre-PCA)
+        self._ragged: dict[str, list[float]] = {}
+        self._owners = OwnerCounts()
+
+    # --- Row encoding ---
+
+    def _vector_row(self, item: MemoryItem) -> tuple[list[float], float, bool]:
+        emb = item.embedding
+        if emb is not None and self._dim is None:
+            self._dim = len(emb)
+            rows = len(self._ids)
+            # First embedding seen after rows without one: back-fill zeros
+            self._vectors.extend(array("f", bytes(4 * self._dim * rows)))
+            self._norms.extend(array("f", bytes(4 * rows)))
+            self._has_vec.extend(array("b", bytes(rows)))
+        dim = self._dim or 0
+        if emb is None or len(emb) != dim:
+            return [0.0] * dim, 0.0, False
+        return emb, math.sqrt(sum(x * x for x in emb)), True
+
+    @staticmethod
+    def _extras_of(item: MemoryItem) -> dict | None:
+        extras = {k: getattr(item, k) for k, default in _EXTRA_DEFAULTS.items()
+                  if getattr(item, k) != default}
+        return extras or None
+
+    def _owner(self, row: int) -> str | None:
+        return (self._extras[row] or {}).get("user_id")
+
+    def _write_row(self, row: int, item: MemoryItem) -> None:
+        self._owners.move(self._owner(row), item.user_id)
+        self._content[row] = item.content
+        self._metadata[row] = item.metadata
+        self._extras[row] = self._extras_of(item)
+        self._created_at[row] = item.created_at
+        self._last_recalled_at[row] = item.last_recalled_at
+        self._importance[row] = item.arbitrary_importance
+        self._total_score[row] = item.total_score
+        self._recall_count[row] = item.recall_count
+        self._zone[row] = item.zone
+        self._encrypted[row] = item.encrypted
+        vector, norm, present = self._vector_row(item)
+        if self._dim:
+            self._vectors[row * self._dim:(row + 1) * self._dim] = array("f", vector)
+            self._norms[row] = norm
+            self._has_vec[row] = present
+        self._set_ragged(item, present)
+
+    def _append_row(self, item: MemoryItem) -> None:
+        row = len(self._ids)
+        vector, norm, present = self._vector_row(item)
+        self._rows[item.id] = row
+        self._ids.append(item.id)
+        self._owners.add(item.user_id)
+        self._content.append(item.content)
+        self._metadata.append(item.metadata)
+        self._extras.append(self._extras_of(item))
+        self._created_at.append(item.created_at)
+        self._last_recalled_at.append(item.last_recalled_at)
+        self._importance.append(item.arbitrary_importance)
+        self._total_score.append(item.total_score)
+        self._recall_count.append(item.recall_count)
+        self._zone.append(item.zone)
+        self._encrypted.append(item.encrypted)
+        if self._dim:
+            self._vectors.extend(array("f", vector))
+            self._norms.append(norm)
+            self._has_vec.append(present)
+        self._set_ragged(item, present)
+
+    def _set_ragged(self, item: MemoryItem, present: bool) -> None:
+        if item.embedding is not None and not present:
+            self._ragged[item.id] = list(item.embedding)
+        else:
+            self._ragged.pop(item.id, None)
+
+    def _materialize(self, row: int) -> MemoryItem:
+        item_id = self._ids[row]
+        embedding = self._ragged.get(item_id)
+        if embedding is None and self._dim and self._has_vec[row]:
+            embedding = self._vectors[row * self._dim:(row + 1) * self._dim].tolist()
+        item = MemoryItem(
+            id=item_id,
+            content=self._content[row],
+            created_at=self._created_at[row],
+            last_recalled_at=self._last_recalled_at[row],
+            recall_count=self._recall_count[row],
+            arbitrary_importance=self._importance[row],
+            zone=self._zone[row],
+            metadata=self._metadata[row],
+            embedding=embedding,
+            total_score=self._total_score[row],
+            encrypted=bool(self._encrypted[row]),
+        )
+        extras = self._extras[row]
+        if extras:
+            for key, value in extras.items():
+                setattr(item, key, value)
+        return item
+
+    # --- ZoneStorage API ---
+
+    @synchronized
+    def store(self, item: MemoryItem) -> None:
+        row = self._rows.get(item.id)
+        if row is None:
+            self._append_row(item)
+        else:
+            self._write_row(row, item)
+
+    @synchronized
+    def get(self, item_id: str) -> MemoryItem | None:
+        row = self._rows.get(item_id)
+        return None if row is None else self._materialize(row)
+
+    @synchronized
+    def remove(self, item_id: str) -> bool:
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+        self._ragged.pop(item_id, None)
+        self._owners.add(self._owner(row), -1)
+        last = len(self._ids) - 1
+        columns = [self._content, self._metadata, self._extras,
+                   self._created_at, self._last_recalled_at, self._importance,
+                   self._total_score, self._recall_count, self._zone,
+                   self._encrypted]
+        if self._dim:
+            columns += [self._norms, self._has_vec]
+        if row != last:
+            # Swap-remove: move the last row into the freed slot
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+            for col in columns:
+                col[row] = col[last]
+            if self._dim:
+                d = self._dim
+                self._vectors[row * d:(row + 1) * d] = self._vectors[last * d:(last + 1) * d]
+        self._ids.pop()
+        for col in columns:
+            col.pop()
+        if self._dim:
+            del self._vectors[last * self._dim:]
+        return True
+
+    @synchronized
+    def update(self, item: MemoryItem) -> None:
+        row = self._rows.get(item.id)
+        if row is not None:
+            self._write_row(row, item)
+
+    @synchronized
+    def search(self, query: str, limit: int = 5,
+               query_embedding: list[float] | None = None,
+               filters: SearchFilter | None = None) -> list[MemoryItem]:
+        query_words = query.lower().split()
+        if not query_words or not self._ids:
+            return []
+        # Substring matching and the attribute filter (string fields kept in
+        # extras/metadata) are per row; scoring and ranking are vectorized
+        keyword = [sum(1 for w in query_words if w in content.lower()) / len(query_words)
+                   for content in self._content]
+        allowed = None
+        if filters is not None and not filters.is_empty:
+            allowed = [self._row_matches(r, filters) for r in range(len(self._ids))]
+        try:
+            import numpy as np
+        except ImportError:
+            return self._search_rows(keyword, allowed, query_embedding, limit)
+        scores = np.asarray(keyword)
+        if query_embedding is not None:
+            semantic, has = self._semantic_array(np, query_embedding)
+            scores = np.where(has, 0.7 * semantic + 0.3 * scores, scores)
+        if allowed is not None:
+            scores = np.where(allowed, scores, 0.0)
+        ranked = np.argsort(-scores, kind="stable")[:limit]
+        return [self._materialize(int(row)) for row in ranked if scores[row] > 0]
+
+    def _search_rows(self, keyword: list[float], allowed: list[bool] | None,
+                     query_embedding: list[float] | None,
+                     limit: int) -> list[MemoryItem]:
+        """Pure-Python scoring when NumPy is not installed."""
+        semantic = self._semantic_scores(query_embedding) if query_embedding is not None else None
+        scored: list[tuple[float, int]] = []
+        for row, keyword_score in enumerate(keyword):
+            if allowed is not None and not allowed[row]:
+                continue
+            sem = semantic[row] if semantic is not None else None
+            score = keyword_score if sem is None else 0.7 * sem + 0.3 * keyword_score
+            if score > 0:
+                scored.append((score, row))
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [self._materialize(row) for _, row in scored[:limit]]
+
+    def _row_matches(self, row: int, filters: SearchFilter) -> bool:
+        """SearchFilter.matches evaluated on the columns (no materialization)."""
+        extras = self._extras[row] or {}
+        if filters.user_id is not None and extras.get("user_id") not in (None, filters.user_id):
+            return False
+        if filters.emotion is not None:
+            emotion = extras.get("emotion")
+            if emotion is None or emotion.dominant != filters.emotion:
+                return False
+        if (filters.session_id is not None
+                and self._metadata[row].get("session_id") != filters.session_id):
+            return False
+        if (filters.content_type is not None
+                and extras.get("content_type", "text") != filters.content_type):
+            return False
+        return True
+
+    def _semantic_scores(self, query: list[float]) -> list[float | None]:
+        """Cosine similarity (clamped to [0, 1]) per row, None without embedding."""
+        from stellar_memory.utils import cosine_similarity
+        n = len(self._ids)
+        scores: list[float | None] = [None] * n
+        q_norm = math.sqrt(sum(x * x for x in query))
+        if self._dim and len(query) == self._dim:
+            d = self._dim
+            dots = [sum(a * b for a, b in zip(self._vectors[r * d:(r + 1) * d], query))
+                    for r in range(n)]
+            for row in range(n):
+                if not self._has_vec[row]:
+                    continue
+                denom = self._norms[row] * q_norm
+                scores[row] = 0.0 if denom == 0 else max(0.0, min(1.0, dots[row] / denom))
+        for item_id, emb in self._ragged.items():
+            scores[self._rows[item_id]] = cosine_similarity(query, emb)
+        return scores
+
+    def _semantic_array(self, np, query: list[float]):
+        """(similarities, has-embedding mask) as arrays over all rows."""
+        from stellar_memory.utils import cosine_similarity
+        n = len(self._ids)
+        sims = np.zeros(n)
+        has = np.zeros(n, dtype=bool)
+        q_norm = math.sqrt(sum(x * x for x in query))
+        if self._dim and len(query) == self._dim and q_norm > 0:
+            # Temporary views only: a live export would block array growth.
+            # Dots are float32 like the matrix; the division is float64.
+            dots = (np.frombuffer(self._vectors, dtype=np.float32).reshape(n, self._dim)
+                    @ np.asarray(query, dtype=np.float32)).astype(np.float64)
+            denom = np.frombuffer(self._norms, dtype=np.float32).astype(np.float64) * q_norm
+            has = np.frombuffer(self._has_vec, dtype=np.int8) != 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sims = np.clip(np.where(denom > 0, dots / denom, 0.0), 0.0, 1.0)
+        elif self._dim and len(query) == self._dim:
+            has = np.frombuffer(self._has_vec, dtype=np.int8) != 0
+        for item_id, emb in self._ragged.items():
+            row = self._rows[item_id]
+            sims[row] = cosine_similarity(query, emb)
+            has[row] = True
+        return sims, has
+
+    @synchronized
+    def get_all(self) -> list[MemoryItem]:
+        return [self._materialize(row) for row in range(len(self._ids))]
+
+    @synchronized
+    def count(self) -> int:
+        return len(self._ids)
+
+    @synchronized
+    def count_items(self, user_id: str | None = None) -> int:
+        if user_id is None:
+            return len(self._ids)
+        return self._owners.visible_to(user_id)
+
+    @synchronized
+    def get_lowest_score_item(self) -> MemoryItem | None:
+        if not self._ids:
+            return None
+        try:
+            import numpy as np
+        except ImportError:
+            scores = self._total_score
+            return self._materialize(min(range(len(scores)), key=scores.__getitem__))
+        return self._materialize(int(np.frombuffer(self._total_score).argmin()))
+
+    @synchronized
+    def list_items(self, user_id: str | None = None,
+                   order_by: str = "total_score",
+                   after: ListCursor | None = None, limit: int = 50,
+                   fields: list[str] | None = None) -> list[dict]:
+        # Rank on the typed column; only the page's rows are materialized
+        fields = list_fields(order_by, fields)
+        column = self._total_score if order_by == "total_score" else self._created_at
+        ids = self._ids
+        rows = range(len(ids))
+        if user_id is not None:
+            rows = (r for r in rows
+                    if (self._extras[r] or {}).get("user_id") in (None, user_id))
+        if after is not None:
+            rows = (r for r in rows if after.precedes(column[r], ids[r]))
+        page = heapq.nsmallest(limit, rows, key=lambda r: (-column[r], ids[r]))
+        result = []
+        for row in page:
+            item = self._materialize(row)
+            result.append({f: getattr(item, f) for f in fields})
+        return result
+
+    # --- Bulk export / load (hot-zone snapshots) ---
+
+    @synchronized
+    def export_columns(self) -> dict:
+        """Copy of every column; typed arrays are copied with one memcpy each."""
+        columns = {
+            "ids": list(self._ids),
+            "content": list(self._content),
+            "metadata": list(self._metadata),
+            "extras": list(self._extras),
+            "ragged": dict(self._ragged),
+            "dim": self._dim or 0,
+        }
+        for name in NUMERIC_COLUMNS + VECTOR_COLUMNS:
+            columns[name] = getattr(self, f"_{name}")[:]
+        return columns
+
+    @synchronized
+    def load_columns(self, columns: dict) -> None:
+        """Replace the contents with columns from :meth:`export_columns`."""
+        self._ids = list(columns["ids"])
+        self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+        self._content = list(columns["content"])
+        self._metadata = list(columns["metadata"])
+        self._extras = list(columns["extras"])
+        self._ragged = dict(columns["ragged"])
+        self._dim = columns["dim"] or None
+        for name in NUMERIC_COLUMNS + VECTOR_COLUMNS:
+            setattr(self, f"_{name}", columns[name])
+        self._owners = OwnerCounts()
+        for row in range(len(self._ids)):
+            self._owners.add(self._owner(row))
@@ -0,0 +1,481 @@
+"""Durable hot zones: append-only operation log plus binary snapshots.
+
+In-memory zones (Core/Inner) are rebuilt on startup from the newest
+snapshot, loaded through ``mmap``, followed by replaying the log records
+written after it. Log writes are group-committed: a writer thread appends
+every queued record, then issues one ``fsync`` for the whole batch.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+
+from stellar_memory.models import EmotionVector, MemoryItem
+from stellar_memory.storage import ListCursor, SearchFilter, ZoneStorage
+from stellar_memory.storage.codec import decode_item, encode_item
+from stellar_memory.storage.columnar import (
+    ColumnarStorage, NUMERIC_COLUMNS, VECTOR_COLUMNS,
+)
+
+logger = logging.getLogger(__name__)
+
+OP_STORE = 1
+OP_UPDATE = 2
+OP_REMOVE = 3
+
+# Log frame: payload length, crc32(seq + op + payload), seq, op
+_FRAME = struct.Struct("<IIQB")
+_SNAP_MAGIC = b"SMSNAP\x01\x00"
+# Snapshot header: last applied seq, item count, vector dim, JSON length;
+# then the JSON columns and one length-prefixed block per typed column
+_SNAP_HEADER = struct.Struct("<QQIQ")
+_ROTATE = object()
+
+
+def _crc(seq: int, op: int, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(struct.pack("<QB", seq, op)))
+
+
+class OpLog:
+    """Segmented append-only log of zone operations.
+
+    Segments are named ``<name>.<first seq>.log``. :meth:`rotate` starts a
+    new segment, so everything before a snapshot can be deleted whole.
+    """
+
+    def __init__(self, directory: str | Path, name: str, sync: bool = True):
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._name = name
+        self._sync = sync
+        self._seq = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._durable_seq = 0
+        self._durable = threading.Condition()
+        self._file = None
+        self._thread: threading.Thread | None = None
+        self._error: Exception | None = None
+        self.batches = 0
+        self.records = 0
+
+    def segments(self) -> list[tuple[int, Path]]:
+        found = []
+        for path in self._dir.glob(f"{self._name}.*.log"):
+            try:
+                found.append((int(path.name.split(".")[-2]), path))
+            except ValueError:
+                continue
+        return sorted(found)
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def replay(self, after_seq: int = 0):
+        """Yield ``(seq, op, payload)`` for records newer than ``after_seq``.
+
+        A torn or corrupt record ends the log: the segment is truncated
+        there so later appends start from a clean boundary.
+        """
+        self._seq = max(self._seq, after_seq)
+        for _, path in self.segments():
+            with open(path, "rb") as f:
+                data = f.read()
+            offset = 0
+            while offset + _FRAME.size <= len(data):
+                length, crc, seq, op = _FRAME.unpack_from(data, offset)
+                end = offset + _FRAME.size + length
+                payload = data[offset + _FRAME.size:end]
+                if end > len(data) or _crc(seq, op, payload) != crc:
+                    break
+                offset = end
+                self._seq = max(self._seq, seq)
+                if seq > after_seq:
+                    yield seq, op, payload
+            if offset < len(data):
+                logger.warning("Truncating torn tail of %s at byte %d", path, offset)
+                with open(path, "r+b") as f:
+                    f.truncate(offset)
+
+    def open(self) -> None:
+        segments = self.segments()
+        path = (segments[-1][1] if segments
+                else self._dir / f"{self._name}.{self._seq + 1}.log")
+        self._file = open(path, "ab")
+        self._durable_seq = self._seq
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name=f"stellar-oplog-{self._name}")
+        self._thread.start()
+
+    def append(self, op: int, payload: bytes) -> int:
+        """Queue a record; returns its sequence number (see :meth:`wait`).
+
+        Callers serialize appends (sequence order is queue order). Raises
+        ``RuntimeError`` once the writer thread has died.
+        """
+        self._check_writer()
+        self._seq += 1
+        seq = self._seq
+        self._queue.put(_FRAME.pack(len(payload), _crc(seq, op, payload), seq, op)
+                        + payload)
+        return seq
+
+    def wait(self, seq: int, timeout: float | None = 5.0) -> bool:
+        """Block until record ``seq`` is durable (written, and fsynced if ``sync``).
+
+        Raises ``RuntimeError`` if the writer died before getting there.
+        """
+        with self._durable:
+            done = self._durable.wait_for(
+                lambda: self._durable_seq >= seq or self._error is not None, timeout)
+            if self._durable_seq >= seq:
+                return True
+        self._check_writer()
+        return done
+
+    def _check_writer(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"Op log writer for {self._name} failed") from self._error
+
+    def rotate(self) -> int:
+        """Start a new segment after the records queued so far; returns the last seq."""
+        self._queue.put((_ROTATE, self._seq))
+        return self._seq
+
+    def drop_segments(self, upto_seq: int) -> int:
+        """Delete segments holding only records ``<= upto_seq``."""
+        segments = self.segments()
+        dropped = 0
+        for (first, path), (next_first, _) in zip(segments, segments[1:]):
+            if next_first - 1 <= upto_seq:
+                path.unlink(missing_ok=True)
+                dropped += 1
+        return dropped
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=10)
+            self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _run(self) -> None:
+        try:
+            self._write_batches()
+        except Exception as exc:
+            logger.exception("Op log writer for %s failed", self._name)
+            with self._durable:
+                self._error = exc
+                self._durable.notify_all()
+
+    def _write_batches(self) -> None:
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            while True:  # group commit: take everything already queued
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            last = self._durable_seq
+            for entry in batch:
+                if entry is None:
+                    stop = True
+                elif isinstance(entry, tuple):
+                    self._flush()
+                    self._file.close()
+                    self._file = open(self._dir / f"{self._name}.{entry[1] + 1}.log", "ab")
+                else:
+                    self._file.write(entry)
+                    last = _FRAME.unpack_from(entry)[2]
+                    self.records += 1
+            self._flush()
+            self.batches += 1
+            with self._durable:
+                self._durable_seq = max(self._durable_seq, last)
+                self._durable.notify_all()
+
+    def _flush(self) -> None:
+        self._file.flush()
+        if self._sync:
+            os.fsync(self._file.fileno())
+
+
+def columns_of(items: list[MemoryItem]) -> dict:
+    """Columnar form of ``items`` (the layout snapshots are written in)."""
+    staging = ColumnarStorage()
+    for item in items:
+        staging.store(item)
+    return staging.export_columns()
+
+
+def write_snapshot(path: str | Path, columns: dict, last_seq: int) -> None:
+    """Atomically write ``columns`` as a snapshot covering records ``<= last_seq``.
+
+    Strings and dicts go into one JSON document; numeric columns and the
+    embedding matrix are raw little-endian arrays, so loading them is a
+    copy out of the mapped file rather than per-item parsing.
+    """
+    extras = [
+        {**e, "emotion": e["emotion"].to_list()} if e and e.get("emotion") else e
+        for e in columns["extras"]
+    ]
+    meta_bytes = json.dumps({
+        "ids": columns["ids"],
+        "content": columns["content"],
+        "metadata": columns["metadata"],
+        "extras": extras,
+        "ragged": columns["ragged"],
+    }, separators=(",", ":")).encode()
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_SNAP_MAGIC)
+        f.write(_SNAP_HEADER.pack(last_seq, len(columns["ids"]), columns["dim"],
+                                  len(meta_bytes)))
+        f.write(meta_bytes)
+        for name in NUMERIC_COLUMNS + VECTOR_COLUMNS:
+            column = columns[name]
+            if sys.byteorder != "little":
+                column = column[:]
+                column.byteswap()
+            data = column.tobytes()
+            f.write(struct.pack("<Q", len(data)))
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_snapshot(path: str | Path) -> tuple[int, dict | None]:
+    """Read a snapshot via ``mmap``; returns ``(last_seq, columns)``."""
+    path = Path(path)
+    if not path.exists() or path.stat().st_size < len(_SNAP_MAGIC) + _SNAP_HEADER.size:
+        return 0, None
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm[:len(_SNAP_MAGIC)] != _SNAP_MAGIC:
+            raise ValueError(f"Not a hot-zone snapshot: {path}")
+        offset = len(_SNAP_MAGIC)
+        last_seq, _count, dim, meta_len = _SNAP_HEADER.unpack_from(mm, offset)
+        offset += _SNAP_HEADER.size
+        columns = json.loads(mm[offset:offset + meta_len])
+        offset += meta_len
+        template = ColumnarStorage()
+        for name in NUMERIC_COLUMNS + VECTOR_COLUMNS:
+            (size,) = struct.unpack_from("<Q", mm, offset)
+            offset += 8
+            column = array(getattr(template, f"_{name}").typecode)
+            column.frombytes(mm[offset:offset + size])
+            if sys.byteorder != "little":
+                column.byteswap()
+            columns[name] = column
+            offset += size
+    for extras in columns["extras"]:
+        if extras and extras.get("emotion"):
+            extras["emotion"] = EmotionVector.from_list(extras["emotion"])
+    columns["dim"] = dim
+    return last_seq, columns
+
+
+class DurableZoneStorage(ZoneStorage):
+    """Logs every mutation of an in-process ``inner`` storage.
+
+    ``store`` and ``remove`` return once their record is durable (inside
+    :meth:`deferred_commit`, the block's exit waits instead); ``update``
+    (recall bumps, score refreshes) is queued and rides the next group
+    commit. Every ``snapshot_ops`` logged operations a snapshot is written
+    on a background thread and the log segments it covers are deleted.
+    """
+
+    def __init__(self, inner: ZoneStorage, directory: str | Path, zone_id: int,
+                 sync: bool = True, snapshot_ops: int = 50_000) -> None:
+        self.inner = inner
+        self.in_process = inner.in_process
+        self._dir = Path(directory)
+        self._snapshot_path = self._dir / f"zone_{zone_id}.snap"
+        self._snapshot_ops = snapshot_ops
+        self._lock = threading.Lock()
+        self._snapshot_thread: threading.Thread | None = None
+        self._ops_since_snapshot = 0
+        self._closed = False
+        self._local = threading.local()
+        self._log = OpLog(self._dir, f"zone_{zone_id}", sync=sync)
+        self.recovered = self._recover()
+        self._log.open()
+
+    def _recover(self) -> int:
+        last_seq, columns = load_snapshot(self._snapshot_path)
+        loaded = 0
+        if columns is not None:
+            loaded = len(columns["ids"])
+            if isinstance(self.inner, ColumnarStorage):
+                self.inner.load_columns(columns)  # no per-item decoding
+            else:
+                staging = ColumnarStorage()
+                staging.load_columns(columns)
+                for item in staging.get_all():
+                    self.inner.store(item)
+        replayed = 0
+        for _, op, payload in self._log.replay(last_seq):
+            if op == OP_STORE:
+                self.inner.store(decode_item(payload))
+            elif op == OP_UPDATE:
+                self.inner.update(decode_item(payload))
+            elif op == OP_REMOVE:
+                self.inner.remove(payload.decode())
+            replayed += 1
+        self._ops_since_snapshot = replayed
+        return loaded + replayed
+
+    # --- ZoneStorage ---
+
+    def store(self, item: MemoryItem) -> None:
+        with self._lock:
+            self.inner.store(item)
+            seq = self._append(OP_STORE, encode_item(item))
+        self._committed(seq, wait=not self._defer(seq))
+
+    def get(self, item_id: str) -> MemoryItem | None:
+        return self.inner.get(item_id)
+
+    def remove(self, item_id: str) -> bool:
+        with self._lock:
+            removed = self.inner.remove(item_id)
+            if not removed:
+                return False
+            seq = self._append(OP_REMOVE, item_id.encode())
+        self._committed(seq, wait=not self._defer(seq))
+        return True
+
+    def update(self, item: MemoryItem) -> None:
+        with self._lock:
+            self.inner.update(item)
+            seq = self._append(OP_UPDATE, encode_item(item))
+        self._committed(seq, wait=False)
+
+    def search(self, query: str, limit: int = 5,
+               query_embedding: list[float] | None = None,
+               filters: SearchFilter | None = None) -> list[MemoryItem]:
+        return self.inner.search(query, limit, query_embedding=query_embedding,
+                                 filters=filters)
+
+    def get_all(self) -> list[MemoryItem]:
+        return self.inner.get_all()
+
+    def count(self) -> int:
+        return self.inner.count()
+
+    def get_lowest_score_item(self) -> MemoryItem | None:
+        return self.inner.get_lowest_score_item()
+
+    def list_items(self, user_id: str | None = None,
+                   order_by: str = "total_score",
+                   after: ListCursor | None = None, limit: int = 50,
+                   fields: list[str] | None = None) -> list[dict]:
+        return self.inner.list_items(user_id, order_by, after, limit, fields)
+
+    def count_items(self, user_id: str | None = None) -> int:
+        return self.inner.count_items(user_id)
+
+    # --- Durability ---
+
+    def _append(self, op: int, payload: bytes) -> int:
+        # Caller holds self._lock, which keeps sequence and queue order equal
+        self._ops_since_snapshot += 1
+        return self._log.append(op, payload)
+
+    def _committed(self, seq: int, wait: bool) -> None:
+        if wait and not self._log.wait(seq):
+            logger.warning("Hot-zone log commit of record %d timed out", seq)
+        if self._ops_since_snapshot >= self._snapshot_ops:
+            self.snapshot(background=True)
+
+    def _defer(self, seq: int) -> bool:
+        if getattr(self._local, "deferred_seq", None) is None:
+            return False
+        self._local.deferred_seq = seq
+        return True
+
+    @contextmanager
+    def deferred_commit(self):
+        """Within the block, this thread's stores and removes do not wait
+        for their records; one wait at exit covers all of them."""
+        if getattr(self._local, "deferred_seq", None) is not None:
+            yield  # nested: the outermost block waits
+            return
+        self._local.deferred_seq = 0
+        try:
+            yield
+        finally:
+            seq, self._local.deferred_seq = self._local.deferred_seq, None
+            if seq:
+                self._committed(seq, wait=True)
+
+    def snapshot(self, background: bool = False) -> None:
+        """Write a snapshot of the current contents and drop covered log segments."""
+        with self._lock:
+            if background and self._snapshot_thread is not None:
+                return
+            # State at the cut. Every record after last_seq carries the
+            # item's full state, so replaying them on top converges
+            if isinstance(self.inner, ColumnarStorage):
+                columns, items = self.inner.export_columns(), None
+            else:
+                columns, items = None, [copy.copy(i) for i in self.inner.get_all()]
+            last_seq = self._log.rotate()
+            self._ops_since_snapshot = 0
+
+        def _write() -> None:
+            try:
+                write_snapshot(self._snapshot_path,
+                               columns if items is None else columns_of(items),
+                               last_seq)
+                self._log.wait(last_seq, timeout=None)
+                self._log.drop_segments(last_seq)
+            except Exception:
+                logger.exception("Hot-zone snapshot failed")
+            finally:
+                self._snapshot_thread = None
+
+        if not background:
+            _write()
+            return
+        thread = threading.Thread(target=_write, daemon=True,
+                                  name="stellar-hot-snapshot")
+        with self._lock:
+            self._snapshot_thread = thread
+        thread.start()
+
+    def close(self) -> None:
+        """Snapshot (so the next start replays nothing) and stop the log writer."""
+        if self._closed:
+            return
+        self._closed = True
+        thread = self._snapshot_thread
+        if thread is not None:
+            thread.join()
+        self.snapshot()
+        self._log.close()
+
+    def stats(self) -> dict:
+        return {
+            "last_seq": self._log.last_seq,
+            "ops_since_snapshot": self._ops_since_snapshot,
+            "log_records": self._log.records,
+            "log_batches": self._log.batches,
+            "segments": len(self._log.segments()),
+        }
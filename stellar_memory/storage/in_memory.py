@@ -2,45 +2,68 @@
 
 from __future__ import annotations
 
-from stellar_memory.storage import ZoneStorage
+from stellar_memory.storage import OwnerCounts, ZoneStorage, SearchFilter
 from stellar_memory.models import MemoryItem
 
 
 class InMemoryStorage(ZoneStorage):
+    in_process = True
+
     def __init__(self) -> None:
         self._items: dict[str, MemoryItem] = {}
+        # Owner at insert time: items are shared objects, so a later
+        # in-place change is only visible through update()
+        self._owner_of: dict[str, str | None] = {}
+        self._owners = OwnerCounts()
 
     def store(self, item: MemoryItem) -> None:
         self._items[item.id] = item
+        self._track_owner(item)
+
+    def _track_owner(self, item: MemoryItem) -> None:
+        if item.id in self._owner_of:
+            self._owners.move(self._owner_of[item.id], item.user_id)
+        else:
+            self._owners.add(item.user_id)
+        self._owner_of[item.id] = item.user_id
 
     def get(self, item_id: str) -> MemoryItem | None:
         return self._items.get(item_id)
 
     def remove(self, item_id: str) -> bool:
-        return self._items.pop(item_id, None) is not None
+        if self._items.pop(item_id, None) is None:
+            return False
+        self._owners.add(self._owner_of.pop(item_id), -1)
+        return True
 
     def update(self, item: MemoryItem) -> None:
         if item.id in self._items:
             self._items[item.id] = item
+            self._track_owner(item)
 
     def search(self, query: str, limit: int = 5,
-               query_embedding: list[float] | None = None) -> list[MemoryItem]:
+               query_embedding: list[float] | None = None,
+               filters: SearchFilter | None = None) -> list[MemoryItem]:
         query_words = query.lower().split()
         if not query_words:
             return []
+        pool = list(self._items.values())
+        if filters is not None and not filters.is_empty:
+            pool = [i for i in pool if filters.matches(i)]
+        semantic: dict[str, float] = {}
+        if query_embedding is not None:
+            from stellar_memory.utils import similarities
+            embedded = [i for i in pool if i.embedding is not None]
+            sims = similarities(query_embedding, [i.embedding for i in embedded])
+            semantic = {i.id: s for i, s in zip(embedded, sims)}
         scored: list[tuple[float, MemoryItem]] = []
-        for item in self._items.values():
+        for item in pool:
             content_lower = item.content.lower()
             match_count = sum(1 for w in query_words if w in content_lower)
             keyword_score = match_count / len(query_words)
 
-            semantic_score = 0.0
-            if query_embedding is not None and item.embedding is not None:
-                from stellar_memory.utils import cosine_similarity
-                semantic_score = cosine_similarity(query_embedding, item.embedding)
-
-            if query_embedding is not None and item.embedding is not None:
-                score = 0.7 * semantic_score + 0.3 * keyword_score
+            if item.id in semantic:
+                score = 0.7 * semantic[item.id] + 0.3 * keyword_score
             else:
                 score = keyword_score
 
@@ -55,7 +78,13 @@ class InMemoryStorage(ZoneStorage):
     def count(self) -> int:
         return len(self._items)
 
+    def count_items(self, user_id: str | None = None) -> int:
+        if user_id is None:
+            return len(self._items)
+        return self._owners.visible_to(user_id)
+
     def get_lowest_score_item(self) -> MemoryItem | None:
         if not self._items:
             return None
-        return min(self._items.values(), key=lambda x: x.total_score)
+        # Snapshot first: concurrent stores may resize the dict mid-scan
+        return min(list(self._items.values()), key=lambda x: x.total_score)
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import TYPE_CHECKING
+import math
+import struct
+import threading
+import uuid
+from typing import TYPE_CHECKING, Any, Coroutine
 
+from stellar_memory.config import PgVectorIndexConfig
 from stellar_memory.storage import StorageBackend
 
 if TYPE_CHECKING:
@@ -13,38 +19,212 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Column order shared by single upserts and COPY-based bulk loads
+_COLUMNS = (
+    "id", "content", "created_at", "last_recalled_at", "recall_count",
+    "arbitrary_importance", "zone", "metadata", "total_score",
+    "encrypted", "source_type", "source_url", "ingested_at",
+    "vector_clock", "embedding", "user_id",
+)
+
+_UPSERT_SET = """
+    content=EXCLUDED.content, zone=EXCLUDED.zone,
+    total_score=EXCLUDED.total_score,
+    last_recalled_at=EXCLUDED.last_recalled_at,
+    recall_count=EXCLUDED.recall_count,
+    arbitrary_importance=EXCLUDED.arbitrary_importance,
+    metadata=EXCLUDED.metadata, embedding=EXCLUDED.embedding,
+    encrypted=EXCLUDED.encrypted,
+    vector_clock=EXCLUDED.vector_clock
+"""
+
+
+def _uuid_or_none(value: str | None) -> str | None:
+    """Canonical UUID text, or None when ``value`` is not a UUID."""
+    try:
+        return str(uuid.UUID(str(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_version(text: str | None) -> tuple[int, ...]:
+    parts = []
+    for piece in (text or "").split("."):
+        digits = "".join(ch for ch in piece if ch.isdigit())
+        parts.append(int(digits or 0))
+    return tuple(parts)
 
-class PostgresStorage(StorageBackend):
-    """PostgreSQL storage backend with optional pgvector support."""
 
-    def __init__(self, db_url: str, pool_size: int = 10):
+def _encode_vector(values) -> bytes:
+    """pgvector binary wire format: int16 dim, int16 unused, float32[] (BE)."""
+    return struct.pack(f">HH{len(values)}f", len(values), 0, *values)
+
+
+def _decode_vector(data: bytes) -> list[float]:
+    dim, _ = struct.unpack_from(">HH", data)
+    return list(struct.unpack_from(f">{dim}f", data, 4))
+
+
+class PostgresStorage(StorageBackend):
+    """PostgreSQL storage backend with optional pgvector support.
+
+    The asyncpg pool is bound to one long-lived event loop. ``connect()``
+    starts a private loop on a daemon thread; ``aconnect()`` binds to the
+    caller's running loop instead (e.g. a FastAPI app). The sync methods
+    dispatch onto that loop with ``run_coroutine_threadsafe``; the ``a*``
+    methods (``astore``, ``aget``, ``asearch``, ...) are the native async
+    API and can be awaited from any loop.
+
+    ANN indexes are built off the write path: writes keep per-tenant row
+    counters, and a background task on the storage loop builds an index
+    once its threshold is crossed (``pg_index.maintenance = "manual"``
+    leaves that to :meth:`ensure_indexes`).
+    """
+
+    def __init__(self, db_url: str, pool_size: int = 10,
+                 timeout: float | None = 30.0, copy_batch_size: int = 10_000,
+                 index_config: PgVectorIndexConfig | None = None):
         self._db_url = db_url
         self._pool_size = pool_size
+        self._timeout = timeout
+        self._copy_batch_size = copy_batch_size
+        self._index_cfg = index_config or PgVectorIndexConfig()
         self._pool = None
         self._connected = False
-
-    def connect(self) -> None:
+        self._has_pgvector = False
+        self._vector_codec = False
+        self._pgvector_version: tuple[int, ...] = ()
+        self._vector_index: str | None = None  # "hnsw" | "ivfflat" once built
+        self._tenant_indexes: set[str] = set()
+        # Embedded-row counts kept current by writes (the thresholds' inputs)
+        self._rows = 0
+        self._tenant_rows: dict[str, int] = {}
+        self._due_tenants: set[str] = set()
+        self._index_wakeup: asyncio.Event | None = None
+        self._index_task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+
+    # --- Event loop plumbing ---
+
+    def _start_loop(self) -> None:
+        if self._loop is not None:
+            return
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        self._loop_thread = threading.Thread(
+            target=run, name="stellar-postgres-loop", daemon=True
+        )
+        self._loop_thread.start()
+        ready.wait()
+        self._loop = loop
+
+    def _stop_loop(self) -> None:
+        loop, thread = self._loop, self._loop_thread
+        self._loop = None
+        self._loop_thread = None
+        if thread is None:
+            return  # borrowed loop (aconnect) is not ours to stop
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _run(self, coro: Coroutine) -> Any:
+        """Run ``coro`` on the storage loop and block for the result."""
+        loop = self._loop
+        if loop is None:
+            coro.close()
+            raise RuntimeError("PostgresStorage is not connected")
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError(
+                "Blocking PostgresStorage call from its own event loop; "
+                "await the async API (astore, aget, asearch, ...) instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(self._timeout)
+
+    async def _bridge(self, coro: Coroutine) -> Any:
+        """Await ``coro`` on the storage loop from any running loop."""
+        loop = self._loop
+        if loop is None:
+            coro.close()
+            raise RuntimeError("PostgresStorage is not connected")
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+    # --- Connection ---
+
+    @staticmethod
+    def _require_asyncpg() -> None:
         try:
-            import asyncio
-            asyncio.run(self._async_connect())
+            import asyncpg  # noqa: F401
         except ImportError:
             raise ImportError(
                 "asyncpg is required for PostgreSQL backend. "
                 "Install with: pip install stellar-memory[postgres]"
             )
 
+    def connect(self) -> None:
+        self._require_asyncpg()
+        self._start_loop()
+        try:
+            self._run(self._async_connect())
+        except Exception:
+            self._stop_loop()
+            raise
+
+    async def aconnect(self) -> None:
+        """Connect with the pool bound to the caller's running loop."""
+        self._require_asyncpg()
+        self._loop = asyncio.get_running_loop()
+        try:
+            await self._async_connect()
+        except Exception:
+            self._loop = None
+            raise
+
     async def _async_connect(self) -> None:
         import asyncpg
         self._pool = await asyncpg.create_pool(
-            self._db_url, min_size=2, max_size=self._pool_size
+            self._db_url, min_size=2, max_size=self._pool_size,
+            init=self._init_connection,
         )
         await self._ensure_schema()
+        if self._has_pgvector and not self._vector_codec:
+            # Connections opened before CREATE EXTENSION lack the codec
+            await self._pool.expire_connections()
+        if (self._has_pgvector and self._index_cfg.method != "none"
+                and self._index_cfg.maintenance == "background"):
+            self._index_wakeup = asyncio.Event()
+            self._index_task = asyncio.get_running_loop().create_task(
+                self._maintain_indexes())
         self._connected = True
 
+    async def _init_connection(self, conn) -> None:
+        """Register the binary pgvector codec (no-op without the extension)."""
+        try:
+            await conn.set_type_codec(
+                "vector", schema="public", format="binary",
+                encoder=_encode_vector, decoder=_decode_vector,
+            )
+            self._vector_codec = True
+        except ValueError:
+            pass  # type "vector" not installed yet
+
     async def _ensure_schema(self) -> None:
         async with self._pool.acquire() as conn:
             # Try to enable pgvector extension
-            self._has_pgvector = False
             try:
                 await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
                 self._has_pgvector = True
@@ -127,71 +307,293 @@ class PostgresStorage(StorageBackend):
                 CREATE INDEX IF NOT EXISTS idx_memories_user_score
                 ON memories(user_id, total_score DESC)
             """)
-            # IVFFlat index for pgvector
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_memories_user_created
+                ON memories(user_id, created_at DESC, id)
+            """)
+            # ANN indexes are built later, once there is enough data
             if self._has_pgvector:
-                try:
-                    await conn.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_memories_embedding
-                        ON memories USING ivfflat (embedding vector_cosine_ops)
-                        WITH (lists = 100)
-                    """)
-                except Exception:
-                    pass  # IVFFlat needs data to build
+                self._pgvector_version = _parse_version(await conn.fetchval(
+                    "SELECT extversion FROM pg_extension WHERE extname = 'vector'"
+                ))
+                await self._detect_vector_indexes(conn)
+
+    # --- ANN indexes ---
+
+    async def _detect_vector_indexes(self, conn) -> None:
+        rows = await conn.fetch(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE tablename = 'memories' AND indexname LIKE 'idx_memories_embedding%'"
+        )
+        for row in rows:
+            name, definition = row["indexname"], row["indexdef"].lower()
+            method = "hnsw" if "using hnsw" in definition else "ivfflat"
+            if name.startswith("idx_memories_embedding_u_"):
+                self._tenant_indexes.add(str(uuid.UUID(name.rsplit("_", 1)[-1])))
+            else:
+                self._vector_index = method
+
+    @staticmethod
+    def _ivf_lists(rows: int) -> int:
+        # pgvector guidance: rows / 1000 up to 1M rows, sqrt(rows) beyond
+        return max(10, rows // 1000) if rows <= 1_000_000 else int(math.sqrt(rows))
+
+    def _index_ddl(self, rows: int, user_id: str | None = None) -> str | None:
+        """CREATE INDEX statement for the table, or a tenant's partial index."""
+        cfg = self._index_cfg
+        if cfg.method == "hnsw":
+            using = (f"USING hnsw (embedding vector_cosine_ops) "
+                     f"WITH (m = {int(cfg.hnsw_m)}, "
+                     f"ef_construction = {int(cfg.hnsw_ef_construction)})")
+        elif cfg.method == "ivfflat":
+            lists = int(cfg.ivf_lists or self._ivf_lists(rows))
+            using = f"USING ivfflat (embedding vector_cosine_ops) WITH (lists = {lists})"
+        else:
+            return None
+        if user_id is None:
+            return (f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                    f"idx_memories_embedding_{cfg.method} ON memories {using}")
+        tenant = _uuid_or_none(user_id)
+        if tenant is None:
+            raise ValueError(f"Tenant index needs a UUID user_id, got {user_id!r}")
+        # Literal predicate: DDL cannot take parameters; the UUID is validated
+        return (f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"idx_memories_embedding_u_{uuid.UUID(tenant).hex} ON memories "
+                f"{using} WHERE user_id = '{tenant}'::uuid")
+
+    def ensure_indexes(self) -> dict:
+        return self._run(self._async_ensure_indexes())
+
+    async def aensure_indexes(self) -> dict:
+        return await self._bridge(self._async_ensure_indexes())
+
+    async def _async_ensure_indexes(self) -> dict:
+        """Recount embedded rows and build every index past its threshold.
+
+        This scans the table; it runs once in the background after
+        connect and otherwise only when called explicitly.
+        """
+        if self._has_pgvector and self._index_cfg.method != "none":
+            async with self._pool.acquire() as conn:
+                self._rows = await conn.fetchval(
+                    "SELECT count(*) FROM memories WHERE embedding IS NOT NULL"
+                )
+                if self._index_cfg.tenant_min_rows > 0:
+                    tenants = await conn.fetch(
+                        "SELECT user_id, count(*) AS n FROM memories "
+                        "WHERE user_id IS NOT NULL AND embedding IS NOT NULL "
+                        "GROUP BY user_id"
+                    )
+                    self._tenant_rows = {str(r["user_id"]): r["n"] for r in tenants}
+                    self._due_tenants = {
+                        t for t, n in self._tenant_rows.items()
+                        if n >= self._index_cfg.tenant_min_rows
+                        and t not in self._tenant_indexes
+                    }
+            await self._build_due_indexes()
+        return {"vector_index": self._vector_index,
+                "tenant_indexes": len(self._tenant_indexes)}
+
+    def _note_rows(self, added: dict[str | None, int]) -> None:
+        """Count newly inserted embedded rows per tenant; wake the maintainer
+        once a threshold is crossed."""
+        cfg = self._index_cfg
+        for tenant, n in added.items():
+            self._rows += n
+            if tenant is None or cfg.tenant_min_rows <= 0:
+                continue
+            total = self._tenant_rows.get(tenant, 0) + n
+            self._tenant_rows[tenant] = total
+            if total >= cfg.tenant_min_rows and tenant not in self._tenant_indexes:
+                self._due_tenants.add(tenant)
+        due = self._due_tenants or (self._vector_index is None
+                                    and self._rows >= cfg.min_rows)
+        if due and self._index_wakeup is not None:
+            self._index_wakeup.set()
+
+    async def _build_due_indexes(self) -> None:
+        """CREATE INDEX CONCURRENTLY for thresholds the counters say were crossed."""
+        cfg = self._index_cfg
+        async with self._pool.acquire() as conn:
+            if self._vector_index is None and self._rows >= cfg.min_rows:
+                await conn.execute(self._index_ddl(self._rows))
+                self._vector_index = cfg.method
+                logger.info("Built %s index over %d embeddings", cfg.method, self._rows)
+            while self._due_tenants:
+                tenant = self._due_tenants.pop()
+                if tenant in self._tenant_indexes:
+                    continue
+                # Counters only grow; confirm against the table before building
+                rows = await conn.fetchval(
+                    "SELECT count(*) FROM memories "
+                    "WHERE user_id = $1::uuid AND embedding IS NOT NULL", tenant,
+                )
+                self._tenant_rows[tenant] = rows
+                if rows >= cfg.tenant_min_rows:
+                    await conn.execute(self._index_ddl(rows, tenant))
+                    self._tenant_indexes.add(tenant)
+
+    async def _maintain_indexes(self) -> None:
+        """Background task: one full recount, then build indexes as writes
+        push the counters past their thresholds."""
+        try:
+            await self._async_ensure_indexes()
+        except Exception:
+            logger.exception("ANN index check failed")
+        while True:
+            await self._index_wakeup.wait()
+            self._index_wakeup.clear()
+            try:
+                await self._build_due_indexes()
+            except Exception:
+                logger.exception("ANN index build failed")
+
+    async def _stop_index_maintenance(self) -> None:
+        task, self._index_task = self._index_task, None
+        self._index_wakeup = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _search_settings(self, limit: int, ef_search: int | None = None,
+                         probes: int | None = None) -> str:
+        """SET LOCAL statements tuning the ANN scan for one query."""
+        if self._vector_index is None and not self._tenant_indexes:
+            return ""
+        cfg = self._index_cfg
+        prefix = "hnsw" if cfg.method == "hnsw" else "ivfflat"
+        if cfg.method == "hnsw":
+            stmts = [f"SET LOCAL hnsw.ef_search = {max(int(ef_search or cfg.ef_search), limit)}"]
+        else:
+            stmts = [f"SET LOCAL ivfflat.probes = {int(probes or cfg.ivf_probes)}"]
+        # Iterative scans keep going until enough rows pass the WHERE filters
+        mode = cfg.iterative_scan
+        if mode in ("strict_order", "relaxed_order") and self._pgvector_version >= (0, 8):
+            if prefix == "ivfflat":
+                mode = "relaxed_order"  # the only mode IVFFlat supports
+            stmts.append(f"SET LOCAL {prefix}.iterative_scan = {mode}")
+        return "; ".join(stmts)
 
     def disconnect(self) -> None:
-        if self._pool:
-            import asyncio
-            asyncio.run(self._pool.close())
-            self._connected = False
+        if self._loop is not None:
+            self._run(self._stop_index_maintenance())
+        if self._pool and self._loop is not None:
+            self._run(self._pool.close())
+        self._pool = None
+        self._connected = False
+        self._stop_loop()
+
+    async def adisconnect(self) -> None:
+        if self._loop is not None:
+            await self._bridge(self._stop_index_maintenance())
+        if self._pool and self._loop is not None:
+            await self._bridge(self._pool.close())
+        self._pool = None
+        self._connected = False
+        if self._loop_thread is not None:
+            await asyncio.to_thread(self._stop_loop)
+        else:
+            self._loop = None
 
     def is_connected(self) -> bool:
         return self._connected and self._pool is not None
 
     def store(self, item: MemoryItem) -> None:
-        import asyncio
-        asyncio.run(self._async_store(item))
+        self._run(self._async_store(item))
 
-    async def _async_store(self, item: MemoryItem) -> None:
-        # Prepare embedding based on backend type
+    async def astore(self, item: MemoryItem) -> None:
+        await self._bridge(self._async_store(item))
+
+    def _record(self, item: MemoryItem) -> tuple:
+        """Row tuple in ``_COLUMNS`` order."""
         embedding_val = None
         if item.embedding is not None:
-            if getattr(self, '_has_pgvector', False):
-                # pgvector: pass as text '[1,2,3]'
-                embedding_val = "[" + ",".join(str(v) for v in item.embedding) + "]"
+            if self._has_pgvector:
+                embedding_val = self._vector_param(item.embedding)
             else:
                 from stellar_memory.utils import serialize_embedding
                 embedding_val = serialize_embedding(item.embedding)
+        return (
+            item.id, item.content, item.created_at, item.last_recalled_at,
+            item.recall_count, item.arbitrary_importance, item.zone,
+            json.dumps(item.metadata), item.total_score,
+            item.encrypted, item.source_type, item.source_url,
+            item.ingested_at, json.dumps(item.vector_clock or {}),
+            embedding_val, item.user_id,
+        )
 
-        vector_clock_json = json.dumps(item.vector_clock or {})
+    def _vector_param(self, values):
+        """pgvector parameter: float list with the binary codec, text literal without."""
+        if self._vector_codec:
+            return [float(v) for v in values]
+        return "[" + ",".join(str(v) for v in values) + "]"
 
+    async def _async_store(self, item: MemoryItem) -> None:
+        placeholders = ",".join(f"${i}" for i in range(1, len(_COLUMNS) + 1))
         async with self._pool.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO memories
-                    (id, content, created_at, last_recalled_at, recall_count,
-                     arbitrary_importance, zone, metadata, total_score,
-                     encrypted, source_type, source_url, ingested_at,
-                     vector_clock, embedding, user_id)
-                VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,$15,$16)
-                ON CONFLICT (id) DO UPDATE SET
-                    content=EXCLUDED.content, zone=EXCLUDED.zone,
-                    total_score=EXCLUDED.total_score,
-                    last_recalled_at=EXCLUDED.last_recalled_at,
-                    recall_count=EXCLUDED.recall_count,
-                    arbitrary_importance=EXCLUDED.arbitrary_importance,
-                    metadata=EXCLUDED.metadata, embedding=EXCLUDED.embedding,
-                    encrypted=EXCLUDED.encrypted,
-                    vector_clock=EXCLUDED.vector_clock
-            """, item.id, item.content, item.created_at, item.last_recalled_at,
-                item.recall_count, item.arbitrary_importance, item.zone,
-                json.dumps(item.metadata), item.total_score,
-                item.encrypted, item.source_type, item.source_url,
-                item.ingested_at, vector_clock_json, embedding_val,
-                item.user_id)
+            inserted = await conn.fetchval(
+                f"INSERT INTO memories ({', '.join(_COLUMNS)}) "
+                f"VALUES ({placeholders}) "
+                f"ON CONFLICT (id) DO UPDATE SET {_UPSERT_SET} "
+                f"RETURNING (xmax = 0)",
+                *self._record(item),
+            )
+        if inserted and item.embedding is not None:
+            self._note_rows({_uuid_or_none(item.user_id): 1})
+
+    def store_many(self, items: list[MemoryItem]) -> int:
+        return self._run(self._async_store_many(items))
+
+    async def astore_many(self, items: list[MemoryItem]) -> int:
+        return await self._bridge(self._async_store_many(items))
+
+    async def _async_store_many(self, items: list[MemoryItem]) -> int:
+        """COPY into a temp staging table, then one set-based upsert per batch."""
+        # ON CONFLICT cannot touch the same row twice in one statement
+        latest = {item.id: item for item in items}
+        records = [self._record(item) for item in latest.values()]
+        columns = ", ".join(_COLUMNS)
+        added: dict[str | None, int] = {}
+        async with self._pool.acquire() as conn:
+            for start in range(0, len(records), self._copy_batch_size):
+                async with conn.transaction():
+                    await conn.execute(
+                        "CREATE TEMP TABLE IF NOT EXISTS memories_staging "
+                        "(LIKE memories INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+                    )
+                    await conn.copy_records_to_table(
+                        "memories_staging", columns=list(_COLUMNS),
+                        records=records[start:start + self._copy_batch_size],
+                    )
+                    # xmax = 0 marks rows inserted rather than updated
+                    rows = await conn.fetch(
+                        f"WITH upserted AS ("
+                        f"INSERT INTO memories ({columns}) "
+                        f"SELECT {columns} FROM memories_staging "
+                        f"ON CONFLICT (id) DO UPDATE SET {_UPSERT_SET} "
+                        f"RETURNING user_id, xmax = 0 AS inserted, "
+                        f"embedding IS NOT NULL AS embedded) "
+                        f"SELECT user_id, count(*) AS n FROM upserted "
+                        f"WHERE inserted AND embedded GROUP BY user_id"
+                    )
+                    for row in rows:
+                        tenant = str(row["user_id"]) if row["user_id"] else None
+                        added[tenant] = added.get(tenant, 0) + row["n"]
+        if added:
+            self._note_rows(added)
+        return len(records)
 
     def get(self, item_id: str,
             user_id: str | None = None) -> MemoryItem | None:
-        import asyncio
-        return asyncio.run(self._async_get(item_id, user_id))
+        return self._run(self._async_get(item_id, user_id))
+
+    async def aget(self, item_id: str,
+                   user_id: str | None = None) -> MemoryItem | None:
+        return await self._bridge(self._async_get(item_id, user_id))
 
     async def _async_get(self, item_id: str,
                          user_id: str | None = None) -> MemoryItem | None:
@@ -209,8 +611,11 @@ class PostgresStorage(StorageBackend):
 
     def remove(self, item_id: str,
                user_id: str | None = None) -> bool:
-        import asyncio
-        return asyncio.run(self._async_remove(item_id, user_id))
+        return self._run(self._async_remove(item_id, user_id))
+
+    async def aremove(self, item_id: str,
+                      user_id: str | None = None) -> bool:
+        return await self._bridge(self._async_remove(item_id, user_id))
 
     async def _async_remove(self, item_id: str,
                             user_id: str | None = None) -> bool:
@@ -226,38 +631,104 @@ class PostgresStorage(StorageBackend):
                 )
             return result.endswith("1")
 
+    def get_many(self, item_ids: list[str],
+                 user_id: str | None = None) -> list[MemoryItem]:
+        return self._run(self._async_get_many(item_ids, user_id))
+
+    async def aget_many(self, item_ids: list[str],
+                        user_id: str | None = None) -> list[MemoryItem]:
+        return await self._bridge(self._async_get_many(item_ids, user_id))
+
+    async def _async_get_many(self, item_ids: list[str],
+                              user_id: str | None = None) -> list[MemoryItem]:
+        async with self._pool.acquire() as conn:
+            if user_id:
+                rows = await conn.fetch(
+                    "SELECT * FROM memories WHERE id = ANY($1::text[]) AND user_id = $2",
+                    list(item_ids), user_id
+                )
+            else:
+                rows = await conn.fetch(
+                    "SELECT * FROM memories WHERE id = ANY($1::text[])", list(item_ids)
+                )
+        by_id = {r["id"]: r for r in rows}
+        return [self._row_to_item(by_id[i]) for i in item_ids if i in by_id]
+
+    def remove_many(self, item_ids: list[str],
+                    user_id: str | None = None) -> int:
+        return self._run(self._async_remove_many(item_ids, user_id))
+
+    async def aremove_many(self, item_ids: list[str],
+                           user_id: str | None = None) -> int:
+        return await self._bridge(self._async_remove_many(item_ids, user_id))
+
+    async def _async_remove_many(self, item_ids: list[str],
+                                 user_id: str | None = None) -> int:
+        async with self._pool.acquire() as conn:
+            if user_id:
+                result = await conn.execute(
+                    "DELETE FROM memories WHERE id = ANY($1::text[]) AND user_id = $2",
+                    list(item_ids), user_id
+                )
+            else:
+                result = await conn.execute(
+                    "DELETE FROM memories WHERE id = ANY($1::text[])", list(item_ids)
+                )
+        return int(result.split()[-1])
+
     def update(self, item: MemoryItem) -> None:
         self.store(item)
 
+    async def aupdate(self, item: MemoryItem) -> None:
+        await self.astore(item)
+
     def search(self, query: str, limit: int = 5,
                query_embedding: list[float] | None = None,
                zone: int | None = None,
-               user_id: str | None = None) -> list[MemoryItem]:
-        import asyncio
-        return asyncio.run(self._async_search(query, limit, query_embedding,
-                                              zone, user_id))
+               user_id: str | None = None,
+               ef_search: int | None = None,
+               probes: int | None = None) -> list[MemoryItem]:
+        return self._run(self._async_search(query, limit, query_embedding,
+                                            zone, user_id, ef_search, probes))
+
+    async def asearch(self, query: str, limit: int = 5,
+                      query_embedding: list[float] | None = None,
+                      zone: int | None = None,
+                      user_id: str | None = None,
+                      ef_search: int | None = None,
+                      probes: int | None = None) -> list[MemoryItem]:
+        return await self._bridge(self._async_search(query, limit, query_embedding,
+                                                     zone, user_id, ef_search, probes))
 
     async def _async_search(self, query: str, limit: int,
                             query_embedding: list[float] | None,
                             zone: int | None,
-                            user_id: str | None = None) -> list[MemoryItem]:
+                            user_id: str | None = None,
+                            ef_search: int | None = None,
+                            probes: int | None = None) -> list[MemoryItem]:
         async with self._pool.acquire() as conn:
             # Build WHERE clauses
             conditions = []
             params = []
             idx = 1
 
-            if user_id:
-                conditions.append(f"user_id = ${idx}")
-                params.append(user_id)
-                idx += 1
+            if query_embedding and self._has_pgvector:
+                tenant = _uuid_or_none(user_id) if user_id else None
+                if tenant in self._tenant_indexes:
+                    # Inline the (validated) UUID so the planner can match the
+                    # tenant's partial index; a bind parameter hides it
+                    conditions.append(f"user_id = '{tenant}'::uuid")
+                elif user_id:
+                    conditions.append(f"user_id = ${idx}")
+                    params.append(user_id)
+                    idx += 1
 
-            if query_embedding and getattr(self, '_has_pgvector', False):
-                vec_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
                 vec_param_idx = idx
-                params.append(vec_str)
+                params.append(self._vector_param(query_embedding))
                 idx += 1
 
+                # Filters sit in the same scan as the ORDER BY so the ANN
+                # index (with iterative scan) applies them while traversing
                 if zone is not None:
                     conditions.append(f"zone = ${idx}")
                     params.append(zone)
@@ -265,13 +736,25 @@ class PostgresStorage(StorageBackend):
 
                 where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
                 params.append(limit)
-                rows = await conn.fetch(
-                    f"SELECT *, embedding <=> ${vec_param_idx}::vector AS distance "
-                    f"FROM memories {where} "
-                    f"ORDER BY distance ASC LIMIT ${idx}",
-                    *params
-                )
+                settings = self._search_settings(limit, ef_search, probes)
+                async with conn.transaction():
+                    if settings:
+                        await conn.execute(settings)
+                    rows = await conn.fetch(
+                        f"SELECT *, embedding <=> ${vec_param_idx}::vector AS distance "
+                        f"FROM memories {where} "
+                        f"ORDER BY embedding <=> ${vec_param_idx}::vector LIMIT ${idx}",
+                        *params
+                    )
+                # relaxed_order iterative scans may return slightly out of order
+                rows = sorted(rows, key=lambda r: (r["distance"] is None,
+                                                   r["distance"] or 0.0))
             else:
+                if user_id:
+                    conditions.append(f"user_id = ${idx}")
+                    params.append(user_id)
+                    idx += 1
+
                 if zone is not None:
                     conditions.append(f"zone = ${idx}")
                     params.append(zone)
@@ -292,8 +775,11 @@ class PostgresStorage(StorageBackend):
 
     def get_all(self, zone: int | None = None,
                 user_id: str | None = None) -> list[MemoryItem]:
-        import asyncio
-        return asyncio.run(self._async_get_all(zone, user_id))
+        return self._run(self._async_get_all(zone, user_id))
+
+    async def aget_all(self, zone: int | None = None,
+                       user_id: str | None = None) -> list[MemoryItem]:
+        return await self._bridge(self._async_get_all(zone, user_id))
 
     async def _async_get_all(self, zone: int | None,
                              user_id: str | None = None) -> list[MemoryItem]:
@@ -319,8 +805,11 @@ class PostgresStorage(StorageBackend):
 
     def count(self, zone: int | None = None,
               user_id: str | None = None) -> int:
-        import asyncio
-        return asyncio.run(self._async_count(zone, user_id))
+        return self._run(self._async_count(zone, user_id))
+
+    async def acount(self, zone: int | None = None,
+                     user_id: str | None = None) -> int:
+        return await self._bridge(self._async_count(zone, user_id))
 
     async def _async_count(self, zone: int | None,
                            user_id: str | None = None) -> int:
@@ -344,9 +833,60 @@ class PostgresStorage(StorageBackend):
             )
             return row[0]
 
+    def list_items(self, zone: int | None = None, user_id: str | None = None,
+                   order_by: str = "total_score", after=None, limit: int = 50,
+                   fields: list[str] | None = None) -> list[dict]:
+        """Keyset page ordered by ``order_by`` descending, then id."""
+        return self._run(self._async_list_items(zone, user_id, order_by,
+                                                after, limit, fields))
+
+    async def alist_items(self, zone: int | None = None, user_id: str | None = None,
+                          order_by: str = "total_score", after=None, limit: int = 50,
+                          fields: list[str] | None = None) -> list[dict]:
+        return await self._bridge(self._async_list_items(zone, user_id, order_by,
+                                                         after, limit, fields))
+
+    async def _async_list_items(self, zone, user_id, order_by, after,
+                                limit, fields) -> list[dict]:
+        from stellar_memory.storage import list_fields
+        fields = list_fields(order_by, fields)
+        columns = [f for f in fields if f != "content_type"]  # not stored here
+        conditions = []
+        params: list = []
+        if user_id:
+            params.append(user_id)
+            conditions.append(f"user_id = ${len(params)}")
+        if zone is not None:
+            params.append(zone)
+            conditions.append(f"zone = ${len(params)}")
+        if after is not None:
+            params.extend([after.value, after.item_id])
+            n = len(params)
+            conditions.append(
+                f"({order_by} < ${n - 1} OR ({order_by} = ${n - 1} AND id > ${n}))")
+        params.append(limit)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        async with self._pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"SELECT {', '.join(columns)} FROM memories {where} "
+                f"ORDER BY {order_by} DESC, id LIMIT ${len(params)}",
+                *params,
+            )
+        result = []
+        for r in rows:
+            row = {f: r[f] if f in columns else "text" for f in fields}
+            if isinstance(row.get("metadata"), str):
+                row["metadata"] = json.loads(row["metadata"])
+            if row.get("user_id") is not None:
+                row["user_id"] = str(row["user_id"])
+            result.append(row)
+        return result
+
     def get_lowest_score_item(self, zone: int) -> MemoryItem | None:
-        import asyncio
-        return asyncio.run(self._async_lowest(zone))
+        return self._run(self._async_lowest(zone))
+
+    async def aget_lowest_score_item(self, zone: int) -> MemoryItem | None:
+        return await self._bridge(self._async_lowest(zone))
 
     async def _async_lowest(self, zone: int) -> MemoryItem | None:
         async with self._pool.acquire() as conn:
@@ -358,10 +898,16 @@ class PostgresStorage(StorageBackend):
 
     def _row_to_item(self, row) -> MemoryItem:
         from stellar_memory.models import MemoryItem
-        embedding = None
-        if row.get("embedding"):
+        raw = row.get("embedding")
+        if raw is None:
+            embedding = None
+        elif isinstance(raw, (bytes, memoryview)):
             from stellar_memory.utils import deserialize_embedding
-            embedding = deserialize_embedding(row["embedding"])
+            embedding = deserialize_embedding(bytes(raw))
+        elif isinstance(raw, str):  # pgvector text output, no codec
+            embedding = json.loads(raw)
+        else:
+            embedding = list(raw)
         user_id_val = row.get("user_id")
         return MemoryItem(
             id=row["id"],
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING
 
@@ -13,15 +12,27 @@ logger = logging.getLogger(__name__)
 
 
 class RedisCache:
-    """Redis-based read cache for frequently accessed memories."""
+    """Redis read-through / write-through cache for hot-zone memories.
+
+    Items live under ``sm:<id>``; each cached zone also keeps a key set
+    ``sm:zone:<zone>`` so a whole zone can be dropped without a SCAN.
+    Multi-key operations go through ``MGET`` and pipelines.
+    """
 
     def __init__(self, redis_url: str, ttl: int = 300,
                  cached_zones: tuple = (0, 1)):
         self._url = redis_url
         self._ttl = ttl
-        self._cached_zones = cached_zones
+        self._cached_zones = tuple(cached_zones)
         self._client = None
         self._connected = False
+        self._pubsub_thread = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cached_zones(self) -> tuple:
+        return self._cached_zones
 
     def connect(self) -> None:
         try:
@@ -41,6 +52,7 @@ class RedisCache:
             self._connected = False
 
     def disconnect(self) -> None:
+        self.unsubscribe()
         if self._client:
             self._client.close()
             self._connected = False
@@ -48,91 +60,140 @@ class RedisCache:
     def is_connected(self) -> bool:
         return self._connected and self._client is not None
 
+    @staticmethod
+    def _key(item_id: str) -> str:
+        return f"sm:{item_id}"
+
+    @staticmethod
+    def _zone_key(zone: int) -> str:
+        return f"sm:zone:{zone}"
+
+    # --- Reads ---
+
     def get(self, item_id: str) -> MemoryItem | None:
         if not self._client:
             return None
         try:
-            data = self._client.get(f"sm:{item_id}")
-            if data:
-                return self._deserialize(data)
+            data = self._client.get(self._key(item_id))
         except Exception:
-            pass
-        return None
+            return None
+        if not data:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._deserialize(data)
+
+    def get_many(self, item_ids: list[str]) -> dict[str, MemoryItem]:
+        """Batched lookup (one MGET); returns only the ids that were cached."""
+        if not self._client or not item_ids:
+            return {}
+        try:
+            values = self._client.mget([self._key(i) for i in item_ids])
+        except Exception:
+            return {}
+        found: dict[str, MemoryItem] = {}
+        for item_id, data in zip(item_ids, values):
+            if data:
+                found[item_id] = self._deserialize(data)
+        self.hits += len(found)
+        self.misses += len(item_ids) - len(found)
+        return found
+
+    # --- Writes ---
 
     def set(self, item: MemoryItem) -> None:
-        if not self._client or item.zone not in self._cached_zones:
+        self.set_many([item])
+
+    def set_many(self, items: list[MemoryItem]) -> None:
+        """Write-through in one pipeline; items outside cached zones are skipped."""
+        if not self._client:
+            return
+        items = [i for i in items if i.zone in self._cached_zones]
+        if not items:
             return
         try:
-            self._client.setex(
-                f"sm:{item.id}", self._ttl, self._serialize(item)
-            )
+            pipe = self._client.pipeline(transaction=False)
+            zones = set()
+            for item in items:
+                pipe.setex(self._key(item.id), self._ttl, self._serialize(item))
+                pipe.sadd(self._zone_key(item.zone), item.id)
+                zones.add(item.zone)
+            for zone in zones:
+                pipe.expire(self._zone_key(zone), self._ttl)
+            pipe.execute()
         except Exception:
             pass
 
     def invalidate(self, item_id: str) -> None:
-        if self._client:
-            try:
-                self._client.delete(f"sm:{item_id}")
-            except Exception:
-                pass
+        self.invalidate_many([item_id])
+
+    def invalidate_many(self, item_ids: list[str]) -> None:
+        if not self._client or not item_ids:
+            return
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.delete(*[self._key(i) for i in item_ids])
+            for zone in self._cached_zones:
+                pipe.srem(self._zone_key(zone), *item_ids)
+            pipe.execute()
+        except Exception:
+            pass
 
     def invalidate_zone(self, zone: int) -> None:
-        """Invalidate all cached items in a zone (scan-based)."""
+        """Drop every cached item of ``zone`` via its key set (no SCAN)."""
         if not self._client:
             return
         try:
-            cursor = 0
-            while True:
-                cursor, keys = self._client.scan(
-                    cursor, match="sm:*", count=100
-                )
-                for key in keys:
-                    data = self._client.get(key)
-                    if data:
-                        try:
-                            d = json.loads(data)
-                            if d.get("zone") == zone:
-                                self._client.delete(key)
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-                if cursor == 0:
-                    break
+            members = self._client.smembers(self._zone_key(zone))
+            pipe = self._client.pipeline(transaction=False)
+            if members:
+                pipe.delete(*[self._key(m.decode() if isinstance(m, bytes) else m)
+                              for m in members])
+            pipe.delete(self._zone_key(zone))
+            pipe.execute()
         except Exception:
             pass
 
-    def _serialize(self, item: MemoryItem) -> bytes:
-        d = {
-            "id": item.id,
-            "content": item.content,
-            "created_at": item.created_at,
-            "last_recalled_at": item.last_recalled_at,
-            "recall_count": item.recall_count,
-            "arbitrary_importance": item.arbitrary_importance,
-            "zone": item.zone,
-            "metadata": item.metadata,
-            "total_score": item.total_score,
-            "encrypted": item.encrypted,
-            "source_type": item.source_type,
-            "source_url": item.source_url,
-            "ingested_at": item.ingested_at,
+    # --- Pub/sub ---
+
+    def publish(self, channel: str, message: bytes) -> None:
+        if not self._client:
+            return
+        try:
+            self._client.publish(channel, message)
+        except Exception:
+            pass
+
+    def subscribe(self, channel: str, handler) -> None:
+        """Call ``handler(data: bytes)`` for each message, on a daemon thread."""
+        if not self._client or self._pubsub_thread is not None:
+            return
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{channel: lambda msg: handler(msg["data"])})
+        self._pubsub_thread = pubsub.run_in_thread(sleep_time=0.01, daemon=True)
+
+    def unsubscribe(self) -> None:
+        if self._pubsub_thread is not None:
+            try:
+                self._pubsub_thread.stop()
+            except Exception:
+                pass
+            self._pubsub_thread = None
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
         }
-        return json.dumps(d).encode()
+
+    # --- Serialization ---
+
+    def _serialize(self, item: MemoryItem) -> bytes:
+        from stellar_memory.storage.codec import encode_item
+        return encode_item(item)
 
     def _deserialize(self, data: bytes) -> MemoryItem:
-        from stellar_memory.models import MemoryItem
-        d = json.loads(data)
-        return MemoryItem(
-            id=d["id"],
-            content=d["content"],
-            created_at=d["created_at"],
-            last_recalled_at=d["last_recalled_at"],
-            recall_count=d.get("recall_count", 0),
-            arbitrary_importance=d.get("arbitrary_importance", 0.5),
-            zone=d.get("zone", -1),
-            metadata=d.get("metadata", {}),
-            total_score=d.get("total_score", 0.0),
-            encrypted=d.get("encrypted", False),
-            source_type=d.get("source_type", "user"),
-            source_url=d.get("source_url"),
-            ingested_at=d.get("ingested_at"),
-        )
+        from stellar_memory.storage.codec import decode_item
+        return decode_item(data)
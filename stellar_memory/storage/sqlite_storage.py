@@ -6,14 +6,27 @@ import json
 import sqlite3
 import threading
 
-from stellar_memory.storage import ZoneStorage
-from stellar_memory.models import MemoryItem
+from stellar_memory.metrics import count_query
+from stellar_memory.storage import ListCursor, SearchFilter, ZoneStorage, list_fields
+from stellar_memory.models import MemoryItem, EmotionVector
+
+# Filterable attributes, appended after the original columns so tables
+# created by older versions can be migrated with ALTER TABLE.
+_FILTER_COLUMNS = (
+    ("user_id", "TEXT"),
+    ("content_type", "TEXT DEFAULT 'text'"),
+    ("emotion", "TEXT"),
+    ("emotion_dominant", "TEXT"),
+    ("session_id", "TEXT"),
+)
 
 
 class SqliteStorage(ZoneStorage):
-    def __init__(self, db_path: str, zone_id: int):
+    def __init__(self, db_path: str, zone_id: int,
+                 embedding_codec: str = "float32"):
         self._db_path = db_path
         self._zone_id = zone_id
+        self._embedding_codec = embedding_codec
         self._table = f"memories_zone_{zone_id}"
         self._local = threading.local()
         self._init_table()
@@ -41,6 +54,22 @@ class SqliteStorage(ZoneStorage):
                 updated_at REAL NOT NULL DEFAULT 0.0
             )
         """)
+        existing = {row[1] for row in conn.execute(f"PRAGMA table_info({self._table})")}
+        for name, decl in _FILTER_COLUMNS:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE {self._table} ADD COLUMN {name} {decl}")
+        if "session_id" not in existing:
+            # Older rows kept the session only in metadata
+            conn.execute(f"""
+                UPDATE {self._table}
+                SET session_id = json_extract(metadata, '$.session_id')
+                WHERE session_id IS NULL AND json_valid(metadata)
+            """)
+        for name in ("user_id", "content_type", "emotion_dominant", "session_id"):
+            conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{self._table}_{name}
+                ON {self._table}({name})
+            """)
         conn.execute(f"""
             CREATE INDEX IF NOT EXISTS idx_{self._table}_score
             ON {self._table}(zone, total_score)
@@ -49,16 +78,23 @@ class SqliteStorage(ZoneStorage):
             CREATE INDEX IF NOT EXISTS idx_{self._table}_zone
             ON {self._table}(zone)
         """)
+        # Keyset listing (list_items) walks these instead of sorting
+        for order_by in ("total_score", "created_at"):
+            conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{self._table}_list_{order_by}
+                ON {self._table}({order_by} DESC, id)
+            """)
         conn.commit()
 
     def _row_to_item(self, row: tuple) -> MemoryItem:
         # Columns: id, content, created_at, last_recalled_at, recall_count,
-        #          arbitrary_importance, zone, metadata, embedding, total_score, updated_at
+        #          arbitrary_importance, zone, metadata, embedding, total_score, updated_at,
+        #          user_id, content_type, emotion, emotion_dominant, session_id
         embedding = None
         if len(row) > 8 and row[8] is not None:
             from stellar_memory.utils import deserialize_embedding
             embedding = deserialize_embedding(row[8])
-        return MemoryItem(
+        item = MemoryItem(
             id=row[0],
             content=row[1],
             created_at=row[2],
@@ -70,35 +106,74 @@ class SqliteStorage(ZoneStorage):
             embedding=embedding,
             total_score=row[9] if len(row) > 9 else 0.0,
         )
+        if len(row) > 13:
+            item.user_id = row[11]
+            item.content_type = row[12] or "text"
+            if row[13]:
+                item.emotion = EmotionVector.from_list(json.loads(row[13]))
+        return item
+
+    @staticmethod
+    def _filter_values(item: MemoryItem) -> tuple:
+        emotion = json.dumps(item.emotion.to_list()) if item.emotion else None
+        dominant = item.emotion.dominant if item.emotion else None
+        return (item.user_id, item.content_type, emotion, dominant,
+                item.metadata.get("session_id"))
+
+    @staticmethod
+    def _filter_sql(filters: SearchFilter | None) -> tuple[str, list]:
+        """SQL conjunction (prefixed with AND) and params for a SearchFilter."""
+        if filters is None or filters.is_empty:
+            return "", []
+        clauses: list[str] = []
+        params: list = []
+        if filters.user_id is not None:
+            clauses.append("(user_id IS NULL OR user_id = ?)")
+            params.append(filters.user_id)
+        if filters.emotion is not None:
+            clauses.append("emotion_dominant = ?")
+            params.append(filters.emotion)
+        if filters.session_id is not None:
+            clauses.append("session_id = ?")
+            params.append(filters.session_id)
+        if filters.content_type is not None:
+            clauses.append("content_type = ?")
+            params.append(filters.content_type)
+        return " AND " + " AND ".join(clauses), params
 
     def store(self, item: MemoryItem) -> None:
         import time as _time
         embedding_blob = None
         if item.embedding is not None:
             from stellar_memory.utils import serialize_embedding
-            embedding_blob = serialize_embedding(item.embedding)
+            embedding_blob = serialize_embedding(item.embedding, self._embedding_codec)
         conn = self._get_conn()
         conn.execute(
             f"INSERT OR REPLACE INTO {self._table} "
             "(id, content, created_at, last_recalled_at, recall_count, "
-            "arbitrary_importance, zone, metadata, embedding, total_score, updated_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "arbitrary_importance, zone, metadata, embedding, total_score, updated_at, "
+            "user_id, content_type, emotion, emotion_dominant, session_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
             (item.id, item.content, item.created_at, item.last_recalled_at,
              item.recall_count, item.arbitrary_importance, item.zone,
-             json.dumps(item.metadata), embedding_blob, item.total_score, _time.time()),
+             json.dumps(item.metadata), embedding_blob, item.total_score, _time.time())
+            + self._filter_values(item),
         )
         conn.commit()
+        count_query()
 
     def get(self, item_id: str) -> MemoryItem | None:
         conn = self._get_conn()
         cur = conn.execute(f"SELECT * FROM {self._table} WHERE id = ?", (item_id,))
         row = cur.fetchone()
+        count_query(1 if row else 0)
         return self._row_to_item(row) if row else None
 
     def remove(self, item_id: str) -> bool:
         conn = self._get_conn()
         cur = conn.execute(f"DELETE FROM {self._table} WHERE id = ?", (item_id,))
         conn.commit()
+        count_query()
         return cur.rowcount > 0
 
     def update(self, item: MemoryItem) -> None:
@@ -106,87 +181,136 @@ class SqliteStorage(ZoneStorage):
         embedding_blob = None
         if item.embedding is not None:
             from stellar_memory.utils import serialize_embedding
-            embedding_blob = serialize_embedding(item.embedding)
+            embedding_blob = serialize_embedding(item.embedding, self._embedding_codec)
         conn = self._get_conn()
         conn.execute(
             f"UPDATE {self._table} SET content=?, last_recalled_at=?, recall_count=?, "
-            "arbitrary_importance=?, zone=?, metadata=?, embedding=?, total_score=?, updated_at=? WHERE id=?",
+            "arbitrary_importance=?, zone=?, metadata=?, embedding=?, total_score=?, updated_at=?, "
+            "user_id=?, content_type=?, emotion=?, emotion_dominant=?, session_id=? WHERE id=?",
             (item.content, item.last_recalled_at, item.recall_count,
              item.arbitrary_importance, item.zone, json.dumps(item.metadata),
-             embedding_blob, item.total_score, _time.time(), item.id),
+             embedding_blob, item.total_score, _time.time())
+            + self._filter_values(item) + (item.id,),
         )
         conn.commit()
+        count_query()
 
     def search(self, query: str, limit: int = 5,
-               query_embedding: list[float] | None = None) -> list[MemoryItem]:
+               query_embedding: list[float] | None = None,
+               filters: SearchFilter | None = None) -> list[MemoryItem]:
         conn = self._get_conn()
         words = query.lower().split()
         if not words:
             return []
+        filter_sql, filter_params = self._filter_sql(filters)
         if query_embedding is not None:
             # Phase 1: Pre-filter by keyword (limit * 5 candidates)
             candidate_limit = limit * 5
             conditions = " OR ".join(["LOWER(content) LIKE ?" for _ in words])
             params = [f"%{w}%" for w in words]
             cur = conn.execute(
-                f"SELECT * FROM {self._table} WHERE {conditions} LIMIT ?",
-                params + [candidate_limit],
+                f"SELECT * FROM {self._table} WHERE ({conditions}){filter_sql} LIMIT ?",
+                params + filter_params + [candidate_limit],
             )
-            candidates = [self._row_to_item(row) for row in cur.fetchall()]
+            candidates = cur.fetchall()
+            count_query(len(candidates))
 
             # Phase 1b: supplement with recent embedded items if not enough
             if len(candidates) < candidate_limit:
-                existing_ids = {c.id for c in candidates}
+                existing_ids = {row[0] for row in candidates}
                 cur2 = conn.execute(
-                    f"SELECT * FROM {self._table} WHERE embedding IS NOT NULL "
+                    f"SELECT * FROM {self._table} WHERE embedding IS NOT NULL{filter_sql} "
                     f"ORDER BY last_recalled_at DESC LIMIT ?",
-                    (candidate_limit - len(candidates),),
+                    filter_params + [candidate_limit - len(candidates)],
                 )
-                for row in cur2.fetchall():
-                    item = self._row_to_item(row)
-                    if item.id not in existing_ids:
-                        candidates.append(item)
-
-            # Phase 2: Re-rank by hybrid score
-            from stellar_memory.utils import cosine_similarity
-            scored: list[tuple[float, MemoryItem]] = []
-            for item in candidates:
-                content_lower = item.content.lower()
+                rows = cur2.fetchall()
+                count_query(len(rows))
+                candidates.extend(row for row in rows if row[0] not in existing_ids)
+
+            # Phase 2: Re-rank by hybrid score, straight from the stored
+            # (possibly quantized) blobs; only the winners are decoded
+            from stellar_memory.utils import blob_similarities
+            embedded = [row for row in candidates if row[8] is not None]
+            sims = blob_similarities(query_embedding, [row[8] for row in embedded])
+            semantic = {row[0]: s for row, s in zip(embedded, sims)}
+            scored: list[tuple[float, tuple]] = []
+            for row in candidates:
+                content_lower = row[1].lower()
                 match_count = sum(1 for w in words if w in content_lower)
                 keyword_score = match_count / len(words)
-                semantic_score = 0.0
-                if item.embedding is not None:
-                    semantic_score = cosine_similarity(query_embedding, item.embedding)
-                    score = 0.7 * semantic_score + 0.3 * keyword_score
+                if row[0] in semantic:
+                    score = 0.7 * semantic[row[0]] + 0.3 * keyword_score
                 else:
                     score = keyword_score
                 if score > 0:
-                    scored.append((score, item))
+                    scored.append((score, row))
             scored.sort(key=lambda x: x[0], reverse=True)
-            return [item for _, item in scored[:limit]]
+            return [self._row_to_item(row) for _, row in scored[:limit]]
         else:
             conditions = " OR ".join(["LOWER(content) LIKE ?" for _ in words])
             params = [f"%{w}%" for w in words]
             cur = conn.execute(
-                f"SELECT * FROM {self._table} WHERE {conditions} LIMIT ?",
-                params + [limit],
+                f"SELECT * FROM {self._table} WHERE ({conditions}){filter_sql} LIMIT ?",
+                params + filter_params + [limit],
             )
-            return [self._row_to_item(row) for row in cur.fetchall()]
+            items = [self._row_to_item(row) for row in cur.fetchall()]
+            count_query(len(items))
+            return items
 
     def get_all(self) -> list[MemoryItem]:
         conn = self._get_conn()
         cur = conn.execute(f"SELECT * FROM {self._table}")
-        return [self._row_to_item(row) for row in cur.fetchall()]
+        items = [self._row_to_item(row) for row in cur.fetchall()]
+        count_query(len(items))
+        return items
 
     def count(self) -> int:
         conn = self._get_conn()
         cur = conn.execute(f"SELECT COUNT(*) FROM {self._table}")
         return cur.fetchone()[0]
 
+    def list_items(self, user_id: str | None = None,
+                   order_by: str = "total_score",
+                   after: ListCursor | None = None, limit: int = 50,
+                   fields: list[str] | None = None) -> list[dict]:
+        fields = list_fields(order_by, fields)  # validated: safe to interpolate
+        clauses: list[str] = []
+        params: list = []
+        if user_id is not None:
+            clauses.append("(user_id IS NULL OR user_id = ?)")
+            params.append(user_id)
+        if after is not None:
+            clauses.append(f"({order_by} < ? OR ({order_by} = ? AND id > ?))")
+            params.extend([after.value, after.value, after.item_id])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cur = self._get_conn().execute(
+            f"SELECT {', '.join(fields)} FROM {self._table} {where} "
+            f"ORDER BY {order_by} DESC, id LIMIT ?",
+            params + [limit],
+        )
+        rows = [dict(zip(fields, row)) for row in cur.fetchall()]
+        count_query(len(rows))
+        for row in rows:
+            if "metadata" in row:
+                row["metadata"] = json.loads(row["metadata"]) if row["metadata"] else {}
+            if "content_type" in row:
+                row["content_type"] = row["content_type"] or "text"
+        return rows
+
+    def count_items(self, user_id: str | None = None) -> int:
+        if user_id is None:
+            return self.count()
+        cur = self._get_conn().execute(
+            f"SELECT COUNT(*) FROM {self._table} WHERE user_id IS NULL OR user_id = ?",
+            (user_id,),
+        )
+        return cur.fetchone()[0]
+
     def get_lowest_score_item(self) -> MemoryItem | None:
         conn = self._get_conn()
         cur = conn.execute(
             f"SELECT * FROM {self._table} ORDER BY total_score ASC LIMIT 1"
         )
         row = cur.fetchone()
+        count_query(1 if row else 0)
         return self._row_to_item(row) if row else None
@@ -0,0 +1,165 @@
+"""Two-tier item cache: in-process LRU (L1) in front of Redis (L2)."""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import uuid
+from collections import OrderedDict
+
+from stellar_memory.models import MemoryItem
+from stellar_memory.storage.redis_cache import RedisCache
+
+_MAX_TOMBSTONES = 10_000
+
+
+class TieredItemCache:
+    """L1 LRU of deserialized items backed by a :class:`RedisCache`.
+
+    Every write or removal is broadcast on a Redis pub/sub channel so
+    other processes drop their L1 copy and re-read L2. L1 fills from L2
+    are versioned by an invalidation generation: a read that started
+    before an invalidation of the same id is not cached, so a slow MGET
+    cannot resurrect stale data. Items are returned as shallow copies.
+    """
+
+    def __init__(self, l2: RedisCache, max_items: int = 10_000,
+                 channel: str = "sm:invalidate"):
+        self._l2 = l2
+        self._max_items = max_items
+        self._channel = channel
+        self._origin = uuid.uuid4().hex
+        self._l1: OrderedDict[str, MemoryItem] = OrderedDict()
+        self._tombstones: OrderedDict[str, int] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.l1_hits = 0
+        self.l1_misses = 0
+        self.remote_invalidations = 0
+
+    @property
+    def cached_zones(self) -> tuple:
+        return self._l2.cached_zones
+
+    def start(self) -> None:
+        """Subscribe to invalidations from other processes."""
+        self._l2.subscribe(self._channel, self._on_message)
+
+    def stop(self) -> None:
+        self._l2.unsubscribe()
+
+    # --- Reads ---
+
+    def get(self, item_id: str) -> MemoryItem | None:
+        return self.get_many([item_id]).get(item_id)
+
+    def get_many(self, item_ids: list[str]) -> dict[str, MemoryItem]:
+        found: dict[str, MemoryItem] = {}
+        missing: list[str] = []
+        with self._lock:
+            for item_id in item_ids:
+                item = self._l1.get(item_id)
+                if item is None:
+                    missing.append(item_id)
+                else:
+                    self._l1.move_to_end(item_id)
+                    found[item_id] = copy.copy(item)
+            self.l1_hits += len(found)
+            self.l1_misses += len(missing)
+            started = self._generation
+        if missing:
+            loaded = self._l2.get_many(missing)
+            with self._lock:
+                for item_id, item in loaded.items():
+                    if self._tombstones.get(item_id, -1) <= started:
+                        self._put(copy.copy(item))
+            found.update(loaded)
+        return found
+
+    # --- Writes ---
+
+    def set(self, item: MemoryItem) -> None:
+        self.set_many([item])
+
+    def set_many(self, items: list[MemoryItem]) -> None:
+        items = [i for i in items if i.zone in self.cached_zones]
+        if not items:
+            return
+        with self._lock:
+            # Fence off in-flight L2 reads that predate this write
+            self._fence(i.id for i in items)
+            for item in items:
+                self._put(copy.copy(item))
+        self._l2.set_many(items)
+        self._broadcast({"ids": [i.id for i in items]})
+
+    def invalidate(self, item_id: str) -> None:
+        self.invalidate_many([item_id])
+
+    def invalidate_many(self, item_ids: list[str]) -> None:
+        self._drop_local(item_ids)
+        self._l2.invalidate_many(item_ids)
+        self._broadcast({"ids": list(item_ids)})
+
+    def invalidate_zone(self, zone: int) -> None:
+        self._drop_local_zone(zone)
+        self._l2.invalidate_zone(zone)
+        self._broadcast({"zone": zone})
+
+    # --- L1 bookkeeping ---
+
+    def _put(self, item: MemoryItem) -> None:
+        self._l1[item.id] = item
+        self._l1.move_to_end(item.id)
+        while len(self._l1) > self._max_items:
+            self._l1.popitem(last=False)
+
+    def _fence(self, item_ids) -> None:
+        self._generation += 1
+        for item_id in item_ids:
+            self._tombstones[item_id] = self._generation
+            self._tombstones.move_to_end(item_id)
+        while len(self._tombstones) > _MAX_TOMBSTONES:
+            self._tombstones.popitem(last=False)
+
+    def _drop_local(self, item_ids) -> None:
+        item_ids = list(item_ids)
+        with self._lock:
+            for item_id in item_ids:
+                self._l1.pop(item_id, None)
+            self._fence(item_ids)
+
+    def _drop_local_zone(self, zone: int) -> None:
+        with self._lock:
+            ids = [i for i, item in self._l1.items() if item.zone == zone]
+        self._drop_local(ids)
+
+    def _broadcast(self, payload: dict) -> None:
+        payload["origin"] = self._origin
+        self._l2.publish(self._channel, json.dumps(payload).encode())
+
+    def _on_message(self, data: bytes) -> None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self._origin:
+            return
+        self.remote_invalidations += 1
+        if "zone" in payload:
+            self._drop_local_zone(payload["zone"])
+        else:
+            self._drop_local(payload.get("ids", ()))
+
+    def stats(self) -> dict:
+        with self._lock:
+            l1_lookups = self.l1_hits + self.l1_misses
+            l1 = {
+                "entries": len(self._l1),
+                "hits": self.l1_hits,
+                "misses": self.l1_misses,
+                "hit_rate": self.l1_hits / l1_lookups if l1_lookups else 0.0,
+                "remote_invalidations": self.remote_invalidations,
+            }
+        return {"l1": l1, "l2": self._l2.stats()}
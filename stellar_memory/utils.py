@@ -2,27 +2,196 @@
 
 from __future__ import annotations
 
+import functools
 import math
+import operator
 import struct
 
+# Embedding blob codecs. "float32" blobs are headerless for backward
+# compatibility; quantized blobs start with a 4-byte header that decodes
+# as a float32 NaN (never produced by an embedder), so the two layouts
+# cannot be confused: [codec_id, 0x00, 0xC0, 0x7F].
+EMBEDDING_CODECS = ("float32", "float16", "int8")
+_CODEC_IDS = {"float16": 1, "int8": 2}
+_CODEC_NAMES = {v: k for k, v in _CODEC_IDS.items()}
+_HEADER_TAIL = b"\x00\xc0\x7f"
+# codec -> (payload offset, struct format, NumPy dtype)
+_BLOB_LAYOUTS = {"float32": (0, "f", "<f4"), "float16": (4, "e", "<f2"),
+                 "int8": (8, "b", "i1")}
+
+
+# The similarity helpers accept arbitrary vectors: stored embeddings may
+# come from callers, so the store paths never assume unit norm. Callers
+# that can vouch for unit-norm inputs (e.g. the benchmark kernels) pass
+# ``normalized=True``; the indexes cache per-row ``norms`` instead.
+
+
+def dot(a, b) -> float:
+    """Dot product. Uses NumPy for ndarrays, a C-level map/sum otherwise."""
+    if hasattr(a, "ndim") or hasattr(b, "ndim"):
+        import numpy as np
+        return float(np.dot(a, b))
+    return sum(map(operator.mul, a, b))
+
+
+def vector_norm(vector) -> float:
+    return math.hypot(*vector)
+
+
+def normalize(vector: list[float]) -> list[float]:
+    """Return a unit-norm copy of ``vector`` (zero vectors are returned as-is)."""
+    norm = math.hypot(*vector)
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
     """Cosine similarity between two vectors, clamped to [0, 1]."""
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
+    norm_a = math.hypot(*a)
+    norm_b = math.hypot(*b)
     if norm_a == 0 or norm_b == 0:
         return 0.0
-    return max(0.0, min(1.0, dot / (norm_a * norm_b)))
+    return max(0.0, min(1.0, dot(a, b) / (norm_a * norm_b)))
+
+
+def similarities(query, vectors, norms=None,
+                 normalized: bool = False) -> list[float]:
+    """Cosine similarity of ``query`` against every row of ``vectors``.
+
+    ``vectors`` is a sequence of vectors or a 2-D NumPy array (the fast
+    path; converting Python lists to an array costs about as much as the
+    pure-Python scan, so callers should cache the matrix). ``norms`` are
+    optional precomputed row norms; ``normalized=True`` means query and
+    rows are unit-norm. Results are clamped to [0, 1] like
+    :func:`cosine_similarity`.
+    """
+    if hasattr(vectors, "ndim"):
+        return _similarities_numpy(query, vectors, norms, normalized)
+    if normalized:
+        return [max(0.0, min(1.0, sum(map(operator.mul, query, v))))
+                for v in vectors]
+    q_norm = math.hypot(*query)
+    if q_norm == 0:
+        return [0.0] * len(vectors)
+    if norms is None:
+        norms = [math.hypot(*v) for v in vectors]
+    out = []
+    for v, n in zip(vectors, norms):
+        if n == 0:
+            out.append(0.0)
+        else:
+            out.append(max(0.0, min(1.0, sum(map(operator.mul, query, v)) / (n * q_norm))))
+    return out
+
 
+def _similarities_numpy(query, matrix, norms, normalized: bool) -> list[float]:
+    import numpy as np
+    if len(matrix) == 0:
+        return []
+    q = np.asarray(query, dtype=matrix.dtype)
+    sims = matrix @ q
+    if not normalized:
+        q_norm = float(np.linalg.norm(q))
+        if q_norm == 0:
+            return [0.0] * len(matrix)
+        row_norms = (np.asarray(norms, dtype=np.float64) if norms is not None
+                     else np.linalg.norm(matrix, axis=1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sims = np.where(row_norms > 0, sims / (row_norms * q_norm), 0.0)
+    return np.clip(sims, 0.0, 1.0).tolist()
 
-def serialize_embedding(embedding: list[float]) -> bytes:
-    """Serialize list[float] to bytes (4 bytes per float, little-endian)."""
-    return struct.pack(f"<{len(embedding)}f", *embedding)
+
+def quantize_int8(embedding: list[float]) -> tuple[list[int], float]:
+    """Symmetric per-vector int8 quantization. Returns (codes, scale)."""
+    max_abs = max((abs(x) for x in embedding), default=0.0)
+    if max_abs == 0:
+        return [0] * len(embedding), 0.0
+    scale = max_abs / 127.0
+    return [max(-127, min(127, round(x / scale))) for x in embedding], scale
+
+
+def dequantize_int8(codes, scale: float) -> list[float]:
+    return [c * scale for c in codes]
+
+
+def serialize_embedding(embedding: list[float], codec: str = "float32") -> bytes:
+    """Serialize list[float] to bytes.
+
+    ``float32`` writes 4 bytes per float (little-endian, no header);
+    ``float16`` 2 bytes per float; ``int8`` 1 byte per float plus a
+    float32 per-vector scale.
+    """
+    n = len(embedding)
+    if codec == "float32":
+        return struct.pack(f"<{n}f", *embedding)
+    if codec == "float16":
+        return (bytes([_CODEC_IDS[codec]]) + _HEADER_TAIL
+                + struct.pack(f"<{n}e", *embedding))
+    if codec == "int8":
+        codes, scale = quantize_int8(embedding)
+        return (bytes([_CODEC_IDS[codec]]) + _HEADER_TAIL
+                + struct.pack("<f", scale) + struct.pack(f"<{n}b", *codes))
+    raise ValueError(f"Unknown embedding codec: {codec}. Valid: {EMBEDDING_CODECS}")
+
+
+def embedding_codec(blob: bytes) -> str:
+    """Detect the codec a blob was written with."""
+    if len(blob) >= 4 and blob[1:4] == _HEADER_TAIL and blob[0] in _CODEC_NAMES:
+        return _CODEC_NAMES[blob[0]]
+    return "float32"
 
 
 def deserialize_embedding(blob: bytes, dim: int | None = None) -> list[float]:
     """Deserialize bytes to list[float]. Infers dim from blob size if not given."""
+    codec = embedding_codec(blob)
+    if codec == "float16":
+        n = dim if dim is not None else (len(blob) - 4) // 2
+        return list(struct.unpack_from(f"<{n}e", blob, 4))
+    if codec == "int8":
+        n = dim if dim is not None else len(blob) - 8
+        (scale,) = struct.unpack_from("<f", blob, 4)
+        return dequantize_int8(struct.unpack_from(f"<{n}b", blob, 8), scale)
     if dim is None:
         dim = len(blob) // 4
     return list(struct.unpack(f"<{dim}f", blob))
+
+
+def blob_similarities(query, blobs) -> list[float]:
+    """Cosine similarity of ``query`` against serialized embedding blobs.
+
+    Rows are scored in their stored encoding (int8 codes, float16 or
+    float32) without decoding to Python floats; the int8 per-vector scale
+    cancels out of the cosine, so it is never applied.
+    """
+    groups: dict[tuple[str, int], list[int]] = {}
+    for i, blob in enumerate(blobs):
+        codec = embedding_codec(blob)
+        groups.setdefault((codec, len(blob)), []).append(i)
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    out = [0.0] * len(blobs)
+    for (codec, size), rows in groups.items():
+        offset, fmt, dtype = _BLOB_LAYOUTS[codec]
+        n = (size - offset) // struct.calcsize(fmt)
+        if np is not None:
+            payload = b"".join(blobs[i][offset:] for i in rows)
+            matrix = np.frombuffer(payload, dtype=dtype).reshape(len(rows), n)
+            sims = similarities(query, matrix.astype(np.float32))
+        else:
+            sims = similarities(query, [struct.unpack_from(f"<{n}{fmt}", blobs[i], offset)
+                                        for i in rows])
+        for i, sim in zip(rows, sims):
+            out[i] = sim
+    return out
+
+
+def synchronized(method):
+    """Run ``method`` holding ``self._lock``."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
@@ -4,16 +4,26 @@ from __future__ import annotations
 
 import logging
 import math
+import struct
+import threading
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass, field
+from typing import Callable
 
-from stellar_memory.utils import cosine_similarity
+from stellar_memory.utils import (
+    quantize_int8, similarities, synchronized, vector_norm,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class VectorIndex(ABC):
-    """Abstract base for vector search indices."""
+    """Abstract base for vector search indices.
+
+    The built-in indices are safe to search while other threads add or
+    remove vectors: each serializes its methods on a per-index lock.
+    """
 
     @abstractmethod
     def add(self, item_id: str, vector: list[float]) -> None: ...
@@ -22,8 +32,12 @@ class VectorIndex(ABC):
     def remove(self, item_id: str) -> None: ...
 
     @abstractmethod
-    def search(self, query_vector: list[float], top_k: int = 10) -> list[tuple[str, float]]:
-        """Returns list of (item_id, similarity_score) sorted descending."""
+    def search(self, query_vector: list[float], top_k: int = 10,
+               filter_fn: Callable[[str], bool] | None = None) -> list[tuple[str, float]]:
+        """Returns list of (item_id, similarity_score) sorted descending.
+
+        ``filter_fn`` is applied to item ids before top-k selection.
+        """
         ...
 
     @abstractmethod
@@ -36,30 +50,270 @@ class VectorIndex(ABC):
 
 
 class BruteForceIndex(VectorIndex):
-    """O(n) brute force search - wraps cosine_similarity."""
+    """O(n) brute force search with cached norms.
 
-    def __init__(self):
-        self._vectors: dict[str, list[float]] = {}
+    Rows are scored in one batched ``similarities`` call. When NumPy is
+    available the vectors also live in a float64 matrix that grows by
+    doubling, so adds write one row instead of invalidating it; removes
+    swap the last row into the freed slot. Filtered searches score every
+    row and drop the excluded ones afterwards, without copying the matrix.
+    """
 
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._vectors: list[list[float]] = []
+        self._norms: list[float] = []
+        self._matrix = None  # NumPy rows [0, len(ids)) mirror _vectors; None if unusable
+        self._matrix_ok = True
+
+    @synchronized
     def add(self, item_id: str, vector: list[float]) -> None:
-        self._vectors[item_id] = vector
-
+        row = self._rows.get(item_id)
+        if row is None:
+            row = len(self._ids)
+            self._rows[item_id] = row
+            self._ids.append(item_id)
+            self._vectors.append(vector)
+            self._norms.append(vector_norm(vector))
+        else:
+            self._vectors[row] = vector
+            self._norms[row] = vector_norm(vector)
+        self._write_matrix_row(row, vector)
+
+    @synchronized
     def remove(self, item_id: str) -> None:
-        self._vectors.pop(item_id, None)
-
-    def search(self, query_vector: list[float], top_k: int = 10) -> list[tuple[str, float]]:
-        scores = []
-        for item_id, vec in self._vectors.items():
-            sim = cosine_similarity(query_vector, vec)
-            scores.append((item_id, sim))
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+            self._vectors[row] = self._vectors[last]
+            self._norms[row] = self._norms[last]
+            if self._matrix is not None:
+                self._matrix[row] = self._matrix[last]
+        self._ids.pop()
+        self._vectors.pop()
+        self._norms.pop()
+
+    def _write_matrix_row(self, row: int, vector: list[float]) -> None:
+        if not self._matrix_ok:
+            return
+        if self._matrix is None:
+            self._build_matrix()
+            return
+        if len(vector) != self._matrix.shape[1]:
+            # Mixed dimensions: fall back to the list path for good
+            self._matrix, self._matrix_ok = None, False
+            return
+        if row >= len(self._matrix):
+            import numpy as np
+            grown = np.empty((max(16, 2 * len(self._matrix)), self._matrix.shape[1]))
+            grown[:len(self._matrix)] = self._matrix
+            self._matrix = grown
+        self._matrix[row] = vector
+
+    def _build_matrix(self) -> None:
+        self._matrix = None
+        self._matrix_ok = len({len(v) for v in self._vectors}) <= 1
+        if not self._matrix_ok or not self._vectors:
+            return
+        try:
+            import numpy as np
+        except ImportError:
+            self._matrix_ok = False
+            return
+        matrix = np.empty((max(16, len(self._vectors)), len(self._vectors[0])))
+        matrix[:len(self._vectors)] = self._vectors
+        self._matrix = matrix
+
+    @synchronized
+    def search(self, query_vector: list[float], top_k: int = 10,
+               filter_fn: Callable[[str], bool] | None = None) -> list[tuple[str, float]]:
+        n = len(self._ids)
+        if not n:
+            return []
+        if self._matrix is not None and self._matrix.shape[1] == len(query_vector):
+            sims = similarities(query_vector, self._matrix[:n], self._norms)
+        else:
+            sims = similarities(query_vector, self._vectors, self._norms)
+        ids = self._ids
+        if filter_fn is None:
+            scores = list(zip(ids, sims))
+        else:
+            scores = [(ids[r], sim) for r, sim in enumerate(sims) if filter_fn(ids[r])]
         scores.sort(key=lambda x: x[1], reverse=True)
         return scores[:top_k]
 
     def size(self) -> int:
-        return len(self._vectors)
+        return len(self._ids)
 
+    @synchronized
     def rebuild(self, items: dict[str, list[float]]) -> None:
-        self._vectors = dict(items)
+        self._ids = list(items)
+        self._rows = {item_id: row for row, item_id in enumerate(self._ids)}
+        self._vectors = [items[i] for i in self._ids]
+        self._norms = [vector_norm(v) for v in self._vectors]
+        self._build_matrix()
+
+
+class QuantizedIndex(VectorIndex):
+    """Brute-force search over scalar-quantized vectors (int8 or float16).
+
+    Codes are kept in one contiguous row-major buffer (1 or 2 bytes per
+    dimension) instead of per-item lists of Python floats. Search scans
+    the quantized matrix, then optionally re-scores a shortlist of
+    ``top_k * rescore_factor`` rows against the float query.
+    """
+
+    def __init__(self, codec: str = "int8", rescore: bool = True,
+                 rescore_factor: int = 4):
+        if codec not in ("int8", "float16"):
+            raise ValueError(f"Unsupported quantization: {codec}")
+        self._codec = codec
+        self._fmt = "b" if codec == "int8" else "e"
+        self._itemsize = 1 if codec == "int8" else 2
+        self._rescore = rescore
+        self._rescore_factor = max(1, rescore_factor)
+        self._lock = threading.RLock()
+        self._dim: int | None = None
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._codes = bytearray()
+        self._scales = array("f")
+        self._norms = array("f")
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by vector data (codes + scales + norms)."""
+        return len(self._codes) + 4 * (len(self._scales) + len(self._norms))
+
+    def _encode(self, vector: list[float]) -> tuple[bytes, float, float]:
+        if self._codec == "int8":
+            codes, scale = quantize_int8(vector)
+            norm = scale * math.sqrt(sum(c * c for c in codes))
+            return struct.pack(f"<{self._dim}b", *codes), scale, norm
+        packed = struct.pack(f"<{self._dim}e", *vector)
+        decoded = struct.unpack(f"<{self._dim}e", packed)
+        return packed, 1.0, math.sqrt(sum(x * x for x in decoded))
+
+    def _row_codes(self, row: int) -> tuple:
+        width = self._dim * self._itemsize
+        return struct.unpack_from(f"<{self._dim}{self._fmt}", self._codes,
+                                  row * width)
+
+    def _row_vector(self, row: int) -> list[float]:
+        scale = self._scales[row]
+        return [c * scale for c in self._row_codes(row)]
+
+    @synchronized
+    def add(self, item_id: str, vector: list[float]) -> None:
+        if self._dim is None:
+            self._dim = len(vector)
+        if len(vector) != self._dim:
+            raise ValueError(f"Vector dim {len(vector)} != index dim {self._dim}")
+        packed, scale, norm = self._encode(vector)
+        row = self._rows.get(item_id)
+        if row is not None:
+            width = len(packed)
+            self._codes[row * width:(row + 1) * width] = packed
+            self._scales[row] = scale
+            self._norms[row] = norm
+            return
+        self._rows[item_id] = len(self._ids)
+        self._ids.append(item_id)
+        self._codes.extend(packed)
+        self._scales.append(scale)
+        self._norms.append(norm)
+
+    @synchronized
+    def remove(self, item_id: str) -> None:
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        width = self._dim * self._itemsize
+        if row != last:
+            # Swap-remove: move the last row into the freed slot
+            moved_id = self._ids[last]
+            self._codes[row * width:(row + 1) * width] = \
+                self._codes[last * width:(last + 1) * width]
+            self._scales[row] = self._scales[last]
+            self._norms[row] = self._norms[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        del self._codes[last * width:]
+        self._ids.pop()
+        self._scales.pop()
+        self._norms.pop()
+
+    @synchronized
+    def search(self, query_vector: list[float], top_k: int = 10,
+               filter_fn: Callable[[str], bool] | None = None) -> list[tuple[str, float]]:
+        if not self._ids:
+            return []
+        q_norm = math.sqrt(sum(x * x for x in query_vector))
+        if q_norm == 0:
+            return []
+        shortlist = top_k * self._rescore_factor if self._rescore else top_k
+        scored = self._scan(query_vector, q_norm)
+        if filter_fn is not None:
+            scored = [(row, sim) for row, sim in scored if filter_fn(self._ids[row])]
+        scored.sort(key=lambda x: x[1], reverse=True)
+        scored = scored[:shortlist]
+        if self._rescore:
+            rows = [row for row, _ in scored]
+            scored = list(zip(rows, similarities(
+                query_vector, [self._row_vector(row) for row in rows])))
+            scored.sort(key=lambda x: x[1], reverse=True)
+        return [(self._ids[row], max(0.0, min(1.0, sim)))
+                for row, sim in scored[:top_k]]
+
+    def _scan(self, query: list[float], q_norm: float) -> list[tuple[int, float]]:
+        """Approximate cosine for every row, computed in the quantized domain."""
+        n = len(self._ids)
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if self._codec == "int8":
+            q_codes, q_scale = quantize_int8(query)
+            if np is not None:
+                mat = np.frombuffer(self._codes, dtype=np.int8).reshape(n, self._dim)
+                raw = mat.astype(np.int32) @ np.asarray(q_codes, dtype=np.int32)
+                dots = (raw * np.frombuffer(self._scales, dtype=np.float32)
+                        * q_scale).tolist()
+            else:
+                dots = [sum(a * b for a, b in zip(self._row_codes(r), q_codes))
+                        * self._scales[r] * q_scale for r in range(n)]
+        else:
+            if np is not None:
+                mat = np.frombuffer(self._codes, dtype=np.float16).reshape(n, self._dim)
+                dots = (mat.astype(np.float32)
+                        @ np.asarray(query, dtype=np.float32)).tolist()
+            else:
+                dots = [sum(a * b for a, b in zip(self._row_codes(r), query))
+                        for r in range(n)]
+        return [(r, dots[r] / (self._norms[r] * q_norm) if self._norms[r] else 0.0)
+                for r in range(n)]
+
+    def size(self) -> int:
+        return len(self._ids)
+
+    @synchronized
+    def rebuild(self, items: dict[str, list[float]]) -> None:
+        self._dim = None
+        self._ids = []
+        self._rows = {}
+        self._codes = bytearray()
+        self._scales = array("f")
+        self._norms = array("f")
+        for item_id, vector in items.items():
+            self.add(item_id, vector)
 
 
 # --- Ball Tree Implementation ---
@@ -70,11 +324,14 @@ class _BallTreeNode:
     radius: float
     item_ids: list[str] | None = None
     vectors: list[list[float]] | None = None
+    norms: list[float] | None = None
     left: _BallTreeNode | None = None
     right: _BallTreeNode | None = None
 
 
 def _euclidean_dist(a: list[float], b: list[float]) -> float:
+    if len(a) == len(b):
+        return math.dist(a, b)
     return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
 
 
@@ -93,31 +350,37 @@ class BallTreeIndex(VectorIndex):
     Pure Python. O(log n) average case."""
 
     def __init__(self, leaf_size: int = 40):
+        self._lock = threading.RLock()
         self._leaf_size = leaf_size
         self._vectors: dict[str, list[float]] = {}
         self._tree: _BallTreeNode | None = None
         self._dirty = True
 
+    @synchronized
     def add(self, item_id: str, vector: list[float]) -> None:
         self._vectors[item_id] = vector
         self._dirty = True
 
+    @synchronized
     def remove(self, item_id: str) -> None:
         self._vectors.pop(item_id, None)
         self._dirty = True
 
-    def search(self, query_vector: list[float], top_k: int = 10) -> list[tuple[str, float]]:
+    @synchronized
+    def search(self, query_vector: list[float], top_k: int = 10,
+               filter_fn: Callable[[str], bool] | None = None) -> list[tuple[str, float]]:
         if not self._vectors:
             return []
         if self._dirty or self._tree is None:
             self._build_tree()
         # Collect candidates, then compute cosine similarity
-        candidates = self._tree_search(query_vector, top_k)
+        candidates = self._tree_search(query_vector, top_k, filter_fn)
         return candidates
 
     def size(self) -> int:
         return len(self._vectors)
 
+    @synchronized
     def rebuild(self, items: dict[str, list[float]]) -> None:
         self._vectors = dict(items)
         self._dirty = True
@@ -138,7 +401,8 @@ class BallTreeIndex(VectorIndex):
 
         if len(ids) <= self._leaf_size:
             return _BallTreeNode(centroid=c, radius=radius,
-                                 item_ids=ids, vectors=vecs)
+                                 item_ids=ids, vectors=vecs,
+                                 norms=[vector_norm(v) for v in vecs])
 
         # Split by dimension with largest spread
         dim = len(vecs[0])
@@ -165,7 +429,8 @@ class BallTreeIndex(VectorIndex):
         node.right = self._build_node(right_ids, right_vecs)
         return node
 
-    def _tree_search(self, query: list[float], top_k: int) -> list[tuple[str, float]]:
+    def _tree_search(self, query: list[float], top_k: int,
+                     filter_fn: Callable[[str], bool] | None = None) -> list[tuple[str, float]]:
         """Search tree using branch-and-bound."""
         results: list[tuple[str, float]] = []
         worst_score = -1.0
@@ -184,8 +449,10 @@ class BallTreeIndex(VectorIndex):
 
             if node.item_ids is not None:
                 # Leaf node
-                for item_id, vec in zip(node.item_ids, node.vectors):
-                    sim = cosine_similarity(query, vec)
+                sims = similarities(query, node.vectors, node.norms)
+                for item_id, sim in zip(node.item_ids, sims):
+                    if filter_fn is not None and not filter_fn(item_id):
+                        continue
                     if len(results) < top_k:
                         results.append((item_id, sim))
                         results.sort(key=lambda x: x[1], reverse=True)
@@ -220,6 +487,9 @@ def create_vector_index(config, dimension: int = 384) -> VectorIndex:
         return BruteForceIndex()
     if not config.enabled:
         return BruteForceIndex()
+    if config.quantization != "none":
+        return QuantizedIndex(config.quantization, config.rescore,
+                              config.rescore_factor)
     if config.backend == "ball_tree":
         return BallTreeIndex(leaf_size=config.ball_tree_leaf_size)
     elif config.backend == "faiss":
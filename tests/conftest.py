@@ -0,0 +1,28 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+from stellar_memory import StellarConfig
+from stellar_memory.models import MemoryItem
+
+
+@pytest.fixture
+def memory_config() -> StellarConfig:
+    """In-memory config with the scheduler and event log off; tweak, then build."""
+    config = StellarConfig(db_path=":memory:", auto_start_scheduler=False)
+    config.event_logger.enabled = False
+    return config
+
+
+@pytest.fixture
+def item_factory():
+    """Build bare MemoryItems: ``item_factory("id", user_id="alice")``.
+
+    The content is the id; without an id the item gets a fresh uuid.
+    """
+    def make(item_id: str | None = None, user_id: str | None = None) -> MemoryItem:
+        item = MemoryItem.create(item_id or "hello", user_id=user_id)
+        if item_id is not None:
+            item.id = item_id
+        return item
+    return make
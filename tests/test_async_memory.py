@@ -0,0 +1,129 @@
+"""Tests for the asyncio StellarMemory facade."""
+
+import asyncio
+import threading
+import time
+import warnings
+
+import pytest
+
+from stellar_memory import StellarMemory
+from stellar_memory.async_memory import AsyncStellarMemory
+from stellar_memory.config import ConcurrencyConfig
+
+
+@pytest.fixture
+def mem(memory_config) -> StellarMemory:
+    memory_config.llm.enabled = False
+    return StellarMemory(memory_config)
+
+
+class TestAsyncStellarMemory:
+    def test_store_recall_forget(self, mem):
+        amem = AsyncStellarMemory(mem)
+
+        async def scenario():
+            item = await amem.store("async coffee notes", importance=0.9)
+            found = await amem.recall("coffee")
+            assert [i.id for i in found] == [item.id]
+            assert (await amem.get(item.id)).content == "async coffee notes"
+            assert await amem.forget(item.id)
+            assert await amem.get(item.id) is None
+            await amem.reorbit()
+
+        asyncio.run(scenario())
+        stats = amem.concurrency_stats()
+        assert stats["store"]["calls"] == 2
+        assert stats["recall"]["calls"] == 3
+        assert stats["maintenance"]["calls"] == 1
+        amem.close()
+
+    def test_llm_backed_store_uses_llm_stage(self, mem):
+        mem.config.llm.enabled = True
+        amem = AsyncStellarMemory(mem)
+        asyncio.run(amem.store("note", auto_evaluate=True))
+        assert amem.concurrency_stats()["llm"]["calls"] == 1
+        amem.close()
+
+    def test_health_skips_deprecated_alias(self, mem):
+        amem = AsyncStellarMemory(mem)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            status = asyncio.run(amem.health())
+        assert status.db_accessible
+        amem.close()
+
+    def test_does_not_block_event_loop(self, mem):
+        amem = AsyncStellarMemory(mem)
+        gate = threading.Event()
+
+        async def scenario():
+            slow = asyncio.ensure_future(amem.run("llm", gate.wait, 5))
+            await asyncio.sleep(0.01)
+            # Loop keeps serving other stages while the slow call runs
+            item = await asyncio.wait_for(amem.store("fast path"), timeout=2)
+            gate.set()
+            assert await slow is True
+            return item
+
+        assert asyncio.run(scenario()).content == "fast path"
+        amem.close()
+
+    def test_stage_limit_caps_concurrency(self, mem):
+        config = ConcurrencyConfig(max_workers=4, llm=1)
+        amem = AsyncStellarMemory(mem, config)
+        active = []
+        peak = []
+
+        def work():
+            active.append(1)
+            peak.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+
+        async def scenario():
+            await asyncio.gather(*(amem.run("llm", work) for _ in range(4)))
+
+        asyncio.run(scenario())
+        assert max(peak) == 1
+        assert amem.concurrency_stats()["llm"]["max_ms"] >= 20
+        amem.close()
+
+    def test_errors_propagate_and_unknown_stage(self, mem):
+        amem = AsyncStellarMemory(mem)
+
+        def boom():
+            raise ValueError("bad")
+
+        async def scenario():
+            with pytest.raises(ValueError):
+                await amem.run("recall", boom)
+            with pytest.raises(ValueError):
+                await amem.run("nope", boom)
+
+        asyncio.run(scenario())
+        assert amem.concurrency_stats()["recall"]["errors"] == 1
+        amem.close()
+
+    def test_concurrent_store_and_recall_columnar(self, memory_config):
+        # Recalls run on executor threads while stores grow the same zones
+        from stellar_memory.benchmark import SyntheticEmbedder
+        memory_config.storage.in_memory_layout = "columnar"
+        memory_config.vector_index.quantization = "int8"
+        mem = StellarMemory(memory_config)
+        mem._embedder = SyntheticEmbedder(dim=128)
+        mem.store_batch([{"content": f"seed note {i} about topic {i % 50}"}
+                         for i in range(1500)])
+        amem = AsyncStellarMemory(mem)
+
+        async def scenario():
+            calls = []
+            for i in range(300):
+                calls.append(amem.store(f"new note {i} topic {i % 50}"))
+                calls.append(amem.recall(f"topic {i % 50}"))
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        assert [r for r in results if isinstance(r, Exception)] == []
+        amem.close()
+        mem.stop()
@@ -0,0 +1,155 @@
+"""Tests for AuthManager's key cache, last_used_at batching and memory counts."""
+
+import asyncio
+
+from stellar_memory.auth import AuthManager
+
+
+class _Conn:
+    """Answers the handful of queries AuthManager issues."""
+
+    def __init__(self, db):
+        self.db = db
+
+    async def fetchrow(self, sql, *args):
+        self.db.queries.append(sql)
+        key = self.db.keys.get(args[0])
+        if key and key["active"]:
+            return {"id": key["user"], "email": "a@b.c", "tier": self.db.tier}
+        return None
+
+    async def fetchval(self, sql, *args):
+        self.db.queries.append(sql)
+        if "RETURNING key_hash" in sql:
+            for key_hash, key in self.db.keys.items():
+                if key["id"] == args[0] and key["active"]:
+                    key["active"] = False
+                    return key_hash
+            return None
+        if "information_schema" in sql:
+            return 1
+        return self.db.memories
+
+    async def execute(self, sql, *args):
+        self.db.queries.append(sql)
+        self.db.executed.append((sql, args))
+
+
+class _Pool:
+    def __init__(self):
+        self.keys = {"h1": {"id": "k1", "user": "u1", "active": True}}
+        self.tier = "free"
+        self.memories = 7
+        self.queries = []
+        self.executed = []
+
+    def acquire(self):
+        pool = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                return _Conn(pool)
+
+            async def __aexit__(self, *exc):
+                return False
+        return _Ctx()
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestKeyCache:
+    def test_repeat_lookups_hit_cache(self):
+        pool = _Pool()
+        auth = AuthManager(pool)
+
+        async def scenario():
+            for _ in range(5):
+                assert (await auth.get_user_by_api_key("h1")).id == "u1"
+        _run(scenario())
+        assert len(pool.queries) == 1
+        assert auth.cache_stats()["hits"] == 4
+
+    def test_revocation_invalidates_and_notifies(self):
+        pool = _Pool()
+        auth = AuthManager(pool)
+
+        async def scenario():
+            await auth.get_user_by_api_key("h1")
+            assert await auth.revoke_api_key("u1", "k1")
+            return await auth.get_user_by_api_key("h1")
+        assert _run(scenario()) is None
+        assert any("pg_notify" in sql for sql, _ in pool.executed)
+
+    def test_lookup_racing_a_revoke_is_not_cached(self):
+        pool = _Pool()
+        auth = AuthManager(pool)
+        fetchrow = _Conn.fetchrow
+
+        async def slow_fetchrow(conn, sql, *args):
+            row = await fetchrow(conn, sql, *args)  # read before the revoke
+            assert await auth.revoke_api_key("u1", "k1")
+            return row
+
+        async def scenario():
+            _Conn.fetchrow = slow_fetchrow
+            try:
+                await auth.get_user_by_api_key("h1")
+            finally:
+                _Conn.fetchrow = fetchrow
+            return await auth.get_user_by_api_key("h1")
+        assert _run(scenario()) is None
+        assert auth.cache_stats()["hits"] == 0
+
+    def test_remote_notification_drops_entries(self):
+        auth = AuthManager(_Pool())
+        _run(auth.get_user_by_api_key("h1"))
+        auth._on_notify(None, 0, AuthManager.NOTIFY_CHANNEL, "user:u1")
+        assert auth.cache_stats()["keys"] == 0
+
+    def test_unknown_keys_expire_quickly(self):
+        auth = AuthManager(_Pool(), negative_ttl=0.0)
+        pool = auth._pool
+
+        async def scenario():
+            await auth.get_user_by_api_key("nope")
+            await auth.get_user_by_api_key("nope")
+        _run(scenario())
+        assert len(pool.queries) == 2
+
+
+class TestLastUsed:
+    def test_stamps_coalesce_into_one_update(self):
+        pool = _Pool()
+        auth = AuthManager(pool)
+
+        async def scenario():
+            for _ in range(10):
+                await auth.get_user_by_api_key("h1")
+            return await auth.flush_last_used()
+        assert _run(scenario()) == 1
+        updates = [args for sql, args in pool.executed if "last_used_at" in sql]
+        assert len(updates) == 1 and updates[0][0] == ["h1"]
+        assert _run(auth.flush_last_used()) == 0
+
+
+class TestMemoryCounts:
+    def test_counted_once_then_adjusted(self):
+        pool = _Pool()
+        auth = AuthManager(pool)
+
+        async def scenario():
+            assert await auth.get_memory_count("u1") == 7
+            auth.adjust_memory_count("u1", 3)
+            auth.adjust_memory_count("u1", -1)
+            return await auth.get_memory_count("u1")
+        assert _run(scenario()) == 9
+        assert sum("COUNT(*) FROM memories" in q for q in pool.queries) == 1
+
+    def test_resync_recounts(self):
+        pool = _Pool()
+        auth = AuthManager(pool, count_resync=0.0)
+        _run(auth.get_memory_count("u1"))
+        auth.adjust_memory_count("u1", 5)
+        assert _run(auth.get_memory_count("u1")) == 7
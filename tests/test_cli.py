@@ -80,3 +80,41 @@ class TestCLI:
         main(["--db", db, "reorbit"])
         captured = capsys.readouterr()
         assert "Moved:" in captured.out
+
+    def test_metrics_command(self, capsys):
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from stellar_memory.metrics import Metrics
+
+        registry = Metrics()
+        registry.observe("recall.search", 0.002)
+        registry.inc("storage_queries", 5)
+        body = registry.render_prometheus().encode()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.handle_request, daemon=True).start()
+        try:
+            main(["metrics", "--url", f"http://127.0.0.1:{server.server_port}/metrics"])
+        finally:
+            server.server_close()
+        out = capsys.readouterr().out
+        assert "recall.search" in out
+        assert "stellar_storage_queries_total 5" in out
+
+    def test_benchmark_scale_writes_json(self, tmp_path):
+        out = tmp_path / "bench.json"
+        main(["benchmark", "--scale", "--dataset", "small", "--queries", "5",
+              "--threads", "2", "--dim", "16", "--output", str(out)])
+        report = json.loads(out.read_text())
+        assert report["dataset"] == "small"
+        assert report["latency"]["recall"]["count"] == 5
+        assert "p99_ms" in report["throughput"]["recall"]["latency"]
@@ -0,0 +1,178 @@
+"""Tests for the hot-zone operation log and snapshots."""
+
+import threading
+import time
+
+import pytest
+
+from stellar_memory import StellarMemory, StellarConfig
+from stellar_memory.models import MemoryItem
+from stellar_memory.storage import StorageFactory
+from stellar_memory.storage.columnar import ColumnarStorage
+from stellar_memory.models import EmotionVector
+from stellar_memory.storage.durable import (
+    DurableZoneStorage, OpLog, OP_STORE, columns_of, load_snapshot, write_snapshot,
+)
+from stellar_memory.storage.in_memory import InMemoryStorage
+
+
+def _item(item_id: str, embedding=None, **kwargs) -> MemoryItem:
+    now = time.time()
+    return MemoryItem(id=item_id, content=f"content {item_id}", created_at=now,
+                      last_recalled_at=now, zone=0, embedding=embedding, **kwargs)
+
+
+def _open(path, **kwargs) -> DurableZoneStorage:
+    return DurableZoneStorage(InMemoryStorage(), path, 0, **kwargs)
+
+
+class TestOpLog:
+    def test_torn_tail_is_truncated(self, tmp_path):
+        log = OpLog(tmp_path, "z")
+        list(log.replay())
+        log.open()
+        log.wait(log.append(OP_STORE, b"first"))
+        log.wait(log.append(OP_STORE, b"second"))
+        log.close()
+        (_, path), = log.segments()
+        size = path.stat().st_size
+        with open(path, "r+b") as f:
+            f.truncate(size - 3)  # crash mid-write
+
+        again = OpLog(tmp_path, "z")
+        assert [p for _, _, p in again.replay()] == [b"first"]
+        assert again.last_seq == 1
+        assert path.stat().st_size < size - 3
+
+    def test_group_commit_batches_concurrent_writers(self, tmp_path):
+        log = OpLog(tmp_path, "z")
+        list(log.replay())
+        log.open()
+        lock = threading.Lock()
+
+        def writer():
+            for _ in range(50):
+                with lock:
+                    seq = log.append(OP_STORE, b"x" * 64)
+                assert log.wait(seq)
+
+        threads = [threading.Thread(target=writer) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        log.close()
+        assert log.records == 400
+        assert log.batches < 400
+
+    def test_dead_writer_fails_append_and_wait(self, tmp_path):
+        log = OpLog(tmp_path, "z")
+        list(log.replay())
+        log.open()
+        log._file.close()  # the next write raises on the writer thread
+        seq = log.append(OP_STORE, b"lost")
+        with pytest.raises(RuntimeError):
+            log.wait(seq)
+        with pytest.raises(RuntimeError):
+            log.append(OP_STORE, b"after")
+        log._file = None
+        log.close()
+
+
+class TestSnapshot:
+    def test_roundtrip_mixed_dimensions(self, tmp_path):
+        emotion = EmotionVector(joy=0.8)
+        items = [_item("a", [0.5, 1.0, -2.0]), _item("b", metadata={"k": 1}),
+                 _item("c", [1.0, 2.0], user_id="u1"),
+                 _item("d", [0.0, 0.25, 4.0], emotion=emotion)]
+        write_snapshot(tmp_path / "s.snap", columns_of(items), last_seq=7)
+        last_seq, columns = load_snapshot(tmp_path / "s.snap")
+        assert last_seq == 7
+        storage = ColumnarStorage()
+        storage.load_columns(columns)
+        loaded = storage.get_all()
+        assert loaded == items
+
+    def test_missing_snapshot_is_empty(self, tmp_path):
+        assert load_snapshot(tmp_path / "none.snap") == (0, None)
+
+
+class TestDurableZoneStorage:
+    def test_replays_log_after_crash(self, tmp_path):
+        storage = _open(tmp_path)
+        storage.store(_item("a", [1.0, 0.0]))
+        storage.store(_item("b"))
+        b = storage.get("b")
+        b.recall_count = 3
+        storage.update(b)
+        storage.remove("a")
+        storage._log.close()  # stop without the closing snapshot
+
+        restored = _open(tmp_path)
+        assert [i.id for i in restored.get_all()] == ["b"]
+        assert restored.get("b").recall_count == 3
+        assert restored.recovered == 4
+
+    def test_snapshot_compacts_log(self, tmp_path):
+        storage = _open(tmp_path, snapshot_ops=10)
+        for n in range(25):
+            storage.store(_item(f"i{n}", [float(n), 1.0]))
+        storage.close()
+        assert len(storage._log.segments()) == 1
+
+        restored = _open(tmp_path)
+        assert restored.count() == 25
+        assert restored.get("i7").embedding == [7.0, 1.0]
+        assert restored.recovered == 25
+        restored.store(_item("new"))
+        restored._log.close()
+        assert _open(tmp_path).count() == 26
+
+    def test_wraps_columnar_layout(self, tmp_path):
+        storage = DurableZoneStorage(ColumnarStorage(), tmp_path, 1)
+        storage.store(_item("a", [1.0, 2.0]))
+        storage._log.close()
+        restored = DurableZoneStorage(ColumnarStorage(), tmp_path, 1)
+        assert restored.get("a").embedding == [1.0, 2.0]
+
+    def test_factory_uses_log_for_file_backed_hot_zones(self, tmp_path):
+        config = StellarConfig(db_path=str(tmp_path / "m.db"))
+        factory = StorageFactory(config.db_path, config.storage)
+        assert isinstance(factory.create(config.zones[1]), InMemoryStorage)  # off by default
+        config.storage.hot_zone_log = True
+        assert isinstance(factory.create(config.zones[0]), DurableZoneStorage)
+        memory_factory = StorageFactory(":memory:", config.storage)
+        assert isinstance(memory_factory.create(config.zones[0]), InMemoryStorage)
+
+
+class TestRestart:
+    def test_core_memories_survive_restart(self, tmp_path):
+        config = StellarConfig(db_path=str(tmp_path / "m.db"), auto_start_scheduler=False)
+        config.storage.hot_zone_log = True
+        config.event_logger.enabled = False
+        config.llm.enabled = False
+        config.tuner.feedback_db_path = str(tmp_path / "fb.db")
+        memory = StellarMemory(config)
+        item = memory.store("critical core fact", importance=0.99)
+        assert item.zone <= 1
+        memory.stop()
+
+        reopened = StellarMemory(config)
+        restored = reopened.get(item.id)
+        assert restored is not None
+        assert restored.content == "critical core fact"
+        reopened.stop()
+
+    def test_deferred_commit_waits_once(self, tmp_path):
+        storage = _open(tmp_path)
+        waits = []
+        wait = storage._log.wait
+        storage._log.wait = lambda seq, timeout=5.0: waits.append(seq) or wait(seq, timeout)
+        with storage.deferred_commit():
+            for n in range(5):
+                storage.store(_item(f"i{n}"))
+            storage.remove("i0")
+            assert waits == []
+        assert waits == [6]
+        storage._log.close()
+        assert _open(tmp_path).count() == 4
@@ -36,3 +36,75 @@ class TestCreateEmbedder:
     def test_none_config_uses_default(self):
         e = create_embedder(None)
         assert hasattr(e, "embed")
+
+
+class TestQueryEmbeddingCache:
+    def _counting_embed(self):
+        calls = []
+
+        def embed(text):
+            calls.append(text)
+            return [float(len(text)), 1.0]
+        return embed, calls
+
+    def test_normalized_key_hits(self):
+        from stellar_memory.embedder import QueryEmbeddingCache
+        cache = QueryEmbeddingCache()
+        embed, calls = self._counting_embed()
+        first = cache.get_or_embed("What  did I eat?", embed)
+        second = cache.get_or_embed("what did i eat?", embed)
+        assert first == second
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_memory_bound_evicts_lru(self):
+        from stellar_memory.embedder import QueryEmbeddingCache
+        cache = QueryEmbeddingCache(max_bytes=500)
+        embed, calls = self._counting_embed()
+        cache.get_or_embed("a", embed)
+        cache.get_or_embed("b", embed)
+        cache.get_or_embed("c", embed)
+        stats = cache.stats()
+        assert stats["bytes"] <= 500
+        assert stats["evictions"] >= 1
+        cache.get_or_embed("c", embed)
+        assert len(calls) == 3
+
+    def test_none_not_cached(self):
+        from stellar_memory.embedder import QueryEmbeddingCache
+        cache = QueryEmbeddingCache()
+        assert cache.get_or_embed("x", NullEmbedder().embed) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_recall_uses_query_cache(self):
+        from stellar_memory import StellarMemory, StellarConfig
+        config = StellarConfig(db_path=":memory:", auto_start_scheduler=False)
+        config.event_logger.enabled = False
+        mem = StellarMemory(config)
+        embed, calls = self._counting_embed()
+        mem._embedder = type("Fake", (), {"embed": staticmethod(embed)})()
+        mem.recall("hello there")
+        mem.recall("Hello   there")
+        stats = mem.stats().query_cache
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert calls == ["hello there"]
+
+    def test_many_embeds_misses_in_one_batch(self):
+        from stellar_memory.embedder import QueryEmbeddingCache
+        cache = QueryEmbeddingCache()
+        embed, calls = self._counting_embed()
+        cache.get_or_embed("cached", embed)
+        batches = []
+
+        def embed_batch(texts):
+            batches.append(texts)
+            return [embed(t) for t in texts]
+        vectors = cache.get_or_embed_many(["cached", "new one", "New  one", "x"],
+                                          embed_batch)
+        assert batches == [["new one", "x"]]
+        assert vectors[1] == vectors[2] == [7.0, 1.0]
+        assert vectors[0] == [6.0, 1.0]
+        assert cache.get_or_embed("x", embed) == [1.0, 1.0]
+        assert len(calls) == 3
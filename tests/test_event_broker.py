@@ -0,0 +1,153 @@
+"""Tests for the SSE event fan-out broker."""
+
+import asyncio
+import threading
+
+from stellar_memory.event_broker import EventBroker
+from stellar_memory.event_bus import EventBus
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestEventBroker:
+    def test_one_handler_per_event_however_many_clients(self, item_factory):
+        bus = EventBus()
+        broker = EventBroker()
+        broker.attach(bus)
+        broker.attach(bus)
+        before = len(bus._handlers["on_store"])
+
+        async def scenario():
+            clients = [broker.subscribe() for _ in range(20)]
+            bus.emit("on_store", item_factory())
+            await asyncio.sleep(0)
+            batches = [await c.get(timeout=1) for c in clients]
+            for c in clients:
+                broker.unsubscribe(c)
+            return batches
+        batches = _run(scenario())
+        assert before == 1 and len(bus._handlers["on_store"]) == 1
+        assert all(len(b) == 1 and b[0]["event"] == "on_store" for b in batches)
+        assert broker.stats()["clients"] == 0
+
+    def test_no_work_without_clients(self, item_factory):
+        bus = EventBus()
+        broker = EventBroker()
+        broker.attach(bus)
+        bus.emit("on_store", item_factory())
+        assert broker.stats()["published"] == 0
+
+    def test_slow_client_drops_oldest(self):
+        bus = EventBus()
+        broker = EventBroker(max_queue=3)
+        broker.attach(bus)
+
+        async def scenario():
+            client = broker.subscribe()
+            for n in range(5):
+                bus.emit("on_forget", f"m{n}")
+            await asyncio.sleep(0)
+            return client, await client.get(timeout=1)
+        client, batch = _run(scenario())
+        assert [r["id"] for r in batch] == ["m2", "m3", "m4"]
+        assert client.dropped == 2
+
+    def test_filter_and_user_isolation(self, item_factory):
+        bus = EventBus()
+        broker = EventBroker()
+        broker.attach(bus)
+
+        async def scenario():
+            client = broker.subscribe(events={"on_store"}, user_id="alice")
+            bus.emit("on_forget", "m1")
+            bus.emit("on_store", item_factory(user_id="bob"))
+            bus.emit("on_store", item_factory(user_id="alice"))
+            await asyncio.sleep(0)
+            return await client.get(timeout=1)
+        batch = _run(scenario())
+        assert [(r["event"], r["user_id"]) for r in batch] == [("on_store", "alice")]
+
+    def test_scoped_client_sees_no_other_tenant_data(self, item_factory):
+        bus = EventBus()
+        broker = EventBroker()
+        broker.attach(bus)
+
+        async def scenario():
+            client = broker.subscribe(user_id="alice")
+            bus.emit("on_recall", [item_factory(user_id="bob")], "bob private query about salary")
+            bus.emit("on_recall", [], "another private query")
+            bus.emit("on_forget", "bob-item-id")
+            bus.emit("on_recall", [item_factory(user_id="alice")], "alice query")
+            await asyncio.sleep(0)
+            return await client.get(timeout=1)
+        batch = _run(scenario())
+        assert [(r["event"], r["user_id"]) for r in batch] == [("on_recall", "alice")]
+        assert "query" not in repr(batch)
+        assert "bob" not in repr(batch)
+
+    def test_records_carry_no_content(self, item_factory):
+        bus = EventBus()
+        broker = EventBroker()
+        broker.attach(bus)
+
+        async def scenario():
+            client = broker.subscribe()
+            bus.emit("on_store", item_factory())
+            bus.emit("on_recall", [], "secret query")
+            await asyncio.sleep(0)
+            return await client.get(timeout=1)
+        batch = _run(scenario())
+        assert "hello" not in repr(batch)
+        assert "secret" not in repr(batch)
+
+    def test_coalesces_bursts(self):
+        bus = EventBus()
+        broker = EventBroker()
+        broker.attach(bus)
+
+        async def scenario():
+            client = broker.subscribe(coalesce=True)
+            for _ in range(4):
+                bus.emit("on_recall", [], "q")
+            bus.emit("on_forget", "m1")
+            await asyncio.sleep(0)
+            return await client.get(timeout=1)
+        batch = _run(scenario())
+        assert [(r["event"], r.get("count", 1)) for r in batch] == [
+            ("on_recall", 4), ("on_forget", 1)]
+
+    def test_emits_from_worker_threads(self):
+        bus = EventBus()
+        broker = EventBroker()
+        broker.attach(bus)
+
+        async def scenario():
+            client = broker.subscribe()
+            threads = [threading.Thread(target=bus.emit, args=("on_forget", f"m{n}"))
+                       for n in range(10)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            received = []
+            while len(received) < 10:
+                batch = await client.get(timeout=1)
+                assert batch
+                received += batch
+            return received
+        assert len(_run(scenario())) == 10
+
+    def test_stream_unsubscribes_on_close(self):
+        bus = EventBus()
+        broker = EventBroker()
+        broker.attach(bus)
+
+        async def scenario():
+            client = broker.subscribe()
+            stream = broker.stream(client, heartbeat=0.01)
+            assert await stream.__anext__() == []  # heartbeat
+            await stream.aclose()
+        _run(scenario())
+        assert broker.stats()["clients"] == 0
@@ -1,5 +1,8 @@
 """Tests for EventBus and StellarMemory event integration."""
 
+import threading
+import time
+
 import pytest
 
 from stellar_memory.event_bus import EventBus
@@ -95,3 +98,86 @@ class TestEventBus:
         mem.events.on("on_forget", lambda mid: received.append(mid))
         mem.forget(item.id)
         assert received == [item.id]
+
+    def test_stellar_forget_emits_on_remove_with_item(self):
+        config = StellarConfig(db_path=":memory:")
+        mem = StellarMemory(config)
+        item = mem.store("to forget", user_id="alice")
+        removed = []
+        mem.events.on("on_remove", lambda it: removed.append((it.id, it.user_id)))
+        mem.forget(item.id)
+        mem.forget(item.id)
+        assert removed == [(item.id, "alice")]
+
+
+class TestAsyncDispatch:
+    def test_slow_handler_runs_off_the_emitting_thread(self):
+        bus = EventBus(async_dispatch=True)
+        gate = threading.Event()
+        seen = []
+        bus.on("on_store", lambda item: (gate.wait(2), seen.append(item)))
+        bus.emit("on_store", "a")  # returns although the handler is blocked
+        assert seen == []
+        gate.set()
+        assert bus.flush(timeout=2)
+        assert seen == ["a"]
+        bus.close()
+
+    def test_sync_handlers_stay_inline(self):
+        bus = EventBus(async_dispatch=True)
+        threads = []
+        bus.on("on_store", lambda item: threads.append(threading.current_thread()),
+               sync=True)
+        bus.emit("on_store", "a")
+        assert threads == [threading.current_thread()]
+        bus.close()
+
+    def test_full_queue_runs_handlers_inline(self):
+        bus = EventBus(async_dispatch=True, queue_size=1)
+        gate = threading.Event()
+        seen = []
+        bus.on("on_forget", lambda mid: (gate.wait(2), seen.append(mid)))
+        bus.emit("on_forget", "m0")  # taken by the worker, which blocks
+        time.sleep(0.05)
+        bus.emit("on_forget", "m1")  # fills the queue
+        gate.set()
+        bus.emit("on_forget", "m2")  # overflow: handled by the caller
+        assert bus.flush(timeout=2)
+        assert sorted(seen) == ["m0", "m1", "m2"]
+        assert bus.stats()["overflows"] >= 1
+        bus.close()
+
+    def test_close_drains_queue(self):
+        bus = EventBus(async_dispatch=True)
+        seen = []
+        bus.on("on_forget", seen.append)
+        for n in range(100):
+            bus.emit("on_forget", n)
+        bus.close()
+        assert seen == list(range(100))
+
+    def test_handler_counters(self):
+        bus = EventBus()
+
+        def failing(item):
+            raise RuntimeError("boom")
+        bus.on("on_store", failing)
+        bus.on("on_store", lambda item: None)
+        bus.emit("on_store", "a")
+        bus.emit("on_store", "b")
+        stats = {h["handler"].rsplit(".", 1)[-1]: h for h in bus.stats()["handlers"]}
+        assert stats["failing"]["calls"] == 2 and stats["failing"]["errors"] == 2
+        assert stats["<lambda>"]["errors"] == 0
+
+    def test_stellar_memory_async_mode(self):
+        config = StellarConfig(db_path=":memory:")
+        config.event_bus.async_dispatch = True
+        config.recall_cache.enabled = True
+        mem = StellarMemory(config)
+        received = []
+        mem.events.on("on_store", lambda item: received.append(item.id))
+        mem.recall("hello")
+        item = mem.store("hello world")
+        assert [m.id for m in mem.recall("hello")] == [item.id]  # cache invalidated inline
+        mem.stop()
+        assert received == [item.id]
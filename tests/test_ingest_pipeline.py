@@ -0,0 +1,165 @@
+"""Tests for the pipelined (background) ingest mode."""
+
+import threading
+
+import pytest
+
+from stellar_memory import StellarMemory, StellarConfig
+from stellar_memory.ingest_pipeline import IngestPipeline
+
+
+class TestIngestPipeline:
+    def test_wait_for_returns_result(self):
+        pipe = IngestPipeline(workers=2)
+        pipe.submit("a", lambda: 42)
+        assert pipe.wait_for("a", timeout=5) == 42
+        assert pipe.flush(timeout=5)
+        assert pipe.stats()["completed"] == 1
+        pipe.stop()
+
+    def test_backpressure_times_out(self):
+        gate = threading.Event()
+        pipe = IngestPipeline(workers=1, queue_size=1, submit_timeout=0.05)
+        pipe.submit("busy", gate.wait)      # occupies the worker
+        pipe.submit("queued", lambda: None)  # fills the queue
+        with pytest.raises(RuntimeError):
+            pipe.submit("overflow", lambda: None)
+        gate.set()
+        assert pipe.flush(timeout=5)
+        pipe.stop()
+
+    def test_errors_are_reported(self):
+        errors = []
+        pipe = IngestPipeline(on_error=lambda job_id, exc: errors.append(job_id))
+
+        def boom():
+            raise ValueError("bad")
+        pipe.submit("x", boom)
+        assert pipe.wait_for("x", timeout=5) is None
+        assert errors == ["x"]
+        assert pipe.stats()["failed"] == 1
+        pipe.stop()
+
+    def test_submit_after_stop_raises(self):
+        pipe = IngestPipeline(workers=1)
+        pipe.stop()
+        with pytest.raises(RuntimeError):
+            pipe.submit("late", lambda: None)
+
+
+class _SlowEmbedder:
+    def __init__(self):
+        self.release = threading.Event()
+
+    def embed(self, text):
+        self.release.wait(5)
+        return [1.0, 0.0]
+
+    def embed_batch(self, texts):
+        return [self.embed(t) for t in texts]
+
+
+def _pipelined(config: StellarConfig) -> StellarMemory:
+    mem = StellarMemory(config)
+    mem._embedder = _SlowEmbedder()
+    mem._query_cache = None
+    return mem
+
+
+@pytest.fixture
+def ingest_config(memory_config) -> StellarConfig:
+    memory_config.ingest.enabled = True
+    memory_config.consolidation.enabled = False
+    return memory_config
+
+
+@pytest.fixture
+def mem(ingest_config) -> StellarMemory:
+    return _pipelined(ingest_config)
+
+
+class TestPipelinedStore:
+    def test_store_returns_before_enrichment(self, mem):
+        stages = []
+        mem.events.on("on_ingest_stage", lambda item_id, stage: stages.append(stage))
+        item = mem.store("provisional write check", importance=0.9)
+        # Raw item is persisted immediately, embedding still pending
+        assert mem.get(item.id) is not None
+        assert item.embedding is None
+        mem._embedder.release.set()
+        final = mem.wait_for(item.id, timeout=5)
+        assert final.embedding == [1.0, 0.0]
+        assert stages == ["persist", "embed", "place"]
+        assert mem.stats().total_memories == 1
+        mem.stop()
+
+    def test_flush_and_complete_events(self, mem):
+        done = []
+        mem.events.on("on_ingest_complete", lambda item_id, item: done.append(item_id))
+        ids = [mem.store(f"note number {i}").id for i in range(5)]
+        mem._embedder.release.set()
+        assert mem.flush(timeout=5)
+        assert sorted(done) == sorted(ids)
+        assert mem.stats().total_memories == 5
+        mem.stop()
+
+    def test_full_queue_rolls_back_and_reports_per_item(self, ingest_config):
+        ingest_config.ingest.workers = 1
+        ingest_config.ingest.queue_size = 1
+        ingest_config.ingest.submit_timeout = 0.05
+        mem = _pipelined(ingest_config)
+        results = mem.store_batch([{"content": f"batch note {i}"} for i in range(5)])
+        failed = [r for r in results if isinstance(r, Exception)]
+        stored = [r for r in results if not isinstance(r, Exception)]
+        assert failed and stored
+        assert all(isinstance(r, RuntimeError) for r in failed)
+        mem._embedder.release.set()
+        assert mem.flush(timeout=5)
+        # Rejected entries left nothing behind
+        assert mem.stats().total_memories == len(stored)
+        mem.stop()
+
+    def test_failed_enrichment_drops_provisional_item(self, mem):
+        errors = []
+        mem.events.on("on_ingest_error", lambda item_id, exc: errors.append(item_id))
+
+        def broken_embed(text):
+            raise ValueError("embedder down")
+        mem._embedder.embed = broken_embed
+        item = mem.store("doomed note")
+        assert mem.flush(timeout=5)
+        assert errors == [item.id]
+        assert mem.get(item.id) is None
+        assert mem.stats().total_memories == 0
+        mem.stop()
+
+    def test_store_after_stop_runs_inline(self, mem):
+        mem._embedder.release.set()
+        mem.stop()
+        item = mem.store("after shutdown")
+        assert item.embedding == [1.0, 0.0]
+        assert mem.get(item.id) is not None
+
+    def test_sync_mode_unchanged(self, memory_config):
+        mem = StellarMemory(memory_config)
+        item = mem.store("inline store")
+        assert mem.flush()
+        assert mem.wait_for(item.id).id == item.id
+
+
+class TestIngestMethod:
+    @pytest.mark.parametrize("pipelined", [False, True])
+    def test_ingest_still_callable(self, tmp_path, pipelined, memory_config):
+        # The pipeline attribute must not shadow StellarMemory._ingest
+        from stellar_memory.models import IngestResult
+        path = tmp_path / "notes.md"
+        path.write_text("# Hello World\nThis is a test file for ingestion.")
+        memory_config.connectors.enabled = True
+        memory_config.ingest.enabled = pipelined
+        mem = StellarMemory(memory_config)
+        with pytest.warns(DeprecationWarning):
+            result = mem.ingest(str(path))
+        assert isinstance(result, IngestResult)
+        assert mem.flush(timeout=5)
+        assert mem.get(result.memory_id) is not None
+        mem.stop()
@@ -0,0 +1,83 @@
+"""Tests for the buffered JSONL writer and tail reader."""
+
+import gzip
+import json
+import time
+
+from stellar_memory.jsonl_writer import JsonlWriter, tail_jsonl
+
+
+class TestJsonlWriter:
+    def test_buffers_until_flush(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = JsonlWriter(path, flush_interval=0)
+        for n in range(10):
+            writer.write({"n": n})
+        assert path.read_bytes() == b""
+        writer.flush()
+        assert [json.loads(line)["n"] for line in path.read_text().splitlines()] == list(range(10))
+        assert writer.flushes == 1
+
+    def test_flushes_after_interval(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = JsonlWriter(path, flush_interval=0.05)
+        writer.write({"n": 1})
+        deadline = time.time() + 2
+        while not path.read_bytes() and time.time() < deadline:
+            time.sleep(0.01)
+        assert tail_jsonl(path, 5) == [{"n": 1}]
+
+    def test_flushes_at_size_threshold(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = JsonlWriter(path, flush_bytes=100, flush_interval=0)
+        for n in range(20):
+            writer.write({"n": n, "pad": "x" * 20})
+        assert path.stat().st_size >= 100
+
+    def test_rotation_keeps_backups(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = JsonlWriter(path, max_size_mb=200 / (1024 * 1024), backups=2,
+                             flush_interval=0)
+        for n in range(30):
+            writer.write({"n": n, "pad": "x" * 40})
+        writer.close()
+        assert path.stat().st_size <= 200
+        assert (tmp_path / "log.jsonl.1").exists()
+        assert (tmp_path / "log.jsonl.2").exists()
+        assert not (tmp_path / "log.jsonl.3").exists()
+        assert tail_jsonl(path, 1) == [{"n": 29, "pad": "x" * 40}]
+
+    def test_gzip_rotated_segments(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        writer = JsonlWriter(path, max_size_mb=200 / (1024 * 1024), compress=True,
+                             flush_interval=0)
+        for n in range(10):
+            writer.write({"n": n, "pad": "x" * 40})
+        writer.close()
+        segment = tmp_path / "log.jsonl.1.gz"
+        lines = gzip.decompress(segment.read_bytes()).decode().splitlines()
+        assert lines and all("pad" in json.loads(line) for line in lines)
+
+    def test_tail_includes_buffered_entries(self, tmp_path):
+        writer = JsonlWriter(tmp_path / "log.jsonl", flush_interval=0)
+        for n in range(5):
+            writer.write({"n": n})
+        assert [e["n"] for e in writer.tail(2)] == [3, 4]
+
+
+class TestTailJsonl:
+    def test_reads_only_the_end(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        with open(path, "w") as f:
+            for n in range(50_000):
+                f.write(json.dumps({"n": n}) + "\n")
+        assert [e["n"] for e in tail_jsonl(path, 3)] == [49_997, 49_998, 49_999]
+        assert len(tail_jsonl(path, 100_000)) == 50_000
+
+    def test_skips_torn_lines(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_text('{"n": 1}\n{"n": 2}\n{"n": ')
+        assert tail_jsonl(path, 5) == [{"n": 1}, {"n": 2}]
+
+    def test_missing_file(self, tmp_path):
+        assert tail_jsonl(tmp_path / "none.jsonl", 5) == []
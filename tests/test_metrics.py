@@ -0,0 +1,91 @@
+"""Tests for stage spans, latency histograms and the metrics registry."""
+
+import pytest
+
+from stellar_memory import metrics
+from stellar_memory.config import StellarConfig
+from stellar_memory.metrics import Histogram, Metrics, NullMetrics
+from stellar_memory.stellar import StellarMemory
+
+
+@pytest.fixture
+def enabled():
+    registry = metrics.enable()
+    registry.reset()
+    yield registry
+    metrics.disable()
+
+
+class TestHistogram:
+    def test_quantiles_within_bucket_error(self):
+        hist = Histogram()
+        for ms in range(1, 1001):
+            hist.record(ms / 1000)
+        for q, expected in ((0.5, 0.5), (0.9, 0.9), (0.99, 0.99)):
+            assert hist.quantile(q) == pytest.approx(expected, rel=0.07)
+        assert hist.count == 1000
+        assert hist.quantile(1.0) <= hist.max == 1.0
+
+    def test_small_values_are_exact(self):
+        hist = Histogram()
+        for us in (3, 3, 3, 7):
+            hist.record(us / 1_000_000)
+        assert hist.quantile(0.5) == pytest.approx(3.5e-6)
+
+    def test_empty(self):
+        assert Histogram().quantile(0.99) == 0.0
+        assert Histogram().summary()["count"] == 0
+
+
+class TestRegistry:
+    def test_span_records_duration(self):
+        registry = Metrics()
+        with registry.span("recall.search"):
+            pass
+        registry.inc("storage_queries", 2)
+        snap = registry.snapshot()
+        assert snap["spans"]["recall.search"]["count"] == 1
+        assert snap["counters"] == {"storage_queries": 2}
+
+    def test_prometheus_text(self):
+        registry = Metrics()
+        registry.observe("store", 0.01)
+        registry.observe("store.embed", 0.004)
+        registry.inc("storage_queries")
+        text = registry.render_prometheus()
+        assert "# TYPE stellar_stage_seconds summary" in text
+        assert 'stellar_stage_seconds_count{op="store",stage="total"} 1' in text
+        assert 'stellar_stage_seconds{op="store",stage="embed",quantile="0.5"}' in text
+        assert "stellar_storage_queries_total 1" in text
+
+    def test_null_metrics_do_nothing(self):
+        null = NullMetrics()
+        with null.span("store"):
+            null.inc("storage_queries")
+        assert null.snapshot() == {"spans": {}, "counters": {}}
+        assert null.render_prometheus() == ""
+        assert metrics.get_metrics() is metrics.NULL_METRICS
+
+
+class TestInstrumentation:
+    def test_store_and_recall_stages(self, tmp_path, enabled):
+        config = StellarConfig(db_path=str(tmp_path / "m.db"))
+        config.metrics.enabled = True
+        mem = StellarMemory(config)
+        mem.store("the quick brown fox", importance=0.1)  # low importance: SQLite zone
+        mem.recall("fox")
+        mem.reorbit()
+        spans = enabled.snapshot()["spans"]
+        for name in ("store", "store.embed", "store.place", "recall", "recall.embed",
+                     "recall.search", "reorbit", "reorbit.orbit"):
+            assert spans[name]["count"] >= 1, name
+        assert enabled.snapshot()["counters"]["storage_queries"] >= 1
+        assert set(mem._health().latency) == {"store", "recall", "reorbit"}
+        mem.stop()
+
+    def test_disabled_by_default(self, tmp_path):
+        mem = StellarMemory(StellarConfig(db_path=str(tmp_path / "m.db")))
+        mem.store("hello")
+        assert mem._health().latency == {}
+        assert metrics.get_metrics().snapshot()["spans"] == {}
+        mem.stop()
@@ -1,7 +1,7 @@
 """Tests for OrbitManager - placement, eviction, reorbiting."""
 
 import time
-from stellar_memory.config import ZoneConfig, MemoryFunctionConfig
+from stellar_memory.config import DEFAULT_ZONES, ZoneConfig, MemoryFunctionConfig
 from stellar_memory.memory_function import MemoryFunction
 from stellar_memory.models import MemoryItem
 from stellar_memory.orbit_manager import OrbitManager
@@ -69,6 +69,20 @@ class TestEviction:
         total = sum(mgr.get_zone_count(z) for z in [0, 1, 2])
         assert total == 3
 
+    def test_eviction_from_last_zone_reports_item(self):
+        small = [
+            ZoneConfig(0, "core", max_slots=1, importance_min=0.5),
+            ZoneConfig(1, "outer", max_slots=1, importance_min=0.0, importance_max=0.5),
+        ]
+        evicted = []
+        mgr = OrbitManager(small, StorageFactory(":memory:"),
+                           on_evict=lambda item: evicted.append(item.id))
+        mgr.place(make_item("m1", score=0.9), 0, 0.9)
+        mgr.place(make_item("m2", score=0.2), 1, 0.2)
+        assert evicted == []
+        mgr.place(make_item("m3", score=0.95), 0, 0.95)
+        assert evicted == ["m2"]
+
 
 class TestReorbit:
     def test_reorbit_moves_stale_items(self):
@@ -89,3 +103,100 @@ class TestReorbit:
         assert result.moved >= 1
         updated = mgr.find_item("m1")
         assert updated.zone > 0
+
+
+class _DictCache:
+    """In-process stand-in for RedisCache's item-cache interface."""
+
+    def __init__(self, cached_zones=(2,)):
+        self.cached_zones = cached_zones
+        self.items = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def get_many(self, ids):
+        self.lookups += 1
+        found = {i: self.items[i] for i in ids if i in self.items}
+        self.hits += len(found)
+        return found
+
+    def set(self, item):
+        self.set_many([item])
+
+    def set_many(self, items):
+        for item in items:
+            if item.zone in self.cached_zones:
+                self.items[item.id] = item
+
+    def invalidate(self, item_id):
+        self.items.pop(item_id, None)
+
+
+class TestItemCache:
+    def _mgr(self, tmp_path):
+        mgr = OrbitManager(SMALL_ZONES, StorageFactory(str(tmp_path / "cache.db")))
+        cache = _DictCache()
+        mgr.attach_cache(cache)
+        return mgr, cache
+
+    def test_write_through_and_invalidate_on_move(self, tmp_path):
+        mgr, cache = self._mgr(tmp_path)
+        mgr.place(make_item("m1", score=0.3), 2, 0.3)
+        assert "m1" in cache.items
+        assert mgr.move("m1", 2, 0, 0.9)
+        assert "m1" not in cache.items
+        assert mgr.find_item("m1").zone == 0
+
+    def test_read_through_fills_cache(self, tmp_path):
+        mgr, cache = self._mgr(tmp_path)
+        mgr.place(make_item("m1", score=0.3), 2, 0.3)
+        cache.items.clear()  # e.g. TTL expiry
+        assert mgr.find_item("m1").id == "m1"
+        assert "m1" in cache.items
+        found = mgr.find_items(["m1", "missing"])
+        assert list(found) == ["m1"]
+        assert cache.lookups == 2
+
+    def test_in_process_zones_skip_cache(self, tmp_path):
+        mgr, cache = self._mgr(tmp_path)
+        mgr.place(make_item("hot", score=0.9), 0, 0.9)
+        assert mgr.find_item("hot").id == "hot"
+        assert cache.lookups == 0
+
+    def test_default_layout_hits(self, tmp_path):
+        mgr = OrbitManager(DEFAULT_ZONES, StorageFactory(str(tmp_path / "cache.db")))
+        assert mgr.io_zones() == (2, 3, 4)
+        cache = _DictCache(cached_zones=mgr.io_zones())
+        mgr.attach_cache(cache)
+        mgr.place(make_item("hot", score=0.9), 0, 0.9)
+        mgr.place(make_item("cold", score=0.3), 2, 0.3)
+        for _ in range(3):
+            assert set(mgr.find_items(["hot", "cold"])) == {"hot", "cold"}
+        assert cache.lookups == 3 and cache.hits == 3
+
+    def test_only_in_process_zones_cached_skips_lookup(self, tmp_path):
+        mgr = OrbitManager(DEFAULT_ZONES, StorageFactory(str(tmp_path / "cache.db")))
+        cache = _DictCache(cached_zones=(0, 1))
+        mgr.attach_cache(cache)
+        mgr.place(make_item("cold", score=0.3), 2, 0.3)
+        assert mgr.find_item("cold").id == "cold"
+        assert cache.lookups == 0
+
+
+class TestListItems:
+    def test_pages_merge_zones_in_order(self):
+        mgr = make_mgr()
+        for n, score in enumerate([0.95, 0.9, 0.6, 0.7, 0.3, 0.2, 0.1]):
+            mgr.place(make_item(f"m{n}", score), 0 if score >= 0.8 else
+                      1 if score >= 0.5 else 2, score)
+        seen, after = [], None
+        while True:
+            rows, after = mgr.list_items(after=after, limit=3, fields=["zone"])
+            seen.extend(r["id"] for r in rows)
+            if after is None:
+                break
+        assert seen == ["m0", "m1", "m3", "m2", "m4", "m5", "m6"]
+        rows, after = mgr.list_items(zone=1, limit=5)
+        assert [r["id"] for r in rows] == ["m3", "m2"] and after is None
+        assert mgr.count_items() == 7
+        assert mgr.count_items(zone=2) == 3
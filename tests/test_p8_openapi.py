@@ -131,3 +131,17 @@ class TestRateLimitHeaders:
         resp2 = client.post("/api/v1/store", json={"content": "rate 2"})
         r2 = int(resp2.headers["X-RateLimit-Remaining"])
         assert r2 < r1
+
+    def test_rejection_has_retry_after(self):
+        from stellar_memory.server import create_api_app
+        from stellar_memory.config import StellarConfig
+        config = StellarConfig(db_path=":memory:")
+        config.server.rate_limit = 2
+        app, _ = create_api_app(config)
+        client = TestClient(app)
+        codes = [client.get("/api/v1/recall", params={"q": "x"}).status_code
+                 for _ in range(3)]
+        assert codes == [200, 200, 429]
+        resp = client.get("/api/v1/recall", params={"q": "x"})
+        assert int(resp.headers["Retry-After"]) >= 1
+        assert resp.headers["X-RateLimit-Remaining"] == "0"
@@ -2,7 +2,10 @@
 
 import pytest
 
-from stellar_memory.benchmark import StandardDataset, MemoryBenchmark
+from stellar_memory.benchmark import (
+    MemoryBenchmark, StandardDataset, SyntheticEmbedder, percentiles,
+    scale_benchmark, similarity_benchmark,
+)
 from stellar_memory.models import BenchmarkReport
 
 
@@ -75,6 +78,14 @@ class TestStandardDataset:
         ds = StandardDataset("standard", seed=42)
         assert ds.name == "standard"
 
+    def test_scale_tiers(self):
+        assert StandardDataset.SIZES["xlarge"][0] == 100_000
+        assert StandardDataset("xxlarge").memory_count == 1_000_000
+
+    def test_iter_matches_generate(self):
+        ds = StandardDataset("small", seed=7)
+        assert list(ds.iter_memories()) == StandardDataset("small", seed=7).generate_memories()
+
     def test_unknown_dataset_defaults(self):
         ds = StandardDataset("unknown", seed=42)
         memories = ds.generate_memories()
@@ -129,3 +140,58 @@ class TestMemoryBenchmark:
         assert report.total_memories > 0
         assert report.queries_run == 5
         assert report.avg_store_latency_ms > 0
+        assert report.recall_latency["count"] == 5
+        assert report.store_latency["p99_ms"] >= report.store_latency["p50_ms"]
+        assert report.memory_usage_mb >= 0
+
+
+class TestSimilarityBenchmark:
+    def test_reports_timings(self):
+        result = similarity_benchmark(n=50, dim=16, repeats=1)
+        assert result["n"] == 50
+        assert result["per_pair_ms"] > 0
+        assert result["batched_ms"] > 0
+        assert "batched" in result["speedup"]
+
+
+class TestPercentiles:
+    def test_nearest_rank(self):
+        p = percentiles([float(n) for n in range(1, 101)])
+        assert (p["p50_ms"], p["p95_ms"], p["p99_ms"], p["max_ms"]) == (50, 95, 99, 100)
+        assert p["count"] == 100
+
+    def test_empty(self):
+        assert percentiles([])["p99_ms"] == 0.0
+
+
+class TestSyntheticEmbedder:
+    def test_deterministic_unit_vectors(self):
+        a = SyntheticEmbedder(dim=32, seed=1).embed("coffee with Alice")
+        b = SyntheticEmbedder(dim=32, seed=1).embed("coffee with Alice")
+        assert a == b and len(a) == 32
+        assert abs(sum(x * x for x in a) - 1.0) < 1e-9
+
+    def test_shared_words_are_closer(self):
+        emb = SyntheticEmbedder(dim=64)
+        query = emb.embed("coffee")
+        near = emb.embed("I had coffee this morning")
+        far = emb.embed("SELECT * FROM users")
+        dot = lambda u, v: sum(x * y for x, y in zip(u, v))
+        assert dot(query, near) > dot(query, far)
+
+
+class TestScaleBenchmark:
+    def test_report(self):
+        import json
+        report = scale_benchmark("small", queries=10, threads=2, dim=16,
+                                 samples=5, batch_size=40, reorbits=1)
+        json.dumps(report)
+        assert report["load"]["memories"] == 100
+        assert report["memories"] >= 100
+        assert report["latency"]["recall"]["count"] == 10
+        assert report["throughput"]["mixed"]["threads"] == 2
+        assert report["throughput"]["recall"]["ops_per_s"] > 0
+        assert set(report["stages"]) == {"embed", "index", "storage", "reorbit", "decay"}
+        assert report["stages"]["index"]["size"] == report["memories"]
+        assert report["memory"]["traced_mb"] > 0
+        assert report["memory"]["bytes_per_memory"] > 0
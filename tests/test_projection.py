@@ -0,0 +1,182 @@
+"""Tests for embedding dimension reduction (projection layer)."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from stellar_memory.config import EmbedderConfig, StellarConfig
+from stellar_memory.projection import (
+    FullVectorStore, IdentityProjector, TruncationProjector, PCAProjector,
+    ProjectedEmbedder, create_projector,
+)
+from stellar_memory.stellar import StellarMemory
+
+
+class FakeEmbedder:
+    """Deterministic 8-dim embedder keyed on a few words."""
+
+    DIM = 8
+    WORDS = ["cat", "dog", "python", "rust", "coffee", "tea", "rain", "sun"]
+
+    def embed(self, text: str) -> list[float]:
+        lower = text.lower()
+        raw = [1.0 if w in lower else 0.05 for w in self.WORDS]
+        norm = math.sqrt(sum(x * x for x in raw))
+        return [x / norm for x in raw]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed(t) for t in texts]
+
+
+class CountingEmbedder(FakeEmbedder):
+    def __init__(self):
+        self.texts = 0
+
+    def embed(self, text: str) -> list[float]:
+        self.texts += 1
+        return super().embed(text)
+
+
+class TestProjectors:
+    def test_identity(self):
+        p = IdentityProjector(4)
+        assert p.project([1.0, 2.0, 3.0, 4.0]) == [1.0, 2.0, 3.0, 4.0]
+
+    def test_truncation_renormalizes(self):
+        p = TruncationProjector(4, 2)
+        out = p.project([3.0, 4.0, 5.0, 6.0])
+        assert len(out) == 2
+        assert math.isclose(math.sqrt(sum(x * x for x in out)), 1.0)
+        assert math.isclose(out[0], 0.6)
+
+    def test_truncation_passes_short_vectors(self):
+        p = TruncationProjector(4, 2)
+        assert p.project([1.0, 0.0]) == [1.0, 0.0]
+
+    def test_unfitted_pca_is_passthrough(self):
+        p = PCAProjector(4, 2)
+        assert not p.fitted
+        assert p.project([1.0, 0.0, 0.0, 0.0]) == [1.0, 0.0, 0.0, 0.0]
+
+    def test_create_projector(self):
+        assert isinstance(create_projector(EmbedderConfig()), IdentityProjector)
+        cfg = EmbedderConfig(projection="truncate", projection_dim=128)
+        p = create_projector(cfg)
+        assert isinstance(p, TruncationProjector)
+        assert p.output_dim == 128
+        assert cfg.index_dimension == 128
+
+    def test_create_projector_unknown(self):
+        with pytest.raises(ValueError):
+            create_projector(EmbedderConfig(projection="svd", projection_dim=8))
+
+
+class TestPCAProjector:
+    def test_fit_and_persist(self, tmp_path):
+        pytest.importorskip("numpy")
+        embedder = FakeEmbedder()
+        sample = [embedder.embed(t) for t in (
+            "cat dog", "python rust", "coffee tea", "rain sun",
+            "cat python", "tea rain", "dog sun", "rust coffee",
+        )]
+        p = PCAProjector(8, 3)
+        p.fit(sample)
+        assert p.fitted
+        out = p.project(sample[0])
+        assert len(out) == 3
+
+        db = str(tmp_path / "pca.db")
+        p.save(db)
+        loaded = PCAProjector(8, 3)
+        assert loaded.load(db)
+        assert loaded.project(sample[0]) == pytest.approx(out)
+
+    def test_fit_requires_samples(self):
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            PCAProjector(8, 3).fit([[1.0] * 8])
+
+
+class TestFullVectorStore:
+    def test_round_trip_and_remove(self, tmp_path):
+        db = str(tmp_path / "full.db")
+        store = FullVectorStore(db)
+        vec = FakeEmbedder().embed("cat python")
+        store.put_many({"a": vec, "b": vec})
+        store.close()
+        reopened = FullVectorStore(db)
+        assert reopened.get_many(["a", "missing"])["a"] == pytest.approx(vec, abs=0.01)
+        reopened.remove_many(["a"])
+        assert list(reopened.get_many(["a", "b"])) == ["b"]
+        reopened.close()
+
+    def test_in_memory(self):
+        store = FullVectorStore(":memory:", codec="float32")
+        store.put_many({"a": [0.5, 0.25]})
+        assert store.get_many(["a"]) == {"a": [0.5, 0.25]}
+
+
+class TestProjectedEmbedder:
+    def test_embed_and_full(self):
+        pe = ProjectedEmbedder(FakeEmbedder(), TruncationProjector(8, 4))
+        assert len(pe.embed("cat")) == 4
+        assert len(pe.embed_full("cat")) == 8
+        assert [len(v) for v in pe.embed_batch(["cat", "dog"])] == [4, 4]
+
+
+def _memory(**embedder_kwargs) -> StellarMemory:
+    config = StellarConfig(db_path=":memory:")
+    config.embedder = EmbedderConfig(projection="truncate", projection_dim=4,
+                                     dimension=8, **embedder_kwargs)
+    config.consolidation.enabled = False
+    config.summarization.enabled = False
+    config.event_logger.enabled = False
+    mem = StellarMemory(config)
+    mem._embedder = ProjectedEmbedder(FakeEmbedder(), mem._embedder.projector)
+    return mem
+
+
+class TestStellarProjection:
+    def test_store_keeps_reduced_vectors(self):
+        mem = _memory()
+        item = mem.store("my cat is fluffy")
+        assert len(item.embedding) == 4
+
+    def test_rerank_full_dim(self):
+        mem = _memory(rerank_full_dim=True, rerank_top_k=10)
+        mem.store("cat notes", importance=0.9)
+        mem.store("coffee notes", importance=0.9)
+        results = mem.recall("coffee notes", limit=1)
+        assert len(results) == 1
+        assert "coffee" in results[0].content
+
+    def test_rerank_reads_vectors_kept_at_store(self):
+        mem = _memory(rerank_full_dim=True, rerank_top_k=10)
+        counting = CountingEmbedder()
+        mem._embedder = ProjectedEmbedder(counting, mem._embedder.projector)
+        items = [mem.store(text, importance=0.9)
+                 for text in ("cat notes", "coffee notes", "rain notes")]
+        assert len(mem._full_vectors.get_many([i.id for i in items])) == 3
+        counting.texts = 0
+        assert "coffee" in mem.recall("coffee notes", limit=1)[0].content
+        assert counting.texts == 2  # reduced + full query embedding, no candidates
+        mem.forget(items[0].id)
+        assert mem._full_vectors.get_many([items[0].id]) == {}
+
+    def test_fit_projection_reprojects_from_kept_vectors(self):
+        pytest.importorskip("numpy")
+        config = StellarConfig(db_path=":memory:")
+        config.embedder = EmbedderConfig(projection="pca", projection_dim=3,
+                                         dimension=8, rerank_full_dim=True)
+        config.consolidation.enabled = False
+        config.summarization.enabled = False
+        config.event_logger.enabled = False
+        mem = StellarMemory(config)
+        mem._embedder = ProjectedEmbedder(FakeEmbedder(), mem._embedder.projector)
+        for text in ("cat dog", "python rust", "coffee tea", "rain sun", "cat tea"):
+            mem.store(text, importance=0.9)
+        assert mem.fit_projection() == 5
+        assert mem.fit_projection() == 5  # refit starts from the full vectors again
+        assert all(len(i.embedding) == 3 for i in mem._orbit_mgr.get_all_items())
@@ -0,0 +1,66 @@
+"""Tests for the GCRA request rate limiters."""
+
+import pytest
+
+from stellar_memory.rate_limit import RateLimiter, RedisRateLimiter
+
+
+class TestRateLimiter:
+    def test_burst_then_steady_rate(self):
+        limiter = RateLimiter(window=60)
+        now = 1000.0
+        assert [limiter.hit("ip", 3, now) for _ in range(3)] == [
+            (True, 2, 1020), (True, 1, 1040), (True, 0, 1060)]
+        assert limiter.hit("ip", 3, now) == (False, 0, 1020)
+        assert not limiter.hit("ip", 3, now + 19.9)[0]
+        assert limiter.hit("ip", 3, now + 20.0)[0]  # one interval refilled
+        assert limiter.hit("other", 3, now)[0]
+
+    def test_exact_limit_fits_window(self):
+        limiter = RateLimiter(window=60)
+        results = [limiter.hit("ip", 7, 0.0)[0] for _ in range(8)]
+        assert results == [True] * 7 + [False]
+
+    def test_idle_keys_are_evicted(self):
+        limiter = RateLimiter(window=60)
+        for n in range(100):
+            limiter.hit(f"ip{n}", 10, 0.0)
+        assert len(limiter) == 100
+        for n in range(30):
+            limiter.hit("active", 1000, 61.0 + n)
+        assert len(limiter) < 10
+        assert limiter.stats()["evictions"] > 90
+
+    def test_max_keys_bounds_memory(self):
+        limiter = RateLimiter(window=60, max_keys=50)
+        for n in range(500):
+            limiter.hit(f"ip{n}", 10, 0.0)
+        assert len(limiter) <= 51
+
+
+class _DownRedis:
+    def ping(self):
+        raise ConnectionError("redis down")
+
+
+class TestRedisRateLimiter:
+    def test_falls_back_to_process_limiter(self):
+        limiter = RedisRateLimiter("redis://unused", client=_DownRedis())
+        limiter.connect()
+        assert limiter.hit("ip", 1, 0.0)[0]
+        assert not limiter.hit("ip", 1, 0.0)[0]
+        assert limiter.stats()["connected"] is False
+
+    def test_limit_shared_between_workers(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")  # fakeredis needs it for Lua scripts
+        server = fakeredis.FakeServer()
+        a = RedisRateLimiter("redis://fake", client=fakeredis.FakeRedis(server=server))
+        b = RedisRateLimiter("redis://fake", client=fakeredis.FakeRedis(server=server))
+        a.connect()
+        b.connect()
+        now = 1000.0
+        assert a.hit("ip", 2, now) == (True, 1, 1030)
+        assert b.hit("ip", 2, now) == (True, 0, 1060)
+        assert a.hit("ip", 2, now) == (False, 0, 1030)
+        assert b.hit("ip", 2, now + 30)[0]
@@ -0,0 +1,107 @@
+"""Tests for the recall result cache."""
+
+import pytest
+
+from stellar_memory import StellarMemory
+from stellar_memory.event_bus import EventBus
+from stellar_memory.recall_cache import RecallCache
+
+
+@pytest.fixture
+def mem(memory_config) -> StellarMemory:
+    memory_config.recall_cache.enabled = True
+    return StellarMemory(memory_config)
+
+
+class TestRecallCache:
+    def test_key_normalizes_query(self):
+        assert RecallCache.make_key("  Hello   World ", 5) == RecallCache.make_key("hello world", 5)
+        assert RecallCache.make_key("q", 5, user_id="a") != RecallCache.make_key("q", 5)
+
+    def test_hit_miss_and_lru(self, item_factory):
+        cache = RecallCache(max_entries=2)
+        assert cache.get(("a",)) is None
+        cache.put(("a", 5, None), [item_factory("1")])
+        cache.put(("b", 5, None), [])
+        assert [i.id for i in cache.get(("a", 5, None))] == ["1"]
+        cache.put(("c", 5, None), [])
+        assert cache.get(("b", 5, None)) is None  # least recently used
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_ttl_expiry(self):
+        cache = RecallCache(ttl_seconds=0.0)
+        cache.put(("a", 5, None), [])
+        assert cache.get(("a", 5, None)) is None
+
+    def test_deferred_bumps(self, item_factory):
+        cache = RecallCache()
+        cache.put(("a", 5, None), [item_factory("1"), item_factory("2")])
+        cache.get(("a", 5, None))
+        cache.get(("a", 5, None))
+        pending, _ = cache.drain_bumps()
+        assert pending == {"1": 2, "2": 2}
+        assert cache.pending_bumps == 0
+
+    def test_selective_invalidation(self, item_factory):
+        bus = EventBus()
+        cache = RecallCache()
+        cache.attach(bus)
+        cache.put(("q", 5, "alice"), [item_factory("1", "alice")])
+        cache.put(("q", 5, "bob"), [item_factory("2", "bob")])
+        bus.emit("on_store", item_factory("3", "bob"))
+        assert cache.get(("q", 5, "alice")) is not None
+        assert cache.get(("q", 5, "bob")) is None
+        bus.emit("on_forget", "1")
+        assert cache.get(("q", 5, "alice")) is None
+
+
+    def test_put_refused_after_invalidation(self, item_factory):
+        cache = RecallCache()
+        generation = cache.generation
+        cache.invalidate_item("1")  # a forget lands while the recall runs
+        assert cache.put(("q", 5, None), [item_factory("1")], generation) is False
+        assert cache.get(("q", 5, None)) is None
+        assert cache.stats()["stale_puts"] == 1
+        assert cache.put(("q", 5, None), [], cache.generation) is True
+
+
+class TestStellarRecallCache:
+    def test_cached_recall_and_stats(self, mem):
+        item = mem.store("weekly planning meeting", importance=0.9)
+        first = mem.recall("weekly planning")
+        second = mem.recall("Weekly  Planning")
+        assert [i.id for i in first] == [i.id for i in second] == [item.id]
+        stats = mem.stats().recall_cache
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_hit_bumps_recall_count_on_flush(self, mem):
+        item = mem.store("quarterly budget review", importance=0.9)
+        mem.recall("quarterly budget")
+        mem.recall("quarterly budget")
+        assert mem.get(item.id).recall_count == 1
+        assert mem._recall_cache.pending_bumps == 1
+        mem._flush_recall_bumps()
+        assert mem.get(item.id).recall_count == 2
+
+    def test_store_invalidates(self, mem):
+        mem.store("garden tomatoes", importance=0.9)
+        assert len(mem.recall("garden")) == 1
+        mem.store("garden roses", importance=0.9)
+        assert len(mem.recall("garden")) == 2
+
+    def test_store_during_recall_is_not_masked(self, mem):
+        mem.store("garden tomatoes", importance=0.9)
+        dispatch = mem._plugin_mgr.dispatch_recall
+        raced = []
+
+        def store_mid_recall(query, results):
+            if not raced:
+                raced.append(mem.store("garden roses", importance=0.9))
+            return dispatch(query, results)
+        mem._plugin_mgr.dispatch_recall = store_mid_recall
+        assert len(mem.recall("garden")) == 1  # computed before the store
+        assert len(mem.recall("garden")) == 2  # stale result was not cached
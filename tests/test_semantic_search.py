@@ -1,8 +1,15 @@
 """Tests for semantic search in storage layer."""
 
+import math
+
+import pytest
+
 from stellar_memory.storage.in_memory import InMemoryStorage
 from stellar_memory.models import MemoryItem
-from stellar_memory.utils import cosine_similarity, serialize_embedding, deserialize_embedding
+from stellar_memory.utils import (
+    cosine_similarity, serialize_embedding, deserialize_embedding, embedding_codec,
+    dot, normalize, similarities, blob_similarities,
+)
 import time
 
 
@@ -88,3 +95,52 @@ class TestUtils:
         # Should be clamped to [0, 1]
         result = cosine_similarity([1.0, 0.5], [1.0, 0.5])
         assert 0.0 <= result <= 1.0
+
+    def test_quantized_codecs_roundtrip(self):
+        original = [0.5, -0.25, 0.125, 0.0, -1.0]
+        for codec, tol in (("float16", 1e-3), ("int8", 1e-2)):
+            blob = serialize_embedding(original, codec)
+            assert embedding_codec(blob) == codec
+            restored = deserialize_embedding(blob)
+            assert len(restored) == len(original)
+            for a, b in zip(original, restored):
+                assert abs(a - b) < tol
+
+    def test_quantized_blobs_are_smaller(self):
+        original = [0.1] * 384
+        assert len(serialize_embedding(original, "int8")) == 384 + 8
+        assert len(serialize_embedding(original, "float16")) == 384 * 2 + 4
+        assert embedding_codec(serialize_embedding(original)) == "float32"
+
+    def test_normalize_and_dot(self):
+        v = normalize([3.0, 4.0])
+        assert abs(math.hypot(*v) - 1.0) < 1e-9
+        assert abs(dot(v, [0.6, 0.8]) - 1.0) < 1e-9
+        assert normalize([0.0, 0.0]) == [0.0, 0.0]
+
+    def test_similarities_match_pairwise(self):
+        query = [1.0, 0.5]
+        rows = [[1.0, 0.5], [0.0, 1.0], [-1.0, 0.0], [0.0, 0.0]]
+        expected = [cosine_similarity(query, r) for r in rows]
+        for got in (similarities(query, rows),
+                    similarities(query, rows, norms=[math.hypot(*r) for r in rows])):
+            assert got == pytest.approx(expected)
+
+    def test_similarities_normalized_and_numpy(self):
+        rows = [normalize([1.0, 2.0]), normalize([2.0, -1.0])]
+        query = normalize([1.0, 1.0])
+        expected = [cosine_similarity(query, r) for r in rows]
+        assert similarities(query, rows, normalized=True) == pytest.approx(expected)
+        np = pytest.importorskip("numpy")
+        assert similarities(query, np.asarray(rows)) == pytest.approx(expected)
+        assert similarities(query, np.zeros((0, 2))) == []
+
+    def test_blob_similarities_match_decoded(self):
+        query = [1.0, 0.5, -0.2]
+        rows = [[0.9, 0.4, -0.1], [0.0, 1.0, 0.0], [0.0, 0.0, 0.0]]
+        blobs = [serialize_embedding(rows[0], "int8"),
+                 serialize_embedding(rows[1], "float16"),
+                 serialize_embedding(rows[2])]
+        expected = [cosine_similarity(query, deserialize_embedding(b)) for b in blobs]
+        assert blob_similarities(query, blobs) == pytest.approx(expected, abs=1e-6)
+        assert blob_similarities(query, []) == []
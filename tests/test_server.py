@@ -42,6 +42,23 @@ class TestServerEndpoints:
         data = resp.json()
         assert data["healthy"] is True
 
+    def test_prometheus_metrics(self):
+        from stellar_memory import metrics
+        from stellar_memory.server import create_api_app
+        from stellar_memory.config import StellarConfig
+        config = StellarConfig(db_path=":memory:")
+        config.metrics.enabled = True
+        app, memory = create_api_app(config)
+        try:
+            client = TestClient(app)
+            client.post("/api/v1/store", json={"content": "Test memory"})
+            resp = client.get("/metrics")
+            assert resp.status_code == 200
+            assert resp.headers["content-type"].startswith("text/plain")
+            assert 'stellar_stage_seconds_count{op="store",stage="total"} 1' in resp.text
+        finally:
+            metrics.disable()
+
     def test_store(self, client):
         resp = client.post("/api/v1/store", json={
             "content": "Test memory", "importance": 0.7,
@@ -78,6 +95,19 @@ class TestServerEndpoints:
         assert "total" in data
         assert "items" in data
 
+    def test_memories_cursor_pagination(self, client):
+        for i in range(5):
+            client.post("/api/v1/store", json={"content": f"Page item {i}"})
+        first = client.get("/api/v1/memories", params={"limit": 3}).json()
+        assert first["total"] == 5 and len(first["items"]) == 3
+        second = client.get("/api/v1/memories", params={
+            "limit": 3, "cursor": first["next_cursor"]}).json()
+        assert len(second["items"]) == 2 and second["next_cursor"] is None
+        ids = {i["id"] for i in first["items"]} | {i["id"] for i in second["items"]}
+        assert len(ids) == 5
+        resp = client.get("/api/v1/memories", params={"cursor": "garbage"})
+        assert resp.status_code == 400
+
     def test_memories_zone_filter(self, client):
         client.post("/api/v1/store", json={"content": "Test", "importance": 0.5})
         resp = client.get("/api/v1/memories", params={"zone": 0})
@@ -104,6 +134,40 @@ class TestServerEndpoints:
         data = resp.json()
         assert "narrative" in data
 
+    def test_store_batch(self, client):
+        resp = client.post("/api/v1/store/batch", json={"items": [
+            {"content": "Batch A", "importance": 0.7},
+            {"content": "Batch B"},
+        ]})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["stored"] == 2
+        assert [r["index"] for r in data["results"]] == [0, 1]
+        assert all(r["id"] and r["error"] is None for r in data["results"])
+
+    def test_store_batch_over_limit(self):
+        from stellar_memory.server import create_api_app
+        from stellar_memory.config import StellarConfig
+        config = StellarConfig(db_path=":memory:")
+        config.server.max_batch_size = 2
+        app, _ = create_api_app(config)
+        resp = TestClient(app).post("/api/v1/store/batch", json={
+            "items": [{"content": f"item {i}"} for i in range(3)]})
+        assert resp.status_code == 413
+
+    def test_recall_batch(self, client):
+        client.post("/api/v1/store", json={"content": "Python is great"})
+        resp = client.post("/api/v1/recall/batch",
+                           json={"queries": ["Python", "nothing here"]})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [r["query"] for r in data] == ["Python", "nothing here"]
+        assert data[0]["items"] and data[1]["items"] == []
+
+    def test_benchmark_rejects_scale_tiers(self, client):
+        resp = client.post("/api/v1/benchmark", json={"dataset": "xlarge"})
+        assert resp.status_code == 422
+
     def test_openapi_docs(self, client):
         resp = client.get("/openapi.json")
         assert resp.status_code == 200
@@ -111,6 +175,34 @@ class TestServerEndpoints:
         assert data["info"]["title"] == "Stellar Memory API"
 
 
+class TestWorkerApp:
+    def test_worker_app_uses_full_config(self, tmp_path, monkeypatch):
+        from stellar_memory.config import StellarConfig
+        from stellar_memory.server import create_worker_app
+        config = StellarConfig(db_path=str(tmp_path / "w.db"))
+        config.server.rate_limit = 7
+        config.tuner.feedback_db_path = str(tmp_path / "fb.db")
+        config.event_logger.log_path = str(tmp_path / "events.jsonl")
+        config_path = tmp_path / "config.json"
+        config.to_json(config_path)
+        monkeypatch.setenv("STELLAR_CONFIG", str(config_path))
+        monkeypatch.setenv("STELLAR_WORKERS", "2")
+        monkeypatch.setenv("STELLAR_NAMESPACE", "")
+        client = TestClient(create_worker_app())
+        resp = client.post("/api/v1/store", json={"content": "from a worker"})
+        assert resp.status_code == 200
+        assert resp.headers["X-RateLimit-Limit"] == "7"
+
+    def test_config_round_trips_through_json(self, tmp_path):
+        from stellar_memory.config import StellarConfig
+        config = StellarConfig(db_path="x.db")
+        config.storage.redis_url = "redis://cache:6379"
+        config.storage.redis_cached_zones = (2, 3)
+        config.server.rate_limit_backend = "redis"
+        config.to_json(tmp_path / "c.json")
+        assert StellarConfig.from_json(tmp_path / "c.json") == config
+
+
 class TestServerAuth:
     def test_unauthorized(self, auth_client):
         resp = auth_client.post("/api/v1/store", json={"content": "test"})
@@ -0,0 +1,120 @@
+"""Tests for cross-process shared state (multi-worker server mode)."""
+
+from stellar_memory import StellarMemory, StellarConfig
+from stellar_memory.event_bus import EventBus
+from stellar_memory.shared_state import ChangeFeed, SharedLease, SharedRateLimiter
+from stellar_memory.storage import StorageFactory
+from stellar_memory.storage.sqlite_storage import SqliteStorage
+
+
+class _FakeEmbedder:
+    def embed(self, text: str) -> list[float]:
+        return [float(len(text)), 1.0, 0.5]
+
+
+def _worker(db_path: str) -> StellarMemory:
+    config = StellarConfig(db_path=db_path, auto_start_scheduler=False)
+    config.storage.shared_hot_zones = True
+    config.storage.change_poll_interval = 60.0  # tests poll explicitly
+    config.recall_cache.enabled = True
+    config.event_logger.enabled = False
+    config.llm.enabled = False
+    config.consolidation.enabled = False
+    config.tuner.feedback_db_path = db_path.replace(".db", "_feedback.db")
+    memory = StellarMemory(config)
+    memory._embedder = _FakeEmbedder()
+    return memory
+
+
+class TestChangeFeed:
+    def test_relays_to_other_processes_only(self, tmp_path, item_factory):
+        db = str(tmp_path / "shared.db")
+        bus_a, bus_b = EventBus(), EventBus()
+        feed_a, feed_b = ChangeFeed(db), ChangeFeed(db)
+        feed_a.attach(bus_a)
+        feed_b.attach(bus_b)
+        seen_a, seen_b = [], []
+        bus_a.on("on_remote_change", lambda *args: seen_a.append(args))
+        bus_b.on("on_remote_change", lambda *args: seen_b.append(args))
+
+        bus_a.emit("on_store", item_factory("x", user_id="u1"))
+        bus_a.emit("on_forget", "y")
+        assert feed_a.poll() == 0
+        assert feed_b.poll() == 2
+        assert seen_b == [("store", "x", "u1"), ("forget", "y", None)]
+        assert seen_a == []
+        assert feed_b.poll() == 0  # cursor advanced
+
+    def test_skips_history_before_startup(self, tmp_path):
+        db = str(tmp_path / "shared.db")
+        ChangeFeed(db).publish("store", "old")
+        late = ChangeFeed(db)
+        late.attach(EventBus())
+        assert late.poll() == 0
+
+
+class TestSharedRateLimiter:
+    def test_limit_is_shared_between_instances(self, tmp_path):
+        db = str(tmp_path / "shared.db")
+        a, b = SharedRateLimiter(db), SharedRateLimiter(db)
+        now = 120.0
+        assert a.hit("ip", 3, now) == (True, 2, 180)
+        assert b.hit("ip", 3, now) == (True, 1, 180)
+        assert a.hit("ip", 3, now) == (True, 0, 180)
+        assert b.hit("ip", 3, now) == (False, 0, 180)
+        assert a.hit("other", 3, now)[0]
+        assert b.hit("ip", 3, now + 60)[0]  # next window
+
+    def test_reset_is_window_end(self, tmp_path):
+        limiter = SharedRateLimiter(str(tmp_path / "shared.db"), window=60)
+        _, _, reset_at = limiter.hit("ip", 5, now=125.0)
+        assert reset_at == 180
+
+
+class TestSharedLease:
+    def test_single_holder_until_expiry(self, tmp_path):
+        db = str(tmp_path / "shared.db")
+        a, b = SharedLease(db, "reorbit", ttl=10), SharedLease(db, "reorbit", ttl=10)
+        assert a.acquire(now=100.0)
+        assert not b.acquire(now=105.0)
+        assert a.acquire(now=105.0)  # renewal
+        assert b.acquire(now=116.0)
+        assert not a.acquire(now=117.0)
+
+
+class TestSharedMemory:
+    def test_factory_puts_hot_zones_in_sqlite(self, tmp_path):
+        config = StellarConfig(db_path=str(tmp_path / "m.db"))
+        config.storage.shared_hot_zones = True
+        factory = StorageFactory(config.db_path, config.storage)
+        assert isinstance(factory.create(config.zones[0]), SqliteStorage)
+
+    def test_workers_see_each_others_writes(self, tmp_path):
+        db = str(tmp_path / "m.db")
+        a, b = _worker(db), _worker(db)
+        try:
+            assert b.recall("shared fact") == []
+            item = a.store("shared fact", importance=0.95)
+            assert item.zone <= 1
+            assert b.get(item.id) is not None
+            assert b._change_feed.poll() >= 1
+            assert b._vector_index.size() == 1
+            assert [r.id for r in b.recall("shared fact")] == [item.id]
+            a.forget(item.id)
+            b._change_feed.poll()
+            assert b._vector_index.size() == 0
+            assert b.recall("shared fact") == []
+        finally:
+            a.stop()
+            b.stop()
+
+    def test_vector_index_rebuilt_on_start(self, tmp_path):
+        db = str(tmp_path / "m.db")
+        a = _worker(db)
+        a.store("first worker memory", importance=0.9)
+        b = _worker(db)
+        try:
+            assert b._vector_index.size() == 1
+        finally:
+            a.stop()
+            b.stop()
@@ -113,3 +113,67 @@ class TestFullLifecycle:
         updated = sm.get(m2.id)
         if updated:
             assert updated.zone >= initial_zone
+
+
+class TestColumnarLayout:
+    def test_store_recall_with_columnar_zones(self):
+        from dataclasses import replace
+        from stellar_memory.config import StorageConfig
+        from stellar_memory.storage.columnar import ColumnarStorage
+        config = replace(FAST_CONFIG, storage=StorageConfig(in_memory_layout="columnar"))
+        sm = StellarMemory(config)
+        assert isinstance(sm._orbit_mgr.get_storage(0), ColumnarStorage)
+        item = sm.store("columnar recall check", importance=0.9)
+        results = sm.recall("columnar recall")
+        assert results[0].id == item.id
+        assert sm.get(item.id).recall_count == 1
+
+
+class TestFilterPushdown:
+    def test_user_filter_applies_before_limit(self):
+        sm = StellarMemory(FAST_CONFIG)
+        for i in range(6):
+            sm.store(f"team standup notes {i}", importance=0.6, user_id="other")
+        mine = sm.store("team standup notes mine", importance=0.6, user_id="alice")
+        results = sm.recall("team standup notes", limit=2, user_id="alice")
+        assert [r.id for r in results] == [mine.id]
+
+
+class _BatchEmbedder:
+    def __init__(self):
+        self.batches = []
+
+    def embed(self, text):
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(t) % 3 == i) for i in range(3)] for t in texts]
+
+
+class TestBatch:
+    def test_store_batch_embeds_once_and_reports_per_item(self):
+        sm = StellarMemory(FAST_CONFIG)
+        embedder = sm._embedder = _BatchEmbedder()
+        results = sm.store_batch([
+            {"content": "batch item one", "importance": 0.7},
+            {"content": ""},
+            {"content": "another batch entry", "metadata": {"k": 1}},
+            {"content": "typo", "importanse": 0.9},
+        ], user_id="alice")
+        assert embedder.batches == [["batch item one", "another batch entry"]]
+        assert sm.get(results[0].id).user_id == "alice"
+        assert sm.get(results[2].id).metadata["k"] == 1
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[3], TypeError)
+
+    def test_recall_batch_shares_embedding_batch(self):
+        sm = StellarMemory(FAST_CONFIG)
+        sm.store("The meeting is at 3pm tomorrow", importance=0.8)
+        sm.store("Python programming language", importance=0.6)
+        embedder = sm._embedder = _BatchEmbedder()
+        results = sm.recall_batch(["meeting tomorrow", "Python", "meeting tomorrow"])
+        assert embedder.batches == [["meeting tomorrow", "Python"]]
+        assert "meeting" in results[0][0].content
+        assert "Python" in results[1][0].content
+        assert results[2] == results[0]
@@ -1,11 +1,16 @@
 """Tests for storage implementations - InMemoryStorage and SqliteStorage."""
 
 import os
+import sys
 import tempfile
 import time
 
-from stellar_memory.models import MemoryItem
+import pytest
+
+from stellar_memory.models import MemoryItem, EmotionVector
+from stellar_memory.storage import ListCursor, SearchFilter
 from stellar_memory.storage.in_memory import InMemoryStorage
+from stellar_memory.storage.columnar import ColumnarStorage
 from stellar_memory.storage.sqlite_storage import SqliteStorage
 
 
@@ -110,6 +115,151 @@ class TestInMemorySearch:
         assert len(results) == 3
 
 
+class TestColumnarStorage:
+    def test_store_get_roundtrip(self):
+        storage = ColumnarStorage()
+        item = make_item("m1", "hello columns", recall_count=3,
+                         embedding=[0.6, 0.8], user_id="u1",
+                         metadata={"tags": ["a"]})
+        storage.store(item)
+        result = storage.get("m1")
+        assert result.content == "hello columns"
+        assert result.recall_count == 3
+        assert result.user_id == "u1"
+        assert result.metadata == {"tags": ["a"]}
+        assert result.embedding == [0.6000000238418579, 0.800000011920929]
+
+    def test_update_requires_explicit_call(self):
+        storage = ColumnarStorage()
+        storage.store(make_item("m1", "original"))
+        item = storage.get("m1")
+        item.recall_count = 7
+        assert storage.get("m1").recall_count == 0
+        storage.update(item)
+        assert storage.get("m1").recall_count == 7
+
+    def test_remove_swaps_last_row(self):
+        storage = ColumnarStorage()
+        for i in range(4):
+            storage.store(make_item(f"m{i}", f"item {i}", embedding=[float(i), 1.0]))
+        assert storage.remove("m1") is True
+        assert storage.remove("m1") is False
+        assert storage.count() == 3
+        assert storage.get("m3").embedding == [3.0, 1.0]
+        assert sorted(i.id for i in storage.get_all()) == ["m0", "m2", "m3"]
+
+    def test_embedding_added_after_plain_rows(self):
+        storage = ColumnarStorage()
+        storage.store(make_item("m1", "no vector"))
+        storage.store(make_item("m2", "with vector", embedding=[1.0, 0.0]))
+        assert storage.get("m1").embedding is None
+        assert storage.get("m2").embedding == [1.0, 0.0]
+
+    def test_mismatched_dimension_kept_exact(self):
+        storage = ColumnarStorage()
+        storage.store(make_item("m1", "short", embedding=[1.0, 0.0]))
+        storage.store(make_item("m2", "long", embedding=[0.1, 0.2, 0.3]))
+        assert storage.get("m2").embedding == [0.1, 0.2, 0.3]
+
+    def test_hybrid_search_matches_dict_storage(self):
+        columnar, plain = ColumnarStorage(), InMemoryStorage()
+        for i, (text, emb) in enumerate([("python code", [1.0, 0.0]),
+                                         ("java code", [0.7, 0.7]),
+                                         ("cooking", [0.0, 1.0])]):
+            for s in (columnar, plain):
+                s.store(make_item(f"m{i}", text, embedding=emb))
+        for query, emb in [("code", [1.0, 0.0]), ("cooking", [0.0, 1.0])]:
+            want = [i.id for i in plain.search(query, limit=3, query_embedding=emb)]
+            got = [i.id for i in columnar.search(query, limit=3, query_embedding=emb)]
+            assert got == want
+
+    def test_vectorized_search_matches_pure_python(self, monkeypatch):
+        pytest.importorskip("numpy")
+        storage = ColumnarStorage()
+        rows = [("python code", [1.0, 0.0], "alice"),
+                ("java code", [0.7, 0.7], "bob"),
+                ("code notes", None, None),
+                ("code zero", [0.0, 0.0], "alice"),
+                ("code long", [0.5, 0.5, 0.5], "alice")]
+        for i, (text, emb, owner) in enumerate(rows):
+            storage.store(make_item(f"m{i}", text, embedding=emb, user_id=owner))
+        cases = [(emb, f) for emb in ([1.0, 0.0], [0.1, 0.9, 0.2], [0.0, 0.0], None)
+                 for f in (None, SearchFilter(user_id="alice"))]
+        fast = [[i.id for i in storage.search("code", 5, query_embedding=emb, filters=f)]
+                for emb, f in cases]
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        slow = [[i.id for i in storage.search("code", 5, query_embedding=emb, filters=f)]
+                for emb, f in cases]
+        assert fast == slow
+        storage.store(make_item("low", "x", total_score=-1.0))
+        assert storage.get_lowest_score_item().id == "low"
+
+    def test_get_lowest_score_item(self):
+        storage = ColumnarStorage()
+        assert storage.get_lowest_score_item() is None
+        storage.store(make_item("m1", total_score=0.9))
+        storage.store(make_item("m2", total_score=0.1))
+        assert storage.get_lowest_score_item().id == "m2"
+
+    def test_search_while_storing(self):
+        # Appends can reallocate the vector buffer; searches must not see that
+        import random
+        import threading
+        rng = random.Random(0)
+        dim = 256
+        storage = ColumnarStorage()
+        vec = lambda: [rng.random() for _ in range(dim)]
+        for n in range(2000):
+            storage.store(make_item(f"seed{n}", f"seed topic {n}", embedding=vec()))
+        query = vec()
+        errors = []
+
+        def writer(w):
+            for n in range(300):
+                try:
+                    storage.store(make_item(f"w{w}-{n}", "new topic", embedding=query))
+                except Exception as exc:
+                    errors.append(exc)
+
+        def reader():
+            for _ in range(100):
+                try:
+                    storage.search("topic", 5, query_embedding=query)
+                except Exception as exc:
+                    errors.append(exc)
+
+        threads = ([threading.Thread(target=writer, args=(w,)) for w in range(4)]
+                   + [threading.Thread(target=reader) for _ in range(4)])
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert storage.count() == 2000 + 4 * 300
+
+
+class TestSearchFilter:
+    def test_matches(self):
+        item = make_item("m1", user_id="alice", content_type="code",
+                         emotion=EmotionVector(joy=0.9),
+                         metadata={"session_id": "s1"})
+        assert SearchFilter().is_empty
+        assert SearchFilter(user_id="alice", emotion="joy",
+                            session_id="s1", content_type="code").matches(item)
+        assert not SearchFilter(user_id="bob").matches(item)
+        assert not SearchFilter(emotion="fear").matches(item)
+        assert not SearchFilter(session_id="s2").matches(item)
+        assert SearchFilter(user_id="bob").matches(make_item("shared"))
+
+    def test_filter_applied_before_limit(self):
+        for storage in (InMemoryStorage(), ColumnarStorage()):
+            for i in range(10):
+                storage.store(make_item(f"o{i}", "shared topic", user_id="other"))
+            storage.store(make_item("mine", "shared topic", user_id="alice"))
+            results = storage.search("topic", limit=3, filters=SearchFilter(user_id="alice"))
+            assert [r.id for r in results] == ["mine"]
+
+
 class TestSqliteCRUD:
     def _make_storage(self):
         fd, path = tempfile.mkstemp(suffix=".db")
@@ -133,6 +283,75 @@ class TestSqliteCRUD:
                     except PermissionError:
                         pass
 
+    def test_filter_columns_persisted_and_pushed_down(self):
+        storage = self._make_storage()
+        storage.store(make_item("a", "project notes", zone=2, user_id="alice",
+                                content_type="code", emotion=EmotionVector(fear=0.8),
+                                metadata={"session_id": "s1"}))
+        for i in range(10):
+            storage.store(make_item(f"b{i}", "project notes", zone=2, user_id="bob"))
+        item = storage.get("a")
+        assert item.user_id == "alice"
+        assert item.content_type == "code"
+        assert item.emotion.dominant == "fear"
+        for f in (SearchFilter(user_id="alice"), SearchFilter(emotion="fear"),
+                  SearchFilter(session_id="s1"), SearchFilter(content_type="code")):
+            assert [r.id for r in storage.search("project", limit=2, filters=f)] == ["a"]
+            assert [r.id for r in storage.search(
+                "project", limit=2, query_embedding=None, filters=f)] == ["a"]
+
+    def test_migrates_old_schema(self):
+        import sqlite3
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self._db_path = path
+        conn = sqlite3.connect(path)
+        conn.execute("""CREATE TABLE memories_zone_2 (
+            id TEXT PRIMARY KEY, content TEXT NOT NULL, created_at REAL NOT NULL,
+            last_recalled_at REAL NOT NULL, recall_count INTEGER DEFAULT 0,
+            arbitrary_importance REAL DEFAULT 0.5, zone INTEGER NOT NULL,
+            metadata TEXT, embedding BLOB, total_score REAL DEFAULT 0.0,
+            updated_at REAL NOT NULL DEFAULT 0.0)""")
+        conn.execute("INSERT INTO memories_zone_2 (id, content, created_at, "
+                     "last_recalled_at, zone) VALUES ('old', 'legacy row', 0, 0, 2)")
+        conn.execute("INSERT INTO memories_zone_2 (id, content, created_at, "
+                     "last_recalled_at, zone, metadata) VALUES "
+                     "('sess', 'legacy row', 0, 0, 2, '{\"session_id\": \"s9\"}')")
+        conn.commit()
+        conn.close()
+        self._storage = SqliteStorage(path, zone_id=2)
+        assert self._storage.get("old").user_id is None
+        # session_id is backfilled from metadata so the filter finds old rows
+        assert [r.id for r in self._storage.search(
+            "legacy", limit=5, filters=SearchFilter(session_id="s9"))] == ["sess"]
+        self._storage.store(make_item("new", "fresh row", zone=2, user_id="u"))
+        assert self._storage.get("new").user_id == "u"
+
+    def test_int8_embedding_codec(self):
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self._db_path = path
+        self._storage = SqliteStorage(path, zone_id=2, embedding_codec="int8")
+        item = make_item("q1", "quantized", zone=2, embedding=[0.6, -0.8, 0.0])
+        self._storage.store(item)
+        restored = self._storage.get("q1").embedding
+        assert all(abs(a - b) < 0.01 for a, b in zip(restored, [0.6, -0.8, 0.0]))
+
+    @pytest.mark.parametrize("codec", ["int8", "float16"])
+    def test_quantized_search_ranks_from_codes(self, codec):
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self._db_path = path
+        self._storage = SqliteStorage(path, zone_id=2, embedding_codec=codec)
+        self._storage.store(make_item("near", "vector note", zone=2,
+                                      embedding=[0.9, 0.1, 0.0]))
+        self._storage.store(make_item("far", "vector note", zone=2,
+                                      embedding=[0.0, 0.2, 0.9]))
+        results = self._storage.search("vector", limit=2,
+                                       query_embedding=[1.0, 0.0, 0.0])
+        assert [r.id for r in results] == ["near", "far"]
+        assert results[0].embedding is not None
+
     def test_store_and_get(self):
         storage = self._make_storage()
         item = make_item("m1", "hello sqlite", zone=2)
@@ -209,3 +428,67 @@ class TestSqliteCRUD:
         storage.store(item)
         result = storage.get("m1")
         assert result.metadata == {"tag": "important", "score": 42}
+
+
+class TestListItems:
+    def _fill(self, storage):
+        scores = [0.9, 0.5, 0.5, 0.1, 0.7]
+        for n, score in enumerate(scores):
+            storage.store(make_item(f"m{n}", f"item {n}", zone=2, total_score=score,
+                                    created_at=100.0 + n, embedding=[1.0, 0.0],
+                                    user_id="bob" if n == 3 else None))
+        return storage
+
+    def _pages(self, storage, **kwargs):
+        ids, after = [], None
+        while True:
+            rows = storage.list_items(after=after, limit=2, **kwargs)
+            ids.extend(r["id"] for r in rows)
+            if len(rows) < 2:
+                return ids
+            after = ListCursor.of(kwargs.get("order_by", "total_score"), rows[-1])
+
+    def test_keyset_order_across_backends(self, tmp_path):
+        for storage in (InMemoryStorage(), ColumnarStorage(),
+                        SqliteStorage(str(tmp_path / "l.db"), zone_id=2)):
+            self._fill(storage)
+            assert self._pages(storage) == ["m0", "m4", "m1", "m2", "m3"]
+            assert self._pages(storage, order_by="created_at") == [
+                "m4", "m3", "m2", "m1", "m0"]
+            assert "m3" not in self._pages(storage, user_id="alice")
+            assert storage.count_items(user_id="alice") == 4
+
+    def test_owner_counts_follow_writes(self):
+        for storage in (InMemoryStorage(), ColumnarStorage()):
+            self._fill(storage)
+            storage.get_all = None  # counting must not scan
+            assert storage.count_items() == 5
+            assert storage.count_items(user_id="bob") == 5
+            storage.update(make_item("m0", zone=2, user_id="bob"))
+            assert storage.count_items(user_id="alice") == 3
+            storage.store(make_item("m5", zone=2, user_id="alice"))
+            assert storage.count_items(user_id="alice") == 4
+            assert storage.remove("m3") and storage.remove("m0")
+            assert storage.count_items(user_id="bob") == 3
+            assert storage.count_items(user_id="alice") == 4
+
+    def test_columnar_owner_counts_survive_snapshot_load(self):
+        source = self._fill(ColumnarStorage())
+        restored = ColumnarStorage()
+        restored.load_columns(source.export_columns())
+        assert restored.count_items(user_id="bob") == 5
+        assert restored.count_items(user_id="alice") == 4
+
+    def test_projection_never_includes_embedding(self, tmp_path):
+        storage = self._fill(SqliteStorage(str(tmp_path / "l.db"), zone_id=2))
+        row, = storage.list_items(limit=1, fields=["content", "metadata"])
+        assert row == {"id": "m0", "total_score": 0.9, "content": "item 0",
+                       "metadata": {}}
+        with pytest.raises(ValueError):
+            storage.list_items(fields=["embedding"])
+
+    def test_cursor_token_roundtrip(self):
+        cursor = ListCursor("created_at", 12.5, "abc")
+        assert ListCursor.decode(cursor.encode()) == cursor
+        with pytest.raises(ValueError):
+            ListCursor.decode("not-a-cursor")
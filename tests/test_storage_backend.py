@@ -1,6 +1,8 @@
 """Tests for P6 StorageBackend, RedisCache, and PostgresStorage interfaces."""
 
 import json
+import os
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -130,7 +132,7 @@ class TestRedisCache:
         cache._connected = True
         item = _make_item("outer", zone=3)
         cache.set(item)  # should be skipped
-        cache._client.setex.assert_not_called()
+        cache._client.pipeline.assert_not_called()
 
     def test_set_caches_zone_0(self):
         cache = RedisCache("redis://localhost", ttl=120)
@@ -138,10 +140,13 @@ class TestRedisCache:
         cache._connected = True
         item = _make_item("core", zone=0)
         cache.set(item)
-        cache._client.setex.assert_called_once()
-        args = cache._client.setex.call_args
+        pipe = cache._client.pipeline.return_value
+        pipe.setex.assert_called_once()
+        args = pipe.setex.call_args
         assert args[0][0] == f"sm:{item.id}"
         assert args[0][1] == 120
+        pipe.sadd.assert_called_once_with("sm:zone:0", item.id)
+        pipe.execute.assert_called_once()
 
     def test_get_returns_none_when_no_client(self):
         cache = RedisCache("redis://localhost")
@@ -152,7 +157,32 @@ class TestRedisCache:
         cache._client = MagicMock()
         cache._connected = True
         cache.invalidate("item-1")
-        cache._client.delete.assert_called_once_with("sm:item-1")
+        pipe = cache._client.pipeline.return_value
+        pipe.delete.assert_called_once_with("sm:item-1")
+        pipe.srem.assert_any_call("sm:zone:0", "item-1")
+        pipe.execute.assert_called_once()
+
+    def test_get_many_uses_mget(self):
+        cache = RedisCache("redis://localhost")
+        cache._client = MagicMock()
+        item = _make_item("hot", zone=0)
+        cache._client.mget.return_value = [cache._serialize(item), None]
+        found = cache.get_many([item.id, "cold"])
+        cache._client.mget.assert_called_once_with([f"sm:{item.id}", "sm:cold"])
+        assert list(found) == [item.id]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_invalidate_zone_uses_key_set(self):
+        cache = RedisCache("redis://localhost")
+        cache._client = MagicMock()
+        cache._client.smembers.return_value = {b"a"}
+        cache.invalidate_zone(1)
+        cache._client.scan.assert_not_called()
+        cache._client.smembers.assert_called_once_with("sm:zone:1")
+        pipe = cache._client.pipeline.return_value
+        pipe.delete.assert_any_call("sm:a")
+        pipe.delete.assert_any_call("sm:zone:1")
 
     def test_serialize_deserialize(self):
         cache = RedisCache("redis://localhost")
@@ -167,6 +197,26 @@ class TestRedisCache:
         assert restored.encrypted is True
         assert restored.source_type == "web"
 
+    def test_binary_serialization_keeps_embedding(self):
+        from stellar_memory.models import EmotionVector
+        cache = RedisCache("redis://localhost")
+        item = _make_item("vec", zone=0)
+        item.embedding = [0.5, -0.25, 1.0]
+        item.emotion = EmotionVector(joy=0.75)
+        item.user_id = "tenant-a"
+        data = cache._serialize(item)
+        assert data.startswith(b"SM\x01")
+        restored = cache._deserialize(data)
+        assert restored.embedding == [0.5, -0.25, 1.0]
+        assert restored.emotion.joy == 0.75
+        assert restored.user_id == "tenant-a"
+
+    def test_reads_legacy_json_entries(self):
+        cache = RedisCache("redis://localhost")
+        legacy = json.dumps({"id": "old", "content": "c", "created_at": 1.0,
+                             "last_recalled_at": 1.0, "zone": 1}).encode()
+        assert cache._deserialize(legacy).id == "old"
+
     def test_connect_import_error(self):
         cache = RedisCache("redis://localhost")
         with patch.dict("sys.modules", {"redis": None}):
@@ -174,6 +224,29 @@ class TestRedisCache:
                 cache.connect()
 
 
+class TestRedisCacheFakeRedis:
+    @pytest.fixture
+    def cache(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        cache = RedisCache("redis://localhost", ttl=60, cached_zones=(0, 1))
+        cache._client = fakeredis.FakeRedis()
+        cache._connected = True
+        return cache
+
+    def test_round_trip_and_zone_invalidation(self, cache):
+        core, inner = _make_item("core", zone=0), _make_item("inner", zone=1)
+        core.embedding = [1.0, 0.0]
+        cache.set_many([core, inner])
+        found = cache.get_many([core.id, inner.id, "missing"])
+        assert found[core.id].embedding == [1.0, 0.0]
+        assert found[inner.id].zone == 1
+        cache.invalidate_zone(0)
+        assert cache.get(core.id) is None
+        assert cache.get(inner.id) is not None
+        cache.invalidate(inner.id)
+        assert cache.get_many([inner.id]) == {}
+
+
 # ---------- StorageConfig ----------
 
 class TestStorageConfig:
@@ -206,3 +279,248 @@ class TestPostgresStorageInterface:
         from stellar_memory.storage.postgres_storage import PostgresStorage
         pg = PostgresStorage("postgresql://localhost/test")
         assert not pg.health_check()
+
+    def test_not_connected_raises(self):
+        from stellar_memory.storage.postgres_storage import PostgresStorage
+        pg = PostgresStorage("postgresql://localhost/test")
+        with pytest.raises(RuntimeError):
+            pg.count()
+
+
+class TestPostgresEncoding:
+    def test_vector_codec_round_trip(self):
+        from stellar_memory.storage.postgres_storage import _encode_vector, _decode_vector
+        data = _encode_vector([0.5, -1.0, 2.25])
+        assert data[:4] == b"\x00\x03\x00\x00"
+        assert len(data) == 4 + 3 * 4
+        assert _decode_vector(data) == [0.5, -1.0, 2.25]
+
+    def test_record_vector_param(self):
+        from stellar_memory.storage.postgres_storage import PostgresStorage, _COLUMNS
+        pg = PostgresStorage("postgresql://localhost/test")
+        pg._has_pgvector = True
+        item = MemoryItem(id="a", content="x", created_at=1.0,
+                          last_recalled_at=1.0, embedding=[1, 2])
+        assert pg._record(item)[_COLUMNS.index("embedding")] == "[1,2]"
+        pg._vector_codec = True
+        record = pg._record(item)
+        assert len(record) == len(_COLUMNS)
+        assert record[_COLUMNS.index("embedding")] == [1.0, 2.0]
+
+    def test_row_to_item_embedding_formats(self):
+        from stellar_memory.storage.postgres_storage import PostgresStorage
+        from stellar_memory.utils import serialize_embedding
+        pg = PostgresStorage("postgresql://localhost/test")
+        base = {"id": "a", "content": "x", "created_at": 1.0,
+                "last_recalled_at": 1.0, "recall_count": 0,
+                "arbitrary_importance": 0.5, "zone": 2, "metadata": "{}",
+                "total_score": 0.0}
+        for raw in ([0.5, 1.0], "[0.5,1.0]", serialize_embedding([0.5, 1.0])):
+            assert pg._row_to_item({**base, "embedding": raw}).embedding == [0.5, 1.0]
+        assert pg._row_to_item({**base, "embedding": None}).embedding is None
+
+
+class TestPostgresIndexPlanning:
+    def _pg(self, **cfg):
+        from stellar_memory.config import PgVectorIndexConfig
+        from stellar_memory.storage.postgres_storage import PostgresStorage
+        return PostgresStorage("postgresql://localhost/test",
+                               index_config=PgVectorIndexConfig(**cfg))
+
+    def test_hnsw_ddl(self):
+        ddl = self._pg(hnsw_m=24)._index_ddl(50_000)
+        assert "USING hnsw (embedding vector_cosine_ops)" in ddl
+        assert "m = 24" in ddl
+        assert "WHERE" not in ddl
+
+    def test_ivfflat_lists_scale_with_rows(self):
+        pg = self._pg(method="ivfflat")
+        assert "lists = 50" in pg._index_ddl(50_000)
+        assert "lists = 3162" in pg._index_ddl(10_000_000)
+        assert "lists = 7" in self._pg(method="ivfflat", ivf_lists=7)._index_ddl(50_000)
+        assert self._pg(method="none")._index_ddl(50_000) is None
+
+    def test_tenant_partial_index_validates_uuid(self):
+        pg = self._pg()
+        tenant = "12345678-1234-5678-1234-567812345678"
+        ddl = pg._index_ddl(60_000, tenant)
+        assert f"WHERE user_id = '{tenant}'::uuid" in ddl
+        assert "idx_memories_embedding_u_12345678123456781234567812345678" in ddl
+        with pytest.raises(ValueError):
+            pg._index_ddl(60_000, "x'; DROP TABLE memories; --")
+
+    def test_search_settings(self):
+        pg = self._pg(ef_search=40)
+        assert pg._search_settings(10) == ""  # no ANN index yet
+        pg._vector_index = "hnsw"
+        assert pg._search_settings(100) == "SET LOCAL hnsw.ef_search = 100"
+        assert pg._search_settings(5, ef_search=80) == "SET LOCAL hnsw.ef_search = 80"
+        pg._pgvector_version = (0, 8, 0)
+        assert pg._search_settings(5).endswith("SET LOCAL hnsw.iterative_scan = relaxed_order")
+        ivf = self._pg(method="ivfflat", iterative_scan="strict_order")
+        ivf._vector_index = "ivfflat"
+        ivf._pgvector_version = (0, 8, 1)
+        assert ivf._search_settings(5, probes=3) == (
+            "SET LOCAL ivfflat.probes = 3; SET LOCAL ivfflat.iterative_scan = relaxed_order"
+        )
+
+
+    def test_write_counters_flag_due_indexes(self):
+        import asyncio
+        pg = self._pg(min_rows=10, tenant_min_rows=5)
+        tenant = "12345678-1234-5678-1234-567812345678"
+        pg._note_rows({None: 4, tenant: 4})
+        assert not pg._due_tenants and pg._rows == 8
+
+        async def scenario():
+            pg._index_wakeup = asyncio.Event()
+            pg._note_rows({tenant: 1})
+            assert pg._index_wakeup.is_set()
+
+        asyncio.run(scenario())
+        assert pg._due_tenants == {tenant} and pg._rows == 9
+        pg._tenant_indexes.add(tenant)
+        pg._due_tenants.clear()
+        pg._note_rows({tenant: 1})
+        assert not pg._due_tenants
+
+
+class TestStorageBackendBatchDefaults:
+    def test_store_get_remove_many(self):
+        backend = DummyBackend()
+        items = [MemoryItem(id=f"i{n}", content="c", created_at=1.0,
+                            last_recalled_at=1.0) for n in range(3)]
+        assert backend.store_many(items) == 3
+        assert [i.id for i in backend.get_many(["i2", "missing", "i0"])] == ["i2", "i0"]
+        assert backend.remove_many(["i0", "i1", "missing"]) == 2
+        assert backend.count() == 1
+
+
+class TestPostgresEventLoop:
+    """Loop plumbing, exercised with plain coroutines (no database)."""
+
+    def test_sync_calls_reuse_one_loop(self):
+        import asyncio
+        from stellar_memory.storage.postgres_storage import PostgresStorage
+        pg = PostgresStorage("postgresql://localhost/test")
+        pg._start_loop()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        try:
+            assert pg._run(current_loop()) is pg._run(current_loop()) is pg._loop
+        finally:
+            pg._stop_loop()
+        assert pg._loop is None
+
+    def test_async_bridge_from_foreign_loop(self):
+        import asyncio
+        from stellar_memory.storage.postgres_storage import PostgresStorage
+        pg = PostgresStorage("postgresql://localhost/test")
+        pg._start_loop()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        async def caller():
+            return await pg._bridge(current_loop())
+
+        try:
+            assert asyncio.run(caller()) is pg._loop
+        finally:
+            pg._stop_loop()
+
+    def test_blocking_call_on_own_loop_rejected(self):
+        import asyncio
+        from stellar_memory.storage.postgres_storage import PostgresStorage
+        pg = PostgresStorage("postgresql://localhost/test")
+
+        async def caller():
+            pg._loop = asyncio.get_running_loop()
+            with pytest.raises(RuntimeError):
+                pg._run(asyncio.sleep(0))
+
+        asyncio.run(caller())
+
+
+# Live round-trip; set STELLAR_TEST_PG_URL to a scratch database to run
+_PG_URL = os.environ.get("STELLAR_TEST_PG_URL")
+
+
+@pytest.mark.skipif(not _PG_URL, reason="STELLAR_TEST_PG_URL not set")
+class TestPostgresLive:
+    @pytest.fixture
+    def pg(self):
+        pytest.importorskip("asyncpg")
+        import asyncio
+        import asyncpg
+        from stellar_memory.storage.postgres_storage import PostgresStorage
+
+        async def prepare():
+            conn = await asyncpg.connect(_PG_URL)
+            await conn.execute("CREATE TABLE IF NOT EXISTS users (id UUID PRIMARY KEY)")
+            await conn.execute("DROP TABLE IF EXISTS memories")
+            await conn.close()
+
+        asyncio.run(prepare())
+        storage = PostgresStorage(_PG_URL, pool_size=4)
+        storage.connect()
+        yield storage
+        storage.disconnect()
+
+    def _item(self, item_id: str, content: str) -> MemoryItem:
+        return MemoryItem(id=item_id, content=content, created_at=1.0,
+                          last_recalled_at=1.0, zone=2)
+
+    def test_sync_round_trip(self, pg):
+        pg.store(self._item("a", "postgres keyword"))
+        assert pg.get("a").content == "postgres keyword"
+        assert pg.count(zone=2) == 1
+        assert [i.id for i in pg.search("keyword", zone=2)] == ["a"]
+        assert pg.remove("a")
+        assert pg.get("a") is None
+
+    def test_async_api_from_another_loop(self, pg):
+        import asyncio
+
+        async def scenario():
+            await asyncio.gather(*(pg.astore(self._item(f"i{n}", f"note {n}"))
+                                   for n in range(10)))
+            assert await pg.acount() == 10
+            assert (await pg.aget("i3")).content == "note 3"
+
+        asyncio.run(scenario())
+
+    def test_bulk_store_get_remove(self, pg):
+        items = [self._item(f"b{n}", f"bulk {n}") for n in range(25)]
+        items.append(self._item("b0", "bulk 0 updated"))  # duplicate id in batch
+        pg._copy_batch_size = 10
+        assert pg.store_many(items) == 25
+        assert pg.count() == 25
+        found = pg.get_many(["b3", "nope", "b0"])
+        assert [i.id for i in found] == ["b3", "b0"]
+        assert found[1].content == "bulk 0 updated"
+        assert pg.remove_many([f"b{n}" for n in range(10)] + ["nope"]) == 10
+        assert pg.count() == 15
+
+    def test_ann_index_built_past_threshold(self, pg):
+        pg._index_cfg.min_rows = 20
+        item = self._item("e0", "vector")
+        item.embedding = [1.0] + [0.0] * 383
+        pg.store(item)
+        assert pg.ensure_indexes()["vector_index"] is None
+        batch = []
+        for n in range(1, 30):
+            it = self._item(f"e{n}", f"vector {n}")
+            it.embedding = [float(n)] + [1.0] * 383
+            batch.append(it)
+        pg.store_many(batch)
+        if pg._has_pgvector:
+            import time
+            deadline = time.monotonic() + 10
+            while pg._vector_index is None and time.monotonic() < deadline:
+                time.sleep(0.05)  # built by the background maintainer
+            assert pg._vector_index == "hnsw"
+            assert pg.search("", limit=1, query_embedding=item.embedding,
+                             zone=2, ef_search=64)[0].id == "e0"
@@ -0,0 +1,156 @@
+"""Tests for the two-tier (L1 in-process + L2 Redis) item cache."""
+
+import time
+
+import pytest
+
+from stellar_memory.models import MemoryItem
+from stellar_memory.storage.redis_cache import RedisCache
+from stellar_memory.storage.tiered_cache import TieredItemCache
+
+
+class _SharedL2:
+    """RedisCache-shaped double shared by several 'workers' (sync pub/sub)."""
+
+    def __init__(self):
+        self.cached_zones = (0, 1)
+        self.data = {}
+        self.subscribers = []
+        self.reads = 0
+
+    def view(self):
+        shared = self
+
+        class _View:
+            cached_zones = shared.cached_zones
+
+            def get_many(self, ids):
+                shared.reads += 1
+                return {i: shared.data[i] for i in ids if i in shared.data}
+
+            def set_many(self, items):
+                shared.data.update({i.id: i for i in items})
+
+            def invalidate_many(self, ids):
+                for i in ids:
+                    shared.data.pop(i, None)
+
+            def invalidate_zone(self, zone):
+                for i in [k for k, v in shared.data.items() if v.zone == zone]:
+                    del shared.data[i]
+
+            def publish(self, channel, message):
+                for handler in list(shared.subscribers):
+                    handler(message)
+
+            def subscribe(self, channel, handler):
+                shared.subscribers.append(handler)
+
+            def unsubscribe(self):
+                pass
+
+            def stats(self):
+                return {"hits": 0, "misses": 0, "hit_rate": 0.0}
+
+        return _View()
+
+
+def _item(item_id: str, zone: int = 0, content: str = "c") -> MemoryItem:
+    now = time.time()
+    return MemoryItem(id=item_id, content=content, created_at=now,
+                      last_recalled_at=now, zone=zone)
+
+
+def _workers(n: int = 2):
+    shared = _SharedL2()
+    caches = [TieredItemCache(shared.view(), max_items=100) for _ in range(n)]
+    for cache in caches:
+        cache.start()
+    return shared, caches
+
+
+class TestTieredItemCache:
+    def test_l1_serves_repeat_reads(self):
+        shared, (cache, _) = _workers()
+        cache.set(_item("a"))
+        assert cache.get("a").id == "a"
+        assert cache.get("a").id == "a"
+        assert shared.reads == 0
+        stats = cache.stats()
+        assert stats["l1"]["hits"] == 2
+        assert stats["l1"]["hit_rate"] == 1.0
+
+    def test_l2_fill_then_l1_hit(self):
+        shared, (a, b) = _workers()
+        a.set(_item("x"))
+        assert b.get("x").id == "x"  # L1 miss, L2 hit
+        assert b.get("x").id == "x"  # now L1
+        assert shared.reads == 1
+
+    def test_update_broadcast_drops_other_workers_copy(self):
+        shared, (a, b) = _workers()
+        a.set(_item("x", content="old"))
+        assert b.get("x").content == "old"
+        a.set(_item("x", content="new"))
+        assert b.get("x").content == "new"
+        assert b.stats()["l1"]["remote_invalidations"] == 2  # one per write
+
+    def test_forget_and_zone_invalidation_propagate(self):
+        _, (a, b) = _workers()
+        a.set_many([_item("x", zone=0), _item("y", zone=1)])
+        b.get_many(["x", "y"])
+        a.invalidate("x")
+        assert b.get("x") is None
+        a.invalidate_zone(1)
+        assert b.get("y") is None
+
+    def test_returns_copies(self):
+        _, (cache, _) = _workers()
+        cache.set(_item("a"))
+        cache.get("a").total_score = 99.0
+        assert cache.get("a").total_score == 0.0
+
+    def test_stale_fill_is_fenced(self):
+        shared, (cache, _) = _workers()
+        shared.data["x"] = _item("x", content="stale")
+        l2 = cache._l2
+        original = l2.get_many
+
+        def racing_get_many(ids):
+            result = original(ids)
+            cache.invalidate("x")  # lands while the MGET is in flight
+            return result
+
+        l2.get_many = racing_get_many
+        cache.get("x")
+        l2.get_many = original
+        assert "x" not in cache._l1
+
+    def test_lru_bound_and_uncached_zones(self):
+        cache = TieredItemCache(_SharedL2().view(), max_items=2)
+        cache.set_many([_item("a"), _item("b"), _item("c"), _item("far", zone=3)])
+        assert list(cache._l1) == ["b", "c"]
+
+
+class TestTieredCacheFakeRedis:
+    def test_cross_process_invalidation(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        caches = []
+        for _ in range(2):
+            l2 = RedisCache("redis://localhost")
+            l2._client = fakeredis.FakeRedis(server=server)
+            l2._connected = True
+            cache = TieredItemCache(l2)
+            cache.start()
+            caches.append(cache)
+        a, b = caches
+        a.set(_item("x", content="old"))
+        assert b.get("x").content == "old"
+        a.set(_item("x", content="new"))
+        deadline = time.time() + 2
+        while b.stats()["l1"]["remote_invalidations"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert b.get("x").content == "new"
+        for cache in caches:
+            cache.stop()
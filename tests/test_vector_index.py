@@ -6,7 +6,7 @@ import math
 import pytest
 
 from stellar_memory.vector_index import (
-    BruteForceIndex, BallTreeIndex, create_vector_index,
+    BruteForceIndex, BallTreeIndex, QuantizedIndex, create_vector_index,
     _euclidean_dist, _centroid,
 )
 from stellar_memory.config import VectorIndexConfig
@@ -63,6 +63,31 @@ class TestBruteForceIndex:
         results = idx.search([0.5, 0.5], top_k=1)
         assert results[0][0] == "new1"
 
+    def test_add_grows_matrix_in_place(self):
+        pytest.importorskip("numpy")
+        idx = BruteForceIndex()
+        idx.add("a", [1.0, 0.0])
+        matrix = idx._matrix
+        for n in range(10):
+            idx.add(f"x{n}", [0.0, 1.0])
+            idx.search([1.0, 0.0], top_k=1)
+        assert idx._matrix is matrix  # rows written into spare capacity
+        assert idx.search([1.0, 0.0], top_k=1)[0][0] == "a"
+
+    def test_swap_remove_and_update(self):
+        idx = BruteForceIndex()
+        for name, vec in [("a", [1.0, 0.0]), ("b", [0.0, 1.0]), ("c", [0.7, 0.7])]:
+            idx.add(name, vec)
+        idx.remove("a")
+        idx.add("b", [1.0, 0.0])  # update in place
+        assert [i for i, _ in idx.search([1.0, 0.0], top_k=3)] == ["b", "c"]
+
+    def test_mixed_dimensions_fall_back(self):
+        idx = BruteForceIndex()
+        idx.add("a", [1.0, 0.0])
+        idx.add("b", [1.0, 0.0, 0.0])
+        assert idx.search([1.0, 0.0], top_k=1)[0][0] == "a"
+
 
 class TestBallTreeIndex:
     def test_add_and_size(self):
@@ -122,6 +147,111 @@ class TestBallTreeIndex:
         assert idx.size() == 2
 
 
+class TestQuantizedIndex:
+    def _vectors(self, n: int = 30, dim: int = 16) -> dict[str, list[float]]:
+        return {f"v{i}": _normalize([math.sin(i * (d + 1)) for d in range(dim)])
+                for i in range(n)}
+
+    @pytest.mark.parametrize("codec", ["int8", "float16"])
+    def test_matches_brute_force(self, codec):
+        vectors = self._vectors()
+        exact = BruteForceIndex()
+        exact.rebuild(vectors)
+        idx = QuantizedIndex(codec)
+        idx.rebuild(vectors)
+        query = vectors["v7"]
+        got = idx.search(query, top_k=5)
+        want = exact.search(query, top_k=5)
+        assert got[0][0] == "v7"
+        assert [i for i, _ in got] == [i for i, _ in want]
+        for (_, a), (_, b) in zip(got, want):
+            assert abs(a - b) < 0.02
+
+    def test_without_rescore(self):
+        vectors = self._vectors()
+        idx = QuantizedIndex("int8", rescore=False)
+        idx.rebuild(vectors)
+        assert idx.search(vectors["v3"], top_k=1)[0][0] == "v3"
+
+    def test_remove_and_update(self):
+        idx = QuantizedIndex("int8")
+        idx.add("a", [1.0, 0.0])
+        idx.add("b", [0.0, 1.0])
+        idx.add("c", [0.7, 0.7])
+        idx.remove("a")
+        assert idx.size() == 2
+        assert idx.search([0.0, 1.0], top_k=1)[0][0] == "b"
+        idx.add("b", [1.0, 0.0])
+        assert idx.size() == 2
+        assert idx.search([1.0, 0.0], top_k=1)[0][0] == "b"
+        idx.remove("missing")
+        assert idx.size() == 2
+
+    def test_compact_storage(self):
+        idx = QuantizedIndex("int8")
+        idx.rebuild(self._vectors(10, 64))
+        assert len(idx._codes) == 10 * 64
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            QuantizedIndex("int4")
+
+
+class TestFilteredSearch:
+    @pytest.mark.parametrize("factory", [
+        BruteForceIndex, lambda: BallTreeIndex(leaf_size=2), QuantizedIndex,
+    ])
+    def test_filter_before_top_k(self, factory):
+        idx = factory()
+        idx.add("near", [1.0, 0.0])
+        idx.add("near2", [0.99, 0.1])
+        idx.add("far", [0.0, 1.0])
+        results = idx.search([1.0, 0.0], top_k=1, filter_fn=lambda i: i == "far")
+        assert [i for i, _ in results] == ["far"]
+
+
+class TestConcurrentAccess:
+    @pytest.mark.parametrize("factory", [
+        BruteForceIndex, lambda: BallTreeIndex(leaf_size=40),
+        lambda: QuantizedIndex("int8"), lambda: QuantizedIndex("float16"),
+    ])
+    def test_search_while_adding(self, factory):
+        import random
+        import threading
+        rng = random.Random(0)
+        vec = lambda: [rng.random() for _ in range(128)]
+        idx = factory()
+        for n in range(1500):
+            idx.add(f"s{n}", vec())
+        query = vec()
+        errors = []
+
+        def writer(w):
+            for n in range(200):
+                try:
+                    idx.add(f"w{w}-{n}", query)
+                    if n % 3 == 0:
+                        idx.remove(f"s{w * 200 + n}")
+                except Exception as exc:
+                    errors.append(exc)
+
+        def reader():
+            for _ in range(30):
+                try:
+                    idx.search(query, 5)
+                except Exception as exc:
+                    errors.append(exc)
+
+        threads = ([threading.Thread(target=writer, args=(w,)) for w in range(4)]
+                   + [threading.Thread(target=reader) for _ in range(4)])
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert idx.size() == 1500 + 4 * 200 - 4 * 67
+
+
 class TestHelperFunctions:
     def test_euclidean_dist(self):
         assert _euclidean_dist([0, 0], [3, 4]) == 5.0
@@ -158,6 +288,11 @@ class TestCreateVectorIndex:
         # faiss not installed → falls back to BallTreeIndex
         assert isinstance(idx, BallTreeIndex)
 
+    def test_quantization(self):
+        config = VectorIndexConfig(quantization="int8", rescore_factor=2)
+        idx = create_vector_index(config, dimension=8)
+        assert isinstance(idx, QuantizedIndex)
+
     def test_non_config_returns_brute_force(self):
         idx = create_vector_index("not_a_config", dimension=8)
         assert isinstance(idx, BruteForceIndex)